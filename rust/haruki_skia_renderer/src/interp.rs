@@ -30,9 +30,9 @@ use crate::pillow_resize::{PillowResizeLimits, resize_rgba8_pillow_lanczos};
 use crate::text_metrics::configured_text_font;
 use crate::{
     AssetDescriptor, NativeMetrics, RasterCacheOutcome, RenderedImage, decode_asset_descriptor,
-    decode_asset_rgba_unpremul, draw_blur_glass_rect, draw_sekai_triangle_background,
+    decode_asset_rgba_unpremul, draw_blur_glass_rect, draw_sekai_triangle_background_cached,
     draw_source_to_raster, encode_surface, load_asset_descriptor, load_typeface_checked,
-    raster_cache_snapshot, rasterize_asset_cached,
+    raster_cache_snapshot, rasterize_asset_cached, subscene_raster_cached,
 };
 
 #[cfg(not(test))]
@@ -959,18 +959,24 @@ pub(crate) fn render_scene_inner(
         output_surface.unwrap_or(surface),
         &scene.export_format,
         scene.jpg_quality,
+        scene.png_profile,
     )?;
+    metrics.encode_elapsed = rendered.metrics.encode_elapsed;
+    metrics.encoded_bytes = rendered.metrics.encoded_bytes;
+    metrics.png_alpha_stripped = rendered.metrics.png_alpha_stripped;
+    metrics.png_palette_colors = rendered.metrics.png_palette_colors;
     metrics.total_elapsed = total_started.elapsed().as_secs_f64();
     rendered.metrics = metrics;
     if profile_enabled() {
         eprintln!(
-            "haruki_skia_renderer.profile total={:.4}s setup={:.4}s prewarm={:.4}s draw={:.4}s scale={:.4}s encode={:.4}s asset_load={:.4}s raster_build={:.4}s raster_wait={:.4}s prewarm_req={} prewarm_hit={} prewarm_miss={} prewarm_coalesced={} cache_hit={} cache_miss={} cache_coalesced={} cache_bypass={} cache_entries={} cache_bytes={} zero_blur={} font_fallbacks={} sdf_quads={} sdf_quad_elapsed={:.4}s",
+            "haruki_skia_renderer.profile total={:.4}s setup={:.4}s prewarm={:.4}s draw={:.4}s scale={:.4}s encode={:.4}s encoded_bytes={} asset_load={:.4}s raster_build={:.4}s raster_wait={:.4}s prewarm_req={} prewarm_hit={} prewarm_miss={} prewarm_coalesced={} cache_hit={} cache_miss={} cache_coalesced={} cache_bypass={} cache_entries={} cache_bytes={} zero_blur={} font_fallbacks={} sdf_quads={} sdf_quad_elapsed={:.4}s",
             rendered.metrics.total_elapsed,
             rendered.metrics.setup_elapsed,
             rendered.metrics.raster_prewarm_elapsed,
             rendered.metrics.draw_elapsed,
             rendered.metrics.scale_elapsed,
             rendered.encode_elapsed,
+            rendered.metrics.encoded_bytes,
             rendered.metrics.asset_load_elapsed,
             rendered.metrics.raster_cache_build_elapsed,
             rendered.metrics.raster_cache_wait_elapsed,
@@ -1014,7 +1020,7 @@ fn render_node(
             if let Some(clip) = &group.clip {
                 let canvas = surface.canvas();
                 canvas.save();
-                apply_clip(canvas, child_off, group.size, clip);
+                apply_clip(canvas, child_off, group.size, clip)?;
             }
             for child in &group.children {
                 render_node(surface, interp, child_off, child)?;
@@ -1063,6 +1069,7 @@ fn render_node(
         Node::Rect(rect) => render_rect(surface.canvas(), rect, off),
         Node::RoundRect(rr) => render_round_rect(surface.canvas(), rr, off),
         Node::PieSlice(pie) => render_pie_slice(surface.canvas(), pie, off),
+        Node::Path(path) => render_path(surface.canvas(), path, off)?,
         Node::Image(image) if image.blend == ImageBlend::PasteLerp => {
             interp.metrics.raster_cache_bypasses += 1;
             draw_paste_lerp_image(surface, interp, image, off)?
@@ -1189,7 +1196,7 @@ fn render_node(
             );
         }
         Node::TriangleBg(bg) => {
-            draw_sekai_triangle_background(
+            let cached = draw_sekai_triangle_background_cached(
                 surface.canvas(),
                 interp.canvas_w,
                 interp.canvas_h,
@@ -1198,6 +1205,9 @@ fn render_node(
                 bg.main_hue,
                 &bg.tris,
             );
+            if cached {
+                interp.metrics.triangle_bg_cache_hits += 1;
+            }
         }
         Node::ImageBg(bg) => {
             if let Some(decoded) = interp.load_direct(&bg.path) {
@@ -1283,7 +1293,7 @@ fn corner_radii(radius: f32, corners: &[bool; 4]) -> [Point; 4] {
     ]
 }
 
-fn apply_clip(canvas: &Canvas, off: (f32, f32), size: Vec2, clip: &Clip) {
+fn apply_clip(canvas: &Canvas, off: (f32, f32), size: Vec2, clip: &Clip) -> Result<(), String> {
     let rect = Rect::from_xywh(off.0, off.1, size[0], size[1]);
     match clip {
         Clip::Rect => {
@@ -1293,7 +1303,23 @@ fn apply_clip(canvas: &Canvas, off: (f32, f32), size: Vec2, clip: &Clip) {
             let radii = corner_radii(*radius, corners);
             canvas.clip_rrect(RRect::new_rect_radii(rect, &radii), ClipOp::Intersect, true);
         }
+        Clip::Path { d, antialias } => {
+            let path = parse_svg_path(d, off)?;
+            canvas.clip_path(&path, ClipOp::Intersect, *antialias);
+        }
+    }
+    Ok(())
+}
+
+/// Parse SVG path data and move it by the group offset. Unparsable data is an emitter bug and
+/// fails the scene instead of drawing (or clipping to) nothing.
+fn parse_svg_path(d: &str, off: (f32, f32)) -> Result<skia_safe::Path, String> {
+    let path = skia_safe::utils::parse_path::from_svg(d)
+        .ok_or_else(|| format!("Path data is not valid SVG path syntax: {d:.64}"))?;
+    if !path.is_finite() {
+        return Err("Path data contains a non-finite coordinate".to_string());
     }
+    Ok(path.with_offset((off.0, off.1)))
 }
 
 /// Resolve a gradient spec to (colors, positions) where positions are strictly increasing.
@@ -1536,6 +1562,26 @@ fn render_pie_slice(canvas: &Canvas, node: &PieSliceNode, off: (f32, f32)) {
     }
 }
 
+fn render_path(canvas: &Canvas, node: &PathNode, off: (f32, f32)) -> Result<(), String> {
+    let path = parse_svg_path(&node.d, off)?;
+    if let Some(fill) = &node.fill {
+        let mut paint = fill_paint(fill, off);
+        paint.set_anti_alias(node.antialias);
+        canvas.draw_path(&path, &paint);
+    }
+    if let Some(stroke) = &node.stroke {
+        let mut paint = stroke_paint(stroke, node.stroke_width, off);
+        paint.set_anti_alias(node.antialias);
+        paint.set_stroke_join(match node.stroke_join {
+            StrokeJoin::Miter => skia_safe::paint::Join::Miter,
+            StrokeJoin::Round => skia_safe::paint::Join::Round,
+            StrokeJoin::Bevel => skia_safe::paint::Join::Bevel,
+        });
+        canvas.draw_path(&path, &paint);
+    }
+    Ok(())
+}
+
 fn render_shadow(canvas: &Canvas, node: &ShadowNode, off: (f32, f32)) {
     let rect = Rect::from_xywh(
         node.pos[0] + off.0 + node.offset[0],
@@ -3864,28 +3910,37 @@ fn draw_raster_subscene(
     interp.push_native_runtime_bytes(surface_bytes, "RasterSubscene natural surface")?;
 
     let result = (|| {
-        let mut sub_surface = surfaces::raster_n32_premul((width, height))
-            .ok_or_else(|| format!("failed to create RasterSubscene surface {width}x{height}"))?;
-        sub_surface.canvas().clear(Color::TRANSPARENT);
-
-        let previous_canvas = (interp.canvas_w, interp.canvas_h);
-        let previous_in_transform = interp.in_transform;
-        let previous_strict_asset_depth = interp.strict_asset_depth;
-        interp.canvas_w = width as f32;
-        interp.canvas_h = height as f32;
-        interp.in_transform = false;
-        interp.strict_asset_depth = previous_strict_asset_depth.saturating_add(1);
-        let child_result = node
-            .children
-            .iter()
-            .try_for_each(|child| render_node(&mut sub_surface, interp, (0.0, 0.0), child));
-        interp.canvas_w = previous_canvas.0;
-        interp.canvas_h = previous_canvas.1;
-        interp.in_transform = previous_in_transform;
-        interp.strict_asset_depth = previous_strict_asset_depth;
-        child_result?;
-
-        let image = sub_surface.image_snapshot();
+        let mut render_children = || {
+            let mut sub_surface =
+                surfaces::raster_n32_premul((width, height)).ok_or_else(|| {
+                    format!("failed to create RasterSubscene surface {width}x{height}")
+                })?;
+            sub_surface.canvas().clear(Color::TRANSPARENT);
+
+            let previous_canvas = (interp.canvas_w, interp.canvas_h);
+            let previous_in_transform = interp.in_transform;
+            let previous_strict_asset_depth = interp.strict_asset_depth;
+            interp.canvas_w = width as f32;
+            interp.canvas_h = height as f32;
+            interp.in_transform = false;
+            interp.strict_asset_depth = previous_strict_asset_depth.saturating_add(1);
+            let child_result = node
+                .children
+                .iter()
+                .try_for_each(|child| render_node(&mut sub_surface, interp, (0.0, 0.0), child));
+            interp.canvas_w = previous_canvas.0;
+            interp.canvas_h = previous_canvas.1;
+            interp.in_transform = previous_in_transform;
+            interp.strict_asset_depth = previous_strict_asset_depth;
+            child_result?;
+            Ok::<_, String>(sub_surface.image_snapshot())
+        };
+        // The subscene renders on its own surface, so its raster does not depend on where or
+        // under which transform it is placed: a keyed hit is exact.
+        let image = match node.cache_key.as_deref() {
+            Some(key) => subscene_raster_cached(key, width, height, render_children)?.0,
+            None => render_children()?,
+        };
         let dst = Rect::from_xywh(
             node.pos[0] + off.0,
             node.pos[1] + off.1,
@@ -5517,6 +5572,47 @@ mod tests {
         );
     }
 
+    #[test]
+    fn path_node_fills_strokes_and_clips_with_svg_path_data() {
+        let root = r#"{ "type": "Group", "offset": [0, 0], "size": [32, 32], "children": [
+            { "type": "Path", "d": "M16 2 L30 30 L2 30 Z", "fill": [255, 0, 0, 255],
+              "stroke": [0, 0, 255, 255], "stroke_width": 2, "stroke_join": "round" },
+            { "type": "Group", "offset": [0, 0], "size": [32, 32],
+              "clip": { "kind": "path", "d": "M0 0 H8 V8 H0 Z", "antialias": false },
+              "children": [ { "type": "Rect", "pos": [0, 0], "size": [32, 32], "fill": [0, 255, 0, 255] } ] }
+        ] }"#;
+        let rendered = render(&bare_scene_json((32, 32), root));
+        let (pixels, width, _) = decode_pixels(&rendered);
+        let pixel = |x: usize, y: usize| &pixels[(y * width as usize + x) * 4..][..4];
+        assert_eq!(
+            pixel(16, 24),
+            &[255, 0, 0, 255],
+            "triangle interior is filled"
+        );
+        assert_eq!(pixel(16, 30)[2], 255, "base edge carries the stroke");
+        assert_eq!(
+            pixel(4, 4),
+            &[0, 255, 0, 255],
+            "inside the aliased path clip"
+        );
+        assert_ne!(
+            pixel(8, 4),
+            &[0, 255, 0, 255],
+            "an aliased clip leaves no partial edge column"
+        );
+
+        let bad = bare_scene_json(
+            (8, 8),
+            r#"{ "type": "Path", "d": "M0 0 Q", "fill": [0, 0, 0, 255] }"#,
+        );
+        let scene: Scene = serde_json::from_str(&bad).expect("parses");
+        let err = expect_scene_error(&scene, HashMap::new());
+        assert!(
+            err.contains("not valid SVG path"),
+            "unexpected error: {err}"
+        );
+    }
+
     #[test]
     fn rect_src_blend_replaces_destination_and_rejects_unknown_values() {
         let json = scene_json(
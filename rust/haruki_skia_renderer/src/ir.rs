@@ -16,6 +16,10 @@ pub struct Scene {
     pub export_format: String,
     #[serde(default = "default_jpg_quality")]
     pub jpg_quality: i32,
+    /// PNG encode profile. Only trades encode CPU against file size: every profile decodes to
+    /// the same pixels, so an older wheel that ignores the field still renders a correct image.
+    #[serde(default)]
+    pub png_profile: PngProfile,
     pub fonts: FontsIr,
     pub canvas: CanvasIr,
     /// Output scale: render at canvas size, then resize the final raster to
@@ -33,6 +37,16 @@ pub struct Scene {
     pub root: Node,
 }
 
+/// See `lib.rs::png_encode_tuning` for what each profile turns on.
+#[derive(Debug, Default, Clone, Copy, PartialEq, Eq, Deserialize)]
+#[serde(rename_all = "lowercase")]
+pub enum PngProfile {
+    #[default]
+    Fastest,
+    Balanced,
+    Smallest,
+}
+
 fn default_export_format() -> String {
     "png".to_string()
 }
@@ -170,6 +184,14 @@ pub enum Clip {
         #[serde(default = "all_corners")]
         corners: [bool; 4],
     },
+    /// SVG path-data clip in the group's local space (requires IR_CAPABILITY >= 20).
+    /// `antialias: false` reproduces a binary Pillow `ImageDraw` mask multiplied into alpha.
+    #[serde(rename = "path")]
+    Path {
+        d: String,
+        #[serde(default = "default_true")]
+        antialias: bool,
+    },
 }
 
 fn all_corners() -> [bool; 4] {
@@ -305,6 +327,7 @@ pub enum Node {
     Rect(RectNode),
     RoundRect(RoundRectNode),
     PieSlice(PieSliceNode),
+    Path(PathNode),
     Image(ImageNode),
     SlicedImage(SlicedImageNode),
     UnityImage(UnityImageNode),
@@ -542,6 +565,36 @@ pub struct PieSliceNode {
     pub stroke_width: f32,
 }
 
+/// Vector path from SVG path data (requires IR_CAPABILITY >= 20).
+///
+/// `d` is the SVG `<path d>` subset Skia's parser accepts (M/L/H/V/C/S/Q/T/A/Z, absolute and
+/// relative), in the enclosing group's local space: rounded polygons, arcs and outlines are
+/// drawn here instead of as Python-rasterized `mem:` layers. An unparsable `d` fails the whole
+/// scene (-> Python fail-open), never draws nothing.
+#[derive(Debug, Deserialize)]
+pub struct PathNode {
+    pub d: String,
+    #[serde(default)]
+    pub fill: Option<Fill>,
+    #[serde(default)]
+    pub stroke: Option<Fill>,
+    #[serde(default = "default_stroke_width")]
+    pub stroke_width: f32,
+    #[serde(default)]
+    pub stroke_join: StrokeJoin,
+    #[serde(default = "default_true")]
+    pub antialias: bool,
+}
+
+#[derive(Debug, Deserialize, Clone, Copy, Default, PartialEq, Eq)]
+#[serde(rename_all = "lowercase")]
+pub enum StrokeJoin {
+    #[default]
+    Miter,
+    Round,
+    Bevel,
+}
+
 fn default_stroke_width() -> f32 {
     1.0
 }
@@ -671,6 +724,12 @@ pub struct RasterSubsceneNode {
     pub alpha: f32,
     #[serde(default)]
     pub shadow: Option<ImageShadow>,
+    /// Names the completed natural-size raster for the process-wide subscene cache: a hit draws
+    /// the cached raster and skips `children`. The key must identify everything the children
+    /// render (Python passes the row's rendered-image cache key plus the scene's font/asset
+    /// options). An older wheel ignores the field and renders the children every time.
+    #[serde(default)]
+    pub cache_key: Option<String>,
     #[serde(default)]
     pub children: Vec<Node>,
 }
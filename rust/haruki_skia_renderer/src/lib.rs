@@ -1,6 +1,8 @@
 use std::cell::Cell;
+use std::collections::hash_map::DefaultHasher;
 use std::collections::{BTreeSet, HashMap};
 use std::fs;
+use std::hash::{Hash, Hasher};
 use std::path::{Component, Path, PathBuf};
 use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Mutex, OnceLock};
@@ -8,7 +10,10 @@ use std::time::Instant;
 
 use moka::sync::Cache;
 use mtpng::encoder::{Encoder as MtpngEncoder, Options as MtpngOptions};
-use mtpng::{ColorType as MtpngColorType, CompressionLevel, Header as MtpngHeader};
+use mtpng::{
+    ColorType as MtpngColorType, CompressionLevel, Filter as MtpngFilter, Header as MtpngHeader,
+    Mode as MtpngMode,
+};
 #[cfg(not(test))]
 use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
@@ -132,6 +137,10 @@ fn render_scene(
         rendered.metrics.raster_cache_entries,
     )?;
     metrics.set_item("raster_cache_bytes", rendered.metrics.raster_cache_bytes)?;
+    metrics.set_item(
+        "triangle_bg_cache_hits",
+        rendered.metrics.triangle_bg_cache_hits,
+    )?;
     metrics.set_item(
         "zero_blur_fast_paths",
         rendered.metrics.zero_blur_fast_paths,
@@ -154,10 +163,107 @@ fn render_scene(
         "sdf_font_cache_bypasses",
         rendered.metrics.sdf_font_cache_bypasses,
     )?;
+    metrics.set_item("encode_elapsed", rendered.metrics.encode_elapsed)?;
+    metrics.set_item("encoded_bytes", rendered.metrics.encoded_bytes)?;
+    metrics.set_item("png_alpha_stripped", rendered.metrics.png_alpha_stripped)?;
+    metrics.set_item("png_palette_colors", rendered.metrics.png_palette_colors)?;
     dict.set_item("native_metrics", metrics)?;
     Ok(dict.unbind())
 }
 
+/// Encode straight RGBA pixels as PNG with the same parallel mtpng encoder `render_scene` uses.
+///
+/// This is the Pillow fallback's encoder: `buffer` is any C-contiguous buffer of
+/// `width * height * 4` bytes (Pillow's `tobytes()`, a numpy array, a memoryview). An immutable
+/// exporter is borrowed for the whole encode with the GIL detached; a mutable one (bytearray,
+/// memoryview) is copied first, for the same data-race reason `extract_mem_image` copies it.
+/// `level` is a `Scene.png_profile` name, so both paths produce the same bytes per profile.
+#[pyfunction]
+#[pyo3(signature = (buffer, width, height, level = "fastest"))]
+fn encode_rgba_png(
+    py: Python<'_>,
+    buffer: &Bound<'_, PyAny>,
+    width: u32,
+    height: u32,
+    level: &str,
+) -> PyResult<Py<PyBytes>> {
+    let profile = parse_png_profile(level).ok_or_else(|| {
+        pyo3::exceptions::PyValueError::new_err(format!("unknown PNG encode level: {level}"))
+    })?;
+    if width == 0 || height == 0 || width > i32::MAX as u32 || height > i32::MAX as u32 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "PNG dimensions must be positive",
+        ));
+    }
+    let expected = (width as usize)
+        .checked_mul(height as usize)
+        .and_then(|pixels| pixels.checked_mul(4))
+        .ok_or_else(|| pyo3::exceptions::PyValueError::new_err("PNG dimensions overflow"))?;
+    let encoded = borrow_rgba_buffer(buffer, expected, |pixels| {
+        py.detach(|| encode_rgba_mtpng(pixels, width, height, profile))
+    })?
+    .map_err(pyo3::exceptions::PyRuntimeError::new_err)?;
+    Ok(PyBytes::new(py, &encoded.bytes).unbind())
+}
+
+fn parse_png_profile(name: &str) -> Option<ir::PngProfile> {
+    match name {
+        "fastest" => Some(ir::PngProfile::Fastest),
+        "balanced" => Some(ir::PngProfile::Balanced),
+        "smallest" => Some(ir::PngProfile::Smallest),
+        _ => None,
+    }
+}
+
+/// Run `encode` over exactly `expected` bytes of `buffer`, borrowing when the exporter is
+/// immutable (`bytes`) and copying when Python could still write through it.
+#[cfg(not(test))]
+fn borrow_rgba_buffer<R>(
+    buffer: &Bound<'_, PyAny>,
+    expected: usize,
+    encode: impl FnOnce(&[u8]) -> R,
+) -> PyResult<R> {
+    let view = PyBuffer::<u8>::get(buffer)?;
+    if !view.is_c_contiguous() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "RGBA buffer must be C-contiguous",
+        ));
+    }
+    if view.len_bytes() != expected {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "RGBA buffer has {} bytes; expected {expected}",
+            view.len_bytes()
+        )));
+    }
+    // SAFETY: `view` pins the exporter (and keeps it from resizing) until it drops after
+    // `encode` returns; the length was checked above.
+    let bytes = unsafe { std::slice::from_raw_parts(view.buf_ptr().cast::<u8>(), expected) };
+    let mutable_exporter = !view.readonly()
+        || buffer.is_instance_of::<pyo3::types::PyByteArray>()
+        || buffer.is_instance_of::<pyo3::types::PyMemoryView>();
+    if mutable_exporter {
+        let owned = bytes.to_vec();
+        return Ok(encode(&owned));
+    }
+    Ok(encode(bytes))
+}
+
+#[cfg(test)]
+fn borrow_rgba_buffer<R>(
+    buffer: &Bound<'_, PyAny>,
+    expected: usize,
+    encode: impl FnOnce(&[u8]) -> R,
+) -> PyResult<R> {
+    let bytes: &[u8] = buffer.extract()?;
+    if bytes.len() != expected {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "RGBA buffer has {} bytes; expected {expected}",
+            bytes.len()
+        )));
+    }
+    Ok(encode(bytes))
+}
+
 /// Wrap the bytes of an *immutable* Python object in a Skia `Data` without copying them.
 ///
 /// `owner` must be the object the slice points into — a `bytes`, or a tuple whose (immutable)
@@ -346,7 +452,8 @@ fn validate_raw_image(
 /// 17 = generic RasterSubscene isolate-then-place composition with whole-image shadow.
 /// 18 = asset-backed SdfAtlasQuad with Pillow-compatible L-mode resize and affine warp.
 /// 19 = source-font SdfFontQuad with native outline flattening, SDF generation, and caching.
-pub const IR_CAPABILITY: u32 = 19;
+/// 20 = SVG path-data `Path` node (fill/stroke/gradient) and the `path` Group clip.
+pub const IR_CAPABILITY: u32 = 20;
 
 /// Capability of the raw `mem:` pixel transport (the tuple forms `extract_mem_image` accepts).
 /// 2 = the six-tuple accepts color type `"a8"` (ColorType::Alpha8, row_bytes == width) for
@@ -361,19 +468,32 @@ pub const ASSET_INFO_CAPABILITY: u32 = 1;
 /// Capability of the standalone, strict native text-measurement API.
 /// 1 = `measure_text_batch(font_dir, font_name, [(text, size), ...])` returns advance,
 /// alphabetic-baseline ink bounds, Pillow-default-anchor bounds, and font metrics.
-pub const TEXT_METRICS_CAPABILITY: u32 = 1;
+/// 2 = `measure_prefix_advances(font_dir, font_name, text, size)` returns the cumulative
+/// advance after each character, for one-pass line fitting.
+pub const TEXT_METRICS_CAPABILITY: u32 = 2;
+
+/// Capability of the PNG encode profiles. Deliberately NOT an IR capability: a wheel that
+/// ignores `Scene.png_profile` still writes a correct (just larger) PNG, so nothing needs to
+/// fail open — this only tells callers such as `skia_bench.py` whether the knob is honored.
+/// 1 = `Scene.png_profile` (`fastest`/`balanced`/`smallest`) + `encoded_bytes`/`encode_elapsed`
+/// in `native_metrics`.
+/// 2 = standalone `encode_rgba_png(buffer, width, height, level)` for the Pillow fallback.
+pub const PNG_PROFILE_CAPABILITY: u32 = 2;
 
 #[pymodule(gil_used = false)]
 fn haruki_skia_renderer(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(render_scene, m)?)?;
     m.add_function(wrap_pyfunction!(asset_image_info, m)?)?;
     m.add_function(wrap_pyfunction!(measure_text_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(measure_prefix_advances, m)?)?;
+    m.add_function(wrap_pyfunction!(encode_rgba_png, m)?)?;
     m.add_function(wrap_pyfunction!(renderer_cache_stats, m)?)?;
     m.add_function(wrap_pyfunction!(clear_renderer_caches, m)?)?;
     m.add("IR_CAPABILITY", IR_CAPABILITY)?;
     m.add("RAW_BUFFER_CAPABILITY", RAW_BUFFER_CAPABILITY)?;
     m.add("ASSET_INFO_CAPABILITY", ASSET_INFO_CAPABILITY)?;
     m.add("TEXT_METRICS_CAPABILITY", TEXT_METRICS_CAPABILITY)?;
+    m.add("PNG_PROFILE_CAPABILITY", PNG_PROFILE_CAPABILITY)?;
     Ok(())
 }
 
@@ -422,6 +542,8 @@ pub(crate) struct NativeMetrics {
     pub(crate) raster_cache_entries: u64,
     pub(crate) raster_cache_bytes: u64,
     pub(crate) zero_blur_fast_paths: u64,
+    /// 1 when this scene's TriangleBg came out of the process-wide background cache.
+    pub(crate) triangle_bg_cache_hits: u64,
     /// Fonts this scene requested that could not be resolved (rendered with sans-serif).
     pub(crate) font_fallbacks: u64,
     /// SdfQuad nodes shaded in this scene, and the seconds spent shading + drawing them.
@@ -432,6 +554,12 @@ pub(crate) struct NativeMetrics {
     pub(crate) sdf_font_cache_misses: u64,
     pub(crate) sdf_font_cache_coalesced: u64,
     pub(crate) sdf_font_cache_bypasses: u64,
+    /// Final encode: seconds, output size, and what the PNG profile did to the pixel layout
+    /// (alpha dropped from an opaque page; palette size of an indexed PNG, 0 = truecolor).
+    pub(crate) encode_elapsed: f64,
+    pub(crate) encoded_bytes: u64,
+    pub(crate) png_alpha_stripped: u64,
+    pub(crate) png_palette_colors: u64,
 }
 
 #[derive(Clone, Copy)]
@@ -539,6 +667,211 @@ fn draw_sekai_triangle_background(
     }
 }
 
+/// Finished triangle backgrounds, keyed by everything `draw_sekai_triangle_background` reads.
+///
+/// A page of a standard width gets the same background for as long as its hour bucket lasts
+/// (Python quantizes the palette hour and pins the scatter to the whole hour), so the gradient
+/// passes plus a few hundred anti-aliased triangle paths were re-drawn per request to produce the
+/// same pixels. The Pillow painter keeps the same cache on its side (`TRIANGLE_BG_CACHE` in
+/// `src/sekai/base/triangle_bg.py`). The scatter is keyed by a hash of `tris` rather than the
+/// Python seed so an IR that carries a hand-built list still gets a correct key.
+#[derive(Clone, Debug, Hash, PartialEq, Eq)]
+struct TriangleBgCacheKey {
+    width: i32,
+    height: i32,
+    hour_bits: u32,
+    time_color: bool,
+    main_hue_bits: u32,
+    tris_hash: u64,
+}
+
+const DEFAULT_TRIANGLE_BG_CACHE_MB: u64 = 64;
+
+static TRIANGLE_BG_CACHE: OnceLock<Option<Cache<TriangleBgCacheKey, RasterCacheValue>>> =
+    OnceLock::new();
+
+fn triangle_bg_cache() -> Option<&'static Cache<TriangleBgCacheKey, RasterCacheValue>> {
+    TRIANGLE_BG_CACHE
+        .get_or_init(|| {
+            let max_bytes = env_mb(
+                "HARUKI_SKIA_TRIANGLE_BG_CACHE_MB",
+                DEFAULT_TRIANGLE_BG_CACHE_MB,
+            );
+            (max_bytes > 0).then(|| {
+                Cache::builder()
+                    .max_capacity(max_bytes)
+                    .weigher(|_, value: &RasterCacheValue| value.byte_size)
+                    .build()
+            })
+        })
+        .as_ref()
+}
+
+fn triangle_bg_cache_key(
+    width: f32,
+    height: f32,
+    hour: f32,
+    time_color: bool,
+    main_hue: f32,
+    tris: &[[f32; 9]],
+) -> TriangleBgCacheKey {
+    let mut hasher = DefaultHasher::new();
+    tris.len().hash(&mut hasher);
+    for t in tris {
+        for value in t {
+            normalized_float_bits(*value).hash(&mut hasher);
+        }
+    }
+    TriangleBgCacheKey {
+        width: width.round() as i32,
+        height: height.round() as i32,
+        hour_bits: normalized_float_bits(hour),
+        time_color,
+        main_hue_bits: if time_color {
+            0
+        } else {
+            normalized_float_bits(main_hue)
+        },
+        tris_hash: hasher.finish(),
+    }
+}
+
+/// `draw_sekai_triangle_background` through the process-wide background cache. A hit is one
+/// opaque image blit at the canvas origin, pixel-identical to drawing the background directly
+/// (the primary gradient is fully opaque, so nothing beneath shows through either way). Falls
+/// back to drawing directly when the cache is disabled, the canvas is fractional, oversized or
+/// transformed, or the offscreen raster cannot be allocated. Returns whether the background came from cache.
+pub(crate) fn draw_sekai_triangle_background_cached(
+    canvas: &Canvas,
+    width: f32,
+    height: f32,
+    hour: f32,
+    time_color: bool,
+    main_hue: f32,
+    tris: &[[f32; 9]],
+) -> bool {
+    let draw_direct =
+        || draw_sekai_triangle_background(canvas, width, height, hour, time_color, main_hue, tris);
+    let Some(cache) = triangle_bg_cache() else {
+        draw_direct();
+        return false;
+    };
+    let key = triangle_bg_cache_key(width, height, hour, time_color, main_hue, tris);
+    let byte_size = (key.width.max(0) as u64)
+        .saturating_mul(key.height.max(0) as u64)
+        .saturating_mul(4);
+    if byte_size == 0
+        || byte_size > u32::MAX as u64
+        || !canvas.local_to_device_as_3x3().is_identity()
+        || key.width as f32 != width
+        || key.height as f32 != height
+    {
+        draw_direct();
+        return false;
+    }
+
+    let did_build = Cell::new(false);
+    let built = cache.try_get_with(key.clone(), || {
+        did_build.set(true);
+        let mut surface = surfaces::raster_n32_premul((key.width, key.height))
+            .ok_or_else(|| format!("failed to create background raster {width}x{height}"))?;
+        surface.canvas().clear(Color::TRANSPARENT);
+        draw_sekai_triangle_background(
+            surface.canvas(),
+            width,
+            height,
+            hour,
+            time_color,
+            main_hue,
+            tris,
+        );
+        Ok::<RasterCacheValue, String>(RasterCacheValue {
+            image: surface.image_snapshot(),
+            byte_size: byte_size as u32,
+        })
+    });
+    match built {
+        Ok(value) => {
+            canvas.draw_image(&value.image, (0.0, 0.0), None);
+            !did_build.get()
+        }
+        Err(_) => {
+            draw_direct();
+            false
+        }
+    }
+}
+
+/// Completed `RasterSubscene` rasters that carry a `cache_key` (list rows, badges), keyed by that
+/// key and the natural size.
+///
+/// A warm event/vlive list used to ship every row to Rust as a raw RGBA mem raster composed by
+/// Pillow; the rows now arrive as asset-backed subscene IR instead, and this cache keeps the
+/// finished row so a warm page re-draws one image per row rather than re-rendering its children.
+#[derive(Clone, Debug, Hash, PartialEq, Eq)]
+struct SubsceneRasterCacheKey {
+    key: String,
+    width: i32,
+    height: i32,
+}
+
+const DEFAULT_SUBSCENE_RASTER_CACHE_MB: u64 = 64;
+
+static SUBSCENE_RASTER_CACHE: OnceLock<Option<Cache<SubsceneRasterCacheKey, RasterCacheValue>>> =
+    OnceLock::new();
+
+fn subscene_raster_cache() -> Option<&'static Cache<SubsceneRasterCacheKey, RasterCacheValue>> {
+    SUBSCENE_RASTER_CACHE
+        .get_or_init(|| {
+            let max_bytes = env_mb(
+                "HARUKI_SKIA_SUBSCENE_RASTER_CACHE_MB",
+                DEFAULT_SUBSCENE_RASTER_CACHE_MB,
+            );
+            (max_bytes > 0).then(|| {
+                Cache::builder()
+                    .max_capacity(max_bytes)
+                    .weigher(|_, value: &RasterCacheValue| value.byte_size)
+                    .build()
+            })
+        })
+        .as_ref()
+}
+
+/// The natural-size raster of a keyed `RasterSubscene`: from the subscene cache when present,
+/// otherwise `build()` (stored for the next render). Builds directly when the cache is disabled
+/// or the raster is too large to weigh. Returns the image and whether it came from cache; a
+/// build error is returned as-is and nothing is stored.
+pub(crate) fn subscene_raster_cached(
+    key: &str,
+    width: i32,
+    height: i32,
+    build: impl FnOnce() -> Result<Image, String>,
+) -> Result<(Image, bool), String> {
+    let byte_size = (width.max(0) as u64)
+        .saturating_mul(height.max(0) as u64)
+        .saturating_mul(4);
+    let Some(cache) = subscene_raster_cache().filter(|_| byte_size > 0 && byte_size <= u32::MAX as u64)
+    else {
+        return build().map(|image| (image, false));
+    };
+    let did_build = Cell::new(false);
+    let cache_key = SubsceneRasterCacheKey {
+        key: key.to_string(),
+        width,
+        height,
+    };
+    cache
+        .try_get_with(cache_key, || {
+            did_build.set(true);
+            build().map(|image| RasterCacheValue {
+                image,
+                byte_size: byte_size as u32,
+            })
+        })
+        .map(|value| (value.image, !did_build.get()))
+        .map_err(|err| err.to_string())
+}
+
 fn lerp_u8(a: u8, b: u8, t: f32) -> u8 {
     (a as f32 * (1.0 - t) + b as f32 * t).round() as u8
 }
@@ -971,10 +1304,12 @@ fn encode_surface(
     mut surface: Surface,
     export_format: &str,
     jpg_quality: i32,
+    png_profile: ir::PngProfile,
 ) -> Result<RenderedImage, String> {
     let started = Instant::now();
     let width = surface.width();
     let height = surface.height();
+    let mut metrics = NativeMetrics::default();
     let data = if export_format == "jpg" {
         let image = surface.image_snapshot();
         let quality = jpg_quality.clamp(1, 100) as u32;
@@ -984,7 +1319,10 @@ fn encode_surface(
                 .ok_or_else(|| "failed to encode image".to_string())?,
         )
     } else if std::env::var("HARUKI_SKIA_PNG_ENCODER").as_deref() != Ok("skia") {
-        EncodedBytes::Owned(encode_surface_mtpng(&mut surface)?)
+        let encoded = encode_surface_mtpng(&mut surface, png_profile)?;
+        metrics.png_alpha_stripped = u64::from(encoded.alpha_stripped);
+        metrics.png_palette_colors = u64::from(encoded.palette_colors);
+        EncodedBytes::Owned(encoded.bytes)
     } else {
         let image = surface.image_snapshot();
         // PNG is lossless, so deflate settings only trade encode speed vs file size, never
@@ -1005,18 +1343,113 @@ fn encode_surface(
     } else {
         ("image/png", "image.png")
     };
+    let encode_elapsed = started.elapsed().as_secs_f64();
+    metrics.encode_elapsed = encode_elapsed;
+    metrics.encoded_bytes = data.as_bytes().len() as u64;
     Ok(RenderedImage {
         bytes: data,
         media_type,
         filename,
         width,
         height,
-        encode_elapsed: started.elapsed().as_secs_f64(),
-        metrics: NativeMetrics::default(),
+        encode_elapsed,
+        metrics,
     })
 }
 
-fn encode_surface_mtpng(surface: &mut Surface) -> Result<Vec<u8>, String> {
+/// mtpng settings for one `Scene.png_profile`.
+///
+/// `fastest` is the historical encoder (Fast deflate, always RGBA) and stays the default: it
+/// keeps the output byte-for-byte what clients already receive. The other two spend CPU on the
+/// pixels before deflate instead of only on deflate itself — an opaque page written as RGB is a
+/// quarter less data to filter and compress, and a page with at most 256 colors written as an
+/// indexed PNG is a quarter of it. Both are exact: the decoded pixels never change.
+struct PngEncodeTuning {
+    level: CompressionLevel,
+    /// Bytes of filtered rows per parallel deflate chunk. Bigger chunks compress better (each
+    /// chunk restarts the dictionary) and parallelize less; `None` keeps mtpng's default.
+    chunk_size: Option<usize>,
+    strip_opaque_alpha: bool,
+    palette: bool,
+}
+
+fn png_encode_tuning(profile: ir::PngProfile) -> PngEncodeTuning {
+    match profile {
+        ir::PngProfile::Fastest => PngEncodeTuning {
+            level: CompressionLevel::Fast,
+            chunk_size: None,
+            strip_opaque_alpha: false,
+            palette: false,
+        },
+        ir::PngProfile::Balanced => PngEncodeTuning {
+            level: CompressionLevel::Default,
+            chunk_size: Some(256 * 1024),
+            strip_opaque_alpha: true,
+            palette: false,
+        },
+        ir::PngProfile::Smallest => PngEncodeTuning {
+            level: CompressionLevel::High,
+            chunk_size: Some(1024 * 1024),
+            strip_opaque_alpha: true,
+            palette: true,
+        },
+    }
+}
+
+struct EncodedPng {
+    bytes: Vec<u8>,
+    alpha_stripped: bool,
+    /// Palette size of an indexed PNG, 0 when the image was written as truecolor.
+    palette_colors: u32,
+}
+
+/// An exact palette for `rgba`, or `None` once a 257th distinct color shows up.
+///
+/// Returns `(indices, plte, trns)`: one index byte per pixel, the RGB palette, and the per-entry
+/// alpha (empty when every entry is opaque, so no tRNS chunk is written). This is lossless
+/// palettization, not quantization: a page that needs more than 256 colors stays truecolor.
+fn exact_palette(rgba: &[u8]) -> Option<(Vec<u8>, Vec<u8>, Vec<u8>)> {
+    let mut lookup: HashMap<u32, u8> = HashMap::with_capacity(256);
+    let mut colors: Vec<[u8; 4]> = Vec::with_capacity(256);
+    let mut indices = Vec::with_capacity(rgba.len() / 4);
+    // Flat UI pages are long runs of one color; skip the hash for a repeat of the last pixel.
+    let mut last: Option<(u32, u8)> = None;
+    for px in rgba.chunks_exact(4) {
+        let key = u32::from_le_bytes([px[0], px[1], px[2], px[3]]);
+        if let Some((last_key, last_index)) = last
+            && last_key == key
+        {
+            indices.push(last_index);
+            continue;
+        }
+        let index = match lookup.get(&key) {
+            Some(&index) => index,
+            None => {
+                if colors.len() == 256 {
+                    return None;
+                }
+                let index = colors.len() as u8;
+                colors.push([px[0], px[1], px[2], px[3]]);
+                lookup.insert(key, index);
+                index
+            }
+        };
+        last = Some((key, index));
+        indices.push(index);
+    }
+    let plte = colors.iter().flat_map(|c| [c[0], c[1], c[2]]).collect();
+    let trns = if colors.iter().any(|c| c[3] != 255) {
+        colors.iter().map(|c| c[3]).collect()
+    } else {
+        Vec::new()
+    };
+    Some((indices, plte, trns))
+}
+
+fn encode_surface_mtpng(
+    surface: &mut Surface,
+    profile: ir::PngProfile,
+) -> Result<EncodedPng, String> {
     let width = surface.width();
     let height = surface.height();
     let row_bytes = width as usize * 4;
@@ -1030,28 +1463,99 @@ fn encode_surface_mtpng(surface: &mut Surface) -> Result<Vec<u8>, String> {
     if !surface.read_pixels(&info, &mut pixels, row_bytes, (0, 0)) {
         return Err("failed to read RGBA pixels for mtpng".to_string());
     }
+    encode_rgba_mtpng(&pixels, width as u32, height as u32, profile)
+}
+
+fn encode_rgba_mtpng(
+    pixels: &[u8],
+    width: u32,
+    height: u32,
+    profile: ir::PngProfile,
+) -> Result<EncodedPng, String> {
+    let tuning = png_encode_tuning(profile);
+    let palette = if tuning.palette {
+        exact_palette(pixels)
+    } else {
+        None
+    };
+    let opaque = palette.is_none()
+        && tuning.strip_opaque_alpha
+        && pixels.chunks_exact(4).all(|px| px[3] == 255);
 
     let mut header = MtpngHeader::new();
     header
-        .set_size(width as u32, height as u32)
+        .set_size(width, height)
         .map_err(|err| format!("mtpng header size failed: {err}"))?;
+    let color_type = if palette.is_some() {
+        MtpngColorType::IndexedColor
+    } else if opaque {
+        MtpngColorType::Truecolor
+    } else {
+        MtpngColorType::TruecolorAlpha
+    };
     header
-        .set_color(MtpngColorType::TruecolorAlpha, 8)
+        .set_color(color_type, 8)
         .map_err(|err| format!("mtpng header color failed: {err}"))?;
     let mut options = MtpngOptions::new();
     options
-        .set_compression_level(CompressionLevel::Fast)
+        .set_compression_level(tuning.level)
         .map_err(|err| format!("mtpng options failed: {err}"))?;
+    if let Some(chunk_size) = tuning.chunk_size {
+        options
+            .set_chunk_size(chunk_size)
+            .map_err(|err| format!("mtpng chunk size failed: {err}"))?;
+    }
+    if palette.is_some() {
+        // Indexed rows are palette indices, not intensities: the prediction filters only add
+        // noise to them (the PNG spec's own recommendation is filter type None for palettes).
+        options
+            .set_filter_mode(MtpngMode::Fixed(MtpngFilter::None))
+            .map_err(|err| format!("mtpng filter mode failed: {err}"))?;
+    }
     let mut encoder = MtpngEncoder::new(Vec::new(), &options);
     encoder
         .write_header(&header)
         .map_err(|err| format!("mtpng header encode failed: {err}"))?;
-    encoder
-        .write_image_rows(&pixels)
-        .map_err(|err| format!("mtpng pixel encode failed: {err}"))?;
-    encoder
+    let palette_colors = match &palette {
+        Some((indices, plte, trns)) => {
+            encoder
+                .write_palette(plte)
+                .map_err(|err| format!("mtpng palette encode failed: {err}"))?;
+            if !trns.is_empty() {
+                encoder
+                    .write_transparency(trns)
+                    .map_err(|err| format!("mtpng transparency encode failed: {err}"))?;
+            }
+            encoder
+                .write_image_rows(indices)
+                .map_err(|err| format!("mtpng pixel encode failed: {err}"))?;
+            (plte.len() / 3) as u32
+        }
+        None if opaque => {
+            let rgb: Vec<u8> = pixels
+                .chunks_exact(4)
+                .flat_map(|px| [px[0], px[1], px[2]])
+                .collect();
+            encoder
+                .write_image_rows(&rgb)
+                .map_err(|err| format!("mtpng pixel encode failed: {err}"))?;
+            0
+        }
+        None => {
+            encoder
+                .write_image_rows(pixels)
+                .map_err(|err| format!("mtpng pixel encode failed: {err}"))?;
+            0
+        }
+    };
+    let bytes = encoder
         .finish()
-        .map_err(|err| format!("mtpng finish failed: {err}"))
+        .map_err(|err| format!("mtpng finish failed: {err}"))?;
+    Ok(EncodedPng {
+        bytes,
+        alpha_stripped: opaque,
+        palette_colors,
+    })
 }
 
 fn decode_image_file(full_path: &Path) -> Result<Image, String> {
@@ -1136,6 +1640,34 @@ static RASTER_IMAGE_CACHE: OnceLock<Option<Cache<RasterCacheKey, RasterCacheValu
     OnceLock::new();
 static IMAGE_DIMENSION_CACHE: OnceLock<Cache<AssetIdentity, [i32; 2]>> = OnceLock::new();
 
+/// One level of an asset's half-size reduction chain (`level` 0 is the first halving of the
+/// source rect). Levels depend only on the asset and the source rect, never on the destination,
+/// so every target size of the same jacket or thumbnail shares them.
+#[derive(Clone, Debug, Hash, PartialEq, Eq)]
+struct MipLevelKey {
+    asset: AssetIdentity,
+    src_bits: [u32; 4],
+    level: u8,
+}
+
+const DEFAULT_MIP_LEVEL_CACHE_MB: u64 = 64;
+
+static MIP_LEVEL_CACHE: OnceLock<Option<Cache<MipLevelKey, RasterCacheValue>>> = OnceLock::new();
+
+fn mip_level_cache() -> Option<&'static Cache<MipLevelKey, RasterCacheValue>> {
+    MIP_LEVEL_CACHE
+        .get_or_init(|| {
+            let max_bytes = env_mb("HARUKI_SKIA_MIP_CACHE_MB", DEFAULT_MIP_LEVEL_CACHE_MB);
+            (max_bytes > 0).then(|| {
+                Cache::builder()
+                    .max_capacity(max_bytes)
+                    .weigher(|_, value: &RasterCacheValue| value.byte_size)
+                    .build()
+            })
+        })
+        .as_ref()
+}
+
 fn env_mb(name: &str, default_mb: u64) -> u64 {
     std::env::var(name)
         .ok()
@@ -1410,6 +1942,33 @@ fn measure_text_batch(
     Ok(results.unbind())
 }
 
+/// Cumulative advance after each character of `text` with one strictly resolved typeface.
+///
+/// Same font resolution and limits as `measure_text_batch`; the measurement runs with the GIL
+/// detached.
+#[pyfunction]
+fn measure_prefix_advances(
+    py: Python<'_>,
+    font_dir: &str,
+    font_name: &str,
+    text: &str,
+    size: f32,
+) -> PyResult<Vec<f32>> {
+    use text_metrics::{MAX_TEXT_METRICS_CHARS, measure_text_prefix_advances};
+
+    // Same early bound as `measure_text_batch`: reject before copying into Rust-owned memory.
+    if text.len() > MAX_TEXT_METRICS_CHARS * 4 {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "prefix advance text exceeds {MAX_TEXT_METRICS_CHARS} characters"
+        )));
+    }
+    let font_dir = font_dir.to_owned();
+    let font_name = font_name.to_owned();
+    let text = text.to_owned();
+    py.detach(|| measure_text_prefix_advances(&font_dir, &font_name, &text, size))
+        .map_err(pyo3::exceptions::PyValueError::new_err)
+}
+
 pub(crate) fn decode_asset_descriptor(descriptor: &AssetDescriptor) -> Result<Image, String> {
     decode_image_file(&descriptor.identity.full_path)
 }
@@ -1472,39 +2031,93 @@ fn normalized_float_bits(value: f32) -> u32 {
     if value == 0.0 { 0 } else { value.to_bits() }
 }
 
+/// Sizes of the half-size levels a mipmapped draw of `source_rect` at `width`x`height` walks:
+/// each level halves (rounding up) the previous one and the chain stops at the last level still
+/// at least as large as the destination.
+fn mip_chain_dims(source_rect: Rect, width: i32, height: i32) -> Vec<(i32, i32)> {
+    let mut levels = Vec::new();
+    let (mut current_width, mut current_height) = (source_rect.width(), source_rect.height());
+    loop {
+        let next_width = (current_width * 0.5).ceil() as i32;
+        let next_height = (current_height * 0.5).ceil() as i32;
+        if next_width < width || next_height < height {
+            break;
+        }
+        if next_width == current_width.ceil() as i32 && next_height == current_height.ceil() as i32 {
+            break;
+        }
+        levels.push((next_width, next_height));
+        (current_width, current_height) = (next_width as f32, next_height as f32);
+    }
+    levels
+}
+
 fn build_target_raster(
-    source: &Image,
+    descriptor: &AssetDescriptor,
+    source: Option<&Image>,
     source_rect: Rect,
     width: i32,
     height: i32,
     sampling: SamplingOptions,
 ) -> Result<Image, String> {
-    let mut current = source.clone();
-    let mut current_src = source_rect;
-
     // CPU raster images do not retain Skia's lazy mip chain. Build only the levels needed for
     // this destination so a 740px jacket is reduced 740→370→185→93→64 instead of one aliased
-    // bilinear jump. Each previous level is released immediately; only the final raster is cached.
-    if sampling.mipmap != MipmapMode::None {
-        loop {
-            let next_width = (current_src.width() * 0.5).ceil() as i32;
-            let next_height = (current_src.height() * 0.5).ceil() as i32;
-            if next_width < width || next_height < height {
-                break;
-            }
-            if next_width == current_src.width().ceil() as i32
-                && next_height == current_src.height().ceil() as i32
-            {
-                break;
-            }
-            current = draw_source_to_raster(
-                &current,
-                current_src,
-                next_width,
-                next_height,
-                SamplingOptions::new(FilterMode::Linear, MipmapMode::None),
-            )?;
-            current_src = Rect::from_xywh(0.0, 0.0, next_width as f32, next_height as f32);
+    // bilinear jump. The levels go to the shared mip cache: another target size of the same
+    // asset resamples off the deepest cached level that is still large enough and, when one
+    // exists, skips decoding the source at all.
+    let levels = if sampling.mipmap != MipmapMode::None {
+        mip_chain_dims(source_rect, width, height)
+    } else {
+        Vec::new()
+    };
+    let level_key = |level: usize| MipLevelKey {
+        asset: descriptor.identity.clone(),
+        src_bits: [
+            normalized_float_bits(source_rect.left),
+            normalized_float_bits(source_rect.top),
+            normalized_float_bits(source_rect.right),
+            normalized_float_bits(source_rect.bottom),
+        ],
+        level: level as u8,
+    };
+    let level_cache = mip_level_cache().filter(|_| levels.len() <= u8::MAX as usize);
+    let cached_level = level_cache.and_then(|cache| {
+        (0..levels.len())
+            .rev()
+            .find_map(|level| cache.get(&level_key(level)).map(|value| (level, value.image)))
+    });
+    let (mut current, mut current_src, first_level) = match cached_level {
+        Some((level, image)) => {
+            let (level_width, level_height) = levels[level];
+            let level_rect = Rect::from_xywh(0.0, 0.0, level_width as f32, level_height as f32);
+            (image, level_rect, level + 1)
+        }
+        None => {
+            let image = match source {
+                Some(source) => source.clone(),
+                None => decode_asset_descriptor(descriptor)?,
+            };
+            (image, source_rect, 0)
+        }
+    };
+    for (level, &(level_width, level_height)) in levels.iter().enumerate().skip(first_level) {
+        current = draw_source_to_raster(
+            &current,
+            current_src,
+            level_width,
+            level_height,
+            SamplingOptions::new(FilterMode::Linear, MipmapMode::None),
+        )?;
+        current_src = Rect::from_xywh(0.0, 0.0, level_width as f32, level_height as f32);
+        let byte_size = (level_width as u64) * (level_height as u64) * 4;
+        if let Some(cache) = level_cache.filter(|_| byte_size <= u32::MAX as u64) {
+            cache.insert(
+                level_key(level),
+                RasterCacheValue {
+                    image: current.clone(),
+                    byte_size: byte_size as u32,
+                },
+            );
         }
     }
 
@@ -1589,14 +2202,14 @@ pub(crate) fn rasterize_asset_cached(
     let value = cache
         .try_get_with(key, || {
             did_build.set(true);
-            let decoded = if source.is_none() {
-                Some(decode_asset_descriptor(descriptor)?)
-            } else {
-                None
-            };
-            let source = source.or(decoded.as_ref()).expect("source image available");
-            let image =
-                build_target_raster(source, source_rect, raster_width, raster_height, sampling)?;
+            let image = build_target_raster(
+                descriptor,
+                source,
+                source_rect,
+                raster_width,
+                raster_height,
+                sampling,
+            )?;
             Ok::<RasterCacheValue, String>(RasterCacheValue {
                 image,
                 byte_size: byte_size as u32,
@@ -1640,6 +2253,30 @@ fn renderer_cache_stats(py: Python<'_>) -> PyResult<Py<PyDict>> {
     dict.set_item("raster_cache_oversample", snapshot.oversample)?;
     dict.set_item("raster_cache_entries", snapshot.entries)?;
     dict.set_item("raster_cache_bytes", snapshot.bytes)?;
+    let (triangle_bg_entries, triangle_bg_bytes) = triangle_bg_cache()
+        .map(|cache| {
+            cache.run_pending_tasks();
+            (cache.entry_count(), cache.weighted_size())
+        })
+        .unwrap_or_default();
+    dict.set_item("triangle_bg_cache_entries", triangle_bg_entries)?;
+    dict.set_item("triangle_bg_cache_bytes", triangle_bg_bytes)?;
+    let (mip_entries, mip_bytes) = mip_level_cache()
+        .map(|cache| {
+            cache.run_pending_tasks();
+            (cache.entry_count(), cache.weighted_size())
+        })
+        .unwrap_or_default();
+    dict.set_item("mip_level_cache_entries", mip_entries)?;
+    dict.set_item("mip_level_cache_bytes", mip_bytes)?;
+    let (subscene_entries, subscene_bytes) = subscene_raster_cache()
+        .map(|cache| {
+            cache.run_pending_tasks();
+            (cache.entry_count(), cache.weighted_size())
+        })
+        .unwrap_or_default();
+    dict.set_item("subscene_raster_cache_entries", subscene_entries)?;
+    dict.set_item("subscene_raster_cache_bytes", subscene_bytes)?;
     let (sdf_max_bytes, sdf_max_entry_bytes, sdf_entries, sdf_bytes) =
         interp::sdf_font_cache_snapshot();
     dict.set_item("sdf_font_cache_max_bytes", sdf_max_bytes)?;
@@ -1663,6 +2300,18 @@ fn clear_renderer_caches() {
         cache.invalidate_all();
         cache.run_pending_tasks();
     }
+    if let Some(cache) = triangle_bg_cache() {
+        cache.invalidate_all();
+        cache.run_pending_tasks();
+    }
+    if let Some(cache) = subscene_raster_cache() {
+        cache.invalidate_all();
+        cache.run_pending_tasks();
+    }
+    if let Some(cache) = mip_level_cache() {
+        cache.invalidate_all();
+        cache.run_pending_tasks();
+    }
     let dimensions = image_dimension_cache();
     dimensions.invalidate_all();
     dimensions.run_pending_tasks();
@@ -1824,8 +2473,9 @@ mod tests {
     fn write_test_png(path: &Path, width: i32, height: i32) {
         let mut surface = surfaces::raster_n32_premul((width, height)).expect("surface");
         surface.canvas().clear(Color::BLUE);
-        let encoded = encode_surface_mtpng(&mut surface).expect("png encode");
-        fs::write(path, encoded).expect("png write");
+        let encoded =
+            encode_surface_mtpng(&mut surface, ir::PngProfile::Fastest).expect("png encode");
+        fs::write(path, encoded.bytes).expect("png write");
     }
 
     #[test]
@@ -1978,8 +2628,9 @@ mod tests {
         let mut expected = vec![0_u8; 3 * 2 * 4];
         assert!(surface.read_pixels(&info, &mut expected, 3 * 4, (0, 0)));
 
-        let encoded = encode_surface_mtpng(&mut surface).expect("mtpng encode");
-        let decoded = Image::from_encoded(Data::new_copy(&encoded)).expect("PNG decode");
+        let encoded =
+            encode_surface_mtpng(&mut surface, ir::PngProfile::Fastest).expect("mtpng encode");
+        let decoded = Image::from_encoded(Data::new_copy(&encoded.bytes)).expect("PNG decode");
         let mut actual = vec![0_u8; expected.len()];
         assert!(decoded.read_pixels(
             &info,
@@ -1990,4 +2641,89 @@ mod tests {
         ));
         assert_eq!(actual, expected);
     }
+
+    fn decode_unpremul_rgba(encoded: &[u8], width: i32, height: i32) -> Vec<u8> {
+        let info = ImageInfo::new(
+            (width, height),
+            ColorType::RGBA8888,
+            AlphaType::Unpremul,
+            None,
+        );
+        let decoded = Image::from_encoded(Data::new_copy(encoded)).expect("PNG decode");
+        let mut actual = vec![0_u8; (width * height * 4) as usize];
+        assert!(decoded.read_pixels(
+            &info,
+            &mut actual,
+            width as usize * 4,
+            (0, 0),
+            skia_safe::image::CachingHint::Disallow,
+        ));
+        actual
+    }
+
+    #[test]
+    fn png_profiles_decode_to_identical_pixels() {
+        // Opaque two-color page: balanced strips alpha, smallest palettizes; all three must
+        // decode to exactly the pixels the fastest (historical RGBA) encoder writes.
+        let (width, height) = (64_u32, 48_u32);
+        let mut pixels = Vec::with_capacity((width * height * 4) as usize);
+        for y in 0..height {
+            for x in 0..width {
+                let px = if (x / 8 + y / 8) % 2 == 0 {
+                    [250, 250, 250, 255]
+                } else {
+                    [30, 90, 200, 255]
+                };
+                pixels.extend_from_slice(&px);
+            }
+        }
+        let fastest = encode_rgba_mtpng(&pixels, width, height, ir::PngProfile::Fastest)
+            .expect("fastest encode");
+        let balanced = encode_rgba_mtpng(&pixels, width, height, ir::PngProfile::Balanced)
+            .expect("balanced encode");
+        let smallest = encode_rgba_mtpng(&pixels, width, height, ir::PngProfile::Smallest)
+            .expect("smallest encode");
+        assert!(!fastest.alpha_stripped && fastest.palette_colors == 0);
+        assert!(balanced.alpha_stripped && balanced.palette_colors == 0);
+        assert_eq!(smallest.palette_colors, 2);
+        assert!(smallest.bytes.len() <= fastest.bytes.len());
+        for encoded in [&fastest, &balanced, &smallest] {
+            assert_eq!(
+                decode_unpremul_rgba(&encoded.bytes, width as i32, height as i32),
+                pixels
+            );
+        }
+    }
+
+    #[test]
+    fn encode_level_names_match_scene_png_profiles() {
+        for name in ["fastest", "balanced", "smallest"] {
+            let scene_profile: ir::PngProfile =
+                serde_json::from_value(serde_json::Value::String(name.to_string()))
+                    .expect("scene profile name");
+            assert_eq!(parse_png_profile(name), Some(scene_profile));
+        }
+        assert_eq!(parse_png_profile("fast"), None);
+    }
+
+    #[test]
+    fn palette_keeps_translucency_and_gives_up_past_256_colors() {
+        let pixels = [
+            10, 20, 30, 255, 10, 20, 30, 0, 200, 100, 50, 128, 10, 20, 30, 255,
+        ];
+        let encoded =
+            encode_rgba_mtpng(&pixels, 2, 2, ir::PngProfile::Smallest).expect("palette encode");
+        assert_eq!(encoded.palette_colors, 3);
+        assert!(!encoded.alpha_stripped);
+        // A fully transparent pixel keeps its alpha but not its (undefined) color channels.
+        let decoded = decode_unpremul_rgba(&encoded.bytes, 2, 2);
+        assert_eq!(decoded[3], 255);
+        assert_eq!(decoded[7], 0);
+        assert_eq!(&decoded[8..12], &[200, 100, 50, 128]);
+
+        let many: Vec<u8> = (0..300_u32)
+            .flat_map(|i| [(i % 256) as u8, (i / 256) as u8, 7, 255])
+            .collect();
+        assert!(exact_palette(&many).is_none());
+    }
 }
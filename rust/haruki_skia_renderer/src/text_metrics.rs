@@ -222,6 +222,47 @@ pub(crate) fn measure_text_metrics_batch(
     Ok(measure_loaded_text_batch(&typeface, requests))
 }
 
+/// Cumulative advance after each Unicode scalar of `text`: entry `i` is the width of the
+/// first `i + 1` characters laid out with the configured IR font.
+///
+/// Skia maps one code point to one glyph without shaping, so the result lines up with Python's
+/// per-code-point string indexing. Callers use it to find a line's break position in a single
+/// pass and verify only the boundary with a full measurement.
+fn prefix_advances_for(typeface: &Typeface, text: &str, size: f32) -> Vec<f32> {
+    let font = configured_text_font(typeface.clone(), size);
+    let glyphs = font.str_to_glyphs_vec(text);
+    let mut widths = vec![0.0_f32; glyphs.len()];
+    font.get_widths(&glyphs, &mut widths);
+    let mut total = 0.0_f32;
+    widths
+        .into_iter()
+        .map(|width| {
+            total += width;
+            total
+        })
+        .collect()
+}
+
+pub(crate) fn measure_text_prefix_advances(
+    font_dir: &str,
+    font_name: &str,
+    text: &str,
+    size: f32,
+) -> Result<Vec<f32>, String> {
+    let request = TextMetricsRequest {
+        text: text.to_owned(),
+        size,
+    };
+    validate_text_metrics_requests(font_dir, font_name, std::slice::from_ref(&request))?;
+    let (typeface, fell_back) = load_typeface_checked(font_dir, font_name);
+    if fell_back {
+        return Err(format!(
+            "font could not be resolved without fallback: name={font_name:?} dir={font_dir:?}"
+        ));
+    }
+    Ok(prefix_advances_for(&typeface, text, size))
+}
+
 #[cfg(test)]
 mod tests {
     use skia_safe::{FontMgr, FontStyle};
@@ -291,6 +332,22 @@ mod tests {
         }
     }
 
+    #[test]
+    fn prefix_advances_are_cumulative_per_character() {
+        let typeface = default_typeface();
+        let advances = prefix_advances_for(&typeface, "Haruki未来", 24.0);
+        assert_eq!(advances.len(), "Haruki未来".chars().count());
+        assert!(advances.windows(2).all(|pair| pair[1] >= pair[0]));
+        let whole = measure_loaded_text_batch(
+            &typeface,
+            &[TextMetricsRequest {
+                text: "Haruki未来".to_string(),
+                size: 24.0,
+            }],
+        );
+        assert!((advances[advances.len() - 1] - whole[0].advance).abs() < 1.0);
+    }
+
     #[test]
     fn strict_batch_rejects_a_missing_font_instead_of_measuring_fallback() {
         let request = TextMetricsRequest {
@@ -0,0 +1,102 @@
+"""Whole-profile wall time: N sequential ``/custom-profile-card`` calls vs one ``/custom-profile-cards``.
+
+Clients used to split a profile with ``select_custom_profile_cards`` and post every card on its
+own, each request re-validating, re-resolving the region's resources and waiting for the
+previous card. The batch route takes the profile once, validates and builds the shared context
+once, and renders the cards concurrently under one admission decision. This bench posts the same
+selection both ways through the real app (in-process ASGI, full middleware stack) and prints the
+wall time of each round, after one warm-up round that is not counted.
+
+Inputs: ``--profile`` is a GetAnotherProfileResponse carrying ``userCustomProfileCards`` (default
+``response.json`` at the repo root); ``--resources`` is a JSON file whose ``resources`` object is
+the Cloud-inlined index (e.g. a payload from ``scripts/parity_payloads/gen_custom_profile.py``).
+Parallelism is bounded by ``custom_profile_max_concurrent_requests``; with the default of 1 the
+batch saves the per-request overhead only.
+
+Run (repo root):
+    uv run python scripts/bench_custom_profile_cards.py --resources out/parity-payloads/custom_profile_card.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import httpx
+
+from src.core.main import app
+from src.sekai.profile.custom_profile.split import (
+    build_custom_profile_render_request,
+    infer_profile_region,
+    select_custom_profile_cards,
+)
+
+ROUNDS = 3
+PREFIX = "/api/pjsk/profile"
+
+
+async def _sequential(client: httpx.AsyncClient, bodies: list[dict]) -> tuple[float, int]:
+    started = time.perf_counter()
+    ok = 0
+    for body in bodies:
+        response = await client.post(f"{PREFIX}/custom-profile-card", json=body)
+        ok += response.status_code == 200
+    return time.perf_counter() - started, ok
+
+
+async def _batch(client: httpx.AsyncClient, body: dict) -> tuple[float, int]:
+    started = time.perf_counter()
+    response = await client.post(f"{PREFIX}/custom-profile-cards", json=body)
+    elapsed = time.perf_counter() - started
+    return elapsed, response.content.count(b"Content-Type: image/png")
+
+
+async def _run(profile: dict, resources: dict, region: str | None, rounds: int) -> None:
+    cards = select_custom_profile_cards(profile, all_cards=True)
+    if not cards:
+        raise SystemExit("the profile has no userCustomProfileCards")
+    region = region or infer_profile_region(profile) or "cn"
+    bodies = [
+        {**build_custom_profile_render_request(profile, card, region=region), "resources": resources} for card in cards
+    ]
+    batch_body = {"profile": profile, "resources": resources, "region": region, "all_cards": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await _sequential(client, bodies)
+        await _batch(client, batch_body)
+        print(f"{len(cards)} cards, {rounds} rounds")  # noqa: T201
+        for index in range(rounds):
+            seq_s, seq_ok = await _sequential(client, bodies)
+            batch_s, batch_ok = await _batch(client, batch_body)
+            print(  # noqa: T201
+                f"  round {index}: sequential {seq_s * 1000:9.1f} ms ({seq_ok} ok)  "
+                f"batch {batch_s * 1000:9.1f} ms ({batch_ok} png)  speedup={seq_s / batch_s:5.2f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", type=Path, default=REPO_ROOT / "response.json")
+    parser.add_argument("--resources", type=Path, default=None, help="JSON file with a 'resources' object")
+    parser.add_argument("--region", default=None)
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    args = parser.parse_args()
+
+    profile = json.loads(args.profile.read_text(encoding="utf-8"))
+    resources = {}
+    if args.resources is not None:
+        resources = json.loads(args.resources.read_text(encoding="utf-8")).get("resources") or {}
+    asyncio.run(_run(profile, resources, args.region, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Micro-benchmark for the emoji atlas on the Pillow text path.
+
+A friend/ranking list or a profile with emoji in nicknames and words draws the same handful of
+emoji over and over. Before the atlas every occurrence went through ``Pilmoji.text``, which decoded
+the emoji PNG (from the in-memory byte cache at best) and LANCZOS-resized it to the font size;
+``painter._draw_emoji_text`` pastes a decoded, pre-scaled raster from ``EMOJI_ATLAS`` instead.
+This bench draws a nickname-heavy list both ways:
+
+- pilmoji: ``Pilmoji(img).text(...)`` per row, which is what ``Painter._text`` did before;
+- atlas cold: ``_draw_emoji_text`` per row with the atlas cleared before each pass;
+- atlas warm: the same with the atlas kept across passes (the steady state of a server).
+
+The emoji source is an in-memory stand-in serving 72x72 PNGs (the Google source's size), so the
+numbers measure decode/resize/paste and not the network or the disk byte cache.
+
+Run (repo root):
+    uv run python scripts/bench_emoji_atlas.py
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+from pilmoji import Pilmoji
+from pilmoji.source import BaseSource
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.sekai.base import painter
+from src.sekai.base.text_cache import EMOJI_ATLAS
+
+ROWS = 60
+ITERATIONS = 20
+FONT_SIZE = 24
+EMOJI = ["🎵", "⭐", "🌸", "💜", "🍓", "✨", "🐱", "🎀"]
+
+
+def _png(index: int) -> bytes:
+    image = Image.new("RGBA", (72, 72), (0, 0, 0, 0))
+    ImageDraw.Draw(image).ellipse((4, 4, 68, 68), fill=(40 * index % 255, 120, 200, 255))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+_PNGS = {emoji: _png(index) for index, emoji in enumerate(EMOJI)}
+
+
+class _MemorySource(BaseSource):
+    def get_emoji(self, emoji: str, /) -> BytesIO | None:
+        data = _PNGS.get(emoji)
+        return BytesIO(data) if data is not None else None
+
+    def get_discord_emoji(self, id: int, /) -> BytesIO | None:
+        return None
+
+
+def _nicknames() -> list[str]:
+    return [
+        f"{EMOJI[index % len(EMOJI)]}プレイヤー{index}{EMOJI[(index * 3) % len(EMOJI)]} 一言 {EMOJI[(index + 5) % 8]}"
+        for index in range(ROWS)
+    ]
+
+
+def _pilmoji_pass(rows: list[str], font) -> None:
+    image = Image.new("RGBA", (640, ROWS * 32 + 40), (255, 255, 255, 255))
+    with Pilmoji(image, source=_MemorySource) as pilmoji:
+        for index, text in enumerate(rows):
+            pilmoji.text((10, 30 + index * 32), text, font=font, fill=(0, 0, 0, 255), anchor="ls")
+
+
+def _atlas_pass(rows: list[str], font, *, cold: bool) -> None:
+    if cold:
+        EMOJI_ATLAS.clear()
+    image = Image.new("RGBA", (640, ROWS * 32 + 40), (255, 255, 255, 255))
+    for index, text in enumerate(rows):
+        painter._draw_emoji_text(image, (10, 30 + index * 32), text, font, (0, 0, 0, 255))
+
+
+def _time(fn, *args, **kwargs) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(*args, **kwargs)
+    return (time.perf_counter() - started) / ITERATIONS * 1000
+
+
+def main() -> None:
+    painter.CachedGoogleEmojiSource = _MemorySource
+    font = ImageFont.load_default(FONT_SIZE)
+    rows = _nicknames()
+    occurrences = ROWS * 3
+
+    pilmoji_ms = _time(_pilmoji_pass, rows, font)
+    cold_ms = _time(_atlas_pass, rows, font, cold=True)
+    warm_ms = _time(_atlas_pass, rows, font, cold=False)
+    print(f"{ROWS} nickname rows, {occurrences} emoji, mean of {ITERATIONS} passes (ms/list)")  # noqa: T201
+    print(f"  pilmoji     {pilmoji_ms:8.2f}")  # noqa: T201
+    print(f"  atlas cold  {cold_ms:8.2f}  speedup={pilmoji_ms / cold_ms:5.1f}x")  # noqa: T201
+    print(f"  atlas warm  {warm_ms:8.2f}  speedup={pilmoji_ms / warm_ms:5.1f}x")  # noqa: T201
+    print(f"  atlas stats {EMOJI_ATLAS.stats()}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
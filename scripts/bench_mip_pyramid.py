@@ -0,0 +1,99 @@
+"""Micro-benchmark for the Pillow mip pyramid behind the resize cache.
+
+A list page (cards, musics, gacha) draws every jacket/thumbnail at one or two sizes, and the next
+list page draws the same assets at different ones, so the exact-size resize cache misses per
+size and each miss used to resample the full-resolution source. This bench replays that shape:
+``ASSETS`` synthetic 740px jackets resized to each of ``SIZES``, both ways:
+
+- direct: ``Image.resize`` off the decoded source (what every resize-cache miss paid before);
+- pyramid: ``resize_with_mip_pyramid`` with the pool enabled (one reduce chain per asset, then
+  each size resamples off its level).
+
+It reports thread CPU per simulated list page (one pass over all assets at one size) and the
+premultiplied pixel difference against the direct resize, which is what the parity budgets in
+``skia_parity_budgets.py`` are measured on. Decoding is excluded from both sides. The native
+renderer's level cache is reported per render as ``raster_cache_build_elapsed`` in the native
+metrics and is not measured here.
+
+Run (repo root):
+    uv run python scripts/bench_mip_pyramid.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.sekai.base.mip_pyramid import (
+    MIP_PYRAMID_CACHE,
+    clear_mip_pyramid_cache,
+    get_mip_pyramid_cache_stats,
+    resize_with_mip_pyramid,
+)
+
+ASSETS = 40
+SIZES = [48, 64, 80, 100, 117]
+RESAMPLE = Image.Resampling.LANCZOS
+
+
+def _jacket(seed: int) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:740, 0:740]
+    pixels = np.zeros((740, 740, 4), np.int64)
+    pixels[..., 0] = xx * 255 // 739
+    pixels[..., 1] = yy * 255 // 739
+    pixels[..., 2] = (xx // 37 + yy // 37 + seed) % 2 * 255
+    pixels[..., :3] += rng.integers(-40, 40, (740, 740, 3))
+    pixels[..., 3] = np.where((xx - 370) ** 2 + (yy - 370) ** 2 < 330**2, 255, 0)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), "RGBA")
+
+
+def _page_cpu_ms(resize, size: int) -> float:
+    started = time.thread_time_ns()
+    for index in range(ASSETS):
+        resize(index, size)
+    return (time.thread_time_ns() - started) / 1e6
+
+
+def main() -> None:
+    sources = [_jacket(seed) for seed in range(ASSETS)]
+    MIP_PYRAMID_CACHE.max_entries = ASSETS
+    MIP_PYRAMID_CACHE.max_bytes = 512 << 20
+    clear_mip_pyramid_cache()
+
+    def _direct(index: int, size: int) -> Image.Image:
+        return sources[index].resize((size, size), RESAMPLE)
+
+    def _pyramid(index: int, size: int) -> Image.Image:
+        return resize_with_mip_pyramid((f"jacket{index}.png", 1, 1), sources[index].copy, (size, size), RESAMPLE)
+
+    print(f"resize CPU per list page of {ASSETS} jackets (ms, thread time)")  # noqa: T201
+    for size in SIZES:
+        direct_ms = _page_cpu_ms(_direct, size)
+        pyramid_ms = _page_cpu_ms(_pyramid, size)
+        diffs = np.concatenate(
+            [
+                np.abs(
+                    np.asarray(_direct(index, size).convert("RGBa"), np.int64)
+                    - np.asarray(_pyramid(index, size).convert("RGBa"), np.int64)
+                ).ravel()
+                for index in range(0, ASSETS, 8)
+            ]
+        )
+        print(  # noqa: T201
+            f"  {size:>4}px  direct {direct_ms:8.2f}  pyramid {pyramid_ms:8.2f}  "
+            f"speedup={direct_ms / pyramid_ms:5.1f}x  diff mean={diffs.mean():.3f} p99={np.percentile(diffs, 99):.0f}"
+        )
+    print(f"  cache stats {get_mip_pyramid_cache_stats()}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Micro-benchmark for the memoized timezone registry and the per-request ``RequestClock``.
+
+Before the clock, every row of a list page re-resolved the request's timezone string
+(``normalize_timezone`` + ``ZoneInfo``) for each timestamp field and again for each "now". For a
+valid key ``ZoneInfo`` caches the instance, so that is mostly string/cache overhead; for an
+unknown key (a client typo) every call fell through to a filesystem lookup before falling back to
+``DEFAULT_TIMEZONE``. This bench replays a 100-row event list both ways:
+
+- legacy: per row, two ``localize_datetime`` calls and one ``request_now`` with the registry
+  bypassed (``_resolve_timezone.__wrapped__``), which is what the code did per field before;
+- clock: one ``RequestClock`` per request, ``clock.localize`` per field and ``clock.now``.
+
+Run (repo root):
+    uv run python scripts/bench_request_clock.py
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.sekai.base.timezone import RequestClock, _resolve_timezone, parse_datetime_utc
+from src.sekai.event.model import EventListRequest
+
+ROWS = 100
+ITERATIONS = 200
+BASE_MS = 1_700_000_000_000
+DAY_MS = 86_400_000
+
+
+def _rows() -> list[dict]:
+    return [
+        {
+            "id": index,
+            "event_name": f"event {index}",
+            "event_type": "marathon",
+            "event_type_name": "马拉松",
+            "start_at": BASE_MS + index * 9 * DAY_MS,
+            "end_at": BASE_MS + index * 9 * DAY_MS + 8 * DAY_MS,
+        }
+        for index in range(ROWS)
+    ]
+
+
+def _legacy_localize(value, timezone_name: str) -> datetime | None:
+    dt = parse_datetime_utc(value)
+    if dt is None:
+        return None
+    return dt.astimezone(_resolve_timezone.__wrapped__(timezone_name.strip())[1])
+
+
+def _legacy_pass(rows: list[dict], timezone_name: str) -> None:
+    for row in rows:
+        _legacy_localize(row["start_at"], timezone_name)
+        _legacy_localize(row["end_at"], timezone_name)
+        datetime.now(_resolve_timezone.__wrapped__(timezone_name.strip())[1])
+
+
+def _clock_pass(rows: list[dict], timezone_name: str) -> None:
+    clock = RequestClock(timezone_name)
+    for row in rows:
+        clock.localize(row["start_at"])
+        clock.localize(row["end_at"])
+        _ = clock.now
+
+
+def _time(fn, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(*args)
+    return (time.perf_counter() - started) / ITERATIONS * 1000
+
+
+def main() -> None:
+    rows = _rows()
+    print(f"{ROWS}-row event list, mean of {ITERATIONS} passes (ms/request)")  # noqa: T201
+    for timezone_name in ("Asia/Shanghai", "Not/AZone"):
+        legacy_ms = _time(_legacy_pass, rows, timezone_name)
+        clock_ms = _time(_clock_pass, rows, timezone_name)
+        print(  # noqa: T201
+            f"  timezone={timezone_name:<14} legacy={legacy_ms:7.3f}  clock={clock_ms:7.3f}  "
+            f"speedup={legacy_ms / clock_ms:5.1f}x"
+        )
+
+    payload = {"timezone": "Asia/Shanghai", "event_info": rows}
+    validate_ms = _time(EventListRequest.model_validate, payload)
+    print(f"  EventListRequest.model_validate (clock-backed): {validate_ms:.3f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Micro-benchmark for the compiled TMP font table pack.
+
+The first custom-profile request after a deploy (or an asset update that touches a table) used to
+parse metadata.json plus every character/glyph table with ``json.loads`` and build one
+``TMPGlyphMetrics`` per glyph; concurrent first requests each repeated the whole parse. The tables
+are now compiled into one mmap-able pack (``src.sekai.profile.custom_profile.tmp_tables``) and
+misses are single-flight. This bench measures, on a synthetic asset set of CJK size:
+
+- json parse: ``TMPFontLibrary._load_assets`` (the old cold path);
+- pack compile: parse plus writing the pack (paid once per asset version);
+- pack load: a cold process with a valid pack (mmap, one manifest check, lazy glyphs);
+- hit: the in-memory table cache revalidating its signature list;
+- concurrent cold misses: ``THREADS`` simultaneous first loads, and how many parses they ran.
+
+Runs entirely against a temp dir; pass ``--metadata path/to/metadata.json`` to time a real asset set
+instead (its pack is written to the temp dir, nothing next to the metadata is touched).
+
+Run (repo root):
+    uv run python scripts/bench_tmp_font_tables.py
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.sekai.profile.custom_profile import tmp_tables
+from src.sekai.profile.custom_profile.cache import clear_custom_profile_caches, get_custom_profile_cache_stats
+from src.sekai.profile.custom_profile.renderer import TMPFontLibrary
+
+ASSETS = 4
+GLYPHS_PER_ASSET = 8000
+ITERATIONS = 5
+HIT_LOADS = 200
+THREADS = 8
+PROBE = [0x6625, 0x65E5, 0x5F71, 0x41]
+
+
+def write_synthetic_metadata(meta_dir: Path) -> Path:
+    meta_dir.mkdir(parents=True, exist_ok=True)
+    rows = []
+    for asset_index in range(ASSETS):
+        name = f"BenchFont{asset_index}"
+        codes = [0x41 + i for i in range(64)] + [0x4E00 + i for i in range(GLYPHS_PER_ASSET - 64)]
+        (meta_dir / f"{name}_characters.json").write_text(
+            json.dumps([{"m_Unicode": cp, "m_GlyphIndex": i + 1, "m_Scale": 1.0} for i, cp in enumerate(codes)]),
+            encoding="utf-8",
+        )
+        (meta_dir / f"{name}_glyphs.json").write_text(
+            json.dumps(
+                [
+                    {
+                        "m_Index": i + 1,
+                        "m_AtlasIndex": 0,
+                        "m_Scale": 1.0,
+                        "m_Metrics": {
+                            "m_Width": 40.0,
+                            "m_Height": 42.0,
+                            "m_HorizontalBearingX": 1.5,
+                            "m_HorizontalBearingY": 36.0,
+                            "m_HorizontalAdvance": 44.0,
+                        },
+                        "m_GlyphRect": {"m_X": i % 64 * 48, "m_Y": i // 64 * 48, "m_Width": 40, "m_Height": 42},
+                    }
+                    for i in range(len(codes))
+                ]
+            ),
+            encoding="utf-8",
+        )
+        rows.append(
+            {
+                "name": name,
+                "bundle": "custom_profile_font.bundle",
+                "material": 101,
+                "character_table_path": f"{name}_characters.json",
+                "glyph_table_path": f"{name}_glyphs.json",
+                "atlas_textures": [],
+                "atlas_padding": 5.0,
+                "face_info": {"m_PointSize": 48.0, "m_Scale": 1.0, "m_AscentLine": 44.0, "m_DescentLine": -12.0},
+            }
+        )
+    metadata_path = meta_dir / "metadata.json"
+    metadata_path.write_text(
+        json.dumps({"materials": [{"path_id": 101, "floats": {"_GradientScale": 6.0}}], "tmp_font_assets": rows}),
+        encoding="utf-8",
+    )
+    return metadata_path
+
+
+def _load(metadata_path: Path) -> TMPFontLibrary:
+    library = TMPFontLibrary.load(metadata_path, source_metadata_path=None)
+    for rows in library.assets.values():
+        for code in PROBE:
+            rows[0].glyphs.get(code)
+    return library
+
+
+def _mean_ms(fn, iterations: int = ITERATIONS) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--metadata", type=Path, default=None, help="time a real metadata.json")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        tmp_tables.TMP_TABLE_PACK_DIR = workdir / "packs"
+        metadata_path = (args.metadata or write_synthetic_metadata(workdir / "meta")).resolve()
+        pack_path = tmp_tables.tmp_table_pack_candidates(metadata_path)[-1]
+
+        parse_ms = _mean_ms(lambda: TMPFontLibrary._load_assets(metadata_path))
+
+        def compile_once() -> None:
+            clear_custom_profile_caches()
+            pack_path.unlink(missing_ok=True)
+            _load(metadata_path)
+
+        compile_ms = _mean_ms(compile_once)
+
+        def pack_once() -> None:
+            clear_custom_profile_caches()
+            _load(metadata_path)
+
+        pack_ms = _mean_ms(pack_once)
+        hit_ms = _mean_ms(lambda: _load(metadata_path), HIT_LOADS)
+
+        clear_custom_profile_caches()
+        pack_path.unlink(missing_ok=True)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(THREADS) as pool:
+            list(pool.map(lambda _: _load(metadata_path), range(THREADS)))
+        concurrent_ms = (time.perf_counter() - started) * 1000
+        stats = get_custom_profile_cache_stats()["tmp_metadata"]
+
+        print(f"TMP font tables ({metadata_path}), pack {pack_path.stat().st_size / 1e6:.1f} MB")  # noqa: T201
+        print(f"  json parse           {parse_ms:9.2f} ms")  # noqa: T201
+        print(f"  pack compile         {compile_ms:9.2f} ms")  # noqa: T201
+        print(f"  pack load            {pack_ms:9.2f} ms  speedup={parse_ms / pack_ms:6.1f}x")  # noqa: T201
+        print(f"  hit revalidation     {hit_ms:9.3f} ms")  # noqa: T201
+        print(  # noqa: T201
+            f"  {THREADS} concurrent cold  {concurrent_ms:9.2f} ms  parses={stats['misses']} "
+            f"single_flight_waits={stats['single_flight_waits']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
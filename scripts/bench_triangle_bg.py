@@ -0,0 +1,65 @@
+"""Micro-benchmark for the finished triangle-background cache on the Pillow path.
+
+Every page that opens with ``draw_random_triangle_bg`` used to build two quarter-size gradients,
+LANCZOS them up to the canvas and alpha-composite a few hundred triangle overlays, on every
+request. The palette hour now moves in five-minute steps, so a background is a pure function of
+``triangle_bg_cache_key`` and ``Painter`` pastes a finished raster from ``TRIANGLE_BG_CACHE``.
+This bench times one background draw at the common canvas sizes both ways:
+
+- cold: the cache is cleared before every draw (what every request paid before);
+- warm: the raster is kept across draws (the steady state of a server within one palette step).
+
+This is the Pillow draw alone. ``scripts/skia_bench.py`` carries the ``triangle_bg_*`` cases that
+put the same background through both backends, the native renderer's own background cache
+included (its hits are reported per render as ``triangle_bg_cache_hits`` in the native metrics).
+
+Run (repo root):
+    uv run python scripts/bench_triangle_bg.py
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import time
+
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.sekai.base.painter import Painter
+from src.sekai.base.triangle_bg import TRIANGLE_BG_CACHE
+
+ITERATIONS = 10
+SIZES = [(600, 800), (1000, 1400), (1400, 2000)]
+
+
+def _draw(size: tuple[int, int], *, cold: bool) -> None:
+    if cold:
+        TRIANGLE_BG_CACHE.clear()
+    Painter(Image.new("RGBA", size))._impl_draw_random_triangle_bg(True, None, 0.0)
+
+
+def _time(fn, *args, **kwargs) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(*args, **kwargs)
+    return (time.perf_counter() - started) / ITERATIONS * 1000
+
+
+def main() -> None:
+    os.environ.setdefault("HARUKI_BG_TEST_HOUR", "15.5")
+    print(f"triangle background draw, mean of {ITERATIONS} draws (ms)")  # noqa: T201
+    for size in SIZES:
+        cold_ms = _time(_draw, size, cold=True)
+        warm_ms = _time(_draw, size, cold=False)
+        label = f"{size[0]}x{size[1]}"
+        print(f"  {label:>10}  cold {cold_ms:8.2f}  warm {warm_ms:7.2f}  speedup={cold_ms / warm_ms:6.1f}x")  # noqa: T201
+    print(f"  cache stats {TRIANGLE_BG_CACHE.stats()}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,14 @@ Example:
     --requests 100 \
     --concurrency 16 \
     --output-dir ./out/profile-load
+
+Mixed load (each request picks the next target in turn); per-endpoint latency and drawing-pool
+queue wait (the X-Haruki-Pool-Wait-Ms header) go into the summary, and --pool-stats appends the
+server's per-class queue wait from /render-stats:
+  python scripts/concurrent_fetch_images.py \
+    --mix /api/pjsk/card/box=payloads/card_box.json \
+    --mix /api/pjsk/stamp/list=payloads/stamp.json \
+    --requests 200 --concurrency 32 --pool-stats
 """
 
 from __future__ import annotations
@@ -28,10 +36,13 @@ from typing import Any
 
 import aiohttp
 
+POOL_WAIT_HEADER = "X-Haruki-Pool-Wait-Ms"
+
 
 @dataclass(slots=True)
 class RequestResult:
     index: int
+    endpoint: str
     status: int | None
     elapsed_ms: float
     ok: bool
@@ -39,18 +50,30 @@ class RequestResult:
     response_bytes: int
     content_type: str | None
     error: str | None
+    pool_wait_ms: float | None = None
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Concurrent fetcher for image endpoints.")
     parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="API base URL.")
-    parser.add_argument("--endpoint", required=True, help="Endpoint path, e.g. /api/pjsk/profile/.")
+    parser.add_argument("--endpoint", default="", help="Endpoint path, e.g. /api/pjsk/profile/.")
     parser.add_argument("--method", default="POST", choices=("POST", "GET"), help="HTTP method.")
     parser.add_argument(
         "--payload-file",
-        required=True,
+        default="",
         help="JSON file path. Supports a single object or a list of objects.",
     )
+    parser.add_argument(
+        "--mix",
+        action="append",
+        default=[],
+        help="Extra target in ENDPOINT=PAYLOAD_FILE format for mixed load. Can be repeated.",
+    )
+    parser.add_argument(
+        "--pool-stats",
+        action="store_true",
+        help="Append the server's drawing-pool queue wait per class (GET /render-stats) to the summary.",
+    )
     parser.add_argument("--requests", type=int, default=100, help="Total request count.")
     parser.add_argument("--concurrency", type=int, default=16, help="Concurrent workers.")
     parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout seconds.")
@@ -96,6 +119,22 @@ def load_payloads(payload_file: str) -> list[dict[str, Any]]:
     raise ValueError("payload file must be a JSON object or a list of JSON objects")
 
 
+def load_targets(endpoint: str, payload_file: str, mix: list[str]) -> list[tuple[str, list[dict[str, Any]]]]:
+    targets: list[tuple[str, list[dict[str, Any]]]] = []
+    if endpoint or payload_file:
+        if not (endpoint and payload_file):
+            raise ValueError("--endpoint and --payload-file must be given together")
+        targets.append((endpoint, load_payloads(payload_file)))
+    for item in mix:
+        if "=" not in item:
+            raise ValueError(f"Invalid --mix value: {item}. Use ENDPOINT=PAYLOAD_FILE.")
+        mix_endpoint, mix_file = item.split("=", 1)
+        targets.append((mix_endpoint.strip(), load_payloads(mix_file.strip())))
+    if not targets:
+        raise ValueError("give --endpoint/--payload-file or at least one --mix")
+    return targets
+
+
 def get_output_dir(cli_value: str) -> Path:
     if cli_value:
         out = Path(cli_value)
@@ -151,6 +190,7 @@ async def fire_one(
     *,
     index: int,
     method: str,
+    endpoint: str,
     url: str,
     payload: dict[str, Any],
     out_dir: Path,
@@ -162,15 +202,16 @@ async def fire_one(
             async with session.get(url, params=payload) as resp:
                 body = await resp.read()
                 elapsed_ms = (time.perf_counter() - started) * 1000
-                return await save_response(index, resp, body, elapsed_ms, out_dir, save_errors)
+                return await save_response(index, endpoint, resp, body, elapsed_ms, out_dir, save_errors)
         async with session.post(url, json=payload) as resp:
             body = await resp.read()
             elapsed_ms = (time.perf_counter() - started) * 1000
-            return await save_response(index, resp, body, elapsed_ms, out_dir, save_errors)
+            return await save_response(index, endpoint, resp, body, elapsed_ms, out_dir, save_errors)
     except Exception as exc:
         elapsed_ms = (time.perf_counter() - started) * 1000
         return RequestResult(
             index=index,
+            endpoint=endpoint,
             status=None,
             elapsed_ms=elapsed_ms,
             ok=False,
@@ -183,6 +224,7 @@ async def fire_one(
 
 async def save_response(
     index: int,
+    endpoint: str,
     resp: aiohttp.ClientResponse,
     body: bytes,
     elapsed_ms: float,
@@ -205,8 +247,10 @@ async def save_response(
         path.write_bytes(body)
         file_path = str(path)
 
+    pool_wait = resp.headers.get(POOL_WAIT_HEADER)
     return RequestResult(
         index=index,
+        endpoint=endpoint,
         status=resp.status,
         elapsed_ms=elapsed_ms,
         ok=is_image,
@@ -214,9 +258,42 @@ async def save_response(
         response_bytes=len(body),
         content_type=content_type,
         error=None if is_image else f"status={resp.status}, content-type={content_type}",
+        pool_wait_ms=float(pool_wait) if pool_wait else None,
     )
 
 
+def latency_summary(values: list[float]) -> dict[str, float]:
+    return {
+        "avg": round(statistics.mean(values), 2) if values else 0.0,
+        "p50": round(percentile(values, 0.50), 2),
+        "p95": round(percentile(values, 0.95), 2),
+        "p99": round(percentile(values, 0.99), 2),
+        "max": round(max(values), 2) if values else 0.0,
+    }
+
+
+def endpoint_summary(results: list[RequestResult]) -> dict[str, Any]:
+    by_endpoint: dict[str, Any] = {}
+    for endpoint in dict.fromkeys(r.endpoint for r in results):
+        rows = [r for r in results if r.endpoint == endpoint]
+        waits = [r.pool_wait_ms for r in rows if r.pool_wait_ms is not None]
+        by_endpoint[endpoint] = {
+            "requests": len(rows),
+            "ok_images": sum(1 for r in rows if r.ok),
+            "latency_ms": latency_summary([r.elapsed_ms for r in rows if r.status is not None]),
+            "pool_wait_ms": latency_summary(waits) if waits else None,
+        }
+    return by_endpoint
+
+
+async def fetch_pool_stats(session: aiohttp.ClientSession, base_url: str) -> Any:
+    try:
+        async with session.get(build_url(base_url, "/render-stats")) as resp:
+            return (await resp.json()).get("pool_scheduler")
+    except Exception as exc:
+        return {"error": str(exc)}
+
+
 async def run() -> int:
     args = parse_args()
     if args.requests <= 0:
@@ -225,9 +302,8 @@ async def run() -> int:
         raise ValueError("--concurrency must be > 0")
 
     headers = parse_headers(args.header)
-    payloads = load_payloads(args.payload_file)
+    targets = load_targets(args.endpoint, args.payload_file, args.mix)
     out_dir = get_output_dir(args.output_dir)
-    url = build_url(args.base_url, args.endpoint)
 
     timeout = aiohttp.ClientTimeout(total=args.timeout)
     connector = aiohttp.TCPConnector(limit=args.concurrency, ssl=not args.insecure)
@@ -237,12 +313,14 @@ async def run() -> int:
 
         async def wrapped(idx: int) -> RequestResult:
             async with sem:
-                payload = pick_payload(payloads, idx)
+                endpoint, payloads = targets[idx % len(targets)]
+                payload = pick_payload(payloads, idx // len(targets))
                 return await fire_one(
                     session,
                     index=idx,
                     method=args.method,
-                    url=url,
+                    endpoint=endpoint,
+                    url=build_url(args.base_url, endpoint),
                     payload=payload,
                     out_dir=out_dir,
                     save_errors=args.save_errors,
@@ -250,6 +328,7 @@ async def run() -> int:
 
         tasks = [asyncio.create_task(wrapped(i)) for i in range(args.requests)]
         results = await asyncio.gather(*tasks)
+        pool_stats = await fetch_pool_stats(session, args.base_url) if args.pool_stats else None
 
     results.sort(key=lambda x: x.index)
     elapsed_list = [r.elapsed_ms for r in results if r.status is not None]
@@ -262,22 +341,19 @@ async def run() -> int:
         status_counts[key] = status_counts.get(key, 0) + 1
 
     summary = {
-        "url": url,
+        "url": build_url(args.base_url, targets[0][0]) if len(targets) == 1 else None,
         "method": args.method,
         "requests": args.requests,
         "concurrency": args.concurrency,
         "ok_images": ok_count,
         "failed": fail_count,
         "status_counts": status_counts,
-        "latency_ms": {
-            "avg": round(statistics.mean(elapsed_list), 2) if elapsed_list else 0.0,
-            "p50": round(percentile(elapsed_list, 0.50), 2),
-            "p95": round(percentile(elapsed_list, 0.95), 2),
-            "p99": round(percentile(elapsed_list, 0.99), 2),
-            "max": round(max(elapsed_list), 2) if elapsed_list else 0.0,
-        },
+        "latency_ms": latency_summary(elapsed_list),
+        "by_endpoint": endpoint_summary(results),
         "output_dir": str(out_dir.resolve()),
     }
+    if pool_stats is not None:
+        summary["pool_scheduler"] = pool_stats
 
     (out_dir / "summary.json").write_text(
         json.dumps(summary, ensure_ascii=False, indent=2),
@@ -286,13 +362,28 @@ async def run() -> int:
 
     with (out_dir / "results.csv").open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow(["index", "status", "elapsed_ms", "ok", "bytes", "content_type", "response_path", "error"])
+        writer.writerow(
+            [
+                "index",
+                "endpoint",
+                "status",
+                "elapsed_ms",
+                "pool_wait_ms",
+                "ok",
+                "bytes",
+                "content_type",
+                "response_path",
+                "error",
+            ]
+        )
         for r in results:
             writer.writerow(
                 [
                     r.index,
+                    r.endpoint,
                     r.status if r.status is not None else "",
                     f"{r.elapsed_ms:.2f}",
+                    "" if r.pool_wait_ms is None else f"{r.pool_wait_ms:.1f}",
                     int(r.ok),
                     r.response_bytes,
                     r.content_type or "",
@@ -23,8 +23,18 @@ So: both sides produce RESPONSE BYTES, both start warm (the state a live process
     cold   every cache cleared before every render — first-request latency
     warm   caches hot — steady state, which is what production runs in (default)
 
+The triangle background gets cases of its own (`triangle_bg_<mode>_<w>x<h>`): a `Canvas` holding
+nothing but `RandomTriangleBg`, at the common page sizes, in both palettes. Every drawing endpoint
+opens with it, so its cost is inside every row above; these rows isolate it, with the background
+caches (`TRIANGLE_BG_CACHE` for Pillow, the native background cache for Skia) hot when warm and
+cleared when cold.
+
+`--png-profiles` adds a size/time table of the native PNG encode profiles (fastest / balanced /
+smallest) per case: encoded bytes and the encode's own seconds, both read back from
+`native_metrics`, min of N. The pixels are identical across profiles, so this is the whole trade.
+
 Run (repo root):
-    uv run python -X gil=0 scripts/skia_bench.py [--cold] [--reps 3] [--only a,b]
+    uv run python -X gil=0 scripts/skia_bench.py [--cold] [--reps 3] [--only a,b] [--png-profiles]
 """
 
 from __future__ import annotations
@@ -47,11 +57,35 @@ if str(REPO_ROOT) not in sys.path:
 
 from scripts.skia_parity_sweep import CASES, _load_mysekai_real, setup
 from scripts.skia_warm_parity import _bind, clear_all_caches
+from src.core.debug import set_png_encode_profile
 from src.core.utils import _encode_image
+from src.sekai.base.plot import Canvas, RandomTriangleBg
+from src.sekai.skia_renderer.canvas import render_canvas_payload
 from src.sekai.skia_renderer.payload_cache import clear_skia_payload_cache
-from src.settings import EXPORT_IMAGE_FORMAT, JPG_QUALITY
+from src.settings import EXPORT_IMAGE_FORMAT, JPG_QUALITY, PNG_ENCODE_PROFILES
 
 OUT = REPO_ROOT / "out" / "skia-bench"
+TRIANGLE_BG_SIZES = [(600, 800), (1000, 1400), (1400, 2000)]
+TRIANGLE_BG_MODES = {"time": RandomTriangleBg(True), "hue": RandomTriangleBg(False, main_hue=0.05)}
+
+
+async def _min_of_alternating(name: str, pillow_bytes, skia_bytes, *, reps: int, cold: bool) -> dict | None:
+    if not cold:  # warm both paths first; production never renders into an empty cache twice
+        await pillow_bytes()
+        if await skia_bytes() is None:
+            return None
+
+    p_times, s_times = [], []
+    for i in range(reps):
+        # alternate, so neither backend systematically warms the OS page cache for the other
+        for backend in ("pillow", "skia") if i % 2 == 0 else ("skia", "pillow"):
+            t = await (pillow_bytes() if backend == "pillow" else skia_bytes())
+            if t is None:
+                return None
+            (p_times if backend == "pillow" else s_times).append(t)
+
+    p, s = min(p_times), min(s_times)
+    return {"endpoint": name, "pillow": p, "skia": s, "speedup": p / s}
 
 
 async def bench_case(case, req, drawer, tr_mod, *, reps: int, cold: bool) -> dict | None:
@@ -82,22 +116,71 @@ async def bench_case(case, req, drawer, tr_mod, *, reps: int, cold: bool) -> dic
 
     if not case.try_render:
         return None
-    if not cold:  # warm both paths first; production never renders into an empty cache twice
-        await pillow_bytes()
-        if await skia_bytes() is None:
+    return await _min_of_alternating(case.name, pillow_bytes, skia_bytes, reps=reps, cold=cold)
+
+
+async def bench_triangle_bg(mode: str, size: tuple[int, int], *, reps: int, cold: bool) -> dict | None:
+    """A background-only page through both backends, response bytes on both sides."""
+
+    def canvas() -> Canvas:
+        return Canvas(*size, bg=TRIANGLE_BG_MODES[mode])
+
+    async def pillow_bytes() -> float:
+        if cold:
+            clear_all_caches()
+        t0 = time.perf_counter()
+        _encode_image(await canvas().get_img(), EXPORT_IMAGE_FORMAT, JPG_QUALITY)
+        return time.perf_counter() - t0
+
+    async def skia_bytes() -> float | None:
+        if cold:
+            clear_all_caches()
+        t0 = time.perf_counter()
+        if await render_canvas_payload(canvas(), endpoint="bench_triangle_bg") is None:
             return None
+        return time.perf_counter() - t0
 
-    p_times, s_times = [], []
-    for i in range(reps):
-        # alternate, so neither backend systematically warms the OS page cache for the other
-        for backend in ("pillow", "skia") if i % 2 == 0 else ("skia", "pillow"):
-            t = await (pillow_bytes() if backend == "pillow" else skia_bytes())
-            if t is None:
-                return None
-            (p_times if backend == "pillow" else s_times).append(t)
+    name = f"triangle_bg_{mode}_{size[0]}x{size[1]}"
+    return await _min_of_alternating(name, pillow_bytes, skia_bytes, reps=reps, cold=cold)
 
-    p, s = min(p_times), min(s_times)
-    return {"endpoint": case.name, "pillow": p, "skia": s, "speedup": p / s}
+
+async def bench_png_profiles(case, req, drawer, tr_mod, *, reps: int) -> dict | None:
+    """Encoded bytes + encode seconds per PNG profile, read from the payload's native_metrics."""
+    if not case.try_render:
+        return None
+    row: dict = {"endpoint": case.name}
+    for profile in PNG_ENCODE_PROFILES:
+        set_png_encode_profile(profile)
+        try:
+            best: tuple[float, int] | None = None
+            for _ in range(reps):
+                clear_skia_payload_cache()  # honor would otherwise hit its payload cache
+                payload = await getattr(tr_mod, case.try_render)(req)
+                if payload is None:
+                    return None
+                metrics = payload.native_metrics or {}
+                elapsed = float(metrics.get("encode_elapsed", payload.encode_elapsed))
+                size = int(metrics.get("encoded_bytes", len(payload.image_bytes)))
+                if best is None or elapsed < best[0]:
+                    best = (elapsed, size)
+        finally:
+            set_png_encode_profile(None)
+        row[profile] = {"encode": best[0], "bytes": best[1]}
+    return row
+
+
+def _print_png_profile_table(rows: list[dict]) -> None:
+    header = "".join(f"{p:>24s}" for p in PNG_ENCODE_PROFILES)
+    print(f"\n=== PNG encode profiles ({len(rows)} cases): KiB / encode ms")  # noqa: T201
+    print(f"  {'endpoint':30s}{header}")  # noqa: T201
+    for row in rows:
+        cells = "".join(f"{row[p]['bytes'] / 1024:12.1f} / {row[p]['encode'] * 1000:7.1f}" for p in PNG_ENCODE_PROFILES)
+        print(f"  {row['endpoint']:30s}{cells}")  # noqa: T201
+    totals = "".join(
+        f"{sum(r[p]['bytes'] for r in rows) / 1024:12.1f} / {sum(r[p]['encode'] for r in rows) * 1000:7.1f}"
+        for p in PNG_ENCODE_PROFILES
+    )
+    print(f"  {'total':30s}{totals}")  # noqa: T201
 
 
 async def main() -> int:
@@ -105,6 +188,7 @@ async def main() -> int:
     ap.add_argument("--cold", action="store_true", help="clear every cache before every render")
     ap.add_argument("--reps", type=int, default=3)
     ap.add_argument("--only", default="")
+    ap.add_argument("--png-profiles", action="store_true", help="also tabulate size/time per PNG encode profile")
     args = ap.parse_args()
 
     setup()
@@ -113,6 +197,14 @@ async def main() -> int:
     clear_all_caches()
 
     rows = []
+    profile_rows = []
+
+    def _print_row(row: dict) -> None:
+        print(  # noqa: T201
+            f"  {row['endpoint']:30s} pillow {row['pillow'] * 1000:7.1f}ms   "
+            f"skia {row['skia'] * 1000:7.1f}ms   {row['speedup']:5.2f}x"
+        )
+
     for case in CASES:
         if names and case.name not in names:
             continue
@@ -127,10 +219,21 @@ async def main() -> int:
         if row is None:
             continue
         rows.append(row)
-        print(  # noqa: T201
-            f"  {row['endpoint']:30s} pillow {row['pillow'] * 1000:7.1f}ms   "
-            f"skia {row['skia'] * 1000:7.1f}ms   {row['speedup']:5.2f}x"
-        )
+        _print_row(row)
+        if args.png_profiles:
+            profile_row = await bench_png_profiles(case, *bound[1:], reps=args.reps)
+            if profile_row is not None:
+                profile_rows.append(profile_row)
+
+    for mode in TRIANGLE_BG_MODES:
+        for size in TRIANGLE_BG_SIZES:
+            if names and f"triangle_bg_{mode}_{size[0]}x{size[1]}" not in names:
+                continue
+            row = await bench_triangle_bg(mode, size, reps=args.reps, cold=args.cold)
+            if row is None:
+                continue
+            rows.append(row)
+            _print_row(row)
 
     if not rows:
         print("no cases benchmarked")  # noqa: T201
@@ -153,6 +256,10 @@ async def main() -> int:
     print(f"  speedup  median {statistics.median(sp):.2f}x   best {max(sp):.2f}x   worst {min(sp):.2f}x")  # noqa: T201
     print(f"  Skia slower on: {len(slower)}{' -> ' + str(slower) if slower else ''}")  # noqa: T201
     print(f"  results: {OUT / 'results.json'}")  # noqa: T201
+    if profile_rows:
+        (OUT / "png_profiles.json").write_text(json.dumps(profile_rows, indent=1), encoding="utf-8")
+        _print_png_profile_table(profile_rows)
+        print(f"  results: {OUT / 'png_profiles.json'}")  # noqa: T201
     return 0
 
 
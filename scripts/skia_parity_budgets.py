@@ -11,6 +11,16 @@ separately calibrated p99 ceiling for its dense 23–31 px native Rodin text and
 26-cell rank grid; its accepted native-pure baseline is mean=1.307/p99=37. The symbol/stamps fixtures are
 not captured yet, but still need an explicit budget before they can enter the
 strict gate.
+
+``NATIVE_PURE_CASES`` is the purity ratchet: cases whose Skia render recorded no Pillow touch
+(``src/core/pillow_telemetry.py``) when accepted. A listed case that renders hybrid is a
+``purity-regression``; a case joins the set once its sweep row reports ``purity: pure``.
+Besides the custom-profile cases it holds chart and honor, whose Skia shells measure their
+watermark with the wheel's ``measure_text_batch`` (``painter.native_text_width``) instead of
+``get_text_size``. honor_fcap still lays out its level text through Painter's Pillow metrics, and
+every Canvas route does the same; moving those to native measurement is the rest of
+docs/pillow-retirement-roadmap.md step 1. The sweep summary lists the cases left with
+``pillow_text_metric`` alone, which join then.
 """
 
 from __future__ import annotations
@@ -84,3 +94,12 @@ PARITY_BUDGETS: dict[str, tuple[float, float]] = {
     "stamp_list": (6.555, 130.1),
     "vlive_list": (1.002, 9.4),
 }
+
+NATIVE_PURE_CASES: frozenset[str] = frozenset(
+    {
+        "chart",
+        "custom_profile_card",
+        "custom_profile_card_collections",
+        "honor",
+    }
+)
@@ -15,14 +15,16 @@ For every payload the harness:
     payload = await try_render_X_payload(req)       # Skia shadow-layer path
     diff(pil, decode(payload)) -> mean/max/p99/p999 ; save <name>_sbs.png
 
-Result rows: {endpoint, status, size_*, mean, max, p99, p999, sbs, note?, error?}.
+Result rows: {endpoint, status, size_*, mean, max, p99, p999, sbs, purity, pillow_touches, note?, error?}.
 No timings: this is a correctness gate, and the ones it used to print were misleading
 in both directions at once (see run_case). Benchmarking is scripts/skia_bench.py.
-Statuses: ok / over-budget / size-mismatch / skia-none /
+Statuses: ok / over-budget / purity-regression / size-mismatch / skia-none /
 pillow-only / pillow-none / pillow-error / skia-error / build-error /
 harness-error / skipped / no-payload.
 (``over-budget``: a Case whose skia-vs-pillow diff exceeds its explicit
 ``budget=(mean, p99)`` ceiling; counts as a failure.)
+(``purity-regression``: a Case in ``NATIVE_PURE_CASES`` whose Skia render touched Pillow;
+counts as a failure. ``purity``/``pillow_touches`` are recorded on every rendered row.)
 
 Known deviations (not failures in the default development mode):
 - ``mysekai_*`` (except housing-competition): needs the gitignored
@@ -70,7 +72,15 @@ if str(REPO_ROOT) not in sys.path:
 import numpy as np
 from PIL import Image, ImageChops
 
-from scripts.skia_parity_budgets import PARITY_BUDGETS
+from scripts.skia_parity_budgets import NATIVE_PURE_CASES, PARITY_BUDGETS
+from src.core.pillow_telemetry import (
+    PILLOW_TOUCH_TEXT_METRIC,
+    PillowTouchSnapshot,
+    begin_pillow_touch_scope,
+    end_pillow_touch_scope,
+    get_last_pillow_touch_snapshot,
+    take_pillow_touch_snapshot,
+)
 from src.settings import settings
 
 PAYLOAD_DIR = REPO_ROOT / "out" / "parity-payloads"
@@ -106,6 +116,7 @@ class Case:
     route_watermark: bool = False  # the route appends a raster watermark footer after compose
     note: str | None = None
     budget: tuple[float, float] | None = None  # None is tolerated only outside --strict.
+    native_pure: bool = False  # a Pillow touch on the Skia path is a purity-regression
 
 
 def _case(
@@ -133,6 +144,7 @@ def _case(
         route_watermark=route_watermark,
         note=note,
         budget=PARITY_BUDGETS.get(name),
+        native_pure=name in NATIVE_PURE_CASES,
     )
 
 
@@ -437,13 +449,19 @@ async def run_case(case: Case, req, compose, try_render, out_dir: Path) -> dict:
         _to_rgb(pil).save(pillow_png)
         row["pillow_png"] = pillow_png.name
         return row
+    # A fresh Pillow-touch scope, as a request would get. The render's own record_render consumes
+    # the scope; anything recorded after that is still pending, so the row sees both.
+    token = begin_pillow_touch_scope()
     try:
         payload = await try_render(req)
+        touches = _merge_touches(get_last_pillow_touch_snapshot(), take_pillow_touch_snapshot())
     except Exception as exc:
         row["status"] = "skia-error"
         row["error"] = f"{type(exc).__name__}: {exc}"
         row["trace"] = traceback.format_exc(limit=6)
         return row
+    finally:
+        end_pillow_touch_scope(token)
     if payload is None:
         row["status"] = "skia-none"  # gate off / unsupported op / known-blocked fence
         return row
@@ -461,10 +479,25 @@ async def run_case(case: Case, req, compose, try_render, out_dir: Path) -> dict:
                 f"diff over budget: mean {stats['mean']} (budget {mean_budget}), "
                 f"p99 {stats['p99']} (budget {p99_budget})"
             )
+    row["purity"] = touches.native_purity
+    row["pillow_touches"] = touches.counts
+    if row["status"] == "ok" and case.native_pure and touches.counts:
+        row["status"] = "purity-regression"
+        row["error"] = "native-pure case touched Pillow: " + ", ".join(
+            f"{reason}={count}" for reason, count in sorted(touches.counts.items())
+        )
     row["sbs"] = _save_sbs(out_dir, case.name, pil, skia)
     return row
 
 
+def _merge_touches(*snapshots: PillowTouchSnapshot) -> PillowTouchSnapshot:
+    counts: dict[str, int] = {}
+    for snapshot in snapshots:
+        for reason, count in snapshot.counts.items():
+            counts[reason] = counts.get(reason, 0) + count
+    return PillowTouchSnapshot.from_counts(counts)
+
+
 async def _run_one(case: Case, mysekai_real, out_dir: Path) -> dict:
     raw = _load_payload(case.name)
     if raw is None:
@@ -532,6 +565,10 @@ def _strict_gate_issues(rows: list[dict], fixture_names: set[str], only: set[str
     if unused_budgets:
         issues.append(f"parity budgets without CASES entries: {unused_budgets}")
 
+    unknown_pure = sorted(NATIVE_PURE_CASES - case_name_set)
+    if unknown_pure:
+        issues.append(f"native-pure cases without CASES entries: {unknown_pure}")
+
     unmapped_fixtures = sorted(fixture_names - case_name_set)
     if unmapped_fixtures:
         issues.append(f"fixtures without CASES mappings: {unmapped_fixtures}")
@@ -569,6 +606,7 @@ def _summary_group_key(row: dict) -> str:
 _STATUS_ORDER = (
     "ok",
     "over-budget",
+    "purity-regression",
     "size-mismatch",
     "skia-none",
     "skia-none (known-blocked)",
@@ -583,6 +621,27 @@ _STATUS_ORDER = (
 )
 
 
+def ratchet_candidates(rows: list[dict]) -> dict[str, list[str]]:
+    """Unlisted ``ok`` rows by what still keeps them out of ``NATIVE_PURE_CASES``.
+
+    ``ready`` rendered pure and can join the ratchet now. ``text_metric_only`` touched Pillow for
+    text measurement alone (the watermark is measured with Pillow on every Canvas route), so they
+    join once text metrics go native rather than with any image-probe or raster work.
+    """
+    ready: list[str] = []
+    text_metric_only: list[str] = []
+    for row in rows:
+        name = str(row.get("endpoint", ""))
+        if row.get("status") != "ok" or name in NATIVE_PURE_CASES or "purity" not in row:
+            continue
+        touches = row.get("pillow_touches") or {}
+        if row["purity"] == "pure":
+            ready.append(name)
+        elif set(touches) == {PILLOW_TOUCH_TEXT_METRIC}:
+            text_metric_only.append(name)
+    return {"ready": sorted(ready), "text_metric_only": sorted(text_metric_only)}
+
+
 def write_summary_md(
     rows: list[dict],
     out_dir: Path,
@@ -626,6 +685,17 @@ def write_summary_md(
             note = row.get("note") or row.get("error") or ""
             lines.append(f"| {row['endpoint']} | {size} | {_fmt(row.get('mean'))} | {_fmt(row.get('p99'))} | {note} |")
         lines.append("")
+    candidates = ratchet_candidates(rows)
+    if any(candidates.values()):
+        lines.extend(
+            [
+                "## Native-purity ratchet candidates",
+                "",
+                f"- pure, not yet in `NATIVE_PURE_CASES`: {', '.join(candidates['ready']) or '-'}",
+                f"- only `{PILLOW_TOUCH_TEXT_METRIC}` left: {', '.join(candidates['text_metric_only']) or '-'}",
+                "",
+            ]
+        )
     path = out_dir / "SUMMARY.md"
     path.write_text("\n".join(lines), encoding="utf-8")
     return path
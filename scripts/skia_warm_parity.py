@@ -81,6 +81,7 @@ from scripts.skia_parity_sweep import (
     setup,
 )
 from src.sekai.base import utils as base_utils
+from src.sekai.base.triangle_bg import clear_triangle_bg_cache
 from src.sekai.skia_renderer.payload_cache import clear_skia_payload_cache
 
 OUT_DIR = REPO_ROOT / "out" / "warm-parity"
@@ -98,6 +99,7 @@ def clear_all_caches() -> None:
     base_utils._composed_image_cache.clear()
     base_utils._load_asset_image_ref_cached.cache_clear()
     clear_skia_payload_cache()
+    clear_triangle_bg_cache()
 
     # The native Moka raster cache lives in the Rust process, not in any Python dict.
     try:
@@ -0,0 +1,247 @@
+"""Cost-model admission control: admit requests against a budget of predicted render seconds.
+
+``should_reject_for_overload`` counts in-flight requests, and a request is a request: a card box
+of 300 cards or a deck recommendation costs a hundred stamp lists, so one fixed inflight cap
+either lets a burst of heavy work through or turns away cheap work the server had room for.
+
+Here every request gets a predicted cost in seconds from its path and the size of its payload
+(``payload_item_count``: list entries at the top two levels of the JSON body, which is what drives
+the canvas area of every list/box page). The predictor is one small online least-squares line per
+path, ``seconds ~ intercept + slope * items``, refit from the execution time of each admitted
+render (wall time minus its drawing-pool queue wait) with exponential forgetting, so it follows
+code and hardware changes without a deploy. Until a path has ``_MIN_OBSERVATIONS`` samples it is
+predicted at ``admission_default_cost_seconds``.
+
+The predicted costs of in-flight requests are summed against ``admission_cost_budget_seconds``.
+Heavy requests (predicted above ``admission_cheap_cost_seconds``) may only fill
+``admission_heavy_budget_fraction`` of it, which keeps headroom that only cheap requests can use:
+under load a stamp list is still admitted while the next card box waits. A rejection carries a
+``Retry-After`` of the time the pool needs to drain the excess. An idle server always admits one
+request, however expensive its prediction.
+
+The budget is off by default (0); the predictor runs regardless, because its class also orders the
+request's tasks in the drawing pool (``request_priority``, read by ``run_in_pool``). With the
+budget off the body is not parsed for its item count (that ``json.loads`` would run on the event
+loop for every request), so the predictor is a per-path mean. Predictor state and accuracy (mean
+absolute error per path) are served by ``/admission-stats``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import math
+import threading
+from typing import Any
+
+from src.settings import DEFAULT_THREAD_POOL_SIZE, settings
+
+# Exponential forgetting of the per-path regression sums: about the last 50 renders carry weight.
+_DECAY = 0.98
+_MIN_OBSERVATIONS = 5
+# Exponential average weight of the reported prediction error.
+_ERROR_ALPHA = 0.05
+_MAX_RETRY_AFTER_SECONDS = 60
+
+# Drawing-pool classes, lowest rank first (see ``request_priority``). Tasks submitted outside a
+# request (startup, heavy workers) are "default".
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_DEFAULT = "default"
+PRIORITY_BULK = "bulk"
+REQUEST_PRIORITIES: tuple[str, ...] = (PRIORITY_INTERACTIVE, PRIORITY_DEFAULT, PRIORITY_BULK)
+
+
+def admission_enabled() -> bool:
+    return settings.drawing.admission_cost_budget_seconds > 0
+
+
+def payload_item_count(body: bytes) -> int:
+    """List entries at the top two levels of a JSON body; 0 for anything that does not parse."""
+    if not body:
+        return 0
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, ValueError):
+        return 0
+    values = payload if isinstance(payload, list) else [payload]
+    count = len(payload) if isinstance(payload, list) else 0
+    for value in values:
+        if not isinstance(value, dict):
+            continue
+        for child in value.values():
+            if isinstance(child, list):
+                count += len(child)
+            elif isinstance(child, dict):
+                count += sum(len(grandchild) for grandchild in child.values() if isinstance(grandchild, list))
+    return count
+
+
+@dataclass(slots=True)
+class _PathModel:
+    """Decayed least-squares sums for one path plus its running prediction error."""
+
+    weight: float = 0.0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+    observations: int = 0
+    abs_error: float | None = None
+    rel_error: float | None = None
+
+    def coefficients(self) -> tuple[float, float] | None:
+        if self.observations < _MIN_OBSERVATIONS or self.weight <= 0:
+            return None
+        mean_x = self.sum_x / self.weight
+        mean_y = self.sum_y / self.weight
+        var_x = self.sum_xx / self.weight - mean_x * mean_x
+        slope = 0.0
+        if var_x > 1e-9:
+            slope = max(0.0, (self.sum_xy / self.weight - mean_x * mean_y) / var_x)
+        return max(0.0, mean_y - slope * mean_x), slope
+
+    def observe(self, items: int, seconds: float) -> None:
+        self.weight = self.weight * _DECAY + 1.0
+        self.sum_x = self.sum_x * _DECAY + items
+        self.sum_y = self.sum_y * _DECAY + seconds
+        self.sum_xx = self.sum_xx * _DECAY + items * items
+        self.sum_xy = self.sum_xy * _DECAY + items * seconds
+        self.observations += 1
+
+
+@dataclass(slots=True)
+class AdmissionTicket:
+    """One admitted request's reservation; hand it back to ``AdmissionController.release``."""
+
+    path: str
+    items: int
+    predicted_seconds: float
+    calibrated: bool
+
+
+class AdmissionController:
+    """Predicts request cost per path and admits requests against a budget of in-flight seconds."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: dict[str, _PathModel] = {}
+        self._inflight_seconds = 0.0
+        self._inflight_requests = 0
+        self._admitted = {"cheap": 0, "heavy": 0}
+        self._rejected = {"cheap": 0, "heavy": 0}
+
+    def predict(self, path: str, items: int) -> float:
+        with self._lock:
+            return self._predict_locked(path, items)[0]
+
+    def _predict_locked(self, path: str, items: int) -> tuple[float, bool]:
+        model = self._models.get(path)
+        coefficients = model.coefficients() if model is not None else None
+        if coefficients is None:
+            return settings.drawing.admission_default_cost_seconds, False
+        intercept, slope = coefficients
+        return intercept + slope * items, True
+
+    def try_admit(self, path: str, items: int) -> tuple[AdmissionTicket | None, int | None]:
+        """``(ticket, None)`` when admitted, ``(None, retry_after_seconds)`` when over budget.
+
+        With the budget off every request is admitted: the tickets still calibrate the predictor,
+        which also picks the request's drawing-pool priority."""
+        budget = settings.drawing.admission_cost_budget_seconds
+        with self._lock:
+            predicted, calibrated = self._predict_locked(path, items)
+            cheap = predicted <= settings.drawing.admission_cheap_cost_seconds
+            limit = budget if cheap else budget * settings.drawing.admission_heavy_budget_fraction
+            kind = "cheap" if cheap else "heavy"
+            if budget > 0 and self._inflight_requests > 0 and self._inflight_seconds + predicted > limit:
+                self._rejected[kind] += 1
+                excess = self._inflight_seconds + predicted - limit
+                return None, retry_after_seconds(excess)
+            self._admitted[kind] += 1
+            self._inflight_seconds += predicted
+            self._inflight_requests += 1
+            return AdmissionTicket(path, items, predicted, calibrated), None
+
+    def release(self, ticket: AdmissionTicket, observed_seconds: float | None) -> None:
+        """Return the reservation; ``observed_seconds`` (a completed render) calibrates the path."""
+        with self._lock:
+            self._inflight_requests -= 1
+            self._inflight_seconds = max(0.0, self._inflight_seconds - ticket.predicted_seconds)
+            if self._inflight_requests == 0:
+                self._inflight_seconds = 0.0  # drop float drift once the server is idle
+            if observed_seconds is None:
+                return
+            model = self._models.setdefault(ticket.path, _PathModel())
+            if model.coefficients() is not None:
+                abs_error = abs(ticket.predicted_seconds - observed_seconds)
+                rel_error = abs_error / max(observed_seconds, 1e-3)
+                model.abs_error = _ewma(model.abs_error, abs_error)
+                model.rel_error = _ewma(model.rel_error, rel_error)
+            model.observe(ticket.items, observed_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            paths = {}
+            for path, model in sorted(self._models.items()):
+                coefficients = model.coefficients()
+                paths[path] = {
+                    "observations": model.observations,
+                    "calibrated": coefficients is not None,
+                    "intercept_seconds": round(coefficients[0], 4) if coefficients else None,
+                    "seconds_per_item": round(coefficients[1], 6) if coefficients else None,
+                    "mean_abs_error_seconds": _round(model.abs_error),
+                    "mean_rel_error": _round(model.rel_error),
+                }
+            return {
+                "enabled": admission_enabled(),
+                "budget_seconds": settings.drawing.admission_cost_budget_seconds,
+                "cheap_cost_seconds": settings.drawing.admission_cheap_cost_seconds,
+                "heavy_budget_fraction": settings.drawing.admission_heavy_budget_fraction,
+                "inflight_requests": self._inflight_requests,
+                "inflight_predicted_seconds": round(self._inflight_seconds, 4),
+                "admitted": dict(self._admitted),
+                "rejected": dict(self._rejected),
+                "paths": paths,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._inflight_seconds = 0.0
+            self._inflight_requests = 0
+            self._admitted = {"cheap": 0, "heavy": 0}
+            self._rejected = {"cheap": 0, "heavy": 0}
+
+
+def request_priority(ticket: AdmissionTicket) -> str:
+    """Drawing-pool class of an admitted request: cheap predictions first, uncalibrated paths next."""
+    if not ticket.calibrated:
+        return PRIORITY_DEFAULT
+    if ticket.predicted_seconds <= settings.drawing.admission_cheap_cost_seconds:
+        return PRIORITY_INTERACTIVE
+    return PRIORITY_BULK
+
+
+def _ewma(previous: float | None, value: float) -> float:
+    return value if previous is None else previous + _ERROR_ALPHA * (value - previous)
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 4)
+
+
+def retry_after_seconds(excess_seconds: float) -> int:
+    """Seconds for the drawing pool to work off ``excess_seconds`` of predicted render time."""
+    drain = excess_seconds / max(1, DEFAULT_THREAD_POOL_SIZE)
+    return min(_MAX_RETRY_AFTER_SECONDS, max(1, math.ceil(drain)))
+
+
+ADMISSION = AdmissionController()
+
+
+def get_admission_stats() -> dict[str, Any]:
+    return ADMISSION.stats()
+
+
+def reset_admission_stats() -> None:
+    ADMISSION.reset()
@@ -0,0 +1,158 @@
+"""Opt-in conditional requests (``ETag`` / ``If-None-Match``) for rendered images.
+
+Apart from the watermark timestamp, a render is a pure function of the request body, the assets
+it names and the drawing code -- exactly what ``build_rendered_image_cache_key`` hashes for the
+composed-image cache. Hashing the same material (plus the watermark policy and the output-format
+settings) before the route runs gives a validator the caching proxy and the bot's retry loop can
+send back, and a match costs the key computation only: no layout, no render, no encode.
+
+Off by default and enabled per path prefix (``conditional_get_paths``), because "pure function"
+is the operator's call: a route that draws "now" into the body (vlive countdowns, sk
+predictions) must not be listed. The watermark is the one clock read every route shares, so it
+gets its own switch: a request without ``dt`` stamps the current time, and on a path listed in
+``conditional_get_fresh_watermark_paths`` such a request is never given an ETag. Elsewhere a
+clock-watermark render gets a weak validator (``W/"..."``): the image is the same apart from the
+printed time, but the bytes are not.
+
+A matching ``If-None-Match`` answers ``304`` on GET/HEAD and ``412`` on any other method (the
+render routes are POST), as RFC 9110 requires; either way nothing is rendered.
+"""
+
+import json
+import logging
+import threading
+from typing import Any
+
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "if-none-match"
+
+# Per-path outcomes, reported under ``conditional_get`` in /render-stats.
+OUTCOME_NOT_MODIFIED = "not_modified"  # If-None-Match matched on GET/HEAD: 304 without rendering
+OUTCOME_PRECONDITION_FAILED = "precondition_failed"  # matched on another method: 412 without rendering
+OUTCOME_ETAG_ISSUED = "etag_issued"  # rendered normally and tagged
+OUTCOME_FRESH_WATERMARK = "fresh_watermark"  # clock watermark on a fresh-watermark path: untagged
+
+CONDITIONAL_OUTCOMES: tuple[str, ...] = (
+    OUTCOME_NOT_MODIFIED,
+    OUTCOME_PRECONDITION_FAILED,
+    OUTCOME_ETAG_ISSUED,
+    OUTCOME_FRESH_WATERMARK,
+)
+
+_lock = threading.Lock()
+_counters: dict[str, dict[str, int]] = {}
+
+
+def _split_prefixes(value: str) -> list[str]:
+    return [prefix.strip() for prefix in value.split(",") if prefix.strip()]
+
+
+def _path_listed(path: str, prefixes: str) -> bool:
+    return any(path.startswith(prefix) for prefix in _split_prefixes(prefixes))
+
+
+def conditional_get_enabled(path: str) -> bool:
+    return _path_listed(path, settings.drawing.conditional_get_paths)
+
+
+def watermark_policy(material: Any) -> str:
+    """How the watermark of this request body is stamped, mirroring ``build_request_watermark_text``.
+
+    An explicit ``dt`` fixes the printed time (and it is already part of the key through the
+    body); without one the watermark reads the clock when it is drawn.
+    """
+    items = material if isinstance(material, list) else [material]
+    for item in items:
+        if isinstance(item, dict) and item.get("dt") is not None:
+            return "dt"
+    return "clock"
+
+
+def compute_render_etag(path: str, query: str, body: bytes) -> tuple[str | None, str | None]:
+    """``(etag, skip_outcome)`` for one request; both ``None`` when the path is not opted in.
+
+    Never raises: a body that does not parse as JSON simply gets no validator, and the route
+    produces its own 422. The validator is weak when the watermark reads the clock.
+    """
+    if not conditional_get_enabled(path):
+        return None, None
+    try:
+        material = json.loads(body) if body else None
+    except (UnicodeDecodeError, ValueError):
+        return None, None
+    policy = watermark_policy(material)
+    if policy == "clock" and _path_listed(path, settings.drawing.conditional_get_fresh_watermark_paths):
+        return None, OUTCOME_FRESH_WATERMARK
+    try:
+        from src.core.debug import current_png_encode_profile
+        from src.sekai.base.utils import build_rendered_image_cache_key, collect_asset_signatures
+        from src.settings import ASSETS_BASE_DIR
+
+        drawing = settings.drawing
+        key = build_rendered_image_cache_key(
+            "conditional_get",
+            {"path": path, "query": query, "body": material},
+            asset_signatures=collect_asset_signatures(ASSETS_BASE_DIR, material),
+            extra={
+                "watermark": policy,
+                # Everything that changes the response BYTES without changing the body: a strong
+                # validator promises byte-identical responses (a clock watermark gets a weak one).
+                "export_image_format": drawing.export_image_format,
+                "jpg_quality": drawing.jpg_quality,
+                "use_skia_plot": drawing.use_skia_plot,
+                "png_encode_profile": current_png_encode_profile() or drawing.png_encode_profile,
+                "png_encode_profile_endpoints": drawing.png_encode_profile_endpoints,
+            },
+        )
+    except Exception:
+        logger.warning("conditional request key failed for %s; serving without ETag", path, exc_info=True)
+        return None, None
+    opaque = f'"{key[:32]}"'
+    return (f"W/{opaque}" if policy == "clock" else opaque), None
+
+
+def if_none_match_matches(header: str | None, etag: str) -> bool:
+    """RFC 9110 weak comparison, which is what ``If-None-Match`` uses (``W/`` prefixes ignored)."""
+    if not header:
+        return False
+    etag = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def precondition_status(method: str) -> int:
+    """Status for a matching ``If-None-Match``: 304 for GET/HEAD, 412 for every other method."""
+    return 304 if method in ("GET", "HEAD") else 412
+
+
+def record_conditional_outcome(path: str, outcome: str) -> None:
+    with _lock:
+        bucket = _counters.get(path)
+        if bucket is None:
+            bucket = dict.fromkeys(CONDITIONAL_OUTCOMES, 0)
+            _counters[path] = bucket
+        bucket[outcome] += 1
+
+
+def get_conditional_get_stats() -> dict:
+    totals = dict.fromkeys(CONDITIONAL_OUTCOMES, 0)
+    with _lock:
+        paths = {path: dict(bucket) for path, bucket in sorted(_counters.items())}
+    for bucket in paths.values():
+        for outcome in CONDITIONAL_OUTCOMES:
+            totals[outcome] += bucket[outcome]
+    return {"paths": paths, "totals": totals}
+
+
+def reset_conditional_get_stats() -> None:
+    with _lock:
+        _counters.clear()
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
 import contextvars
 from dataclasses import dataclass
 import hashlib
@@ -12,16 +13,39 @@ from typing import Any
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-
+from fastapi.responses import JSONResponse, Response
+
+from src.core.admission import (
+    ADMISSION,
+    PRIORITY_DEFAULT,
+    REQUEST_PRIORITIES,
+    AdmissionTicket,
+    admission_enabled,
+    payload_item_count,
+    request_priority,
+)
+from src.core.conditional import (
+    ETAG_HEADER,
+    IF_NONE_MATCH_HEADER,
+    OUTCOME_ETAG_ISSUED,
+    OUTCOME_NOT_MODIFIED,
+    OUTCOME_PRECONDITION_FAILED,
+    compute_render_etag,
+    conditional_get_enabled,
+    if_none_match_matches,
+    precondition_status,
+    record_conditional_outcome,
+)
 from src.core.pillow_telemetry import begin_pillow_touch_scope, end_pillow_touch_scope
 from src.settings import (
     OVERLOAD_MAX_INFLIGHT_REQUESTS,
     OVERLOAD_RETRY_AFTER_SECONDS,
+    PNG_ENCODE_PROFILES,
     READINESS_UNHEALTHY_ASYNCIO_TASKS,
     READINESS_UNHEALTHY_CGROUP_PERCENT,
     READINESS_UNHEALTHY_INFLIGHT_REQUESTS,
     READINESS_UNHEALTHY_RSS_MB,
+    REQUEST_HARD_TIMEOUT_SECONDS,
 )
 
 logger = logging.getLogger("src.core.debug")
@@ -39,6 +63,27 @@ _render_backend_var: contextvars.ContextVar[str] = contextvars.ContextVar(
 )
 
 
+# Per-request override of the native PNG encode profile, taken from this header. ``None`` (no
+# header, or a value that is not a known profile) defers to the endpoint / global setting; see
+# ``src.sekai.skia_renderer.canvas.resolve_png_encode_profile``.
+PNG_ENCODE_PROFILE_HEADER = "x-haruki-png-profile"
+_png_encode_profile_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "drawing_png_encode_profile",
+    default=None,
+)
+
+
+# Total time this request's drawing-pool tasks spent queued, in milliseconds (summed over tasks,
+# so concurrent tasks of one request can add up to more than the request's wall time).
+POOL_WAIT_HEADER = "X-Haruki-Pool-Wait-Ms"
+
+# Set by routes that render while their body streams (``/profile/custom-profile-cards``): the
+# number of parts the body will carry. The middleware then keeps the request open until the last
+# part is sent: admission ticket, in-flight count, watchdog and request context are released by the
+# body, so the whole batch is one admitted, watched request, not an empty handler.
+STREAMED_PARTS_HEADER = "X-Haruki-Parts"
+
+
 @dataclass(slots=True)
 class RequestStageRef:
     value: str = "startup"
@@ -49,6 +94,25 @@ _request_stage_var: contextvars.ContextVar[RequestStageRef | None] = contextvars
     default=None,
 )
 
+
+@dataclass(slots=True)
+class RequestSchedulingRef:
+    """What ``run_in_pool`` reads to order this request's tasks (``priority`` is one of
+    ``REQUEST_PRIORITIES``, set from the admission cost model), and where it adds their queue wait.
+
+    Mutable and shared by reference, like :class:`RequestStageRef`, so the wait recorded by a pool
+    thread (running in a copied context) is visible to the middleware's response header."""
+
+    priority: str = PRIORITY_DEFAULT
+    deadline: float | None = None  # time.monotonic() after which queued tasks are dropped
+    pool_wait_seconds: float = 0.0
+
+
+_request_scheduling_var: contextvars.ContextVar[RequestSchedulingRef | None] = contextvars.ContextVar(
+    "drawing_request_scheduling",
+    default=None,
+)
+
 _inflight_lock = threading.Lock()
 _inflight_requests = 0
 
@@ -62,6 +126,7 @@ _EXEMPT_RUNTIME_GUARD_PATHS = frozenset(
         "/health",
         "/ready",
         "/cache/stats",
+        "/admission-stats",
         "/docs",
         "/redoc",
         "/openapi.json",
@@ -77,6 +142,8 @@ class RequestContextTokens:
     stage: contextvars.Token
     render_backend: contextvars.Token | None = None
     pillow_telemetry: contextvars.Token | None = None
+    png_encode_profile: contextvars.Token | None = None
+    scheduling: contextvars.Token | None = None
 
 
 def current_request_context() -> dict[str, str]:
@@ -89,7 +156,9 @@ def current_request_context() -> dict[str, str]:
     }
 
 
-def push_request_context(request_id: str, path: str, method: str) -> RequestContextTokens:
+def push_request_context(
+    request_id: str, path: str, method: str, *, png_encode_profile: str | None = None
+) -> RequestContextTokens:
     return RequestContextTokens(
         request_id=_request_id_var.set(request_id),
         path=_request_path_var.set(path),
@@ -97,6 +166,10 @@ def push_request_context(request_id: str, path: str, method: str) -> RequestCont
         stage=_request_stage_var.set(RequestStageRef("middleware")),
         render_backend=_render_backend_var.set(DEFAULT_RENDER_BACKEND),
         pillow_telemetry=begin_pillow_touch_scope(),
+        png_encode_profile=_png_encode_profile_var.set(normalize_png_encode_profile(png_encode_profile)),
+        scheduling=_request_scheduling_var.set(
+            RequestSchedulingRef(deadline=time.monotonic() + REQUEST_HARD_TIMEOUT_SECONDS)
+        ),
     )
 
 
@@ -109,6 +182,10 @@ def pop_request_context(tokens: RequestContextTokens) -> None:
     _request_stage_var.reset(tokens.stage)
     if tokens.render_backend is not None:
         _render_backend_var.reset(tokens.render_backend)
+    if tokens.png_encode_profile is not None:
+        _png_encode_profile_var.reset(tokens.png_encode_profile)
+    if tokens.scheduling is not None:
+        _request_scheduling_var.reset(tokens.scheduling)
 
 
 def set_render_backend(backend: str) -> None:
@@ -120,6 +197,32 @@ def current_render_backend() -> str:
     return _render_backend_var.get()
 
 
+def normalize_png_encode_profile(value: str | None) -> str | None:
+    """A known PNG encode profile name, or ``None``. Never raises: a typo in a client header
+    must fall back to the configured profile, not fail the render."""
+    cleaned = (value or "").strip().lower()
+    return cleaned if cleaned in PNG_ENCODE_PROFILES else None
+
+
+def set_png_encode_profile(profile: str | None) -> None:
+    """Override the PNG encode profile for the rest of this request (``None`` clears it)."""
+    _png_encode_profile_var.set(normalize_png_encode_profile(profile))
+
+
+def current_png_encode_profile() -> str | None:
+    return _png_encode_profile_var.get()
+
+
+def current_request_scheduling() -> RequestSchedulingRef | None:
+    return _request_scheduling_var.get()
+
+
+def set_request_priority(priority: str) -> None:
+    scheduling = _request_scheduling_var.get()
+    if scheduling is not None and priority in REQUEST_PRIORITIES:
+        scheduling.priority = priority
+
+
 def set_request_stage(stage: str) -> None:
     cleaned = (stage or "").strip() or "unknown"
     stage_ref = _request_stage_var.get()
@@ -320,10 +423,14 @@ def evaluate_runtime_readiness(metrics: dict[str, Any] | None = None) -> tuple[b
     return len(reasons) == 0, reasons, metrics
 
 
+def _runtime_guard_exempt(path: str) -> bool:
+    return path in _EXEMPT_RUNTIME_GUARD_PATHS or path.startswith("/docs/") or path.startswith("/redoc/")
+
+
 def should_reject_for_overload(path: str, inflight: int) -> str | None:
     if OVERLOAD_MAX_INFLIGHT_REQUESTS <= 0:
         return None
-    if path in _EXEMPT_RUNTIME_GUARD_PATHS or path.startswith("/docs/") or path.startswith("/redoc/"):
+    if _runtime_guard_exempt(path):
         return None
     if inflight > OVERLOAD_MAX_INFLIGHT_REQUESTS:
         return f"inflight {inflight} > {OVERLOAD_MAX_INFLIGHT_REQUESTS}"
@@ -489,6 +596,41 @@ def summarize_json_shape(value: Any, *, depth: int = 0) -> Any:
     return type(value).__name__
 
 
+@dataclass(slots=True)
+class _AdmissionClock:
+    """When an admitted request started executing, and how much drawing-pool queue wait it had
+    accrued by then. The cost model is calibrated with execution time, not wall time: a render that
+    sat behind others in the pool is not slow, and fitting the wait would raise the prediction of
+    every request on the path exactly when the pool is already saturated."""
+
+    started: float
+    scheduling: RequestSchedulingRef | None
+    pool_wait_at_start: float
+
+    @classmethod
+    def start(cls) -> "_AdmissionClock":
+        scheduling = current_request_scheduling()
+        return cls(time.perf_counter(), scheduling, scheduling.pool_wait_seconds if scheduling is not None else 0.0)
+
+    def execution_seconds(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        if self.scheduling is not None:
+            elapsed -= self.scheduling.pool_wait_seconds - self.pool_wait_at_start
+        return max(0.0, elapsed)
+
+
+async def _finish_request_after_body(
+    body: AsyncIterator[bytes], finish: Callable[[bool], Awaitable[None]]
+) -> AsyncIterator[bytes]:
+    completed = False
+    try:
+        async for chunk in body:
+            yield chunk
+        completed = True
+    finally:
+        await finish(completed)
+
+
 def install_debug_middleware(app: FastAPI) -> None:
     @app.middleware("http")
     async def _debug_request_middleware(request: Request, call_next):
@@ -498,6 +640,28 @@ def install_debug_middleware(app: FastAPI) -> None:
         tokens: RequestContextTokens | None = None
         watchdog: RequestWatchdog | None = None
         watchdog_task: asyncio.Task[None] | None = None
+        admission: AdmissionTicket | None = None
+        admission_clock: _AdmissionClock | None = None
+        rendered = False
+        streamed = False
+
+        async def _finish(completed: bool) -> None:
+            if admission is not None:
+                ADMISSION.release(admission, admission_clock.execution_seconds() if completed else None)
+            if watchdog is not None:
+                watchdog.cancel()
+            if watchdog_task is not None:
+                watchdog_task.cancel()
+                await asyncio.gather(watchdog_task, return_exceptions=True)
+            inflight_leave()
+            if tokens is not None:
+                try:
+                    pop_request_context(tokens)
+                except ValueError:
+                    # A stream abandoned mid-body is closed later by the event loop's async-generator
+                    # finalizer, in a context of its own; the request's variables went with its task.
+                    pass
+
         try:
             overload_reason = should_reject_for_overload(request.url.path, inflight_now)
             if overload_reason is not None:
@@ -526,7 +690,12 @@ def install_debug_middleware(app: FastAPI) -> None:
                     },
                 )
 
-            tokens = push_request_context(request_id, request.url.path, request.method)
+            tokens = push_request_context(
+                request_id,
+                request.url.path,
+                request.method,
+                png_encode_profile=request.headers.get(PNG_ENCODE_PROFILE_HEADER),
+            )
             watchdog = RequestWatchdog(
                 request_id=request_id,
                 method=request.method,
@@ -538,6 +707,45 @@ def install_debug_middleware(app: FastAPI) -> None:
             _dump_request_body(request.url.path, request_id, body)
             body_summary = summarize_request_body(body, request.headers.get("content-type"))
             focus_summary = extract_debug_request_focus(request.url.path, body, request.headers.get("content-type"))
+            # A revalidation that will answer 304/412 renders nothing, so it is settled before admission:
+            # it neither takes a share of the budget nor gets turned away by a full one.
+            etag = None
+            if conditional_get_enabled(request.url.path):
+                from src.sekai.base.utils import run_in_pool
+
+                set_request_stage("conditional_get")
+                etag, skipped = await run_in_pool(
+                    compute_render_etag, request.url.path, request.url.query, body, lane="short"
+                )
+                if skipped is not None:
+                    record_conditional_outcome(request.url.path, skipped)
+            not_modified = etag is not None and if_none_match_matches(request.headers.get(IF_NONE_MATCH_HEADER), etag)
+            if not not_modified and not _runtime_guard_exempt(request.url.path):
+                # Item counts only sharpen a budget decision; without a budget skip the event-loop parse.
+                items = payload_item_count(body) if admission_enabled() else 0
+                admission, retry_after = ADMISSION.try_admit(request.url.path, items)
+                if admission is None:
+                    predicted = ADMISSION.predict(request.url.path, items)
+                    logger.warning(
+                        "request.reject id=%s method=%s path=%s reason=cost predicted=%.3fs items=%s retry_after=%s",
+                        request_id,
+                        request.method,
+                        request.url.path,
+                        predicted,
+                        items,
+                        retry_after,
+                    )
+                    return JSONResponse(
+                        status_code=503,
+                        headers={"Retry-After": str(retry_after)},
+                        content={
+                            "status": "overloaded",
+                            "reason": f"predicted cost {predicted:.3f}s exceeds the admission budget",
+                            "inflight": inflight_now,
+                        },
+                    )
+                admission_clock = _AdmissionClock.start()
+                set_request_priority(request_priority(admission))
             start_metrics = snapshot_process_metrics(include_asyncio=True)
 
             logger.info(
@@ -552,8 +760,19 @@ def install_debug_middleware(app: FastAPI) -> None:
                 focus_summary,
                 start_metrics,
             )
-            set_request_stage("handler")
-            response = await call_next(request)
+            if not_modified:
+                status_code = precondition_status(request.method)
+                record_conditional_outcome(
+                    request.url.path, OUTCOME_NOT_MODIFIED if status_code == 304 else OUTCOME_PRECONDITION_FAILED
+                )
+                response = Response(status_code=status_code, headers={ETAG_HEADER: etag})
+            else:
+                set_request_stage("handler")
+                response = await call_next(request)
+                rendered = response.status_code == 200
+                if etag is not None and response.status_code == 200:
+                    response.headers[ETAG_HEADER] = etag
+                    record_conditional_outcome(request.url.path, OUTCOME_ETAG_ISSUED)
         except Exception:
             elapsed = time.perf_counter() - start
             end_metrics = snapshot_process_metrics(include_asyncio=True)
@@ -571,6 +790,9 @@ def install_debug_middleware(app: FastAPI) -> None:
         else:
             elapsed = time.perf_counter() - start
             end_metrics = snapshot_process_metrics(include_asyncio=True)
+            scheduling = current_request_scheduling()
+            if scheduling is not None and getattr(response, "headers", None) is not None:
+                response.headers[POOL_WAIT_HEADER] = f"{scheduling.pool_wait_seconds * 1000:.1f}"
             level = logging.WARNING if elapsed >= _SLOW_REQUEST_SECONDS else logging.INFO
             cache_stats = None
             if elapsed >= _SLOW_REQUEST_SECONDS:
@@ -596,13 +818,11 @@ def install_debug_middleware(app: FastAPI) -> None:
                 getattr(response, "headers", {}).get("content-type") if getattr(response, "headers", None) else None,
                 cache_stats,
             )
+            if rendered and STREAMED_PARTS_HEADER in response.headers:
+                set_request_stage("streaming")
+                response.body_iterator = _finish_request_after_body(response.body_iterator, _finish)
+                streamed = True
             return response
         finally:
-            if watchdog is not None:
-                watchdog.cancel()
-            if watchdog_task is not None:
-                watchdog_task.cancel()
-                await asyncio.gather(watchdog_task, return_exceptions=True)
-            inflight_leave()
-            if tokens is not None:
-                pop_request_context(tokens)
+            if not streamed:
+                await _finish(rendered)
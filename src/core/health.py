@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from src.core.admission import get_admission_stats
+from src.core.conditional import get_conditional_get_stats
 from src.core.debug import evaluate_runtime_readiness, runtime_readiness_thresholds
-from src.sekai.base.utils import get_runtime_cache_stats
+from src.sekai.base.utils import get_pool_scheduler_stats, get_runtime_cache_stats
 from src.sekai.skia_renderer.payload_cache import get_skia_payload_cache_stats
 from src.sekai.skia_renderer.render_stats import get_render_stats
 
@@ -52,9 +54,20 @@ async def cache_stats():
 
 @router.get("/render-stats")
 async def render_stats():
-    """Render outcomes plus native-pure/native-hybrid Pillow dependency telemetry."""
+    """Render outcomes plus native-pure/native-hybrid Pillow dependency telemetry and pool queue waits."""
     return {
         "status": "healthy",
         "renders": get_render_stats(),
         "skia_payload_cache": get_skia_payload_cache_stats(),
+        "conditional_get": get_conditional_get_stats(),
+        "pool_scheduler": get_pool_scheduler_stats(),
+    }
+
+
+@router.get("/admission-stats")
+async def admission_stats():
+    """Cost-model admission state: budget, in-flight predicted seconds and per-path accuracy."""
+    return {
+        "status": "healthy",
+        "admission": get_admission_stats(),
     }
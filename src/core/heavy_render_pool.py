@@ -49,6 +49,8 @@ class _WorkerTask:
     request_id: str
     request_path: str
     request_method: str
+    # The parent's per-request PNG profile override: contextvars do not cross the spawn boundary.
+    png_encode_profile: str | None = None
 
 
 @dataclass(slots=True)
@@ -92,7 +94,11 @@ def _encode_image_payload(image: Image.Image) -> EncodedImagePayload:
             media_type = "image/jpeg"
             filename = "image.jpg"
         else:
-            image.save(buffer, format="PNG")
+            # Lazy like the other src.core.debug consumers here: png_encode reads the request's
+            # PNG profile from it, and the worker module must not pull in the web layer at import.
+            from src.core.png_encode import save_png
+
+            save_png(image, buffer)
             media_type = "image/png"
             filename = "image.png"
     finally:
@@ -184,7 +190,12 @@ def _heavy_render_worker_main(
 
         from src.core.debug import pop_request_context, push_request_context, set_request_stage
 
-        tokens = push_request_context(task.request_id, task.request_path, task.request_method)
+        tokens = push_request_context(
+            task.request_id,
+            task.request_path,
+            task.request_method,
+            png_encode_profile=task.png_encode_profile,
+        )
         with heartbeat_at.get_lock():
             heartbeat_at.value = time.monotonic()
 
@@ -291,7 +302,7 @@ class HeavyRenderWorkerPool:
         logger.info("heavy render worker pool stopped")
 
     async def render(self, kind: HeavyTaskKind, payload: dict[str, Any]) -> EncodedImagePayload:
-        from src.core.debug import current_request_context
+        from src.core.debug import current_png_encode_profile, current_request_context
 
         request_ctx = current_request_context()
         slot = await self._acquire_slot(kind, request_ctx)
@@ -302,6 +313,7 @@ class HeavyRenderWorkerPool:
             request_id=request_ctx["request_id"],
             request_path=request_ctx["path"],
             request_method=request_ctx["method"],
+            png_encode_profile=current_png_encode_profile(),
         )
         slot.current_task_id = task.task_id
         slot.current_task_kind = kind
@@ -1,15 +1,28 @@
 import asyncio
+from collections.abc import AsyncIterator
+import json
 import logging
+import time
+from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
-from src.core.debug import set_request_stage
-from src.core.utils import encoded_image_payload_to_response, image_to_response
+from src.core.debug import STREAMED_PARTS_HEADER, current_render_backend, set_request_stage
+from src.core.image_payload import EncodedImagePayload
+from src.core.utils import encode_image_payload, encoded_image_payload_to_response, image_to_response
 from src.sekai.profile.custom_profile.drawer import compose_custom_profile_card_image
 from src.sekai.profile.custom_profile.limits import validate_custom_profile_card
 from src.sekai.profile.custom_profile.skia import try_render_custom_profile_card_payload
+from src.sekai.profile.custom_profile.split import (
+    build_profile_context,
+    custom_profile_output_name,
+    infer_profile_region,
+    normalize_profile_payload,
+    select_custom_profile_cards,
+)
 from src.sekai.profile.drawer import compose_profile_image, try_render_profile_payload
-from src.sekai.profile.model import CustomProfileCardRenderRequest, ProfileRequest
+from src.sekai.profile.model import CustomProfileCardRenderRequest, CustomProfileCardsRenderRequest, ProfileRequest
 from src.settings import (
     CUSTOM_PROFILE_MAX_CONCURRENT_REQUESTS,
     CUSTOM_PROFILE_MAX_ELEMENTS,
@@ -63,16 +76,20 @@ async def profile(request: ProfileRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _validate_custom_profile_card(card: dict) -> None:
+    validate_custom_profile_card(
+        card,
+        max_elements=CUSTOM_PROFILE_MAX_ELEMENTS,
+        max_scale=CUSTOM_PROFILE_MAX_SCALE,
+        max_text_size=CUSTOM_PROFILE_MAX_TEXT_SIZE,
+        max_text_length=CUSTOM_PROFILE_MAX_TEXT_LENGTH,
+    )
+
+
 @router.post("/custom-profile-card", summary="Generate custom profile card image")
 async def custom_profile_card(request: CustomProfileCardRenderRequest):
     try:
-        validate_custom_profile_card(
-            dict(request.card),
-            max_elements=CUSTOM_PROFILE_MAX_ELEMENTS,
-            max_scale=CUSTOM_PROFILE_MAX_SCALE,
-            max_text_size=CUSTOM_PROFILE_MAX_TEXT_SIZE,
-            max_text_length=CUSTOM_PROFILE_MAX_TEXT_LENGTH,
-        )
+        _validate_custom_profile_card(dict(request.card))
         async with _custom_profile_render_slots:
             set_request_stage("custom_profile_card:compose_image")
             # Skia-first: try_render never raises (fail-open records one outcome and returns None),
@@ -89,3 +106,119 @@ async def custom_profile_card(request: CustomProfileCardRenderRequest):
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _render_custom_profile_card_payload(request: CustomProfileCardRenderRequest) -> EncodedImagePayload:
+    """One card of a batch: the same Skia-first / Pillow-fallback order as ``/custom-profile-card``."""
+    async with _custom_profile_render_slots:
+        payload = await try_render_custom_profile_card_payload(request)
+        if payload is not None:
+            return payload
+        image = await compose_custom_profile_card_image(request)
+    return await encode_image_payload(image, export_format="png")
+
+
+def _multipart_part(boundary: str, headers: dict[str, str], body: bytes) -> bytes:
+    head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    return f"--{boundary}\r\n{head}Content-Length: {len(body)}\r\n\r\n".encode() + body + b"\r\n"
+
+
+async def _custom_profile_card_part(index: int, boundary: str, request: CustomProfileCardRenderRequest) -> bytes:
+    headers = {
+        "X-Haruki-Card-Index": str(index),
+        "X-Haruki-Card-Seq": str(int(request.card.get("seq", 0) or 0)),
+        "X-Haruki-Card-Id": str(int(request.card.get("customProfileCardId", 0) or 0)),
+    }
+    started = time.perf_counter()
+    try:
+        payload = await _render_custom_profile_card_payload(request)
+    except Exception as e:
+        # The part carries the status the single-card route would have answered with; the other
+        # cards of the profile are still delivered.
+        status = 400 if isinstance(e, ValueError) else 500
+        logger.warning("custom_profile_cards part=%d failed status=%d error=%s", index, status, e)
+        body = json.dumps({"status": status, "detail": str(e)}, ensure_ascii=False).encode("utf-8")
+        return _multipart_part(boundary, {"Content-Type": "application/json", **headers}, body)
+    backend = payload.backend or current_render_backend()
+    logger.info(
+        "custom_profile_cards part=%d backend=%s elapsed=%.3fs bytes=%d image=%sx%s",
+        index,
+        backend,
+        time.perf_counter() - started,
+        len(payload.image_bytes),
+        payload.image_width,
+        payload.image_height,
+    )
+    headers = {
+        "Content-Type": payload.media_type,
+        "Content-Disposition": f"inline; filename={custom_profile_output_name(request.card)}",
+        **headers,
+        "X-Haruki-Render-Backend": backend,
+    }
+    return _multipart_part(boundary, headers, payload.image_bytes)
+
+
+async def _stream_custom_profile_cards(
+    requests: list[CustomProfileCardRenderRequest], boundary: str
+) -> AsyncIterator[bytes]:
+    set_request_stage("custom_profile_cards:render")
+    tasks = [
+        asyncio.create_task(_custom_profile_card_part(index, boundary, request))
+        for index, request in enumerate(requests)
+    ]
+    try:
+        for next_part in asyncio.as_completed(tasks):
+            yield await next_part
+        yield f"--{boundary}--\r\n".encode()
+    finally:
+        # Client gone mid-stream: the cancelled cards' pool tasks are dropped before they start.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@router.post("/custom-profile-cards", summary="Generate custom profile card images for one profile")
+async def custom_profile_cards(request: CustomProfileCardsRenderRequest):
+    """
+    Render the selected custom profile cards of one profile as a ``multipart/mixed`` stream.
+
+    The profile is validated, split and its context built once; the cards then render
+    concurrently (each holding a ``custom_profile_max_concurrent_requests`` slot, like a
+    single-card request) and every part is sent as soon as its card is done, so parts arrive in
+    completion order. ``X-Haruki-Card-Index`` gives a part's position in the selection; a card
+    that fails after validation is an ``application/json`` part with its status and detail.
+    """
+    set_request_stage("custom_profile_cards:select")
+    try:
+        profile = normalize_profile_payload(request.profile)
+        cards = select_custom_profile_cards(
+            profile,
+            seq=request.seq,
+            custom_profile_id=request.custom_profile_id,
+            custom_profile_card_id=request.custom_profile_card_id,
+            all_cards=request.all_cards,
+        )
+        for card in cards:
+            _validate_custom_profile_card(card)
+        if not cards:
+            raise HTTPException(status_code=400, detail="no custom profile card matches the selection")
+        profile_context = build_profile_context(profile)
+        region = (request.region or infer_profile_region(profile) or "cn").lower()
+    except (TypeError, ValueError) as e:  # a malformed seq/id in the client's profile is its error, not ours
+        raise HTTPException(status_code=400, detail=str(e))
+    # One context and resource map shared by every card (construct skips re-validating them).
+    requests = [
+        CustomProfileCardRenderRequest.model_construct(
+            region=region,
+            card=card,
+            resources=request.resources,
+            profile_context=profile_context,
+        )
+        for card in cards
+    ]
+    boundary = uuid4().hex
+    return StreamingResponse(
+        _stream_custom_profile_cards(requests, boundary),
+        media_type=f"multipart/mixed; boundary={boundary}",
+        headers={STREAMED_PARTS_HEADER: str(len(requests))},
+    )
@@ -0,0 +1,55 @@
+"""PNG encoding for the Pillow fallback path.
+
+``Image.save(format="PNG")`` deflates on one core through zlib; a full card/box page spends
+hundreds of milliseconds there while the Skia path's mtpng encoder spreads the same work over
+every core. Large RGBA pages therefore go through the native wheel's ``encode_rgba_png`` (the
+exact encoder and profile tuning ``render_scene`` uses), and everything else -- small images,
+other modes, a missing or older wheel -- keeps the Pillow encoder.
+"""
+
+from functools import cache
+import importlib
+import logging
+from typing import IO, Any
+
+from src.core.debug import current_png_encode_profile
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# PNG_PROFILE_CAPABILITY 2 added the standalone encode_rgba_png entry point.
+_REQUIRED_NATIVE_PNG_PROFILE_CAPABILITY = 2
+
+
+@cache
+def _native_png_encoder() -> Any | None:
+    """The wheel's ``encode_rgba_png``, or ``None`` when the module is missing or too old.
+
+    Deliberately not ``load_native_renderer``: this API does not read scene IR, so a wheel whose
+    IR capability is behind this checkout can still encode. Resolved once per process.
+    """
+    try:
+        native = importlib.import_module("haruki_skia_renderer")
+    except ImportError:
+        return None
+    encode = getattr(native, "encode_rgba_png", None)
+    capability = int(getattr(native, "PNG_PROFILE_CAPABILITY", 0) or 0)
+    if capability < _REQUIRED_NATIVE_PNG_PROFILE_CAPABILITY or not callable(encode):
+        return None
+    return encode
+
+
+def save_png(image, buffer: IO[bytes]) -> None:
+    """Write ``image`` to ``buffer`` as PNG, in parallel when the native encoder applies."""
+    min_pixels = settings.drawing.pillow_native_png_min_pixels
+    if min_pixels > 0 and image.mode == "RGBA" and image.width * image.height >= min_pixels:
+        encode = _native_png_encoder()
+        if encode is not None:
+            profile = current_png_encode_profile() or settings.drawing.png_encode_profile
+            try:
+                buffer.write(encode(image.tobytes(), image.width, image.height, profile))
+                return
+            except (RuntimeError, ValueError):
+                # Nothing has been written yet: the Pillow encoder below still produces the image.
+                logger.exception("native PNG encode failed; falling back to Pillow")
+    image.save(buffer, format="PNG")
@@ -12,6 +12,7 @@ from src.core.debug import (
     snapshot_process_metrics,
 )
 from src.core.image_payload import EncodedImagePayload
+from src.core.png_encode import save_png
 from src.sekai.base.utils import run_in_pool
 from src.settings import EXPORT_IMAGE_FORMAT, JPG_QUALITY
 
@@ -40,7 +41,7 @@ def _encode_image(
             media_type = "image/jpeg"
             filename = "image.jpg"
         else:
-            image.save(buffer, format="PNG")
+            save_png(image, buffer)
             media_type = "image/png"
             filename = "image.png"
     finally:
@@ -99,6 +100,39 @@ async def image_to_response(
         buffer.close()
 
 
+async def encode_image_payload(
+    image,
+    export_format: str | None = None,
+    jpg_quality: int | None = None,
+) -> EncodedImagePayload:
+    """Encode a PIL Image off the event loop into a payload, for routes that send several images."""
+    image_width = getattr(image, "width", None)
+    image_height = getattr(image, "height", None)
+    image_mode = getattr(image, "mode", None)
+    started = time.perf_counter()
+    encoder = partial(
+        _encode_image,
+        image,
+        export_format if export_format is not None else EXPORT_IMAGE_FORMAT,
+        jpg_quality if jpg_quality is not None else JPG_QUALITY,
+    )
+    buffer, media_type, filename = await run_in_pool(encoder)
+    try:
+        image_bytes = buffer.getvalue()
+    finally:
+        buffer.close()
+    return EncodedImagePayload(
+        image_bytes=image_bytes,
+        media_type=media_type,
+        filename=filename,
+        image_width=image_width,
+        image_height=image_height,
+        image_mode=image_mode,
+        encode_elapsed=time.perf_counter() - started,
+        backend=current_render_backend(),
+    )
+
+
 def _image_response(image_bytes: bytes, media_type: str, filename: str) -> Response:
     """Send the encoded image as ONE body message.
 
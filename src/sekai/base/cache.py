@@ -0,0 +1,419 @@
+"""Process-level cache primitives shared by the renderers and drawers.
+
+``BoundedCache`` and ``ShardedBoundedCache`` are the in-memory LRU pools behind /cache/stats,
+``GlyphDiskStore`` their optional on-disk layer, and ``MISSING``/``file_signature`` the sentinel and
+file identity their keys are built from. They were written for the custom profile renderer
+(``src.sekai.profile.custom_profile.cache`` still re-exports them) and have no dependencies beyond
+the standard library, so any layer can import them.
+
+Design rules:
+- Keys carry file signatures ``(mtime_ns, size)`` for every file the cached value was derived
+  from, so an asset replaced in place by the asset updater invalidates the entry (CLAUDE.md
+  cache-key rule).
+- Locks only guard dict access, never computation. Concurrent misses on one key duplicate work
+  and last-write-wins; values are immutable so this is harmless.
+- Values are shared across threads without copying, so they must be effectively immutable
+  (frozen dataclasses, fully-materialized PIL images, numpy arrays with ``writeable=False``).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import hashlib
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+import tempfile
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FileSignature = tuple[int, int]
+# Recorded for probed-but-absent paths: a table/font that *arrives* later must invalidate the
+# entry just like a replaced one (the "placeholder cached until TTL" failure mode in CLAUDE.md).
+MISSING_FILE = (-1, -1)
+
+#: Sentinel distinguishing "not cached" from a cached ``None``. BoundedCache supports caching
+#: ``None``, but the glyph pools deliberately store only SUCCESSFUL renders: their None verdicts
+#: come from broad except blocks, and a transient failure cached under an unchanged file
+#: signature would poison the glyph for the process lifetime (negatives stay in the renderer's
+#: per-request L1 instead).
+MISSING: Any = object()
+
+
+def file_signature(path: Path | str) -> FileSignature:
+    """``(st_mtime_ns, st_size)`` of ``path``; raises ``OSError`` when it does not exist."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def optional_file_signature(path: Path | str) -> FileSignature:
+    """Like :func:`file_signature` but maps a missing path to :data:`MISSING_FILE`."""
+    try:
+        return file_signature(path)
+    except OSError:
+        return MISSING_FILE
+
+
+class BoundedCache:
+    """LRU cache bounded by entry count and estimated bytes, with /cache/stats counters.
+
+    Not ``_TTLImageCache``: no TTL (invalidation is by file signature in the key), no
+    copy-on-get (values are shared immutables), no ``close()`` of evicted values.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        estimate: Callable[[Any], int],
+        key_estimate: Callable[[Any], int] | None = None,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._estimate = estimate
+        # For pools whose keys, not values, carry the bulk (request text as a measurement key).
+        self._key_estimate = key_estimate
+        self._lock = threading.RLock()
+        self._data: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: Any) -> Any:
+        """The cached value, or :data:`MISSING`. A cached ``None`` is a hit."""
+        if not self.enabled:
+            return MISSING
+        with self._lock:
+            if key in self._data:
+                value, _ = self._data[key]
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+            return MISSING
+
+    def set(self, key: Any, value: Any) -> None:
+        if not self.enabled:
+            return
+        size = max(0, int(self._estimate(value)))
+        if self._key_estimate is not None:
+            size += max(0, int(self._key_estimate(key)))
+        if size > self.max_bytes:
+            return  # would evict the whole pool to hold one entry
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._sets += 1
+            while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        # Same key shape as src.sekai.base.utils._build_shared_cache_stats (not imported to keep
+        # this module lazily importable from there without a cycle).
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            total = hits + misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "sets": self._sets,
+                "evictions": self._evictions,
+                "hit_rate": (hits / total) if total > 0 else None,
+            }
+
+
+class ShardedBoundedCache:
+    """:class:`BoundedCache` split into lock-striped shards by key hash.
+
+    For pools hit from every pool thread on every widget (text measurement): one lock would
+    serialize the free-threaded workers on a dict probe. Each shard is an independent LRU holding
+    ``1/shards`` of the entry and byte budgets, so eviction is per-shard LRU rather than global
+    LRU — close enough for a cache whose keys hash uniformly. ``stats()`` sums the shards and has
+    the same shape as :meth:`BoundedCache.stats`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        estimate: Callable[[Any], int],
+        shards: int,
+        key_estimate: Callable[[Any], int] | None = None,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        count = max(1, shards)
+        self._shards = tuple(
+            BoundedCache(
+                f"{name}[{index}]",
+                -(-max_entries // count),
+                -(-max_bytes // count),
+                estimate,
+                key_estimate=key_estimate,
+            )
+            for index in range(count)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def _shard(self, key: Any) -> BoundedCache:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: Any) -> Any:
+        """The cached value, or :data:`MISSING`."""
+        if not self.enabled:
+            return MISSING
+        return self._shard(key).get(key)
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.enabled:
+            self._shard(key).set(key, value)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> dict[str, Any]:
+        totals = {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+        for shard in self._shards:
+            shard_stats = shard.stats()
+            for field in totals:
+                totals[field] += shard_stats[field]
+        total = totals["hits"] + totals["misses"]
+        return {
+            "enabled": self.enabled,
+            "entries": totals["entries"],
+            "max_entries": self.max_entries,
+            "bytes": totals["bytes"],
+            "max_bytes": self.max_bytes,
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "sets": totals["sets"],
+            "evictions": totals["evictions"],
+            "hit_rate": (totals["hits"] / total) if total > 0 else None,
+            "shards": len(self._shards),
+        }
+
+
+# ---- disk store ---------------------------------------------------------------------------------
+#
+# Files under a format-versioned directory, content-addressed by the caller's full key:
+#
+#     magic (8 bytes) | meta length (u32) | meta JSON | pad to 8 | payload
+#
+# ``get`` maps the file and hands back a memoryview of the payload, so a caller can build read-only
+# numpy arrays / PIL images straight on the mapping. Files are replaced atomically, a hit
+# refreshes the mtime (at most once a minute) and the store is swept oldest-mtime-first back to
+# 90% of ``max_bytes`` when a write takes it over. The byte total is tracked per process from one
+# scan; processes sharing the directory only make it approximate, never unbounded.
+
+_DISK_STORE_FORMAT = 1
+_DISK_STORE_MAGIC = b"HGLYPH01"
+_DISK_STORE_HEADER = struct.Struct("<8sI")
+_DISK_STORE_SUFFIX = ".glyph"
+_DISK_STORE_TOUCH_SECONDS = 60.0
+
+
+class GlyphDiskStore:
+    """Size-bounded, content-addressed files of generated data, read back through mmap.
+
+    Named for its first user, the custom-profile glyph store; layout snapshots and mip pyramids
+    use the same format.
+    """
+
+    def __init__(self, name: str, root: Path, max_bytes: int) -> None:
+        self.name = name
+        self.root = root
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._scanned_root: Path | None = None
+        self._bytes = 0
+        self._entries = 0
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._evictions = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _dir(self) -> Path:
+        return self.root / f"v{_DISK_STORE_FORMAT}"
+
+    def path_for(self, key: tuple[Any, ...]) -> Path:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return self._dir() / digest[:2] / f"{digest}{_DISK_STORE_SUFFIX}"
+
+    def get(self, key: tuple[Any, ...]) -> tuple[dict[str, Any], memoryview] | None:
+        if not self.enabled:
+            return None
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as fh:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            with self._lock:
+                self._misses += 1
+            return None
+        try:
+            magic, meta_len = _DISK_STORE_HEADER.unpack_from(mapped, 0)
+            if magic != _DISK_STORE_MAGIC:
+                raise ValueError("bad magic")
+            meta = json.loads(mapped[_DISK_STORE_HEADER.size : _DISK_STORE_HEADER.size + meta_len])
+            if meta.get("key") != repr(key):
+                raise ValueError("key mismatch")
+        except (ValueError, struct.error):
+            logger.warning("dropping unreadable %s entry %s", self.name, path)
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._errors += 1
+                self._misses += 1
+            return None
+        offset = _DISK_STORE_HEADER.size + meta_len
+        offset += -offset % 8
+        self._touch(path)
+        with self._lock:
+            self._hits += 1
+        return meta, memoryview(mapped)[offset:]
+
+    def set(self, key: tuple[Any, ...], meta: dict[str, Any], payload: bytes | memoryview) -> None:
+        if not self.enabled:
+            return
+        meta_bytes = json.dumps({**meta, "key": repr(key)}, separators=(",", ":")).encode("utf-8")
+        header = _DISK_STORE_HEADER.pack(_DISK_STORE_MAGIC, len(meta_bytes)) + meta_bytes
+        header += b"\0" * (-len(header) % 8)
+        path = self.path_for(key)
+        try:
+            self._ensure_scanned()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", suffix=_DISK_STORE_SUFFIX, dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(header)
+                    fh.write(payload)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.warning("%s write failed: %s", self.name, path, exc_info=True)
+            with self._lock:
+                self._errors += 1
+            return
+        with self._lock:
+            self._sets += 1
+            self._bytes += len(header) + len(payload) - previous
+            self._entries += 0 if previous else 1
+            over = self._bytes > self.max_bytes
+        if over:
+            self._evict()
+
+    def _touch(self, path: Path) -> None:
+        try:
+            if time.time() - path.stat().st_mtime > _DISK_STORE_TOUCH_SECONDS:
+                os.utime(path)
+        except OSError:
+            pass
+
+    def _files(self) -> list[tuple[float, int, Path]]:
+        files: list[tuple[float, int, Path]] = []
+        for path in self._dir().glob(f"*/*{_DISK_STORE_SUFFIX}"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def _ensure_scanned(self) -> None:
+        with self._lock:
+            if self._scanned_root == self.root:
+                return
+        files = self._files()
+        with self._lock:
+            self._scanned_root = self.root
+            self._bytes = sum(size for _mtime, size, _path in files)
+            self._entries = len(files)
+
+    def _evict(self) -> None:
+        """Delete least-recently-used files until the store is back under 90% of its budget."""
+        files = sorted(self._files())
+        total = sum(size for _mtime, size, _path in files)
+        target = self.max_bytes * 9 // 10
+        evicted = 0
+        for _mtime, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._bytes = total
+            self._entries = len(files) - evicted
+            self._evictions += evicted
+
+    def stats(self) -> dict[str, Any]:
+        if self.enabled:
+            self._ensure_scanned()
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": self._entries,
+                "max_entries": 0,  # bounded by bytes only
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "sets": self._sets,
+                "evictions": self._evictions,
+                "errors": self._errors,
+                "hit_rate": (self._hits / total) if total > 0 else None,
+                "path": str(self._dir()),
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the counters and forget the scan; the files stay (they outlive the process on purpose)."""
+        with self._lock:
+            self._scanned_root = None
+            self._hits = self._misses = self._sets = self._evictions = self._errors = 0
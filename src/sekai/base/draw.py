@@ -1,3 +1,4 @@
+from collections.abc import Callable
 import re
 
 from PIL import Image, ImageDraw
@@ -5,9 +6,13 @@ from PIL import Image, ImageDraw
 from .painter import (
     DEFAULT_FONT,
     Color,
+    Font,
     LinearGradient,
+    fit_prefix_length,
     get_font,
     get_text_size,
+    get_text_width,
+    measure_prefix_advances,
 )
 from .plot import (
     Canvas,
@@ -18,7 +23,7 @@ from .plot import (
     TextStyle,
     VSplit,
 )
-from .timezone import datetime_from_millis, request_now
+from .timezone import RequestClock, datetime_from_millis, request_now
 from .utils import run_in_pool
 
 SEKAI_BLUE_BG = RandomTriangleBg(True)
@@ -129,9 +134,16 @@ def roundrect_bg(
     return RoundRectBg(fill, radius, blur_glass=blur_glass, blur_glass_kwargs=blur_glass_kwargs or {})
 
 
-def wrap_watermark_text(text: str, font, max_width: int) -> list[str]:
+def wrap_watermark_text(
+    text: str,
+    font,
+    max_width: int,
+    text_width: Callable[[Font, str], float] = get_text_width,
+) -> list[str]:
     """
     优先按双空格分段换行，只在单段过长时才退回到段内拆分。
+
+    ``text_width`` 默认为 Pillow 度量；Skia 路径传入 ``native_text_width()``，整个布局不触碰 Pillow。
     """
     max_width = max(1, int(max_width))
     lines: list[str] = []
@@ -148,8 +160,7 @@ def wrap_watermark_text(text: str, font, max_width: int) -> list[str]:
         current = ""
         for segment in segments:
             candidate = segment if not current else f"{current}  {segment}"
-            text_w, _ = get_text_size(font, candidate)
-            if current and text_w > max_width:
+            if current and text_width(font, candidate) > max_width:
                 lines.append(current)
                 current = segment
                 continue
@@ -160,31 +171,34 @@ def wrap_watermark_text(text: str, font, max_width: int) -> list[str]:
 
     final_lines: list[str] = []
     for line in lines:
-        text_w, _ = get_text_size(font, line)
-        if text_w <= max_width:
+        if text_width(font, line) <= max_width:
             final_lines.append(line)
             continue
 
-        current = ""
-        for ch in line:
-            candidate = current + ch
-            text_w, _ = get_text_size(font, candidate)
-            if current and text_w > max_width:
-                final_lines.append(current)
-                current = ch
-            else:
-                current = candidate
-        if current:
-            final_lines.append(current)
+        while line:
+            clip_idx = max(1, _fit_watermark_prefix(font, line, max_width, text_width))
+            final_lines.append(line[:clip_idx])
+            line = line[clip_idx:]
     return final_lines or [""]
 
 
+def _fit_watermark_prefix(font, line: str, max_width: int, text_width: Callable[[Font, str], float]) -> int:
+    """``fit_text_prefix`` measured with ``text_width`` (identical to it for the Pillow default)."""
+    return fit_prefix_length(
+        line,
+        max_width,
+        measure_prefix_advances(font, line),
+        lambda k: text_width(font, line[:k]),
+    )
+
+
 def build_watermark_layout(
     text: str,
     max_width: int,
     size: int,
     min_size: int = WATERMARK_MIN_SIZE,
     max_lines: int = WATERMARK_MAX_LINES,
+    text_width: Callable[[Font, str], float] = get_text_width,
 ) -> tuple[int, str]:
     """
     优先保留字号；当单行放不下时改为多行，必要时再小幅缩字。
@@ -193,22 +207,27 @@ def build_watermark_layout(
     font_size = max(min_size, int(size))
     while font_size > min_size:
         font = get_font(DEFAULT_FONT, font_size)
-        wrapped_lines = wrap_watermark_text(text, font, max_width)
+        wrapped_lines = wrap_watermark_text(text, font, max_width, text_width)
         if len(wrapped_lines) <= max_lines:
             return font_size, "\n".join(wrapped_lines)
         font_size -= 1
     font = get_font(DEFAULT_FONT, min_size)
-    return min_size, "\n".join(wrap_watermark_text(text, font, max_width))
+    return min_size, "\n".join(wrap_watermark_text(text, font, max_width, text_width))
 
 
-def get_watermark_render_spec(text: str, max_width: int, size: int) -> tuple[int, list[str], int, int]:
+def get_watermark_render_spec(
+    text: str,
+    max_width: int,
+    size: int,
+    text_width: Callable[[Font, str], float] = get_text_width,
+) -> tuple[int, list[str], int, int]:
     """
     计算水印的字号、换行结果与实际占用尺寸。
     """
-    font_size, wrapped_text = build_watermark_layout(text, max_width, size)
+    font_size, wrapped_text = build_watermark_layout(text, max_width, size, text_width=text_width)
     font = get_font(DEFAULT_FONT, font_size)
     lines = wrapped_text.split("\n")
-    text_w = max((get_text_size(font, line)[0] for line in lines), default=0)
+    text_w = round(max((text_width(font, line) for line in lines), default=0))
     text_h = len(lines) * (font_size + WATERMARK_LINE_SEP) - WATERMARK_LINE_SEP
     return font_size, lines, text_w, text_h
 
@@ -296,8 +315,10 @@ def add_watermark(canvas: Canvas, text: str = DEFAULT_WATERMARK, size=12):
 def build_request_watermark_text(request, extra_suffix: str | None = None) -> str:
     timezone_name = None
     dt_value = None
+    source = request
     if isinstance(request, list | tuple):
         for item in request:
+            source = item
             timezone_name = getattr(item, "timezone", None)
             dt_value = getattr(item, "dt", None)
             if timezone_name is not None or dt_value is not None:
@@ -308,9 +329,14 @@ def build_request_watermark_text(request, extra_suffix: str | None = None) -> st
 
     text = DEFAULT_WATERMARK
     if timezone_name is not None or dt_value is not None:
-        dt = datetime_from_millis(dt_value, timezone_name)
-        if dt is None:
-            dt = request_now(timezone_name)
+        clock = getattr(source, "clock", None)
+        if isinstance(clock, RequestClock):
+            # The same instant the drawers used for "now" on this request.
+            dt = clock.watermark_time()
+        else:
+            dt = datetime_from_millis(dt_value, timezone_name)
+            if dt is None:
+                dt = request_now(timezone_name)
         timezone_label = (timezone_name or "").strip()
         if not timezone_label and dt.tzinfo is not None:
             timezone_label = dt.tzname() or ""
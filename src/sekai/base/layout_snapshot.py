@@ -0,0 +1,429 @@
+"""Process- and disk-level cache of finished page layouts, replayed instead of rebuilt.
+
+Static and semi-static pages (/help, alias lists, education power-bonus and bonds) rebuild and
+measure the same widget tree for identical inputs on every request; the measurement is most of
+their cost. A :class:`LayoutSnapshot` is the post-layout draw list of such a page: every painter
+primitive the tree issued, with its region (offset, size), resolved text runs, fonts and asset
+refs. A hit builds a :class:`LayoutSnapshotBox` that replays those calls into whatever painter
+draws it, ``Painter`` or ``IRPainter``, so both backends consume the snapshot unchanged and no
+widget is constructed or measured.
+
+The snapshot covers the canvas CONTENT only. The canvas chrome (background, padding, alignment) is
+kept as values and re-applied to a fresh :class:`Canvas`, so the caller adds the per-request
+watermark to the replay canvas exactly as it would to a freshly built one; the watermark's ``dt``
+is why the request's ``dt`` is left out of the key. Nested canvases (``paste_canvas``) are
+snapshotted whole and replayed as their own canvases, keeping the isolation boundary.
+
+The key is ``build_rendered_image_cache_key`` material (request digest, the signatures of every
+asset path the request names, renderer code fingerprint) plus the resolved font files, since
+text positions depend on their metrics. Memory is a :class:`BoundedCache`; the disk layer is the
+content-addressed store the glyph cache uses, under ``data/utils/layout_snapshots``, holding the
+snapshot as JSON: every value is tagged with its type, fonts are kept as path and size, and assets
+as an :class:`AssetImageRef` (path plus file signature). Decoding only constructs the value types
+listed in ``_VALUE_TYPES`` and only replays painter primitives, so an unreadable or foreign file
+costs a rebuild and nothing else. A snapshot holding a value the format cannot name (decoded
+pixels, say) stays memory-only. Both layers are off by default (``layout_snapshot_*`` settings).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+import json
+import logging
+import os
+from pathlib import Path, PurePath
+import stat
+from typing import Any
+
+from PIL import ImageFont
+
+from src.sekai.base.cache import MISSING, BoundedCache, GlyphDiskStore
+from src.settings import (
+    ASSETS_BASE_DIR,
+    DEFAULT_BOLD_FONT,
+    DEFAULT_FONT,
+    DEFAULT_HEAVY_FONT,
+    FONT_DIR,
+    LAYOUT_SNAPSHOT_CACHE_MAX_BYTES,
+    LAYOUT_SNAPSHOT_CACHE_SIZE,
+    LAYOUT_SNAPSHOT_DISK_CACHE_MAX_BYTES,
+)
+
+from .painter import AdaptiveTextColor, FontDesc, ImageTint, LinearGradient, Painter, RadialGradient, get_font
+from .plot import Canvas, FillBg, Frame, ImageBg, RandomTriangleBg, RoundRectBg, Widget, WidgetBg
+from .utils import AssetImageRef, build_rendered_image_cache_key, collect_asset_signatures, run_in_pool
+
+logger = logging.getLogger(__name__)
+
+LAYOUT_SNAPSHOT_DISK_DIR = Path("data/utils/layout_snapshots")
+_OP_BYTES = 256
+# Bumped whenever the JSON layout changes; entries of another format are rebuilt, never decoded.
+_DISK_FORMAT = 1
+
+# Every public Painter primitive a widget may issue. Region moves are not recorded: each op
+# carries the region it was issued in.
+_RECORDED_METHODS = (
+    "text",
+    "paste",
+    "paste_resized_clipped",
+    "image_bg",
+    "paste_with_alpha_blend",
+    "paste_src",
+    "push_clip_roundrect",
+    "pop_clip",
+    "push_mask",
+    "pop_mask",
+    "shadow_roundrect",
+    "rect",
+    "roundrect",
+    "pieslice",
+    "blurglass_roundrect",
+    "draw_random_triangle_bg",
+)
+_REPLAYED_METHODS = frozenset((*_RECORDED_METHODS, "paste_canvas"))
+
+# The value types the disk format names, by tag, with the constructor arguments that rebuild them
+# (each is also the attribute holding the value). Anything else keeps a snapshot memory-only.
+_VALUE_TYPES: dict[str, tuple[type, tuple[str, ...]]] = {
+    "font": (FontDesc, ("path", "size")),
+    "asset": (AssetImageRef, ("path", "size", "mode", "mtime_ns", "file_size")),
+    "linear_gradient": (LinearGradient, ("c1", "c2", "p1", "p2", "method")),
+    "radial_gradient": (RadialGradient, ("c1", "c2", "center", "radius")),
+    "adaptive_text_color": (AdaptiveTextColor, ("pixelwise", "light", "dark", "threshold")),
+    "image_tint": (ImageTint, ("color", "mode")),
+    "fill_bg": (FillBg, ("fill", "stroke", "stroke_width")),
+    "roundrect_bg": (
+        RoundRectBg,
+        ("fill", "radius", "stroke", "stroke_width", "corners", "blur_glass", "blur_glass_kwargs"),
+    ),
+    "image_bg": (ImageBg, ("img", "align", "mode", "blur", "fade")),
+    "random_triangle_bg": (RandomTriangleBg, ("time_color", "main_hue", "size_fixed_rate")),
+}
+_VALUE_TAGS = {cls: tag for tag, (cls, _) in _VALUE_TYPES.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class DrawOp:
+    """One recorded painter call, issued in the region ``offset``/``size`` of the snapshot."""
+
+    offset: tuple[int, int]
+    size: tuple[int, int]
+    method: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutSnapshot:
+    """The draw list of a canvas's content plus the chrome needed to rebuild the canvas."""
+
+    size: tuple[int, int]
+    ops: tuple[DrawOp, ...]
+    canvas_size: tuple[int | None, int | None] = (None, None)
+    bg: WidgetBg | None = None
+    padding: tuple[int, int] = (0, 0)
+    content_align: tuple[str, str] = ("l", "t")
+    nbytes: int = 0
+
+    def to_canvas(self) -> Canvas:
+        """A fresh canvas that draws like the one recorded, ready for a watermark."""
+        with Canvas(*self.canvas_size, bg=self.bg).set_padding(self.padding) as canvas:
+            LayoutSnapshotBox(self)
+        canvas.content_h_align, canvas.content_v_align = self.content_align
+        return canvas
+
+
+def _recording(method: str) -> Callable[..., Any]:
+    def record(self: DrawListRecorder, *args: Any, **kwargs: Any) -> DrawListRecorder:
+        self.ops.append(DrawOp(self.offset, self.size, method, args, kwargs))
+        return self
+
+    record.__name__ = method
+    return record
+
+
+class DrawListRecorder(Painter):
+    """A painter that keeps the public calls a widget tree makes instead of queuing impl ops."""
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        super().__init__(size=size)
+        self._canvas_size = size
+        self.ops: list[DrawOp] = []
+
+    def restore_region(self, depth: int = 1):
+        if not self.region_stack:
+            self.offset = (0, 0)
+            self.size = self._canvas_size
+            self.w, self.h = self.size
+        else:
+            self.offset, self.size = self.region_stack.pop()
+            self.w, self.h = self.size
+        if depth > 1:
+            return self.restore_region(depth - 1)
+        return self
+
+    def paste_canvas(self, canvas: Any, *args: Any, **kwargs: Any) -> DrawListRecorder:
+        # The nested canvas is a one-shot widget tree; keep its snapshot and rebuild it on replay.
+        self.ops.append(DrawOp(self.offset, self.size, "paste_canvas", (_record(canvas), *args), kwargs))
+        return self
+
+
+for _method in _RECORDED_METHODS:
+    setattr(DrawListRecorder, _method, _recording(_method))
+
+
+class LayoutSnapshotBox(Widget):
+    """A fixed-size widget that replays a snapshot's draw list into the painter drawing it."""
+
+    def __init__(self, snapshot: LayoutSnapshot) -> None:
+        super().__init__()
+        self.snapshot = snapshot
+        self.set_size(snapshot.size)
+        self.set_margin(0)
+        self.set_padding(0)
+
+    @property
+    def prefetch_image_sources(self) -> list[AssetImageRef]:
+        return [
+            value
+            for op in self.snapshot.ops
+            for value in (*op.args, *op.kwargs.values())
+            if isinstance(value, AssetImageRef)
+        ]
+
+    def _draw_content(self, p: Painter) -> None:
+        x, y = p.offset
+        for op in self.snapshot.ops:
+            args = op.args
+            if op.method == "paste_canvas":
+                args = (args[0].to_canvas(), *args[1:])
+            p.set_region((x + op.offset[0], y + op.offset[1]), op.size)
+            getattr(p, op.method)(*args, **op.kwargs)
+            p.restore_region()
+
+
+def _record(canvas: Canvas) -> LayoutSnapshot:
+    """Snapshot a whole canvas (chrome included) as a bare draw list."""
+    size = canvas._get_self_size()
+    recorder = DrawListRecorder(size)
+    canvas.draw(recorder)
+    return LayoutSnapshot(size, tuple(recorder.ops))
+
+
+def record_canvas_layout(canvas: Canvas) -> LayoutSnapshot | None:
+    """Measure and record ``canvas``'s content, consuming the canvas.
+
+    ``None`` when the canvas draws on itself (root draw funcs), which a content-only snapshot
+    cannot keep apart from the chrome; the canvas is left untouched then. Synchronous and
+    CPU-bound (it measures the tree): call it from a pool task.
+    """
+    if canvas.draw_funcs:
+        return None
+    content = Frame().set_margin(0).set_padding(0).set_size(canvas._get_content_size())
+    content.content_h_align, content.content_v_align = canvas.content_h_align, canvas.content_v_align
+    content.set_items(list(canvas.items))
+    canvas.set_items([])
+    recorded = _record(content)
+    snapshot = replace(
+        recorded,
+        canvas_size=(canvas.w, canvas.h),
+        bg=canvas.bg,
+        padding=(canvas.h_padding, canvas.v_padding),
+        content_align=(canvas.content_h_align, canvas.content_v_align),
+    )
+    return replace(snapshot, nbytes=_OP_BYTES * _count_ops(snapshot))
+
+
+def _count_ops(snapshot: LayoutSnapshot) -> int:
+    count = 0
+    for op in snapshot.ops:
+        count += 1
+        if op.method == "paste_canvas":
+            count += _count_ops(op.args[0])
+    return count
+
+
+LAYOUT_SNAPSHOT_CACHE = BoundedCache(
+    "layout_snapshot",
+    LAYOUT_SNAPSHOT_CACHE_SIZE,
+    LAYOUT_SNAPSHOT_CACHE_MAX_BYTES,
+    lambda snapshot: snapshot.nbytes,
+)
+LAYOUT_SNAPSHOT_DISK_STORE = GlyphDiskStore(
+    "layout_snapshot_disk", LAYOUT_SNAPSHOT_DISK_DIR, LAYOUT_SNAPSHOT_DISK_CACHE_MAX_BYTES
+)
+
+
+def _font_signature(name: str) -> tuple[str, int, int] | None:
+    # Same candidate order as painter.get_font.
+    for candidate in (name, *(os.path.join(FONT_DIR, name + suffix) for suffix in ("", ".otf", ".ttf", ".ttc"))):
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            return candidate, st.st_mtime_ns, st.st_size
+    return None
+
+
+def layout_snapshot_key(namespace: str, request: Any, extra: dict[str, Any] | None = None) -> str:
+    """Request digest (minus the watermark's ``dt``), asset and font signatures, code fingerprint."""
+    material = request.model_dump(mode="json", exclude={"dt"}) if hasattr(request, "model_dump") else request
+    fonts = {name: _font_signature(name) for name in (DEFAULT_FONT, DEFAULT_BOLD_FONT, DEFAULT_HEAVY_FONT)}
+    return build_rendered_image_cache_key(
+        f"layout_snapshot:{namespace}",
+        material,
+        asset_signatures=collect_asset_signatures(ASSETS_BASE_DIR, material),
+        extra={**(extra or {}), "fonts": fonts},
+    )
+
+
+class _UnnamedValue(TypeError):
+    """A recorded value the JSON disk format has no tag for."""
+
+
+def _encode_value(value: Any) -> Any:
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {"$": "tuple", "items": [_encode_value(item) for item in value]}
+    if isinstance(value, dict) and all(isinstance(name, str) for name in value):
+        return {"$": "dict", "items": {name: _encode_value(item) for name, item in value.items()}}
+    if isinstance(value, PurePath):
+        return {"$": "path", "value": str(value)}
+    if isinstance(value, LayoutSnapshot):
+        return {"$": "snapshot", "value": _encode_snapshot(value)}
+    if isinstance(value, ImageFont.FreeTypeFont) and isinstance(value.path, str):
+        return {"$": "pil_font", "path": value.path, "size": value.size}
+    tag = _VALUE_TAGS.get(type(value))
+    if tag is None:
+        raise _UnnamedValue(type(value).__name__)
+    return {"$": tag, **{name: _encode_value(getattr(value, name)) for name in _VALUE_TYPES[tag][1]}}
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    tag = value["$"]
+    if tag == "tuple":
+        return tuple(_decode_value(item) for item in value["items"])
+    if tag == "dict":
+        return {str(name): _decode_value(item) for name, item in value["items"].items()}
+    if tag == "path":
+        return Path(value["value"])
+    if tag == "snapshot":
+        return _decode_snapshot(value["value"])
+    if tag == "pil_font":
+        return get_font(str(value["path"]), int(value["size"]))
+    if tag not in _VALUE_TYPES:
+        raise ValueError(f"unknown layout snapshot value tag {tag!r}")
+    cls, names = _VALUE_TYPES[tag]
+    return cls(**{name: _decode_value(value[name]) for name in names})
+
+
+def _encode_snapshot(snapshot: LayoutSnapshot) -> dict[str, Any]:
+    return {
+        "size": list(snapshot.size),
+        "ops": [
+            [list(op.offset), list(op.size), op.method, _encode_value(list(op.args)), _encode_value(op.kwargs)]
+            for op in snapshot.ops
+        ],
+        "canvas_size": list(snapshot.canvas_size),
+        "bg": _encode_value(snapshot.bg),
+        "padding": list(snapshot.padding),
+        "content_align": list(snapshot.content_align),
+    }
+
+
+def _decode_snapshot(data: dict[str, Any]) -> LayoutSnapshot:
+    ops = []
+    for offset, size, method, args, kwargs in data["ops"]:
+        if method not in _REPLAYED_METHODS:
+            raise ValueError(f"layout snapshot replays unknown painter method {method!r}")
+        args, kwargs = tuple(_decode_value(args)), _decode_value(kwargs)
+        if not isinstance(kwargs, dict) or (method == "paste_canvas" and not isinstance(args[0], LayoutSnapshot)):
+            raise ValueError(f"malformed layout snapshot {method} op")
+        ops.append(DrawOp(tuple(offset), tuple(size), method, args, kwargs))
+    bg = _decode_value(data["bg"])
+    if bg is not None and not isinstance(bg, WidgetBg):
+        raise ValueError("layout snapshot background is not a WidgetBg")
+    return LayoutSnapshot(
+        tuple(data["size"]),
+        tuple(ops),
+        tuple(data["canvas_size"]),
+        bg,
+        tuple(data["padding"]),
+        tuple(data["content_align"]),
+    )
+
+
+def _load_snapshot(key: str) -> LayoutSnapshot | None:
+    stored = LAYOUT_SNAPSHOT_DISK_STORE.get((key,))
+    if stored is None:
+        return None
+    meta, payload = stored
+    if meta.get("format") != _DISK_FORMAT:
+        return None  # an older store layout: rebuilt and overwritten under the same key
+    try:
+        snapshot = _decode_snapshot(json.loads(bytes(payload)))
+    except Exception:
+        # Written by this service, but a torn or foreign file must only cost a rebuild.
+        logger.warning("dropping unreadable layout snapshot %s", meta.get("namespace"), exc_info=True)
+        return None
+    return replace(snapshot, nbytes=len(payload))
+
+
+def _store_snapshot(key: str, namespace: str, snapshot: LayoutSnapshot) -> LayoutSnapshot:
+    """Persist ``snapshot`` as JSON and return it sized by that payload (snapshots holding a value
+    the format cannot name stay memory-only with the per-op estimate)."""
+    try:
+        payload = json.dumps(_encode_snapshot(snapshot), ensure_ascii=False, separators=(",", ":")).encode()
+    except _UnnamedValue:
+        return snapshot
+    LAYOUT_SNAPSHOT_DISK_STORE.set((key,), {"namespace": namespace, "format": _DISK_FORMAT}, payload)
+    return replace(snapshot, nbytes=len(payload))
+
+
+async def build_layout_snapshot_canvas(
+    namespace: str,
+    request: Any,
+    build_content: Callable[[], Awaitable[Canvas]],
+    *,
+    extra: dict[str, Any] | None = None,
+) -> Canvas:
+    """The page canvas for ``request`` WITHOUT its watermark, replayed from a snapshot when one exists.
+
+    ``build_content`` builds the unwatermarked canvas; it only runs on a miss. ``extra`` names any
+    layout input the request does not carry (the /help measurer backend, say). With both cache
+    layers off this is exactly ``await build_content()``.
+    """
+    if not (LAYOUT_SNAPSHOT_CACHE.enabled or LAYOUT_SNAPSHOT_DISK_STORE.enabled):
+        return await build_content()
+    key = layout_snapshot_key(namespace, request, extra)
+    snapshot = LAYOUT_SNAPSHOT_CACHE.get(key)
+    if snapshot is MISSING:
+        snapshot = await run_in_pool(_load_snapshot, key) if LAYOUT_SNAPSHOT_DISK_STORE.enabled else None
+        if snapshot is None:
+            canvas = await build_content()
+            snapshot = await run_in_pool(record_canvas_layout, canvas)
+            if snapshot is None:
+                return canvas
+            snapshot = await run_in_pool(_store_snapshot, key, namespace, snapshot)
+        LAYOUT_SNAPSHOT_CACHE.set(key, snapshot)
+    return snapshot.to_canvas()
+
+
+def get_layout_snapshot_cache_stats() -> dict[str, Any]:
+    """Pool stats for /cache/stats (the ``layout_snapshot_cache`` key)."""
+    return {"memory": LAYOUT_SNAPSHOT_CACHE.stats(), "disk": LAYOUT_SNAPSHOT_DISK_STORE.stats()}
+
+
+def clear_layout_snapshot_cache() -> None:
+    """Drop the memory pool and zero the disk counters (the files outlive the process on purpose)."""
+    LAYOUT_SNAPSHOT_CACHE.clear()
+    LAYOUT_SNAPSHOT_DISK_STORE.reset_stats()
@@ -1,10 +1,13 @@
+import bisect
 from collections import OrderedDict
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
+from functools import cache
 import glob
 import hashlib
+import importlib
 from io import BytesIO
 import logging
 import math
@@ -18,10 +21,12 @@ import emoji
 import numpy as np
 from PIL import Image, ImageChops, ImageDraw, ImageEnhance, ImageFilter, ImageFont
 from PIL.ImageFont import ImageFont as Font
-from pilmoji import Pilmoji, getsize as getsize_emoji
+from pilmoji import getsize as getsize_emoji
+from pilmoji.helpers import NodeType, to_nodes
 from pilmoji.source import BaseSource, GoogleEmojiSource
 
 from src.core.pillow_telemetry import PILLOW_TOUCH_TEXT_METRIC, record_pillow_touch
+from src.sekai.base.cache import MISSING
 from src.settings import (
     DEFAULT_BOLD_FONT,  # noqa: F401
     DEFAULT_EMOJI_FONT,  # noqa: F401
@@ -31,7 +36,14 @@ from src.settings import (
 )
 
 from .img_utils import adjust_image_alpha_inplace, multiply_image_by_color
-from .triangle_bg import background_hour, build_triangle_bg, gradient_points
+from .text_cache import EMOJI_ATLAS, TEXT_MEASURE_CACHE, thread_font_cache
+from .triangle_bg import (
+    TRIANGLE_BG_CACHE,
+    background_hour,
+    build_triangle_bg,
+    gradient_points,
+    triangle_bg_cache_key,
+)
 from .utils import (
     PASTE_RESAMPLE,
     AssetImageRef,
@@ -278,25 +290,9 @@ class FontDesc:
     size: int
 
 
-@dataclass
-class FontCacheEntry:
-    font: Font
-    last_used: datetime
-
-
-FONT_CACHE_MAX_NUM = 32
-_font_cache_local = threading.local()
 _painter_disk_cache_lock = threading.RLock()
 
 
-def _get_thread_font_cache() -> dict[str, FontCacheEntry]:
-    cache = getattr(_font_cache_local, "font_cache", None)
-    if cache is None:
-        cache = {}
-        _font_cache_local.font_cache = cache
-    return cache
-
-
 def crop_by_align(original_size: int, crop_size: int, align: int) -> tuple[int, int, int, int]:
     w, h = original_size
     cw, ch = crop_size
@@ -375,25 +371,18 @@ def get_font(path: str, size: int) -> Font:
         os.path.join(FONT_DIR, path + ".ttf"),
         os.path.join(FONT_DIR, path + ".ttc"),
     ]
-    font_cache = _get_thread_font_cache()
-    entry = font_cache.get(key)
-    if entry is None:
-        font: ImageFont.ImageFont | ImageFont.FreeTypeFont | None = None
+    font_cache = thread_font_cache()
+    font = font_cache.get(key)
+    if font is None:
         for font_path in paths:
             if os.path.exists(font_path):
                 font = ImageFont.truetype(font_path, size)
                 break
         if font is None:
             font = ImageFont.load_default()
-        entry = FontCacheEntry(font, datetime.now())
-        font_cache[key] = entry
-        # 清理当前线程中过期的字体缓存
-        while len(font_cache) > FONT_CACHE_MAX_NUM:
-            oldest_key = min(font_cache, key=lambda k: font_cache[k].last_used)
-            del font_cache[oldest_key]
-    else:
-        entry.last_used = datetime.now()
-    return entry.font
+        # 当前线程的 LRU,超出 FONT_CACHE_SIZE 时淘汰最久未用的字体
+        font_cache.set(key, font)
+    return font
 
 
 # Text measurement dominates the render. Profiling one inventory/list request: Font.getsize was
@@ -404,9 +393,12 @@ def get_font(path: str, size: int) -> Font:
 # Measuring is a PURE function of (face, size, string), so cache it. The cache is keyed by the font
 # FILE and size, not the font object, so all pool threads share the results while each keeps its own
 # FreeTypeFont (sharing the object would serialize every measurement — see ir_builder's font cache).
-_TEXT_BBOX_CACHE_MAX = 50_000
-_text_bbox_cache: dict[tuple, tuple[int, int, int, int]] = {}
-_text_emoji_size_cache: dict[tuple, Size] = {}
+# All three kinds of measurement (bbox, emoji-composed size, character advance) share the sharded
+# LRU in text_cache, told apart by the first key element.
+_MEASURE_BBOX = "bbox"
+_MEASURE_EMOJI_SIZE = "emoji"
+_MEASURE_ADVANCE = "advance"
+_MEASURE_NATIVE_BBOX = "native_bbox"
 
 
 def _font_key(font: Font) -> tuple:
@@ -418,31 +410,25 @@ def _font_key(font: Font) -> tuple:
 
 
 def _measure_bbox(font: Font, text: str) -> tuple[int, int, int, int]:
-    key = (_font_key(font), text)
-    cached = _text_bbox_cache.get(key)
-    if cached is not None:
+    key = (_MEASURE_BBOX, _font_key(font), text)
+    cached = TEXT_MEASURE_CACHE.get(key)
+    if cached is not MISSING:
         return cached
+    # Measured outside the shard lock: a duplicate compute under a race is harmless (entries are
+    # immutable), and holding a lock across getbbox would re-serialize what the cache parallelizes.
     bbox = font.getbbox(text)
-    # A plain dict is enough: entries are immutable, a duplicate compute under a race is harmless,
-    # and a lock here would re-serialize the very thing this cache exists to parallelize. The bound
-    # matters because the keys carry request text; a wholesale clear is fine since a cold measure is
-    # cheap and correctness never depends on a hit.
-    if len(_text_bbox_cache) >= _TEXT_BBOX_CACHE_MAX:
-        _text_bbox_cache.clear()
-    _text_bbox_cache[key] = bbox
+    TEXT_MEASURE_CACHE.set(key, bbox)
     return bbox
 
 
 def get_text_size(font: Font, text: str) -> Size:
     record_pillow_touch(PILLOW_TOUCH_TEXT_METRIC)
     if emoji.emoji_count(text) > 0:
-        key = (_font_key(font), text)
-        cached = _text_emoji_size_cache.get(key)
-        if cached is None:
+        key = (_MEASURE_EMOJI_SIZE, _font_key(font), text)
+        cached = TEXT_MEASURE_CACHE.get(key)
+        if cached is MISSING:
             cached = getsize_emoji(text, font=font)
-            if len(_text_emoji_size_cache) >= _TEXT_BBOX_CACHE_MAX:
-                _text_emoji_size_cache.clear()
-            _text_emoji_size_cache[key] = cached
+            TEXT_MEASURE_CACHE.set(key, cached)
         return cached
     bbox = _measure_bbox(font, text)
     return bbox[2] - bbox[0], bbox[3] - bbox[1]
@@ -454,6 +440,186 @@ def get_text_offset(font: Font, text: str) -> Position:
     return bbox[0], bbox[1]
 
 
+def get_text_width(font: Font, text: str) -> float:
+    """``get_text_size(font, text)[0]``: the Pillow-measured width, as a ``native_text_width`` peer."""
+    return float(get_text_size(font, text)[0])
+
+
+# TEXT_METRICS_CAPABILITY 1 added measure_text_batch and its Pillow-relative ``pillow_bbox``.
+_REQUIRED_NATIVE_TEXT_BATCH_CAPABILITY = 1
+
+
+@cache
+def _native_text_batch() -> Callable[..., list[dict[str, Any]]] | None:
+    """The wheel's ``measure_text_batch``, or ``None`` when missing or too old (see
+    ``_native_prefix_advances`` for why this is not ``load_native_renderer``)."""
+    try:
+        native = importlib.import_module("haruki_skia_renderer")
+    except ImportError:
+        return None
+    measure = getattr(native, "measure_text_batch", None)
+    capability = int(getattr(native, "TEXT_METRICS_CAPABILITY", 0) or 0)
+    if capability < _REQUIRED_NATIVE_TEXT_BATCH_CAPABILITY or not callable(measure):
+        return None
+    return measure
+
+
+def _native_bbox(measure: Callable[..., list[dict[str, Any]]], font: Font, text: str) -> tuple | None:
+    path = getattr(font, "path", None)
+    if not isinstance(path, str) or emoji.emoji_count(text) > 0:
+        return None
+    key = (_MEASURE_NATIVE_BBOX, _font_key(font), text)
+    cached = TEXT_MEASURE_CACHE.get(key)
+    if cached is not MISSING:
+        return cached
+    try:
+        results = list(measure(os.path.dirname(path), path, [(text, float(font.size))]))
+        bbox = tuple(float(value) for value in results[0]["pillow_bbox"]) if len(results) == 1 else ()
+    except (KeyError, RuntimeError, TypeError, ValueError):
+        return None
+    if len(bbox) != 4 or not all(math.isfinite(value) for value in bbox):
+        return None
+    TEXT_MEASURE_CACHE.set(key, bbox)
+    return bbox
+
+
+def native_text_width() -> Callable[[Font, str], float] | None:
+    """A ``get_text_width`` served by the wheel's ``measure_text_batch``, or ``None`` without it.
+
+    For Skia-path layout that must not touch Pillow: the wheel reports Pillow's ink bbox for the
+    same typeface the IR text nodes draw with. Emoji (``get_text_size`` composes those), a font
+    with no file and a failed native call still measure with Pillow.
+    """
+    measure = _native_text_batch()
+    if measure is None:
+        return None
+
+    def width(font: Font, text: str) -> float:
+        if not text:
+            return 0.0
+        bbox = _native_bbox(measure, font, text)
+        if bbox is None:
+            return get_text_width(font, text)
+        return bbox[2] - bbox[0]
+
+    return width
+
+
+# Line fitting used to binary-search a break with one full ``getbbox`` per probe: O(log n) Pillow
+# layouts per line, each over a growing prefix. ``measure_prefix_advances`` gives every prefix's
+# advance in one pass; it only PREDICTS the break, and the boundary is then confirmed with
+# ``get_text_size`` so the break positions stay exactly the bbox-based ones (advance and ink
+# width differ by the side bearings). A typical line costs two full measurements.
+# Walking from a bad prediction is linear; past this many steps fall back to bisecting.
+_FIT_PREFIX_MAX_WALK = 6
+# TEXT_METRICS_CAPABILITY 2 added the standalone measure_prefix_advances entry point.
+_REQUIRED_NATIVE_PREFIX_ADVANCES_CAPABILITY = 2
+
+
+@cache
+def _native_prefix_advances() -> Callable[..., list[float]] | None:
+    """The wheel's ``measure_prefix_advances``, or ``None`` when missing or too old.
+
+    Not ``load_native_renderer``: this API reads no scene IR (and importing the Skia canvas from
+    here would be circular). Resolved once per process.
+    """
+    try:
+        native = importlib.import_module("haruki_skia_renderer")
+    except ImportError:
+        return None
+    measure = getattr(native, "measure_prefix_advances", None)
+    capability = int(getattr(native, "TEXT_METRICS_CAPABILITY", 0) or 0)
+    if capability < _REQUIRED_NATIVE_PREFIX_ADVANCES_CAPABILITY or not callable(measure):
+        return None
+    return measure
+
+
+def _pillow_prefix_advances(font: Font, text: str) -> list[float]:
+    record_pillow_touch(PILLOW_TOUCH_TEXT_METRIC)
+    key = _font_key(font)
+    advances: list[float] = []
+    total = 0.0
+    for char in text:
+        advance = TEXT_MEASURE_CACHE.get((_MEASURE_ADVANCE, key, char))
+        if advance is MISSING:
+            advance = float(font.getlength(char))
+            TEXT_MEASURE_CACHE.set((_MEASURE_ADVANCE, key, char), advance)
+        total += advance
+        advances.append(total)
+    return advances
+
+
+def measure_prefix_advances(font: Font, text: str) -> list[float]:
+    """Cumulative advance after each character of ``text`` (``len(text)`` entries).
+
+    Served by the native text-metrics module when the wheel provides it (one FFI call, the same
+    configured typeface the IR text nodes use), otherwise summed from per-character Pillow
+    advances. Either way it is an estimate of ``get_text_size`` widths, good enough to predict a
+    break -- use ``fit_text_prefix`` for an exact one.
+    """
+    if not text:
+        return []
+    native = _native_prefix_advances()
+    path = getattr(font, "path", None)
+    if native is not None and isinstance(path, str):
+        try:
+            advances = native(os.path.dirname(path), path, text, float(font.size))
+            if len(advances) == len(text):
+                return [float(value) for value in advances]
+        except (RuntimeError, TypeError, ValueError):
+            pass
+    return _pillow_prefix_advances(font, text)
+
+
+def fit_prefix_length(
+    text: str,
+    width: float,
+    advances: list[float],
+    measure: Callable[[int], float],
+) -> int:
+    """Largest ``k`` in ``0..len(text)`` whose prefix ``measure(k)`` fits in ``width``.
+
+    ``advances`` (from ``measure_prefix_advances``) picks the starting guess; ``measure`` is the
+    authoritative width of the first ``k`` characters and is called only around the boundary.
+    Widths are assumed non-decreasing in ``k``, as the bisection this replaces assumed.
+    """
+    n = len(text)
+    memo: dict[int, float] = {}
+
+    def width_of(k: int) -> float:
+        value = memo.get(k)
+        if value is None:
+            value = memo[k] = measure(k)
+        return value
+
+    k = min(n, bisect.bisect_right(advances, width))
+    for _ in range(_FIT_PREFIX_MAX_WALK):
+        if k > 0 and width_of(k) > width:
+            k -= 1
+        elif k < n and width_of(k + 1) <= width:
+            k += 1
+        else:
+            return k
+    # The guess was far off (emoji, fallback glyphs): bisect for the boundary instead.
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if width_of(mid) <= width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def fit_text_prefix(font: Font, text: str, width: float, suffix: str = "") -> int:
+    """Largest ``k`` such that ``get_text_size(font, text[:k] + suffix)[0] <= width`` (may be 0)."""
+    advances = measure_prefix_advances(font, text)
+    if suffix:
+        suffix_advance = measure_prefix_advances(font, suffix)[-1]
+        advances = [advance + suffix_advance for advance in advances]
+    return fit_prefix_length(text, width, advances, lambda k: get_text_size(font, text[:k] + suffix)[0])
+
+
 def ascender_top_to_painter_y(font_path: str, font_size: int, ascender_top_y: int) -> int:
     """Convert an ``ImageDraw.text`` y (its default ``"la"`` anchor = top of the ascender)
     into the y ``Painter.text`` expects (it anchors the baseline at ``y + ink-height("哇")``).
@@ -779,6 +945,132 @@ class CachedGoogleEmojiSource(BaseSource):
         return self._get_cached_stream("discord", str(id), lambda source: source.get_discord_emoji(id))
 
 
+def _emoji_raster(node_type: NodeType, content: str, width: int) -> Image.Image | None:
+    """The emoji scaled to ``width`` px wide (height by aspect), from the atlas or decoded once.
+
+    ``None`` when the source has no image for it; Pilmoji then draws the node as text. Misses are
+    not cached as ``None``: a failed fetch may be transient, and the byte cache retries it.
+    """
+    key = (node_type.name, content, width)
+    raster = EMOJI_ATLAS.get(key)
+    if raster is not MISSING:
+        return raster
+    source = CachedGoogleEmojiSource()
+    stream = source.get_emoji(content) if node_type is NodeType.emoji else source.get_discord_emoji(int(content))
+    if stream is None:
+        return None
+    with Image.open(stream) as decoded:
+        asset = decoded.convert("RGBA")
+    raster = asset.resize((width, math.ceil(asset.height / asset.width * width)), Image.Resampling.LANCZOS)
+    EMOJI_ATLAS.set(key, raster)
+    return raster
+
+
+def _draw_emoji_text(
+    img: Image.Image, xy: tuple[float, float], text: str, font: Font, fill: Color, align: str = "left"
+) -> None:
+    """``Pilmoji.text(xy, text, font=font, fill=fill, align=align, anchor="ls")`` with atlas emoji.
+
+    A line-for-line port of Pilmoji's layout for the arguments ``Painter._text`` passes
+    (``spacing=4``, no stroke, unit emoji scale, zero offset), so placement is unchanged:
+    each emoji is reserved as a run of spaces in the line's text, the text is drawn in one call,
+    and the rasters are pasted at the advances Pilmoji computes. Only the per-occurrence PNG
+    decode and resize are gone.
+    """
+    if align not in ("left", "center", "right"):
+        raise ValueError('align must be "left", "center" or "right"')
+    draw = ImageDraw.Draw(img)
+    anchor = "ls"
+    width = round(font.size)
+    line_spacing = draw.textbbox((0, 0), "A", font)[3] + 4
+    space_length = draw.textlength(" ", font)
+    ink, _ = draw._getink(fill)
+    if ink is None:
+        ink = fill
+
+    x, y = xy
+    lines = to_nodes(text)
+    line_texts: list[str] = []
+    line_rasters: list[dict[int, Image.Image]] = []
+    widths: list[float] = []
+    for line in lines:
+        line_text = ""
+        rasters: dict[int, Image.Image] = {}
+        for node_id, node in enumerate(line):
+            raster = None
+            if node.type is not NodeType.text:
+                raster = _emoji_raster(node.type, node.content, width)
+            if raster is None:
+                line_text += node.content
+                continue
+            rasters[node_id] = raster
+            line_text += " " * round(width / space_length)
+        line_texts.append(line_text)
+        line_rasters.append(rasters)
+        widths.append(draw.textlength(line_text, font))
+    max_width = max(widths)
+
+    for line_index, line in enumerate(lines):
+        width_difference = max_width - widths[line_index]
+        line_x = x + {"left": 0.0, "center": width_difference / 2.0, "right": width_difference}[align]
+        if line_texts[line_index]:
+            draw.text((line_x, y), line_texts[line_index], fill=fill, font=font, anchor=anchor, spacing=4, align=align)
+        coord = (int(line_x), int(y))
+        start = (math.modf(line_x)[0], math.modf(y)[0])
+        line_y = y
+        if ink is not None:
+            try:
+                _, offset = font.getmask2(line_texts[line_index], draw.fontmode, anchor=anchor, ink=ink, start=start)
+                line_x, line_y = coord[0] + offset[0], coord[1] + offset[1]
+            except AttributeError:
+                line_x, line_y = coord
+        for node_id, node in enumerate(line):
+            raster = line_rasters[line_index].get(node_id)
+            if raster is None:
+                line_x += int(font.getlength(node.content))
+                continue
+            img.paste(raster, (round(line_x), round(line_y)), raster)
+            line_x += width
+        y += line_spacing
+
+
+def _render_triangle_bg(
+    w: int, h: int, hour: float, use_time_color: bool, main_hue: float, size_fixed_rate: float
+) -> Image.Image:
+    """Draw the shared triangle-background spec. The scatter is NOT rolled here — see
+    ``base/triangle_bg.py``: both backends draw the same generated list, so neither the two
+    backends nor two runs of the same backend can disagree about it any more."""
+    spec = build_triangle_bg(w, h, hour, use_time_color, main_hue, size_fixed_rate)
+    primary_p1, primary_p2, overlay_p1, overlay_p2 = gradient_points(w, h)
+
+    s = 4  # the gradients are smooth; build them at quarter size and LANCZOS back up
+    bg = LinearGradient(c1=spec.grad1, c2=spec.grad2, p1=primary_p1, p2=primary_p2).get_img((w // s, h // s))
+    bg.alpha_composite(
+        LinearGradient(c1=spec.overlay1, c2=spec.overlay2, p1=overlay_p1, p2=overlay_p2).get_img((w // s, h // s))
+    )
+    bg.alpha_composite(Image.new("RGBA", (w // s, h // s), (255, 255, 255, spec.white_alpha)))
+    bg = bg.resize((w, h), Image.Resampling.LANCZOS)
+
+    for tri in spec.triangles:
+        # Skia strokes the path at float coordinates, so the overlay's ORIGIN is snapped to the
+        # pixel grid and the vertices keep their subpixel offset inside it. Rounding the centre
+        # instead (the old `int(x) - width // 2`) shifted every triangle by up to half a pixel
+        # relative to Skia, which no amount of seed-sharing would have fixed.
+        span = tri.size * 2
+        overlay = Image.new("RGBA", (span, span), (0, 0, 0, 0))
+        ox, oy = math.floor(tri.x - tri.size), math.floor(tri.y - tri.size)
+        cx, cy = tri.x - ox, tri.y - oy
+        radius = tri.size * 0.56
+        type_angle_offset = (0, 18, -18)[tri.type % 3]
+        points = []
+        for idx in range(3):
+            angle = math.radians(tri.rot + type_angle_offset + idx * 120 - 90)
+            points.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
+        ImageDraw.Draw(overlay).polygon(points, fill=tri.color)
+        bg.alpha_composite(overlay, (ox, oy))
+    return bg
+
+
 class Painter:
     def __init__(self, img: Image.Image | None = None, size: tuple[int, int] | None = None) -> None:
         self.operations: list[PainterOperation] = []
@@ -811,18 +1103,9 @@ class Painter:
             pos = (pos[0] - text_offset[0] + self.offset[0], pos[1] - text_offset[1] + self.offset[1])
             draw.text(pos, text, font=font, fill=fill, align=align, anchor="ls")
         else:
-            with Pilmoji(self.img, source=CachedGoogleEmojiSource) as pilmoji:
-                text_offset = (0, -std_size[1])
-                pos = (pos[0] - text_offset[0] + self.offset[0], pos[1] - text_offset[1] + self.offset[1])
-                pilmoji.text(
-                    pos,
-                    text,
-                    font=font,
-                    fill=fill,
-                    align=align,
-                    emoji_position_offset=(0, 0),
-                    anchor="ls",
-                )
+            text_offset = (0, -std_size[1])
+            pos = (pos[0] - text_offset[0] + self.offset[0], pos[1] - text_offset[1] + self.offset[1])
+            _draw_emoji_text(self.img, pos, text, font, fill, align)
         return self
 
     @staticmethod
@@ -2003,37 +2286,13 @@ class Painter:
         return self
 
     def _impl_draw_random_triangle_bg(self, use_time_color: bool, main_hue: float, size_fixed_rate: float):
-        """Draw the shared triangle-background spec. The scatter is NOT rolled here — see
-        ``base/triangle_bg.py``: both backends draw the same generated list, so neither the two
-        backends nor two runs of the same backend can disagree about it any more."""
+        """Paste the finished background for this size and palette step, drawing it on a miss."""
         w, h = self.size
-        spec = build_triangle_bg(w, h, background_hour(), use_time_color, main_hue, size_fixed_rate)
-        primary_p1, primary_p2, overlay_p1, overlay_p2 = gradient_points(w, h)
-
-        s = 4  # the gradients are smooth; build them at quarter size and LANCZOS back up
-        bg = LinearGradient(c1=spec.grad1, c2=spec.grad2, p1=primary_p1, p2=primary_p2).get_img((w // s, h // s))
-        bg.alpha_composite(
-            LinearGradient(c1=spec.overlay1, c2=spec.overlay2, p1=overlay_p1, p2=overlay_p2).get_img((w // s, h // s))
-        )
-        bg.alpha_composite(Image.new("RGBA", (w // s, h // s), (255, 255, 255, spec.white_alpha)))
-        bg = bg.resize((w, h), Image.Resampling.LANCZOS)
-
-        for tri in spec.triangles:
-            # Skia strokes the path at float coordinates, so the overlay's ORIGIN is snapped to the
-            # pixel grid and the vertices keep their subpixel offset inside it. Rounding the centre
-            # instead (the old `int(x) - width // 2`) shifted every triangle by up to half a pixel
-            # relative to Skia, which no amount of seed-sharing would have fixed.
-            span = tri.size * 2
-            overlay = Image.new("RGBA", (span, span), (0, 0, 0, 0))
-            ox, oy = math.floor(tri.x - tri.size), math.floor(tri.y - tri.size)
-            cx, cy = tri.x - ox, tri.y - oy
-            radius = tri.size * 0.56
-            type_angle_offset = (0, 18, -18)[tri.type % 3]
-            points = []
-            for idx in range(3):
-                angle = math.radians(tri.rot + type_angle_offset + idx * 120 - 90)
-                points.append((cx + radius * math.cos(angle), cy + radius * math.sin(angle)))
-            ImageDraw.Draw(overlay).polygon(points, fill=tri.color)
-            bg.alpha_composite(overlay, (ox, oy))
-
+        hour = background_hour()
+        key = triangle_bg_cache_key(w, h, hour, use_time_color, main_hue, size_fixed_rate)
+        bg = TRIANGLE_BG_CACHE.get(key)
+        if bg is MISSING:
+            bg = _render_triangle_bg(w, h, hour, use_time_color, main_hue, size_fixed_rate)
+            TRIANGLE_BG_CACHE.set(key, bg)
         self.img.paste(bg, self.offset)
+        return self
@@ -26,6 +26,7 @@ from .painter import (
     ImageTint,
     LinearGradient,
     Painter,
+    fit_text_prefix,
     get_font,
     get_font_desc,
     get_text_size,
@@ -1239,17 +1240,7 @@ class TextBox(Widget):
         w, _ = get_text_size(font, text + suffix)
         if w <= width:
             return None
-        left_idx, right_idx = 0, len(text)
-        while left_idx <= right_idx:
-            mid_idx = (left_idx + right_idx) // 2
-            w, _ = get_text_size(font, text[:mid_idx] + suffix)
-            if w < width:
-                left_idx = mid_idx + 1
-            elif w > width:
-                right_idx = mid_idx - 1
-            else:
-                return mid_idx
-        return right_idx
+        return fit_text_prefix(font, text, width, suffix)
 
     def _get_lines(self) -> list[str]:
         lines = self.text.split("\n")
@@ -1421,10 +1412,15 @@ class ColoredTextBox(Widget):
             return
 
         suffix_width, _ = get_text_size(font, suffix)
+        # Trim the last segment to the longest prefix that still fits; drop it when none does.
         while line and self._get_line_width(font, line) + suffix_width > width:
-            line[-1]["text"] = line[-1]["text"][:-1]
-            if not line[-1]["text"]:
-                line.pop()
+            last = line[-1]["text"]
+            available = width - suffix_width - self._get_line_width(font, line[:-1])
+            keep = fit_text_prefix(font, last, available) if available >= 0 else 0
+            if 0 < keep < len(last):
+                line[-1]["text"] = last[:keep]
+                break
+            line.pop()
 
         if not line and suffix_width > width:
             return
@@ -0,0 +1,263 @@
+"""The drawing thread pool behind ``run_in_pool``: priority classes, request deadlines, a short lane.
+
+It used to be one FIFO ``ThreadPoolExecutor``: header probes, full Pillow renders, native
+``render_scene`` calls and matplotlib figures all queued in submission order, so a burst of card
+boxes left a stamp list's asset probes waiting behind several seconds of rendering. Here tasks are
+picked, not queued:
+
+- lane: ``"short"`` tasks (asset header probes, ETag hashing — milliseconds each) go first, and
+  ``thread_pool_short_lane_workers`` extra threads run nothing else, so they never wait behind a
+  render that is already running;
+- class: the request's ``RequestSchedulingRef.priority`` from the admission cost model
+  (interactive < default < bulk). A task moves up one class per ``_AGING_SECONDS`` waited, so bulk
+  work is delayed under load, never starved;
+- deadline: inside a class the earliest request deadline (request start plus
+  ``request_hard_timeout_seconds``) goes first, then submission order.
+
+A task is dropped without running when the coroutine awaiting it was cancelled (client gone,
+route timeout) or when its request deadline passed while it queued; the latter raises
+``TimeoutError`` into the awaiting coroutine. Queue wait is measured per class (``/render-stats``
+``pool_scheduler``) and per request (the ``X-Haruki-Pool-Wait-Ms`` response header).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import contextvars
+from dataclasses import dataclass, field
+import logging
+import math
+import threading
+import time
+from typing import Any, Literal
+
+from src.core.admission import PRIORITY_DEFAULT, REQUEST_PRIORITIES
+from src.core.debug import RequestSchedulingRef
+
+logger = logging.getLogger(__name__)
+
+PoolLane = Literal["render", "short"]
+LANE_SHORT = "short"
+
+_CLASS_RANK = {priority: rank for rank, priority in enumerate(REQUEST_PRIORITIES)}
+_AGING_SECONDS = 2.0
+_WAIT_SAMPLES = 1024
+
+_OUTCOME_RUN = "run"
+_OUTCOME_CANCELLED = "cancelled"
+_OUTCOME_EXPIRED = "expired"
+
+
+@dataclass(slots=True)
+class _PoolTask:
+    func: Callable[..., Any]
+    args: tuple[Any, ...]
+    context: contextvars.Context
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    lane: str
+    priority: str
+    deadline: float | None
+    scheduling: RequestSchedulingRef | None
+    seq: int
+    submitted: float = field(default_factory=time.monotonic)
+
+    @property
+    def stats_class(self) -> str:
+        return LANE_SHORT if self.lane == LANE_SHORT else self.priority
+
+    def order(self, now: float) -> tuple[int, int, float, int]:
+        aged = int((now - self.submitted) / _AGING_SECONDS)
+        rank = max(0, _CLASS_RANK.get(self.priority, _CLASS_RANK[PRIORITY_DEFAULT]) - aged)
+        return (
+            0 if self.lane == LANE_SHORT else 1,
+            rank,
+            self.deadline if self.deadline is not None else math.inf,
+            self.seq,
+        )
+
+
+@dataclass(slots=True)
+class _ClassStats:
+    submitted: int = 0
+    started: int = 0
+    dropped_cancelled: int = 0
+    dropped_expired: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    waits: deque = field(default_factory=lambda: deque(maxlen=_WAIT_SAMPLES))
+
+    def snapshot(self, queued: int) -> dict[str, Any]:
+        ordered = sorted(self.waits)
+        return {
+            "queued": queued,
+            "submitted": self.submitted,
+            "started": self.started,
+            "dropped_cancelled": self.dropped_cancelled,
+            "dropped_expired": self.dropped_expired,
+            "wait_ms_avg": round(self.wait_total / self.started * 1000, 2) if self.started else None,
+            "wait_ms_p50": round(_percentile(ordered, 0.50) * 1000, 2) if ordered else None,
+            "wait_ms_p95": round(_percentile(ordered, 0.95) * 1000, 2) if ordered else None,
+            "wait_ms_max": round(self.wait_max * 1000, 2),
+        }
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def _resolve(future: asyncio.Future, result: Any, exc: BaseException | None) -> None:
+    if future.cancelled():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+class PoolScheduler:
+    """Worker threads that pick the best pending task instead of the oldest one."""
+
+    def __init__(self, workers: int, short_lane_workers: int, name: str = "drawing-pool") -> None:
+        self.workers = max(1, workers)
+        self.short_lane_workers = max(0, short_lane_workers)
+        self.name = name
+        self._condition = threading.Condition()
+        self._pending: list[_PoolTask] = []
+        self._threads: list[threading.Thread] = []
+        self._seq = 0
+        self._shutdown = False
+        self._stats = {key: _ClassStats() for key in (LANE_SHORT, *REQUEST_PRIORITIES)}
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        *,
+        context: contextvars.Context,
+        lane: str,
+        scheduling: RequestSchedulingRef | None,
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            self._start_threads_locked()
+            self._seq += 1
+            task = _PoolTask(
+                func=func,
+                args=args,
+                context=context,
+                loop=loop,
+                future=future,
+                lane=lane,
+                priority=scheduling.priority if scheduling is not None else PRIORITY_DEFAULT,
+                deadline=scheduling.deadline if scheduling is not None else None,
+                scheduling=scheduling,
+                seq=self._seq,
+            )
+            self._stats[task.stats_class].submitted += 1
+            self._pending.append(task)
+            self._condition.notify_all()
+        return future
+
+    def _start_threads_locked(self) -> None:
+        if self._threads:
+            return
+        for index in range(self.workers + self.short_lane_workers):
+            short_only = index >= self.workers
+            thread = threading.Thread(
+                target=self._worker,
+                args=(short_only,),
+                name=f"{self.name}-{'short' if short_only else 'render'}-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _take_locked(self, short_only: bool) -> _PoolTask | None:
+        now = time.monotonic()
+        best_index = -1
+        best_order = None
+        for index, task in enumerate(self._pending):
+            if short_only and task.lane != LANE_SHORT:
+                continue
+            order = task.order(now)
+            if best_order is None or order < best_order:
+                best_index, best_order = index, order
+        if best_index < 0:
+            return None
+        return self._pending.pop(best_index)
+
+    def _worker(self, short_only: bool) -> None:
+        while True:
+            with self._condition:
+                task = self._take_locked(short_only)
+                while task is None and not self._shutdown:
+                    self._condition.wait()
+                    task = self._take_locked(short_only)
+                if task is None:
+                    return
+                outcome = self._start_locked(task)
+            if outcome != _OUTCOME_CANCELLED:
+                self._run(task, outcome)
+
+    def _start_locked(self, task: _PoolTask) -> str:
+        stats = self._stats[task.stats_class]
+        now = time.monotonic()
+        if task.future.cancelled():
+            stats.dropped_cancelled += 1
+            return _OUTCOME_CANCELLED
+        if task.deadline is not None and now >= task.deadline:
+            stats.dropped_expired += 1
+            return _OUTCOME_EXPIRED
+        waited = now - task.submitted
+        stats.started += 1
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+        stats.waits.append(waited)
+        if task.scheduling is not None:
+            task.scheduling.pool_wait_seconds += waited
+        return _OUTCOME_RUN
+
+    def _run(self, task: _PoolTask, outcome: str) -> None:
+        result: Any = None
+        exc: BaseException | None = None
+        if outcome == _OUTCOME_EXPIRED:
+            exc = TimeoutError("request deadline passed while the task was queued in the drawing pool")
+        else:
+            try:
+                result = task.context.run(task.func, *task.args)
+            except BaseException as error:  # re-raised in the awaiting coroutine, as run_in_executor does
+                exc = error
+        try:
+            task.loop.call_soon_threadsafe(_resolve, task.future, result, exc)
+        except RuntimeError:
+            logger.debug("drawing pool result dropped: event loop closed func=%s", task.func)
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            queued = dict.fromkeys(self._stats, 0)
+            for task in self._pending:
+                queued[task.stats_class] += 1
+            return {
+                "workers": self.workers,
+                "short_lane_workers": self.short_lane_workers,
+                "queued": len(self._pending),
+                "classes": {name: stats.snapshot(queued[name]) for name, stats in self._stats.items()},
+            }
+
+    def shutdown(self) -> None:
+        """Stop taking tasks; queued ones are cancelled, running ones finish on their threads."""
+        with self._condition:
+            self._shutdown = True
+            pending, self._pending = self._pending, []
+            self._condition.notify_all()
+        for task in pending:
+            try:
+                task.loop.call_soon_threadsafe(task.future.cancel)
+            except RuntimeError:
+                pass
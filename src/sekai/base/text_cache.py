@@ -0,0 +1,136 @@
+"""Process-level text caches for the Pillow path: measurements, ``painter.get_font`` and emoji.
+
+- ``TEXT_MEASURE_CACHE``: Pillow text metrics (``getbbox`` boxes, emoji-composed sizes, single
+  character advances) keyed by ``(kind, font key, text)``, where the font key is the font FILE and
+  size (``painter._font_key``), so every pool thread shares the results. It replaces three plain
+  dicts that were wiped wholesale at 50k entries: after each wipe every measurement on every
+  thread missed at once. It is a lock-striped LRU with byte accounting instead; an entry's cost is
+  dominated by its key (request text), so the estimate is taken from the key.
+- The font cache stays per-thread (a shared ``FreeTypeFont`` serializes every measurement, see
+  ``skia_renderer.ir_builder.get_pil_font``) but is an LRU sized by ``font_cache_size`` rather
+  than 32 entries with a linear oldest-entry scan. Each thread's counters are summed for stats.
+- ``EMOJI_ATLAS``: decoded, pre-scaled RGBA emoji rasters keyed by ``(kind, emoji, width)`` for
+  the Pillow emoji text path. The source PNG bytes are already kept in memory and on disk by
+  ``painter.CachedGoogleEmojiSource``; this pool skips the per-occurrence decode and LANCZOS
+  resize, which Pilmoji repeated for every emoji of every nickname on every render.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Any
+import weakref
+
+from src.sekai.base.cache import BoundedCache, ShardedBoundedCache
+from src.settings import (
+    EMOJI_ATLAS_CACHE_MAX_BYTES,
+    EMOJI_ATLAS_CACHE_SIZE,
+    FONT_CACHE_SIZE,
+    TEXT_MEASURE_CACHE_MAX_BYTES,
+    TEXT_MEASURE_CACHE_SHARDS,
+    TEXT_MEASURE_CACHE_SIZE,
+)
+
+# OrderedDict slot, key tuple, font key and the boxed ints of the value.
+_ENTRY_OVERHEAD_BYTES = 320
+
+
+def _measure_value_bytes(_value: Any) -> int:
+    return 0  # a 4-int box, a size pair or a float: folded into the per-entry overhead
+
+
+def _measure_key_bytes(key: Any) -> int:
+    text = key[-1]
+    return _ENTRY_OVERHEAD_BYTES + (4 * len(text) if isinstance(text, str) else 0)
+
+
+TEXT_MEASURE_CACHE = ShardedBoundedCache(
+    "text_measure",
+    TEXT_MEASURE_CACHE_SIZE,
+    TEXT_MEASURE_CACHE_MAX_BYTES,
+    _measure_value_bytes,
+    TEXT_MEASURE_CACHE_SHARDS,
+    key_estimate=_measure_key_bytes,
+)
+
+
+def _emoji_raster_bytes(raster: Any) -> int:
+    return raster.width * raster.height * 4 + 256
+
+
+EMOJI_ATLAS = BoundedCache("emoji_atlas", EMOJI_ATLAS_CACHE_SIZE, EMOJI_ATLAS_CACHE_MAX_BYTES, _emoji_raster_bytes)
+
+
+class ThreadFontCache:
+    """One thread's ``"{path}_{size}" -> font`` LRU. Only its owner thread touches it, unlocked."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.fonts: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        font = self.fonts.get(key)
+        if font is None:
+            self.misses += 1
+            return None
+        self.fonts.move_to_end(key)
+        self.hits += 1
+        return font
+
+    def set(self, key: str, font: Any) -> None:
+        self.fonts[key] = font
+        while len(self.fonts) > self.max_entries:
+            self.fonts.popitem(last=False)
+            self.evictions += 1
+
+
+_font_cache_local = threading.local()
+_font_caches_lock = threading.Lock()
+_font_caches: weakref.WeakSet[ThreadFontCache] = weakref.WeakSet()
+
+
+def thread_font_cache() -> ThreadFontCache:
+    cache = getattr(_font_cache_local, "font_cache", None)
+    if cache is None:
+        cache = ThreadFontCache(FONT_CACHE_SIZE)
+        _font_cache_local.font_cache = cache
+        with _font_caches_lock:
+            _font_caches.add(cache)
+    return cache
+
+
+def _font_cache_stats() -> dict[str, Any]:
+    with _font_caches_lock:
+        caches = list(_font_caches)
+    hits = sum(cache.hits for cache in caches)
+    misses = sum(cache.misses for cache in caches)
+    total = hits + misses
+    return {
+        "enabled": True,
+        "threads": len(caches),
+        "entries": sum(len(cache.fonts) for cache in caches),
+        "max_entries_per_thread": FONT_CACHE_SIZE,
+        "hits": hits,
+        "misses": misses,
+        "evictions": sum(cache.evictions for cache in caches),
+        "hit_rate": (hits / total) if total > 0 else None,
+    }
+
+
+def get_text_cache_stats() -> dict[str, Any]:
+    """Per-pool stats for /cache/stats (the ``text_caches`` key)."""
+    return {
+        "text_measure": TEXT_MEASURE_CACHE.stats(),
+        "font": _font_cache_stats(),
+        "emoji_atlas": EMOJI_ATLAS.stats(),
+    }
+
+
+def clear_text_caches() -> None:
+    """Drop the shared measurements and emoji rasters. Per-thread fonts are left to their threads."""
+    TEXT_MEASURE_CACHE.clear()
+    EMOJI_ATLAS.clear()
@@ -1,26 +1,40 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 DEFAULT_TIMEZONE = "Asia/Shanghai"
 
+# Distinct timezone strings seen by the process. Requests name a handful of zones, but the value
+# is client-controlled, so the registry is bounded rather than a plain dict.
+_TIMEZONE_REGISTRY_SIZE = 64
 
-def normalize_timezone(value: str | None) -> str:
-    text = (value or "").strip()
+
+@lru_cache(maxsize=_TIMEZONE_REGISTRY_SIZE)
+def _resolve_timezone(text: str) -> tuple[str, ZoneInfo]:
+    """``(normalized name, ZoneInfo)`` for a stripped timezone string.
+
+    Memoized because every drawer row used to redo this: ``ZoneInfo`` caches valid keys itself,
+    but an unknown key is looked up on disk again on every call before falling back.
+    """
     if not text:
-        return DEFAULT_TIMEZONE
+        return DEFAULT_TIMEZONE, ZoneInfo(DEFAULT_TIMEZONE)
     try:
-        ZoneInfo(text)
-        return text
+        return text, ZoneInfo(text)
     except ZoneInfoNotFoundError:
-        return DEFAULT_TIMEZONE
+        return DEFAULT_TIMEZONE, ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def normalize_timezone(value: str | None) -> str:
+    return _resolve_timezone((value or "").strip())[0]
 
 
 def get_timezone(value: str | None) -> ZoneInfo:
-    return ZoneInfo(normalize_timezone(value))
+    return _resolve_timezone((value or "").strip())[1]
 
 
 def request_now(value: str | None) -> datetime:
@@ -72,9 +86,54 @@ def datetime_from_millis(value: float | str | None, timezone_name: str | None) -
     return localize_datetime(value, timezone_name)
 
 
+class RequestClock:
+    """One request's resolved clock: its timezone, its single "now", and memoized timestamps.
+
+    A render used to call ``request_now`` once per section and ``localize_datetime`` once per
+    field per row, each re-resolving the timezone, and the watermark read the wall clock again
+    on its own. The clock is resolved once per request and shared by the model, the drawers and
+    ``add_request_watermark``, so every "now" on one image is the same instant and a raw
+    timestamp value is parsed and converted at most once.
+    """
+
+    __slots__ = ("_localized", "dt", "now", "timezone_name", "tzinfo")
+
+    def __init__(self, timezone_name: str | None, dt: int | None = None, *, now: datetime | None = None) -> None:
+        self.timezone_name, self.tzinfo = _resolve_timezone((timezone_name or "").strip())
+        self.dt = dt
+        self.now = now.astimezone(self.tzinfo) if now is not None else datetime.now(self.tzinfo)
+        self._localized: dict[Any, datetime | None] = {}
+
+    def localize(self, value: datetime | float | str | None) -> datetime | None:
+        """``localize_datetime(value, timezone)``, computed once per distinct raw value."""
+        if value is None:
+            return None
+        try:
+            return self._localized[value]
+        except KeyError:
+            pass
+        localized = localize_datetime(value, self.timezone_name)
+        self._localized[value] = localized
+        return localized
+
+    def watermark_time(self) -> datetime:
+        """The time the request watermark prints: the request's ``dt``, else this clock's now."""
+        return self.localize(self.dt) or self.now
+
+
 class TimeZoneRequest(BaseModel):
     timezone: str = Field(default=DEFAULT_TIMEZONE)
     dt: int | None = Field(default=None)
+    _clock: RequestClock | None = PrivateAttr(default=None)
+
+    @property
+    def clock(self) -> RequestClock:
+        """This request's :class:`RequestClock`, rebuilt (keeping its now) if timezone/dt changed."""
+        clock = self._clock
+        if clock is None or clock.timezone_name != self.timezone or clock.dt != self.dt:
+            clock = RequestClock(self.timezone, self.dt, now=clock.now if clock is not None else None)
+            self._clock = clock
+        return clock
 
     def model_post_init(self, __context, /) -> None:
         self.timezone = normalize_timezone(self.timezone)
@@ -17,7 +17,11 @@ Pillow painter draws the list directly and ``IRPainter`` ships the same list to
 ``tris`` field of the ``TriangleBg`` node. Neither backend rolls a die.
 
 The palette is a different story and was never broken: both sides interpolate the same tables from
-the same fractional hour, so it stays where it is.
+the same fractional hour, so it stays where it is. That hour moves in five-minute steps
+(``palette_hour_bucket``): a background is then a pure function of a small key, and both backends
+keep finished rasters for it — ``TRIANGLE_BG_CACHE`` here for the Pillow painter, the native
+renderer's background cache for Skia — instead of re-drawing the gradients and a few hundred
+triangles on every request.
 """
 
 from __future__ import annotations
@@ -26,8 +30,13 @@ import colorsys
 from dataclasses import dataclass
 from datetime import datetime
 import hashlib
+import math
 import os
 import random
+from typing import Any
+
+from src.sekai.base.cache import BoundedCache
+from src.settings import TRIANGLE_BG_CACHE_MAX_BYTES, TRIANGLE_BG_CACHE_SIZE
 
 # (hour, hue, saturation, lightness) — the custom-hue path's time-of-day modulation.
 _TIME_COLORS: tuple[tuple[float, float, float, float], ...] = (
@@ -127,11 +136,21 @@ class TriangleBgSpec:
     triangles: tuple[Triangle, ...]
 
 
+# The palette is interpolated over hours; a five-minute step is invisible in it and bounds how many
+# distinct backgrounds one canvas size can have in a day (288).
+PALETTE_HOUR_STEPS_PER_HOUR = 12
+
+
+def palette_hour_bucket(hour: float) -> float:
+    """``hour`` floored to the palette step."""
+    return math.floor(hour * PALETTE_HOUR_STEPS_PER_HOUR) / PALETTE_HOUR_STEPS_PER_HOUR
+
+
 def background_hour() -> float:
-    """The fractional hour both backends key the background on.
+    """The fractional hour both backends key the background on, in palette steps.
 
-    ``HARUKI_BG_TEST_HOUR`` pins it, which is what makes a background reproducible across processes
-    (the parity harnesses rely on this)."""
+    ``HARUKI_BG_TEST_HOUR`` pins it exactly, which is what makes a background reproducible across
+    processes (the parity harnesses rely on this)."""
     override = os.getenv("HARUKI_BG_TEST_HOUR")
     if override is not None:
         try:
@@ -139,7 +158,7 @@ def background_hour() -> float:
         except ValueError:
             pass
     now = datetime.now()
-    return now.hour + now.minute / 60 + now.second / 3600
+    return palette_hour_bucket(now.hour + now.minute / 60 + now.second / 3600)
 
 
 def _lerp_tuple(c1, c2, t: float) -> tuple[int, ...]:
@@ -212,8 +231,8 @@ def triangle_bg_seed(
     """A stable seed for this background's scatter.
 
     ``hour`` is quantized to the whole hour on purpose. The palette keeps the *fractional* hour and
-    goes on shifting smoothly with the clock; only the layout is pinned, so the same page renders
-    the same triangles for an hour at a time. That is what makes a render reproducible — and what
+    goes on shifting with the clock in five-minute steps; only the layout is pinned, so the same
+    page renders the same triangles for an hour at a time. That is what makes a render reproducible — and what
     lets a raster cache key on the seed at all. (The old Rust seed took the fractional hour at
     millisecond precision, so it changed roughly every 3.6 seconds.)
 
@@ -335,3 +354,40 @@ def build_triangle_bg(
         white_alpha=white_alpha,
         triangles=tuple(triangles),
     )
+
+
+def _raster_bytes(image: Any) -> int:
+    return image.width * image.height * 4
+
+
+# Finished Pillow background rasters. Values are shared read-only: Painter only pastes them.
+TRIANGLE_BG_CACHE = BoundedCache("triangle_bg", TRIANGLE_BG_CACHE_SIZE, TRIANGLE_BG_CACHE_MAX_BYTES, _raster_bytes)
+
+
+def triangle_bg_cache_key(
+    width: int, height: int, hour: float, time_color: bool, main_hue: float | None, size_fixed_rate: float
+) -> tuple:
+    """``(width, height, mode, main_hue, palette hour, seed)``: every input of a finished background.
+
+    The seed already folds in the scatter's inputs (the whole hour among them). The hue is kept
+    whole because the palette reads it directly; the palette step only matters to the time-of-day
+    palette, so a custom-hue background keys ``None`` there and is shared for the whole hour."""
+    main_hue = 0.0 if main_hue is None else float(main_hue)
+    size_fixed_rate = float(size_fixed_rate or 0.0)
+    return (
+        width,
+        height,
+        bool(time_color),
+        main_hue,
+        palette_hour_bucket(hour) if time_color else None,
+        triangle_bg_seed(width, height, hour, time_color, main_hue, size_fixed_rate),
+    )
+
+
+def get_triangle_bg_cache_stats() -> dict[str, Any]:
+    """Pool stats for /cache/stats (the ``triangle_bg_cache`` key)."""
+    return TRIANGLE_BG_CACHE.stats()
+
+
+def clear_triangle_bg_cache() -> None:
+    TRIANGLE_BG_CACHE.clear()
@@ -1,10 +1,12 @@
 import asyncio
 from collections import OrderedDict
+from collections.abc import Callable
 import contextvars
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import lru_cache
+from functools import cache, lru_cache
 import hashlib
+import importlib
 import io
 import json
 import logging
@@ -14,12 +16,13 @@ from pathlib import Path
 from stat import S_ISREG
 import threading
 import time
+from types import MappingProxyType
 from typing import Any, Literal
 from uuid import uuid4
 
 from PIL import Image, ImageDraw, ImageFont
 
-from src.core.debug import current_request_context, snapshot_process_metrics
+from src.core.debug import current_request_context, current_request_scheduling, snapshot_process_metrics
 from src.core.pillow_telemetry import (
     PILLOW_TOUCH_IMAGE_DECODE,
     PILLOW_TOUCH_IMAGE_HEADER_PROBE,
@@ -37,11 +40,14 @@ from src.settings import (
     FONT_DIR,
     IMAGE_CACHE_MAX_BYTES,
     IMAGE_CACHE_SIZE,
+    THREAD_POOL_SHORT_LANE_WORKERS,
     THUMB_CACHE_MAX_BYTES,
     THUMB_CACHE_SIZE,
     TMP_PATH,
 )
 
+from .mip_pyramid import resize_with_mip_pyramid
+
 logger = logging.getLogger(__name__)
 
 MissingImageMode = Literal["raise", "placeholder"]
@@ -849,8 +855,15 @@ def get_runtime_cache_stats() -> dict[str, Any]:
     composed_disk_stats = _composed_image_disk_cache.stats()
     # Imported lazily: the Skia payload cache lives under src.sekai.skia_renderer, which imports
     # this module transitively; the custom-profile pools live next to their renderer.
+    from src.sekai.base.layout_snapshot import get_layout_snapshot_cache_stats
+    from src.sekai.base.mip_pyramid import get_mip_pyramid_cache_stats
+    from src.sekai.base.text_cache import get_text_cache_stats
+    from src.sekai.base.triangle_bg import get_triangle_bg_cache_stats
+    from src.sekai.chart.cache import get_chart_cache_stats
+    from src.sekai.misc.cache import get_misc_cache_stats
     from src.sekai.profile.custom_profile.cache import get_custom_profile_cache_stats
     from src.sekai.skia_renderer.payload_cache import get_skia_payload_cache_stats
+    from src.sekai.skia_renderer.subtree_cache import get_native_subtree_cache_stats
 
     return {
         "image_cache": image_stats,
@@ -859,6 +872,13 @@ def get_runtime_cache_stats() -> dict[str, Any]:
         "composed_image_disk_cache": composed_disk_stats,
         "skia_payload_cache": get_skia_payload_cache_stats(),
         "custom_profile_caches": get_custom_profile_cache_stats(),
+        "chart_caches": get_chart_cache_stats(),
+        "misc_caches": get_misc_cache_stats(),
+        "native_subtree_cache": get_native_subtree_cache_stats(),
+        "layout_snapshot_cache": get_layout_snapshot_cache_stats(),
+        "mip_pyramid_cache": get_mip_pyramid_cache_stats(),
+        "text_caches": get_text_cache_stats(),
+        "triangle_bg_cache": get_triangle_bg_cache_stats(),
     }
 
 
@@ -1160,6 +1180,27 @@ def _resolve_and_stat(base_path: Path, path: str) -> tuple[Path, str, os.stat_re
     return full_path, full_path_str, st
 
 
+# ASSET_INFO_CAPABILITY 1 added asset_image_info (dimensions from the header, read in Rust).
+_REQUIRED_NATIVE_ASSET_INFO_CAPABILITY = 1
+
+
+@cache
+def _native_asset_image_info() -> Callable[[str, str], Any] | None:
+    """The wheel's ``asset_image_info``, or ``None`` when the module is missing or too old.
+
+    Resolved once per process, like ``painter._native_prefix_advances``: this API reads no IR.
+    """
+    try:
+        native = importlib.import_module("haruki_skia_renderer")
+    except ImportError:
+        return None
+    info_fn = getattr(native, "asset_image_info", None)
+    capability = int(getattr(native, "ASSET_INFO_CAPABILITY", 0) or 0)
+    if capability < _REQUIRED_NATIVE_ASSET_INFO_CAPABILITY or not callable(info_fn):
+        return None
+    return info_fn
+
+
 @lru_cache(maxsize=16384)
 def _load_asset_image_ref_cached(
     full_path_str: str,
@@ -1167,6 +1208,26 @@ def _load_asset_image_ref_cached(
     file_size: int,
 ) -> AssetImageRef:
     full_path = Path(full_path_str)
+    # ``full_path`` is already resolved and confined to the asset root, so its own directory is
+    # a safe root for the native confinement check. The ref only needs the size for layout (Rust
+    # decodes the file itself and normalizes it to RGBA); the file identity stays the live stat's.
+    # A header the native probe rejects takes the Pillow probe below, which raises the same
+    # OSError callers already turn into the missing-image placeholder.
+    info_fn = _native_asset_image_info()
+    if info_fn is not None:
+        try:
+            info = info_fn(str(full_path.parent), full_path.name)
+            size = (int(info["width"]), int(info["height"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+        else:
+            return AssetImageRef(
+                path=full_path,
+                size=size,
+                mode=str(info.get("mode") or "RGBA"),
+                mtime_ns=mtime_ns,
+                file_size=file_size,
+            )
     record_pillow_touch(PILLOW_TOUCH_IMAGE_HEADER_PROBE)
     with Image.open(full_path) as image:
         return AssetImageRef(path=full_path, size=image.size, mode=image.mode, mtime_ns=mtime_ns, file_size=file_size)
@@ -1195,7 +1256,7 @@ async def get_asset_image_ref(
         raise ValueError("图片路径不能为空(None)")
 
     try:
-        return await run_in_pool(_load_asset_image_ref_sync, base_path, path)
+        return await run_in_pool(_load_asset_image_ref_sync, base_path, path, lane="short")
     except (FileNotFoundError, OSError) as exc:
         if on_missing == "placeholder":
             _log_missing_image_once(path, exc)
@@ -1203,6 +1264,147 @@ async def get_asset_image_ref(
         raise
 
 
+PrefetchMissingMode = Literal["raise", "placeholder", "none"]
+_PREFETCH_ERRORS = (FileNotFoundError, OSError)
+# Paths per pool hop. Warm refs are one stat each, so small batches would only add hops; the
+# cap on hops (the pool size) keeps a cold 100-asset page spread across every worker.
+_PREFETCH_MIN_PATHS_PER_HOP = 8
+
+PrefetchKey = str | tuple[str | None, tuple[str | None, ...], PrefetchMissingMode] | None
+
+
+def _probe_asset_chains_sync(base_path: Path, chains: list[tuple[str, ...]]) -> list[AssetImageRef | BaseException]:
+    """Resolve, stat and header-probe each chain; the first candidate that loads wins."""
+    results: list[AssetImageRef | BaseException] = []
+    for chain in chains:
+        error: BaseException | None = None
+        for candidate in chain:
+            try:
+                results.append(_load_asset_image_ref_sync(base_path, candidate))
+                break
+            except (*_PREFETCH_ERRORS, ValueError) as exc:
+                error = exc
+        else:
+            results.append(error or FileNotFoundError(chain))
+    return results
+
+
+def _next_unprobed(chain: tuple[str, ...], probed: dict[str, AssetImageRef | BaseException]) -> str | None:
+    """The candidate ``chain`` still waits on, or ``None`` once it is settled."""
+    for candidate in chain:
+        result = probed.get(candidate)
+        if result is None:
+            return candidate
+        if isinstance(result, AssetImageRef):
+            return None
+    return None
+
+
+class AssetPrefetchPlan:
+    """Every asset ref one drawer reads, resolved in one deduplicated, batched parallel pass.
+
+    A drawer used to await ``get_asset_image_ref`` per asset (each its own pool hop), often one
+    after another between layout steps. Instead it registers every path up front with
+    :meth:`add` — optional fallbacks are tried in order — awaits :meth:`resolve` once, and then
+    builds the widget tree synchronously from the returned read-only mapping.
+
+    ``on_missing`` mirrors :func:`get_asset_image_ref`: ``"placeholder"`` maps a missing asset
+    to the usual placeholder image and ``"raise"`` makes :meth:`resolve` raise; ``"none"``
+    maps it to ``None`` so the drawer can apply its own fallback. A path outside the asset root
+    raises ``ValueError`` except under ``"none"``.
+
+    Every path is probed once however many registrations name it, but each registration keeps its
+    own fallbacks and mode: the profile background read with ``"none"`` still falls back to the
+    default background when another part of the page reads the same path with ``"placeholder"``.
+    The first registration of a path is read back under the path itself; a later one that differs
+    in fallbacks or mode gets its own key, which :meth:`add` returns.
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        self._base_path = base_path
+        self._registrations: dict[PrefetchKey, tuple[tuple[str | None, ...], PrefetchMissingMode]] = {}
+        self._keys: dict[tuple[tuple[str | None, ...], PrefetchMissingMode], PrefetchKey] = {}
+        self._requested = 0
+
+    def __len__(self) -> int:
+        return len(self._registrations)
+
+    def add(
+        self, path: str | None, *fallbacks: str | None, on_missing: PrefetchMissingMode = "placeholder"
+    ) -> PrefetchKey:
+        """Register ``path`` (and its fallbacks); returns the key to read it back with."""
+        self._requested += 1
+        registration = ((path, *fallbacks), on_missing)
+        key = self._keys.get(registration)
+        if key is None:
+            key = path if path not in self._registrations else (path, tuple(fallbacks), on_missing)
+            self._keys[registration] = key
+            self._registrations[key] = registration
+        return key
+
+    async def resolve(self, label: str = "") -> MappingProxyType:
+        started = time.perf_counter()
+        chains = {
+            key: tuple(candidate for candidate in candidates if candidate and candidate.strip())
+            for key, (candidates, _mode) in self._registrations.items()
+        }
+        # Shared by every registration. Each round probes the next candidate every unsettled chain
+        # waits on, so a page without fallbacks (or whose primaries all load) takes one round.
+        probed: dict[str, AssetImageRef | BaseException] = {}
+        hops = 0
+        while True:
+            wanted = list(
+                dict.fromkeys(
+                    candidate for chain in chains.values() if (candidate := _next_unprobed(chain, probed)) is not None
+                )
+            )
+            if not wanted:
+                break
+            per_hop = max(_PREFETCH_MIN_PATHS_PER_HOP, -(-len(wanted) // max(1, DEFAULT_THREAD_POOL_SIZE)))
+            batches = [
+                [(path,) for path in wanted[start : start + per_hop]] for start in range(0, len(wanted), per_hop)
+            ]
+            results = await asyncio.gather(
+                *[run_in_pool(_probe_asset_chains_sync, self._base_path, b, lane="short") for b in batches]
+            )
+            probed.update(zip(wanted, (result for batch in results for result in batch), strict=True))
+            hops += len(batches)
+
+        assets: dict[PrefetchKey, ImageSource | None] = {}
+        for key, ((path, *_fallbacks), mode) in self._registrations.items():
+            result: AssetImageRef | BaseException | None = None  # None: every candidate was empty
+            for candidate in chains[key]:
+                result = probed[candidate]
+                if isinstance(result, AssetImageRef):
+                    break
+            if isinstance(result, AssetImageRef):
+                assets[key] = result
+            elif mode == "none":
+                assets[key] = None
+            elif result is None:
+                if mode == "raise":
+                    raise ValueError("图片路径不能为空(None)")
+                _log_missing_image_once(path, "empty-path")
+                assets[key] = _get_missing_placeholder_image(path)
+            elif mode == "raise" or not isinstance(result, _PREFETCH_ERRORS):
+                raise result
+            else:
+                _log_missing_image_once(path, result)
+                assets[key] = _get_missing_placeholder_image(path)
+
+        logger.debug(
+            "[perf] asset.prefetch id=%s label=%s requested=%d registrations=%d probed=%d pool_hops=%d elapsed=%.3fs",
+            current_request_context()["request_id"],
+            label,
+            self._requested,
+            len(self._registrations),
+            len(probed),
+            hops,
+            time.perf_counter() - started,
+        )
+        return MappingProxyType(assets)
+
+
 def _load_image_resized_sync(
     base_path: Path,
     path: str,
@@ -1239,17 +1441,21 @@ def _load_image_resized_full_path_sync(
         if cached is not None:
             return cached
 
-    # Read-only full-size cache probe (an opportunistic bonus lookup, so it stays out of the
-    # hit/miss stats entirely); deliberately NO full-size cache put — resized consumers
-    # (e.g. hundreds of list jackets) would thrash the byte budget with full-size
-    # entries they never read again.
-    loaded = None
-    if _cache_enabled(full_path_str):
-        loaded = _load_image_cached(full_path_str, stat.st_mtime_ns, stat.st_size, count_stats=False)
-    if loaded is None:
-        loaded = _open_image_copy(full_path)
-    resized = loaded.resize((target_w, target_h), resample)
-    loaded.close()
+    def _load_source() -> Image.Image:
+        # Read-only full-size cache probe (an opportunistic bonus lookup, so it stays out of the
+        # hit/miss stats entirely); deliberately NO full-size cache put — resized consumers
+        # (e.g. hundreds of list jackets) would thrash the byte budget with full-size
+        # entries they never read again.
+        loaded = None
+        if _cache_enabled(full_path_str):
+            loaded = _load_image_cached(full_path_str, stat.st_mtime_ns, stat.st_size, count_stats=False)
+        return _open_image_copy(full_path) if loaded is None else loaded
+
+    # Every target size of a hot asset shares one mip pyramid, so a miss resamples off the
+    # nearest large-enough level instead of the full-resolution source (mip_pyramid.py).
+    resized = resize_with_mip_pyramid(
+        (full_path_str, stat.st_mtime_ns, stat.st_size), _load_source, (target_w, target_h), resample
+    )
 
     if _cache_enabled(full_path_str):
         ret = resized.copy()
@@ -1648,41 +1854,52 @@ class TempFilePath:
 
 # ============================ 异步和任务 ============================ #
 
-from concurrent.futures import ThreadPoolExecutor
+from .pool_scheduler import PoolLane, PoolScheduler
 
-_default_pool_executor = ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE)
+_default_pool_executor = PoolScheduler(DEFAULT_THREAD_POOL_SIZE, THREAD_POOL_SHORT_LANE_WORKERS)
 _SLOW_POOL_TASK_SECONDS = 0.2
 
 
-async def run_in_pool(func, *args, pool=None):
-    if pool is None:
-        global _default_pool_executor
-        pool = _default_pool_executor
+async def run_in_pool(func, *args, pool=None, lane: PoolLane = "render"):
+    """在绘图线程池中执行同步函数。
+
+    默认池按请求优先级 / 截止时间 / 提交顺序挑选任务(见 ``pool_scheduler``);``lane="short"``
+    留给毫秒级的小任务(资源头探测等)。传入 ``pool`` 时按普通 executor 提交,不参与调度。
+    """
     request_ctx = current_request_context()
     context = contextvars.copy_context()
+    scheduling = current_request_scheduling()
     started = time.perf_counter()
     try:
-        return await asyncio.get_running_loop().run_in_executor(pool, context.run, func, *args)
+        if pool is not None:
+            return await asyncio.get_running_loop().run_in_executor(pool, context.run, func, *args)
+        return await _default_pool_executor.submit(func, args, context=context, lane=lane, scheduling=scheduling)
     finally:
         elapsed = time.perf_counter() - started
         if elapsed >= _SLOW_POOL_TASK_SECONDS:
             logger.log(
                 logging.WARNING if elapsed >= 1.0 else logging.INFO,
-                "pool.task id=%s path=%s method=%s func=%s elapsed=%.3fs metrics=%s",
+                "pool.task id=%s path=%s method=%s func=%s lane=%s elapsed=%.3fs metrics=%s",
                 request_ctx["request_id"],
                 request_ctx["path"],
                 request_ctx["method"],
                 getattr(func, "__name__", repr(func)),
+                lane,
                 elapsed,
                 snapshot_process_metrics(include_asyncio=False),
             )
 
 
+def get_pool_scheduler_stats() -> dict[str, Any]:
+    """Per-class queue wait of the drawing pool (the ``pool_scheduler`` key of /render-stats)."""
+    return _default_pool_executor.stats()
+
+
 def shutdown_utils() -> None:
     """关闭 utils 模块持有的全局资源（线程池、图片缓存、临时文件）"""
     global _image_cache_total_bytes, _thumb_cache_total_bytes
 
-    _default_pool_executor.shutdown(wait=False)
+    _default_pool_executor.shutdown()
 
     cleanup_expired_tmp_files()
 
@@ -1707,6 +1924,20 @@ def shutdown_utils() -> None:
     _load_asset_image_ref_cached.cache_clear()
     _composed_image_cache.clear()
 
+    from src.sekai.base.layout_snapshot import clear_layout_snapshot_cache
+    from src.sekai.base.mip_pyramid import clear_mip_pyramid_cache
+    from src.sekai.base.text_cache import clear_text_caches
+    from src.sekai.base.triangle_bg import clear_triangle_bg_cache
+    from src.sekai.chart.cache import clear_chart_caches
+    from src.sekai.misc.cache import clear_misc_caches
     from src.sekai.skia_renderer.payload_cache import clear_skia_payload_cache
+    from src.sekai.skia_renderer.subtree_cache import clear_native_subtree_cache
 
     clear_skia_payload_cache()
+    clear_chart_caches()
+    clear_misc_caches()
+    clear_native_subtree_cache()
+    clear_layout_snapshot_cache()
+    clear_mip_pyramid_cache()
+    clear_text_caches()
+    clear_triangle_bg_cache()
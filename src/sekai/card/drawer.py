@@ -33,7 +33,6 @@ from src.sekai.base.plot import (
     TextStyle,
     VSplit,
 )
-from src.sekai.base.timezone import datetime_from_millis, request_now
 from src.sekai.base.utils import (
     get_asset_image_ref,
 )
@@ -596,7 +595,7 @@ async def _build_card_detail_canvas(
     _extra_imgs = dict(zip(_extra_keys, await asyncio.gather(*_extra_tasks.values()))) if _extra_tasks else {}
 
     # 时间格式化
-    release_time = datetime_from_millis(card_info.release_at, rqd.timezone)
+    release_time = rqd.clock.localize(card_info.release_at)
 
     # 样式定义
     title_style_def = TextStyle(font=DEFAULT_BOLD_FONT, size=24, color=(0, 0, 0))
@@ -889,7 +888,7 @@ async def _build_card_list_canvas(rqd: CardListRequest) -> Canvas:
 
     with Canvas(bg=bg).set_padding(BG_PADDING) as canvas:
         with VSplit().set_sep(16).set_content_align("lt").set_item_align("lt"):
-            now = request_now(rqd.timezone)
+            now = rqd.clock.now
             if rqd.title:
                 with (
                     HSplit()
@@ -915,7 +914,7 @@ async def _build_card_list_canvas(rqd: CardListRequest) -> Canvas:
 
                     with Frame().set_content_align("lb").set_bg(bg):
                         # 检查是否为未来卡牌
-                        release_time = datetime_from_millis(card.release_at, rqd.timezone)
+                        release_time = rqd.clock.localize(card.release_at)
                         if release_time > now:
                             TextBox("未上线", leak_style).set_offset((4, -4))
 
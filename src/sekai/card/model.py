@@ -8,7 +8,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
-from src.sekai.base.timezone import TimeZoneRequest, localize_datetime, parse_datetime_utc
+from src.sekai.base.timezone import TimeZoneRequest, parse_datetime_utc
 from src.sekai.profile.model import CardFullThumbnailRequest, DetailedProfileCardRequest
 
 # ========== 基础数据模型 ==========
@@ -298,11 +298,11 @@ class CardDetailRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         if self.event_info is not None:
-            self.event_info.start_at = localize_datetime(self.event_info.start_at, self.timezone)
-            self.event_info.end_at = localize_datetime(self.event_info.end_at, self.timezone)
+            self.event_info.start_at = self.clock.localize(self.event_info.start_at)
+            self.event_info.end_at = self.clock.localize(self.event_info.end_at)
         if self.gacha_info is not None:
-            self.gacha_info.start_at = localize_datetime(self.gacha_info.start_at, self.timezone)
-            self.gacha_info.end_at = localize_datetime(self.gacha_info.end_at, self.timezone)
+            self.gacha_info.start_at = self.clock.localize(self.gacha_info.start_at)
+            self.gacha_info.end_at = self.clock.localize(self.gacha_info.end_at)
 
 
 class CardListRequest(TimeZoneRequest):
@@ -0,0 +1,67 @@
+"""Process-level caches for the chart endpoint.
+
+Every chart request used to reopen and reparse the SUS file and reread the style sheet, and a new
+release means the same handful of scores is requested over and over. Parsing is pure in the file
+contents, so the parsed values are kept here under the file's ``(mtime_ns, size)`` signature:
+a score or style replaced in place by the asset updater misses and is reparsed.
+
+- ``CHART_SCORE_CACHE``: parsed ``Score`` objects. ``Score.set_meta`` mutates, so the request's
+  meta is applied BEFORE insertion and is part of the key; a cached score is never mutated again
+  and is shared read-only across concurrent renders.
+- ``CHART_STYLE_CACHE``: style sheet text (shares the score pool's limits).
+- ``CHART_RASTER_CACHE``: the finished crate output (zero-copy raster or PNG), keyed by the score
+  key, the style signature and every render option. Off by default: a chart raster is tens of
+  megabytes, so it is sized explicitly by the operator.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.sekai.base.cache import BoundedCache
+from src.settings import (
+    CHART_RASTER_CACHE_MAX_BYTES,
+    CHART_RASTER_CACHE_SIZE,
+    CHART_SCORE_CACHE_MAX_BYTES,
+    CHART_SCORE_CACHE_SIZE,
+)
+
+
+def _score_bytes(score: Any) -> int:
+    """Rough resident size of a parsed score: its events and notes dominate."""
+    try:
+        return (int(score.event_count()) + int(score.note_count())) * 256 + 4096
+    except Exception:
+        return 64 * 1024
+
+
+def _style_bytes(style_sheet: str) -> int:
+    return len(style_sheet) * 4 + 64
+
+
+def _raster_bytes(value: tuple[Any, int, int, str]) -> int:
+    """``(mem_image, width, height, transport)`` as returned by ``render_chart_mem_image``."""
+    mem_image, _width, height, _transport = value
+    if isinstance(mem_image, bytes):
+        return len(mem_image)
+    _w, _h, row_bytes, _color_type, _alpha_type, _raster = mem_image
+    return int(row_bytes) * int(height)
+
+
+CHART_SCORE_CACHE = BoundedCache("chart_score", CHART_SCORE_CACHE_SIZE, CHART_SCORE_CACHE_MAX_BYTES, _score_bytes)
+CHART_STYLE_CACHE = BoundedCache("chart_style", CHART_SCORE_CACHE_SIZE, CHART_SCORE_CACHE_MAX_BYTES, _style_bytes)
+CHART_RASTER_CACHE = BoundedCache("chart_raster", CHART_RASTER_CACHE_SIZE, CHART_RASTER_CACHE_MAX_BYTES, _raster_bytes)
+
+
+def get_chart_cache_stats() -> dict[str, Any]:
+    """Per-pool stats for /cache/stats (the ``chart_caches`` key)."""
+    return {
+        "score": CHART_SCORE_CACHE.stats(),
+        "style": CHART_STYLE_CACHE.stats(),
+        "raster": CHART_RASTER_CACHE.stats(),
+    }
+
+
+def clear_chart_caches() -> None:
+    for pool in (CHART_SCORE_CACHE, CHART_STYLE_CACHE, CHART_RASTER_CACHE):
+        pool.clear()
@@ -9,6 +9,7 @@ from pjsekai_scores_rs import Drawing, Score
 
 from src.core.debug import set_render_backend
 from src.core.image_payload import EncodedImagePayload
+from src.sekai.base.cache import MISSING, file_signature, optional_file_signature
 from src.sekai.base.draw import (
     WATERMARK_BOTTOM_OFFSET,
     WATERMARK_LINE_SEP,
@@ -18,9 +19,15 @@ from src.sekai.base.draw import (
     build_request_watermark_text,
     get_watermark_render_spec,
 )
-from src.sekai.base.painter import get_font, get_text_size
+from src.sekai.base.painter import get_font, get_text_width, native_text_width
 from src.sekai.base.utils import run_in_pool
-from src.sekai.skia_renderer.canvas import load_native_renderer, payload_from_native, skia_plot_enabled
+from src.sekai.chart.cache import CHART_RASTER_CACHE, CHART_SCORE_CACHE, CHART_STYLE_CACHE
+from src.sekai.skia_renderer.canvas import (
+    load_native_renderer,
+    payload_from_native,
+    resolve_png_encode_profile,
+    skia_plot_enabled,
+)
 from src.sekai.skia_renderer.ir_builder import IRBuilder
 from src.sekai.skia_renderer.render_stats import (
     OUTCOME_DISABLED,
@@ -72,19 +79,72 @@ def load_score(rqd: GenerateMusicChartRequest) -> Score:
     return Score.open(str(ASSETS_BASE_DIR / rqd.sus_path))
 
 
-def _prepare_chart_render(rqd: GenerateMusicChartRequest) -> tuple[Drawing, Score]:
-    style_sheet = ""
-    if rqd.style_path:
-        style_sheet = (ASSETS_BASE_DIR / rqd.style_path).read_text(encoding="utf-8")
+def _score_meta(rqd: GenerateMusicChartRequest) -> dict[str, str]:
+    return {
+        "title": rqd.title,
+        "artist": rqd.artist,
+        "difficulty": rqd.difficulty,
+        "playlevel": str(rqd.play_level),
+        "jacket": str(ASSETS_BASE_DIR / rqd.jacket_path),
+        "songid": str(rqd.music_id),
+    }
+
+
+def _score_cache_key(rqd: GenerateMusicChartRequest) -> tuple | None:
+    """``(sus path, file signature, meta)``, or ``None`` for an uncacheable score.
+
+    Inline ``chart_json`` is user content, not an asset: it is parsed per request.
+    """
+    if rqd.chart_json is not None or not rqd.sus_path:
+        return None
+    sus_path = ASSETS_BASE_DIR / rqd.sus_path
+    try:
+        signature = file_signature(sus_path)
+    except OSError:
+        return None  # Score.open raises the canonical error below
+    return (str(sus_path), signature, tuple(sorted(_score_meta(rqd).items())))
+
+
+def _load_score_with_meta(rqd: GenerateMusicChartRequest, key: tuple | None) -> Score:
+    if key is not None:
+        cached = CHART_SCORE_CACHE.get(key)
+        if cached is not MISSING:
+            return cached
     score = load_score(rqd)
-    score.set_meta(
-        title=rqd.title,
-        artist=rqd.artist,
-        difficulty=rqd.difficulty,
-        playlevel=str(rqd.play_level),
-        jacket=str(ASSETS_BASE_DIR / rqd.jacket_path),
-        songid=str(rqd.music_id),
-    )
+    score.set_meta(**_score_meta(rqd))
+    if key is not None:
+        # Inserted only after set_meta: the cached score is shared and must never mutate again.
+        CHART_SCORE_CACHE.set(key, score)
+    return score
+
+
+def _style_cache_key(style_path: str | None) -> tuple | None:
+    if not style_path:
+        return None
+    path = ASSETS_BASE_DIR / style_path
+    try:
+        return (str(path), file_signature(path))
+    except OSError:
+        return None
+
+
+def load_style_sheet(style_path: str | None) -> str:
+    if not style_path:
+        return ""
+    key = _style_cache_key(style_path)
+    if key is not None:
+        cached = CHART_STYLE_CACHE.get(key)
+        if cached is not MISSING:
+            return cached
+    style_sheet = (ASSETS_BASE_DIR / style_path).read_text(encoding="utf-8")
+    if key is not None:
+        CHART_STYLE_CACHE.set(key, style_sheet)
+    return style_sheet
+
+
+def _prepare_chart_render(rqd: GenerateMusicChartRequest) -> tuple[Drawing, Score]:
+    style_sheet = load_style_sheet(rqd.style_path)
+    score = _load_score_with_meta(rqd, _score_cache_key(rqd))
     drawing = Drawing(
         note_host=str(ASSETS_BASE_DIR / rqd.note_host),
         style_sheet=style_sheet,
@@ -96,6 +156,34 @@ def _prepare_chart_render(rqd: GenerateMusicChartRequest) -> tuple[Drawing, Scor
     return drawing, score
 
 
+def _raster_cache_key(rqd: GenerateMusicChartRequest, allow_raster: bool) -> tuple | None:
+    """Everything the crate output depends on, or ``None`` when it cannot be cached.
+
+    The jacket is drawn into the raster, so its signature is part of the key; a style path that
+    does not resolve is left uncached rather than keyed on a missing file.
+    """
+    if not CHART_RASTER_CACHE.enabled:
+        return None
+    score_key = _score_cache_key(rqd)
+    if score_key is None:
+        return None
+    style_key = _style_cache_key(rqd.style_path)
+    if rqd.style_path and style_key is None:
+        return None
+    fonts = chart_font_kwargs()
+    return (
+        score_key,
+        style_key,
+        optional_file_signature(ASSETS_BASE_DIR / rqd.jacket_path),
+        str(ASSETS_BASE_DIR / rqd.note_host),
+        rqd.skill,
+        json.dumps(rqd.music_meta, sort_keys=True, ensure_ascii=False, default=str),
+        rqd.target_segment_seconds,
+        tuple((name, tuple(paths)) for name, paths in sorted(fonts.items())),
+        allow_raster,
+    )
+
+
 def render_chart_png_bytes(rqd: GenerateMusicChartRequest) -> bytes:
     """Render the chart via pjsekai_scores_rs and return encoded PNG bytes."""
     drawing, score = _prepare_chart_render(rqd)
@@ -108,6 +196,22 @@ def render_chart_mem_image(
     allow_raster: bool = True,
 ) -> tuple[object, int, int, str]:
     """Return a render_scene mem image, preferring pjsekai_scores_rs' zero-copy raster transport."""
+    key = _raster_cache_key(rqd, allow_raster)
+    if key is not None:
+        cached = CHART_RASTER_CACHE.get(key)
+        if cached is not MISSING:
+            return cached
+    result = _render_chart_mem_image_uncached(rqd, allow_raster=allow_raster)
+    if key is not None:
+        CHART_RASTER_CACHE.set(key, result)
+    return result
+
+
+def _render_chart_mem_image_uncached(
+    rqd: GenerateMusicChartRequest,
+    *,
+    allow_raster: bool,
+) -> tuple[object, int, int, str]:
     drawing, score = _prepare_chart_render(rqd)
     raster_render = getattr(drawing, "raster", None)
     if allow_raster and raster_render is not None:
@@ -200,10 +304,15 @@ async def try_render_music_chart_payload(rqd: GenerateMusicChartRequest) -> Enco
     # 没有整页 payload 缓存,这是有意的:调用方 (cloud) 已按 payload 去重,同一个 payload 不会来第二次,
     # 页面级缓存永远不可能命中,而每次 miss 仍会 insert 挤占共享 LRU。
     watermark_text = build_request_watermark_text(rqd)
+    png_profile = resolve_png_encode_profile(CHART_ENDPOINT)
 
     def _render():
         chart_image, w, h, transport = render_chart_mem_image(rqd, allow_raster=allow_raster)
-        font_size, lines, text_w, text_h = get_watermark_render_spec(watermark_text, w - WATERMARK_RIGHT_OFFSET, 12)
+        # Measured natively when the wheel can, so the watermark shell never touches Pillow.
+        text_width = native_text_width() or get_text_width
+        font_size, lines, text_w, text_h = get_watermark_render_spec(
+            watermark_text, w - WATERMARK_RIGHT_OFFSET, 12, text_width
+        )
         footer_h = WATERMARK_TOP_OFFSET + text_h + WATERMARK_BOTTOM_OFFSET + WATERMARK_SHADOW_OFFSET
         b = IRBuilder(
             w,
@@ -214,6 +323,7 @@ async def try_render_music_chart_payload(rqd: GenerateMusicChartRequest) -> Enco
             bold_font=DEFAULT_BOLD_FONT,
             export_format=CHART_EXPORT_FORMAT,  # the /chart route pins PNG
             jpg_quality=JPG_QUALITY,
+            png_profile=png_profile,
         )
         b.image("mem:chart", (0, 0), (w, h), fit="stretch")
         # Footer background: the bottom footer_h strip of the chart, stretched (add_watermark_to_image).
@@ -223,7 +333,7 @@ async def try_render_music_chart_payload(rqd: GenerateMusicChartRequest) -> Enco
         x = max(0, w - text_w - WATERMARK_RIGHT_OFFSET)
         y = h + WATERMARK_TOP_OFFSET
         for idx, line in enumerate(lines):
-            line_w = get_text_size(font, line)[0]
+            line_w = text_width(font, line)
             lx = x + max(0, text_w - line_w)
             ly = y + idx * (font_size + WATERMARK_LINE_SEP)
             # PIL ImageDraw.text default anchor is left/top-of-ascent -> IR "ascender" baseline.
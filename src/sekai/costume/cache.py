@@ -0,0 +1,97 @@
+"""Persistent foreground-box index for costume preview images.
+
+The detail page crops the preview around its subject, and finding the subject means decoding the
+full preview and scanning a down-sampled copy. The previews never change between asset updates,
+so the detected box is stored on disk next to the other utils caches, keyed by the asset's
+path and ``(mtime_ns, size)``: a warm detail render reads the box from here and never
+decodes the preview in Python (the Skia path still hands the renderer the asset path).
+
+A preview replaced in place gets a new signature and is detected again; the stale entry for the
+same path is dropped when the new one is written, so the file holds one entry per preview.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from src.sekai.base.cache import MISSING
+
+logger = logging.getLogger(__name__)
+
+COSTUME_PREVIEW_BBOX_INDEX_PATH = Path("data/utils/costume_preview_bbox.json")
+
+BBox = tuple[int, int, int, int]
+
+
+class PreviewBBoxIndex:
+    """``(path, mtime_ns, size) -> bbox | None`` with a JSON file behind it.
+
+    ``None`` is a real value (the detector found no foreground) and is cached like a box. The
+    file is loaded once on first use and rewritten atomically on every new entry, which happens
+    once per preview per asset update.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    @staticmethod
+    def _signature(mtime_ns: int, file_size: int) -> str:
+        return f"{int(mtime_ns)}:{int(file_size)}"
+
+    def _load_locked(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                loaded = json.loads(self._path.read_text(encoding="utf-8"))
+                self._entries = loaded if isinstance(loaded, dict) else {}
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError):
+                logger.warning("costume preview bbox index %s is unreadable; starting empty", self._path)
+                self._entries = {}
+        return self._entries
+
+    def get(self, asset_path: str, mtime_ns: int, file_size: int) -> BBox | Any | None:
+        """The stored box (or ``None``), or :data:`MISSING` when this signature was never detected."""
+        with self._lock:
+            entry = self._load_locked().get(asset_path)
+        if not isinstance(entry, dict) or entry.get("signature") != self._signature(mtime_ns, file_size):
+            return MISSING
+        bbox = entry.get("bbox")
+        if bbox is None:
+            return None
+        if not isinstance(bbox, list) or len(bbox) != 4:
+            return MISSING
+        return tuple(int(value) for value in bbox)
+
+    def set(self, asset_path: str, mtime_ns: int, file_size: int, bbox: BBox | None) -> None:
+        with self._lock:
+            entries = self._load_locked()
+            entries[asset_path] = {
+                "signature": self._signature(mtime_ns, file_size),
+                "bbox": None if bbox is None else [int(value) for value in bbox],
+            }
+            payload = json.dumps(entries, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+            tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(payload, encoding="utf-8")
+                os.replace(tmp_path, self._path)
+            except OSError:
+                # The in-memory entry still serves this process; only persistence is lost.
+                logger.warning("failed to persist costume preview bbox index %s", self._path, exc_info=True)
+                tmp_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget the in-memory copy; the next access reloads the file."""
+        with self._lock:
+            self._entries = None
+
+
+COSTUME_PREVIEW_BBOX_INDEX = PreviewBBoxIndex(COSTUME_PREVIEW_BBOX_INDEX_PATH)
@@ -1,9 +1,11 @@
 import asyncio
 import logging
 
+import numpy as np
 from PIL import Image
 
 from src.core.image_payload import EncodedImagePayload
+from src.sekai.base.cache import MISSING
 from src.sekai.base.draw import BG_PADDING, SEKAI_BLUE_BG, add_request_watermark, roundrect_bg
 from src.sekai.base.painter import (
     BLACK,
@@ -16,10 +18,17 @@ from src.sekai.base.painter import (
 )
 from src.sekai.base.plot import Canvas, Frame, Grid, HSplit, ImageBox, Spacer, TextBox, TextStyle, VSplit
 from src.sekai.base.timezone import datetime_from_millis
-from src.sekai.base.utils import ImageSource, get_asset_image_ref, resolve_image_source_sync, run_in_pool
+from src.sekai.base.utils import (
+    AssetImageRef,
+    ImageSource,
+    get_asset_image_ref,
+    resolve_image_source_sync,
+    run_in_pool,
+)
 from src.sekai.skia_renderer.canvas import render_canvas_payload, skia_plot_enabled
 from src.settings import ASSETS_BASE_DIR
 
+from .cache import COSTUME_PREVIEW_BBOX_INDEX
 from .model import CostumeDetailRequest, CostumeListRequest
 
 logger = logging.getLogger(__name__)
@@ -65,53 +74,43 @@ def _preview_foreground_bbox(image: Image.Image) -> tuple[int, int, int, int] |
     scale = min(1.0, PREVIEW_FOREGROUND_DETECT_WIDTH / source.width)
     small_size = (max(1, round(source.width * scale)), max(1, round(source.height * scale)))
     sample = source.resize(small_size, Image.Resampling.BILINEAR) if small_size != source.size else source
-    pixels = sample.load()
-    width, height = sample.size
+    pixels = np.asarray(sample, dtype=np.int16)
+    height, width = pixels.shape[:2]
     edge_width = max(2, round(width * 0.02))
     threshold = 36
     min_col_hits = max(2, round(height * 0.015))
     min_row_hits = max(2, round(width * 0.015))
-    col_hits = [0] * width
-    row_hits = [0] * height
-
-    for y in range(height):
-        edge_pixels = []
-        for x in range(edge_width):
-            edge_pixels.append(pixels[x, y])
-            edge_pixels.append(pixels[width - 1 - x, y])
-        bg_r = sum(item[0] for item in edge_pixels) // len(edge_pixels)
-        bg_g = sum(item[1] for item in edge_pixels) // len(edge_pixels)
-        bg_b = sum(item[2] for item in edge_pixels) // len(edge_pixels)
-
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
-            if a > 16 and max(abs(r - bg_r), abs(g - bg_g), abs(b - bg_b)) > threshold:
-                col_hits[x] += 1
-                row_hits[y] += 1
-
-    xs = [idx for idx, hits in enumerate(col_hits) if hits >= min_col_hits]
-    ys = [idx for idx, hits in enumerate(row_hits) if hits >= min_row_hits]
-    if not xs or not ys:
+
+    # 每行背景色取左右两侧 edge_width 列的整数均值（与逐像素版本的 // 一致）。
+    edge_columns = list(range(edge_width)) + [width - 1 - x for x in range(edge_width)]
+    edge = pixels[:, edge_columns, :3]
+    bg = edge.sum(axis=1) // len(edge_columns)
+    diff = np.abs(pixels[:, :, :3] - bg[:, None, :]).max(axis=2)
+    hits = (pixels[:, :, 3] > 16) & (diff > threshold)
+
+    xs = np.flatnonzero(hits.sum(axis=0) >= min_col_hits)
+    ys = np.flatnonzero(hits.sum(axis=1) >= min_row_hits)
+    if xs.size == 0 or ys.size == 0:
         return None
 
     inv_scale = 1.0 / scale
     return (
-        max(0, round(min(xs) * inv_scale)),
-        max(0, round(min(ys) * inv_scale)),
-        min(source.width, round((max(xs) + 1) * inv_scale)),
-        min(source.height, round((max(ys) + 1) * inv_scale)),
+        max(0, round(int(xs[0]) * inv_scale)),
+        max(0, round(int(ys[0]) * inv_scale)),
+        min(source.width, round((int(xs[-1]) + 1) * inv_scale)),
+        min(source.height, round((int(ys[-1]) + 1) * inv_scale)),
     )
 
 
-def _costume_preview_cover_crop_box(
-    image: Image.Image,
+def _cover_crop_box(
+    image_size: tuple[int, int],
+    bbox: tuple[int, int, int, int] | None,
     target_size: tuple[int, int] = COSTUME_DETAIL_PREVIEW_SIZE,
 ) -> tuple[int, int, int, int]:
-    width, height = image.size
+    width, height = image_size
     target_w, target_h = target_size
     target_aspect = target_w / target_h
     source_aspect = width / height
-    bbox = _preview_foreground_bbox(image)
 
     if source_aspect > target_aspect:
         crop_h = height
@@ -129,6 +128,33 @@ def _costume_preview_cover_crop_box(
     return (0, top, width, top + crop_h)
 
 
+def _costume_preview_cover_crop_box(
+    image: Image.Image,
+    target_size: tuple[int, int] = COSTUME_DETAIL_PREVIEW_SIZE,
+) -> tuple[int, int, int, int]:
+    return _cover_crop_box(image.size, _preview_foreground_bbox(image), target_size)
+
+
+def _detect_preview_crop_box(
+    preview: ImageSource,
+    target_size: tuple[int, int] = COSTUME_DETAIL_PREVIEW_SIZE,
+) -> tuple[int, int, int, int]:
+    """Cover crop for ``preview``; asset refs go through the persistent bbox index.
+
+    A warm asset never gets decoded here: the index hit plus the ref's header size is all the
+    crop needs. Placeholders and in-memory images are detected every time (they have no file
+    signature to key on).
+    """
+    if not isinstance(preview, AssetImageRef):
+        return _costume_preview_cover_crop_box(resolve_image_source_sync(preview), target_size)
+    asset_path = str(preview.path)
+    bbox = COSTUME_PREVIEW_BBOX_INDEX.get(asset_path, preview.mtime_ns, preview.file_size)
+    if bbox is MISSING:
+        bbox = _preview_foreground_bbox(resolve_image_source_sync(preview))
+        COSTUME_PREVIEW_BBOX_INDEX.set(asset_path, preview.mtime_ns, preview.file_size, bbox)
+    return _cover_crop_box(preview.size, bbox, target_size)
+
+
 class _CostumePreviewBox(ImageBox):
     """Detail 预览：前景检测算出的 cover crop 经 ``src_rect`` 直传两后端——Skia 侧
     仍是原始 asset 路径（检测用的解码副本不进 IR），Pillow 回退在 paste 内裁剪缩放。"""
@@ -310,9 +336,8 @@ async def _build_costume_detail_canvas(rqd: CostumeDetailRequest) -> Canvas:
     preview = await _load_optional_image(costume.preview_image_path)
     preview_crop = None
     if preview is not None:
-        # 前景检测需要真实像素（解码走全局缓存）；检测与像素循环都在线程池里做。
-        preview_pixels = await run_in_pool(resolve_image_source_sync, preview)
-        preview_crop = await run_in_pool(_costume_preview_cover_crop_box, preview_pixels, COSTUME_DETAIL_PREVIEW_SIZE)
+        # 前景框按资源签名落盘索引；仅冷路径在线程池里解码并检测。
+        preview_crop = await run_in_pool(_detect_preview_crop_box, preview, COSTUME_DETAIL_PREVIEW_SIZE)
 
     title_style = TextStyle(font=DEFAULT_BOLD_FONT, size=28, color=BLACK)
     label_style = TextStyle(font=DEFAULT_BOLD_FONT, size=24, color=(50, 50, 50))
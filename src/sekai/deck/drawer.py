@@ -1,6 +1,4 @@
-import asyncio
 import logging
-import time
 
 from PIL import Image
 
@@ -25,11 +23,12 @@ from src.sekai.base.plot import (
     TextStyle,
     VSplit,
 )
-from src.sekai.base.utils import ImageSource, get_asset_image_ref
+from src.sekai.base.utils import AssetPrefetchPlan, ImageSource
 from src.sekai.profile.drawer import (
     CardFullThumbnailBox,
-    get_card_full_thumbnail_layers,
+    card_full_thumbnail_layers_from,
     get_profile_card,
+    plan_card_full_thumbnail_layers,
 )
 from src.sekai.skia_renderer.canvas import render_canvas_payload, skia_plot_enabled
 from src.settings import ASSETS_BASE_DIR, DEFAULT_BOLD_FONT, DEFAULT_FONT
@@ -341,66 +340,50 @@ async def _build_deck_recommend_canvas(rqd: DeckRequest) -> Canvas:
     live_type = rqd.live_type
     live_name = rqd.live_name
     chara_name = rqd.chara_name
-    chara_icon = None
-    if rqd.chara_icon_path:
-        chara_icon = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.chara_icon_path)
-    # 并行加载所有可选图标
-    _deck_tasks = {}
-    if rqd.wl_chara_icon_path:
-        _deck_tasks["wl_chara"] = get_asset_image_ref(ASSETS_BASE_DIR, rqd.wl_chara_icon_path)
-    if rqd.unit_logo_path:
-        _deck_tasks["unit_logo"] = get_asset_image_ref(ASSETS_BASE_DIR, rqd.unit_logo_path)
-    if rqd.attr_icon_path:
-        _deck_tasks["attr_icon"] = get_asset_image_ref(ASSETS_BASE_DIR, rqd.attr_icon_path)
-    if not music_compare and rqd.music_cover_path:
-        _deck_tasks["music_cover"] = get_asset_image_ref(ASSETS_BASE_DIR, rqd.music_cover_path)
-    if rqd.canvas_thumbnail_path:
-        _deck_tasks["canvas_thumb"] = get_asset_image_ref(ASSETS_BASE_DIR, rqd.canvas_thumbnail_path)
+    # 图标、封面和所有卡牌缩略图一次性预取，布局阶段同步读取
+    plan = AssetPrefetchPlan(ASSETS_BASE_DIR)
+    icon_paths = {
+        "chara": rqd.chara_icon_path,
+        "wl_chara": rqd.wl_chara_icon_path,
+        "unit_logo": rqd.unit_logo_path,
+        "attr_icon": rqd.attr_icon_path,
+        "music_cover": None if music_compare else rqd.music_cover_path,
+        "canvas_thumb": rqd.canvas_thumbnail_path,
+    }
+    if recommend_type in ["event", "wl", "bonus", "wl_bonus", "mysekai"] and rqd.event_id:
+        icon_paths["event_banner"] = rqd.event_banner_path
+    icon_paths = {key: path for key, path in icon_paths.items() if path}
+    for path in icon_paths.values():
+        plan.add(path)
+    # 筛选条件的图标即使路径为空也要画（占位图）
+    if rqd.unit_filter:
+        plan.add(rqd.unit_logo_path)
+    if rqd.attr_filter:
+        plan.add(rqd.attr_icon_path)
     # 收集卡牌缩略图和比较封面
-    _card_thumb_tasks = []
-    _card_thumb_keys = []
     _compare_cover_paths = []
     _planner_cover_paths = []
     for deck in rqd.deck_data:
         if music_compare and deck.music_cover_path and deck.music_cover_path not in dict.fromkeys(_compare_cover_paths):
             _compare_cover_paths.append(deck.music_cover_path)
         for card in deck.card_data:
-            _card_thumb_tasks.append(get_card_full_thumbnail_layers(card.card_thumbnail))
-            _card_thumb_keys.append(
-                (
-                    card.card_thumbnail.card_id,
-                    card.card_thumbnail.is_after_training,
-                    card.card_thumbnail.card_thumbnail_path,
-                )
-            )
+            plan_card_full_thumbnail_layers(plan, card.card_thumbnail)
     if rqd.event_planner:
         for song in rqd.event_planner.songs:
             if song.music_cover_path and song.music_cover_path not in dict.fromkeys(_planner_cover_paths):
                 _planner_cover_paths.append(song.music_cover_path)
-    _compare_tasks = [get_asset_image_ref(ASSETS_BASE_DIR, p) for p in _compare_cover_paths]
-    _planner_tasks = [get_asset_image_ref(ASSETS_BASE_DIR, p) for p in _planner_cover_paths]
-
-    # 并行执行所有加载
-    _dk = list(_deck_tasks.keys())
-    _t0 = time.perf_counter()
-    _all_results = await asyncio.gather(*_deck_tasks.values(), *_card_thumb_tasks, *_compare_tasks, *_planner_tasks)
-    logger.debug(
-        "[perf] compose_deck_recommend_image preload %d items: %.3fs",
-        len(_dk) + len(_card_thumb_tasks) + len(_compare_tasks) + len(_planner_tasks),
-        time.perf_counter() - _t0,
-    )
-    _di = dict(zip(_dk, _all_results[: len(_dk)]))
-    _thumb_results = _all_results[len(_dk) : len(_dk) + len(_card_thumb_tasks)]
-    _compare_start = len(_dk) + len(_card_thumb_tasks)
-    _compare_end = _compare_start + len(_compare_tasks)
-    _compare_results = _all_results[_compare_start:_compare_end]
-    _planner_results = _all_results[_compare_end:]
+    for path in (*_compare_cover_paths, *_planner_cover_paths):
+        plan.add(path)
+    assets = await plan.resolve("deck_recommend")
 
+    _di = {key: assets[path] for key, path in icon_paths.items()}
+    chara_icon = _di.get("chara")
     wl_chara_icon = _di.get("wl_chara")
     unit_logo = _di.get("unit_logo")
     attr_icon = _di.get("attr_icon")
     music_cover = _di.get("music_cover")
     canvas_thumbnail = _di.get("canvas_thumb")
+    event_banner = _di.get("event_banner")
     unit_filter = rqd.unit_filter
     attr_filter = rqd.attr_filter
     excluded_cards = rqd.excluded_cards or []
@@ -410,9 +393,17 @@ async def _build_deck_recommend_canvas(rqd: DeckRequest) -> Canvas:
     result_algs = rqd.model_name or [""] * len(result_decks)
     # The same card id can appear in multiple candidate decks with different
     # flower-before/after skill art states, so card_id alone is not a safe key.
-    card_layers = dict(zip(_card_thumb_keys, _thumb_results))
-    compare_music_imgs = dict(zip(_compare_cover_paths, _compare_results))
-    planner_music_imgs = dict(zip(_planner_cover_paths, _planner_results))
+    card_layers = {
+        (
+            card.card_thumbnail.card_id,
+            card.card_thumbnail.is_after_training,
+            card.card_thumbnail.card_thumbnail_path,
+        ): card_full_thumbnail_layers_from(assets, card.card_thumbnail)
+        for deck in rqd.deck_data
+        for card in deck.card_data
+    }
+    compare_music_imgs = {path: assets[path] for path in _compare_cover_paths}
+    planner_music_imgs = {path: assets[path] for path in _planner_cover_paths}
 
     # 绘图
     with Canvas(bg=SEKAI_BLUE_BG).set_padding(BG_PADDING) as canvas:
@@ -447,8 +438,7 @@ async def _build_deck_recommend_canvas(rqd: DeckRequest) -> Canvas:
 
                     with HSplit().set_content_align("l").set_item_align("l").set_sep(16):
                         if recommend_type in ["event", "wl", "bonus", "wl_bonus", "mysekai"] and rqd.event_id:
-                            if rqd.event_banner_path:
-                                event_banner = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.event_banner_path)
+                            if event_banner is not None:
                                 ImageBox(event_banner, size=(None, 50))
                             else:
                                 title = rqd.event_name + " " + title
@@ -494,13 +484,9 @@ async def _build_deck_recommend_canvas(rqd: DeckRequest) -> Canvas:
                             if unit_filter or attr_filter:
                                 TextBox("仅", setting_style)
                                 if unit_filter:
-                                    ImageBox(
-                                        await get_asset_image_ref(ASSETS_BASE_DIR, rqd.unit_logo_path), size=(None, 40)
-                                    )
+                                    ImageBox(assets[rqd.unit_logo_path], size=(None, 40))
                                 if attr_filter:
-                                    ImageBox(
-                                        await get_asset_image_ref(ASSETS_BASE_DIR, rqd.attr_icon_path), size=(None, 35)
-                                    )
+                                    ImageBox(assets[rqd.attr_icon_path], size=(None, 35))
                                 TextBox("上场", setting_style)
                             if excluded_cards:
                                 TextBox(f"排除 {','.join(map(str, excluded_cards))}", setting_style)
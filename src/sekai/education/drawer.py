@@ -20,6 +20,7 @@ from src.sekai.base.draw import (
     add_request_watermark,
     roundrect_bg,
 )
+from src.sekai.base.layout_snapshot import build_layout_snapshot_canvas
 from src.sekai.base.painter import BLACK
 from src.sekai.base.plot import (
     FillBg,
@@ -252,8 +253,8 @@ async def try_render_challenge_live_detail_payload(
 # ========== 加成详情 ==========
 
 
-async def _build_power_bonus_detail_canvas(rqd: PowerBonusDetailRequest) -> Canvas:
-    """合成加成详情图片
+async def _build_power_bonus_detail_content(rqd: PowerBonusDetailRequest) -> Canvas:
+    """合成加成详情图片(不含水印)
 
     Args:
         rqd: 加成详情请求数据
@@ -349,6 +350,13 @@ async def _build_power_bonus_detail_canvas(rqd: PowerBonusDetailRequest) -> Canv
                                 "clip"
                             )
 
+    return canvas
+
+
+async def _build_power_bonus_detail_canvas(rqd: PowerBonusDetailRequest) -> Canvas:
+    canvas = await build_layout_snapshot_canvas(
+        "education_power_bonus", rqd, lambda: _build_power_bonus_detail_content(rqd)
+    )
     add_request_watermark(canvas, rqd)
     return canvas
 
@@ -532,8 +540,8 @@ async def try_render_area_item_upgrade_materials_payload(
 # ========== 羁绊等级 ==========
 
 
-async def _build_bonds_canvas(rqd: BondsRequest) -> Canvas:
-    """合成羁绊等级图片
+async def _build_bonds_content(rqd: BondsRequest) -> Canvas:
+    """合成羁绊等级图片(不含水印)
 
     Args:
         rqd: 羁绊等级请求数据
@@ -672,6 +680,11 @@ async def _build_bonds_canvas(rqd: BondsRequest) -> Canvas:
 
                         TextBox(need_exp_text, text_style).set_w(w5).set_content_align("c")
 
+    return canvas
+
+
+async def _build_bonds_canvas(rqd: BondsRequest) -> Canvas:
+    canvas = await build_layout_snapshot_canvas("education_bonds", rqd, lambda: _build_bonds_content(rqd))
     add_request_watermark(canvas, rqd)
     return canvas
 
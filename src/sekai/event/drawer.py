@@ -18,6 +18,7 @@ from src.sekai.base.draw import (
 from src.sekai.base.painter import DEFAULT_BOLD_FONT, DEFAULT_FONT, DEFAULT_HEAVY_FONT, color_code_to_rgb
 from src.sekai.base.plot import (
     Canvas,
+    CanvasImageBox,
     Frame,
     Grid,
     HSplit,
@@ -29,7 +30,7 @@ from src.sekai.base.plot import (
     TextStyle,
     VSplit,
 )
-from src.sekai.base.timezone import datetime_from_millis, request_now
+from src.sekai.base.timezone import datetime_from_millis
 from src.sekai.base.utils import (
     build_rendered_image_cache_key,
     collect_asset_signatures,
@@ -189,7 +190,7 @@ def _wl_chapter_progress_segments(
 
 async def _build_event_detail_canvas(rqd: EventDetailRequest) -> Canvas:
     detail = rqd.event_info
-    now = request_now(rqd.timezone)
+    now = rqd.clock.now
     _t0 = time.perf_counter()
     card_layers = await asyncio.gather(*[get_card_full_thumbnail_layers(card) for card in rqd.event_cards])
     logger.debug(
@@ -724,13 +725,13 @@ def _add_event_list_card_cell(layers: CardFullThumbnailLayers, card_id_style: Te
         ).set_content_align("c")
 
 
-async def _compose_event_list_entry_image(
+def _build_event_list_entry_canvas(
     d,
     loaded: dict[str, object],
     phase: str,
     style1: TextStyle,
     style2: TextStyle,
-):
+) -> Canvas:
     bg = roundrect_bg(_resolve_event_list_entry_bg_color(phase), 5, alpha=180)
 
     with Canvas().set_padding(0) as canvas:
@@ -763,7 +764,27 @@ async def _compose_event_list_entry_image(
                     if not (d.event_attr_path or d.event_unit_path or d.event_chara_path):
                         Spacer(w=24, h=24)
 
-    return await canvas.get_img()
+    return canvas
+
+
+async def _compose_event_list_entry_image(
+    d,
+    loaded: dict[str, object],
+    phase: str,
+    style1: TextStyle,
+    style2: TextStyle,
+):
+    return await _build_event_list_entry_canvas(d, loaded, phase, style1, style2).get_img()
+
+
+async def _get_event_list_entry_canvas(d, now, style1: TextStyle, style2: TextStyle) -> tuple[Canvas, str]:
+    """Skia 路径的列表行: 不在 Python 侧合成位图,而是返回行 Canvas 及其缓存 key。
+
+    行以 CanvasImageBox 嵌入页面,IRPainter 按 key 复用降级后的子树,native 渲染器按同一 key
+    复用整行光栅,热列表不再经 FFI 传送任何行像素。"""
+    phase = _resolve_event_list_entry_phase(d.start_at, d.end_at, now)
+    loaded = await _preload_event_entry_assets(d)
+    return _build_event_list_entry_canvas(d, loaded, phase, style1, style2), _build_event_list_entry_cache_key(d, phase)
 
 
 async def _get_event_list_entry_image(d, now, style1: TextStyle, style2: TextStyle) -> Image.Image:
@@ -796,18 +817,15 @@ async def _get_event_list_entry_image(d, now, style1: TextStyle, style2: TextSty
 
 
 # 合成活动列表图片
-async def _build_event_list_canvas(rqd: EventListRequest) -> Canvas:
+async def _build_event_list_canvas(rqd: EventListRequest, *, native_rows: bool = False) -> Canvas:
     event_list = rqd.event_info
 
     row_count = math.ceil(math.sqrt(len(event_list)))
     style1 = TextStyle(font=DEFAULT_HEAVY_FONT, size=10, color=(50, 50, 50))
     style2 = TextStyle(font=DEFAULT_FONT, size=10, color=(70, 70, 70))
-    now = request_now(rqd.timezone)
-    entry_images = (
-        await asyncio.gather(*[_get_event_list_entry_image(d, now, style1, style2) for d in event_list])
-        if event_list
-        else []
-    )
+    now = rqd.clock.now
+    get_entry = _get_event_list_entry_canvas if native_rows else _get_event_list_entry_image
+    entries = await asyncio.gather(*[get_entry(d, now, style1, style2) for d in event_list]) if event_list else []
 
     with Canvas(bg=SEKAI_BLUE_BG).set_padding(BG_PADDING) as canvas:
         with VSplit().set_padding(0).set_sep(4).set_content_align("lt").set_item_align("lt"):
@@ -816,8 +834,12 @@ async def _build_event_list_canvas(rqd: EventListRequest) -> Canvas:
                 TextStyle(font=DEFAULT_FONT, size=12, color=(0, 0, 100)),
             ).set_bg(roundrect_bg(radius=4, alpha=80)).set_padding(4)
             with Grid(row_count=row_count, vertical=True).set_sep(6, 6).set_item_align("lt").set_content_align("lt"):
-                for entry_image in entry_images:
-                    ImageBox(entry_image)
+                for entry in entries:
+                    if native_rows:
+                        entry_canvas, entry_key = entry
+                        CanvasImageBox(entry_canvas, cache_key=entry_key)
+                    else:
+                        ImageBox(entry)
 
     add_request_watermark(canvas, rqd)
     return canvas
@@ -834,8 +856,10 @@ async def try_render_event_list_payload(rqd: EventListRequest) -> EncodedImagePa
     # drops the per-request `dt` — would serve a visibly stale timestamp: `event_info` is
     # stable for the whole event period, so the stale window is the 7d cache TTL, not seconds.
     # Keying on the full payload (dt included) is airtight but hits 0% of the time and would
-    # just churn the shared payload LRU. The entry sub-images ARE cached, keyed by
-    # (event, phase) in `_get_event_list_entry_image`, which is where the real cost sits.
+    # just churn the shared payload LRU. The entry rows ARE cached, keyed by (event, phase):
+    # here as native subtrees/rasters (`_get_event_list_entry_canvas`), on the Pillow path as
+    # composed images (`_get_event_list_entry_image`), which is where the real cost sits.
     if not skia_plot_enabled():
         return None
-    return await render_canvas_payload(await _build_event_list_canvas(rqd), endpoint="event_list")
+    canvas = await _build_event_list_canvas(rqd, native_rows=True)
+    return await render_canvas_payload(canvas, endpoint="event_list")
@@ -9,7 +9,7 @@ from typing import Any
 
 from pydantic import BaseModel, field_validator
 
-from src.sekai.base.timezone import TimeZoneRequest, localize_datetime, parse_datetime_utc
+from src.sekai.base.timezone import TimeZoneRequest, parse_datetime_utc
 from src.sekai.deck.model import DeckRequest
 from src.sekai.profile.model import CardFullThumbnailRequest, DetailedProfileCardRequest
 
@@ -215,8 +215,8 @@ class EventDetailRequest(TimeZoneRequest):
 
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
-        self.event_info.start_at = localize_datetime(self.event_info.start_at, self.timezone)
-        self.event_info.end_at = localize_datetime(self.event_info.end_at, self.timezone)
+        self.event_info.start_at = self.clock.localize(self.event_info.start_at)
+        self.event_info.end_at = self.clock.localize(self.event_info.end_at)
 
 
 class EventRecordRequest(TimeZoneRequest):
@@ -242,8 +242,8 @@ class EventRecordRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in [*self.event_info, *self.wl_event_info]:
-            item.start_at = localize_datetime(item.start_at, self.timezone)
-            item.end_at = localize_datetime(item.end_at, self.timezone)
+            item.start_at = self.clock.localize(item.start_at)
+            item.end_at = self.clock.localize(item.end_at)
         self.user_info.timezone = self.timezone
 
 
@@ -261,8 +261,8 @@ class EventListRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.event_info:
-            item.start_at = localize_datetime(item.start_at, self.timezone)
-            item.end_at = localize_datetime(item.end_at, self.timezone)
+            item.start_at = self.clock.localize(item.start_at)
+            item.end_at = self.clock.localize(item.end_at)
 
 
 class EventPlannerDeckCard(BaseModel):
@@ -19,8 +19,8 @@ from src.sekai.base.painter import (
     DEFAULT_HEAVY_FONT,
 )
 from src.sekai.base.plot import Canvas, Grid, HSplit, ImageBg, ImageBox, Spacer, TextBox, TextStyle, VSplit
-from src.sekai.base.timezone import datetime_from_millis, request_now
 from src.sekai.base.utils import (
+    AssetPrefetchPlan,
     ImageSource,
     concat_images,
     get_asset_image_ref,
@@ -209,7 +209,7 @@ async def _build_gacha_list_canvas(rqd: GachaListRequest) -> Canvas:
                 overflow="shrink",
             ).set_w(280).set_bg(roundrect_bg(radius=4, alpha=80)).set_padding(4)
             with Grid(row_count=row_count, vertical=True).set_sep(8, 2).set_item_align("c").set_content_align("c"):
-                now = request_now(rqd.timezone)
+                now = rqd.clock.now
                 for g in gachas:
                     bg_color = (255, 255, 255, 200)
                     if g.start_at <= now <= g.end_at:
@@ -259,38 +259,27 @@ async def _build_gacha_detail_canvas(rqd: GachaDetailRequest) -> Canvas:
     label_style = TextStyle(font=DEFAULT_BOLD_FONT, size=24, color=(50, 50, 50))
     text_style = TextStyle(font=DEFAULT_FONT, size=24, color=(70, 70, 70))
     small_style = TextStyle(font=DEFAULT_FONT, size=12, color=(70, 70, 70))
-    start_time = datetime_from_millis(rqd.gacha.start_at, rqd.timezone)
-    end_time = datetime_from_millis(rqd.gacha.end_at, rqd.timezone)
-    now = request_now(rqd.timezone)
-
-    bg = SEKAI_BLUE_BG
-    if rqd.bg_img_path:
-        bg_img = await get_gacha_image_ref_or_unknown(rqd.bg_img_path)
-        bg = ImageBg(bg_img) if bg_img else SEKAI_BLUE_BG
-
-    # 预加载所有图片（并行）
-    _gd_coros = []
-    _gd_keys = []
-
-    if rqd.logo_img_path:
-        _gd_keys.append("logo")
-        _gd_coros.append(get_gacha_image_ref_or_unknown(rqd.logo_img_path))
-    if rqd.banner_img_path:
-        _gd_keys.append("banner")
-        _gd_coros.append(get_gacha_image_ref_or_unknown(rqd.banner_img_path))
-    if rqd.gacha.ceil_item_img_path:
-        _gd_keys.append("ceil_item")
-        _gd_coros.append(get_gacha_image_ref_or_unknown(rqd.gacha.ceil_item_img_path))
-
-    # cost icons
-    _cost_icon_indices: list[tuple[str, str]] = []
+    start_time = rqd.clock.localize(rqd.gacha.start_at)
+    end_time = rqd.clock.localize(rqd.gacha.end_at)
+    now = rqd.clock.now
+
+    # 背景、logo、banner、天井道具与消耗图标一次性预取；卡牌缩略图和稀有度图与之并行
+    plan = AssetPrefetchPlan(ASSETS_BASE_DIR)
+    image_paths = {
+        "bg": rqd.bg_img_path,
+        "logo": rqd.logo_img_path,
+        "banner": rqd.banner_img_path,
+        "ceil_item": rqd.gacha.ceil_item_img_path,
+    }
     for behavior in rqd.gacha.behaviors:
         if behavior.cost_type and behavior.cost_icon_path:
-            key = f"cost_{behavior.cost_icon_path}"
-            if key not in _gd_keys:
-                _gd_keys.append(key)
-                _gd_coros.append(get_gacha_image_ref_or_unknown(behavior.cost_icon_path))
+            image_paths[f"cost_{behavior.cost_icon_path}"] = behavior.cost_icon_path
+    image_paths = {key: path for key, path in image_paths.items() if path}
+    for path in image_paths.values():
+        plan.add(path, on_missing="none")
 
+    _gd_coros = []
+    _gd_keys = []
     # pickup card thumbnails
     if rqd.pickup_cards:
         for i, card in enumerate(rqd.pickup_cards):
@@ -305,16 +294,25 @@ async def _build_gacha_detail_canvas(rqd: GachaDetailRequest) -> Canvas:
             _gd_coros.append(get_rarity_img(rarity))
 
     _t0 = time.perf_counter()
-    _gd_results = await asyncio.gather(*_gd_coros, return_exceptions=True) if _gd_coros else []
+    assets, *_gd_results = await asyncio.gather(plan.resolve("gacha_detail"), *_gd_coros, return_exceptions=True)
     logger.debug(
         "[perf] compose_gacha_detail_image preload %d items: %.3fs",
-        len(_gd_coros),
+        len(plan) + len(_gd_coros),
         time.perf_counter() - _t0,
     )
+    if isinstance(assets, BaseException):
+        raise assets
     _gd_cache: dict[str, ImageSource | CardFullThumbnailLayers | None] = {}
+    for k, path in image_paths.items():
+        # 缺图按旧语义回退到 UnKnown 占位图
+        ref = assets[path]
+        _gd_cache[k] = ref if ref is not None else await get_unknown_fallback_image(path)
     for k, v in zip(_gd_keys, _gd_results):
         _gd_cache[k] = v if not isinstance(v, BaseException) else None
 
+    bg_img = _gd_cache.get("bg")
+    bg = ImageBg(bg_img) if bg_img else SEKAI_BLUE_BG
+
     with Canvas(bg=bg).set_padding(BG_PADDING) as canvas:
         with HSplit().set_sep(16).set_content_align("lt").set_item_align("lt"):
             w = 600
@@ -8,7 +8,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator
 
-from src.sekai.base.timezone import TimeZoneRequest, localize_datetime, parse_datetime_utc
+from src.sekai.base.timezone import TimeZoneRequest, parse_datetime_utc
 from src.sekai.profile.model import CardFullThumbnailRequest
 
 # ========== 基础数据模型 ==========
@@ -234,8 +234,8 @@ class GachaListRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.gachas:
-            item.start_at = localize_datetime(item.start_at, self.timezone)
-            item.end_at = localize_datetime(item.end_at, self.timezone)
+            item.start_at = self.clock.localize(item.start_at)
+            item.end_at = self.clock.localize(item.end_at)
 
 
 class GachaDetailRequest(TimeZoneRequest):
@@ -35,9 +35,14 @@ from src.sekai.base.draw import (
     build_request_watermark_text,
     get_watermark_render_spec,
 )
-from src.sekai.base.painter import get_font, get_text_size
+from src.sekai.base.painter import get_font, get_text_width, native_text_width
 from src.sekai.base.utils import run_in_pool
-from src.sekai.skia_renderer.canvas import load_native_renderer, payload_from_native, skia_plot_enabled
+from src.sekai.skia_renderer.canvas import (
+    load_native_renderer,
+    payload_from_native,
+    resolve_png_encode_profile,
+    skia_plot_enabled,
+)
 from src.sekai.skia_renderer.ir_builder import IRBuilder
 from src.sekai.skia_renderer.payload_cache import get_skia_payload_cached, put_skia_payload_cache
 from src.sekai.skia_renderer.render_stats import (
@@ -81,7 +86,7 @@ def _record(outcome: str, payload: EncodedImagePayload | None = None) -> None:
         record_native_metrics(payload.native_metrics)
 
 
-def _new_builder(width: int, height: int, export_format: str = "png") -> IRBuilder:
+def _new_builder(width: int, height: int, export_format: str = "png", png_profile: str = "fastest") -> IRBuilder:
     return IRBuilder(
         width,
         height,
@@ -91,6 +96,7 @@ def _new_builder(width: int, height: int, export_format: str = "png") -> IRBuild
         bold_font=DEFAULT_BOLD_FONT,
         export_format=export_format,
         jpg_quality=JPG_QUALITY,
+        png_profile=png_profile,
     )
 
 
@@ -116,7 +122,12 @@ async def try_render_full_honor_payload(rqd: HonorRequest) -> EncodedImagePayloa
     # The cached payload embeds the footer, so the key must cover everything the footer text
     # derives from (dt/timezone) on top of the Pillow composed key (which excludes timezone).
     watermark_text = build_request_watermark_text(rqd)
-    cache_key = f"{build_full_honor_cache_key(rqd)}|skia|{EXPORT_IMAGE_FORMAT}|{JPG_QUALITY}|wm:{watermark_text}"
+    # The profile changes the encoded bytes (never the pixels), and this cache stores bytes.
+    png_profile = resolve_png_encode_profile(HONOR_ENDPOINT)
+    cache_key = (
+        f"{build_full_honor_cache_key(rqd)}|skia|{EXPORT_IMAGE_FORMAT}|{JPG_QUALITY}|png:{png_profile}"
+        f"|wm:{watermark_text}"
+    )
     cached = get_skia_payload_cached(cache_key)
     if cached is not None:
         _record(OUTCOME_CACHE_HIT, cached)
@@ -144,9 +155,13 @@ async def try_render_full_honor_payload(rqd: HonorRequest) -> EncodedImagePayloa
         # Single pass: badge nodes + stretched bottom-strip footer (a SelfImage snapshot of
         # the badge rows just rendered above it) + shadowed watermark lines (mirrors
         # add_watermark_to_image; same spec as the chart watermark shell).
-        font_size, lines, text_w, text_h = get_watermark_render_spec(watermark_text, w - WATERMARK_RIGHT_OFFSET, 12)
+        # Measured natively when the wheel can, so the watermark shell never touches Pillow.
+        text_width = native_text_width() or get_text_width
+        font_size, lines, text_w, text_h = get_watermark_render_spec(
+            watermark_text, w - WATERMARK_RIGHT_OFFSET, 12, text_width
+        )
         footer_h = WATERMARK_TOP_OFFSET + text_h + WATERMARK_BOTTOM_OFFSET + WATERMARK_SHADOW_OFFSET
-        b = _new_builder(w, h + footer_h, export_format=EXPORT_IMAGE_FORMAT)
+        b = _new_builder(w, h + footer_h, export_format=EXPORT_IMAGE_FORMAT, png_profile=png_profile)
         # Clip to the badge rect: the badge canvas is (w, h), so anything the widget draws
         # outside it (the bonds chara icons overhang) must be cropped exactly as the Pillow
         # canvas bounds crop it.
@@ -163,7 +178,7 @@ async def try_render_full_honor_payload(rqd: HonorRequest) -> EncodedImagePayloa
         x = max(0, w - text_w - WATERMARK_RIGHT_OFFSET)
         y = h + WATERMARK_TOP_OFFSET
         for idx, line in enumerate(lines):
-            line_w = get_text_size(font, line)[0]
+            line_w = text_width(font, line)
             lx = x + max(0, text_w - line_w)
             ly = y + idx * (font_size + WATERMARK_LINE_SEP)
             # PIL ImageDraw.text default anchor is left/top-of-ascent -> IR "ascender" baseline.
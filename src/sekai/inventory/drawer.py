@@ -5,7 +5,7 @@ from PIL import Image
 
 from src.core.image_payload import EncodedImagePayload
 from src.sekai.base.draw import BG_PADDING, SEKAI_BLUE_BG, Canvas, add_request_watermark, roundrect_bg
-from src.sekai.base.painter import DEFAULT_BOLD_FONT, DEFAULT_FONT, get_font, get_text_size
+from src.sekai.base.painter import DEFAULT_BOLD_FONT, DEFAULT_FONT, fit_text_prefix, get_font, get_text_size
 from src.sekai.base.plot import Frame, Grid, HSplit, ImageBox, TextBox, TextStyle, VSplit
 from src.sekai.base.utils import ImageSource, get_asset_image_ref
 from src.sekai.profile.drawer import get_profile_card
@@ -206,14 +206,4 @@ def _fits_lines(text: str, font_path: str, size: int, width: int, line_count: in
 
 
 def _clip_text_to_width(text: str, font, width: int) -> int:
-    left_idx, right_idx = 0, len(text)
-    while left_idx <= right_idx:
-        mid_idx = (left_idx + right_idx) // 2
-        measured_width = get_text_size(font, text[:mid_idx])[0]
-        if measured_width < width:
-            left_idx = mid_idx + 1
-        elif measured_width > width:
-            right_idx = mid_idx - 1
-        else:
-            return mid_idx
-    return max(1, right_idx)
+    return max(1, fit_text_prefix(font, text, width))
@@ -0,0 +1,39 @@
+"""Process-level caches for the misc endpoints.
+
+- ``COMMAND_HELP_LAYOUT_CACHE``: the wrapped, sectioned layout of a /help markdown document,
+  keyed by the markdown's digest and the text measurer that produced it. The bot re-renders the
+  same few help pages over and over, and wrapping measured every growing prefix of every line;
+  a hit skips the measuring entirely and goes straight to emitting draw ops. The title override
+  is not part of the layout (the title box has a fixed height), so it is not part of the key.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.sekai.base.cache import BoundedCache
+from src.settings import COMMAND_HELP_LAYOUT_CACHE_SIZE
+
+_COMMAND_HELP_LAYOUT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _layout_bytes(layout: Any) -> int:
+    """Rough resident size: one small frozen dataclass per wrapped line."""
+    return sum(len(section.lines) for section in layout.sections) * 320 + 1024
+
+
+COMMAND_HELP_LAYOUT_CACHE = BoundedCache(
+    "command_help_layout",
+    COMMAND_HELP_LAYOUT_CACHE_SIZE,
+    _COMMAND_HELP_LAYOUT_CACHE_MAX_BYTES,
+    _layout_bytes,
+)
+
+
+def get_misc_cache_stats() -> dict[str, Any]:
+    """Per-pool stats for /cache/stats (the ``misc_caches`` key)."""
+    return {"command_help_layout": COMMAND_HELP_LAYOUT_CACHE.stats()}
+
+
+def clear_misc_caches() -> None:
+    COMMAND_HELP_LAYOUT_CACHE.clear()
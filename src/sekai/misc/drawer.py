@@ -1,13 +1,18 @@
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
-from functools import partial
+from functools import cache
+import hashlib
+import importlib
 import logging
 import re
 import time
+from typing import Any
 
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image
 
 from src.core.image_payload import EncodedImagePayload
+from src.sekai.base.cache import MISSING
 from src.sekai.base.draw import (
     BG_PADDING,
     CHARACTER_COLOR_CODE,
@@ -17,7 +22,20 @@ from src.sekai.base.draw import (
     add_request_watermark,
     roundrect_bg,
 )
-from src.sekai.base.painter import ADAPTIVE_WB, WHITE, color_code_to_rgb, get_font, get_text_size
+from src.sekai.base.layout_snapshot import build_layout_snapshot_canvas
+from src.sekai.base.painter import (
+    ADAPTIVE_WB,
+    WHITE,
+    Painter,
+    ascender_top_to_painter_y,
+    color_code_to_rgb,
+    fit_prefix_length,
+    fit_text_prefix,
+    get_font,
+    get_font_desc,
+    get_text_size,
+    measure_prefix_advances,
+)
 from src.sekai.base.plot import (
     Flow,
     Frame,
@@ -31,7 +49,6 @@ from src.sekai.base.plot import (
     VSplit,
     Widget,
 )
-from src.sekai.base.timezone import datetime_from_millis
 from src.sekai.base.utils import (
     ImageSource,
     get_asset_image_ref,
@@ -49,8 +66,11 @@ from src.settings import (
     DEFAULT_BOLD_FONT,
     DEFAULT_FONT,
     DEFAULT_HEAVY_FONT,
+    FONT_DIR,
 )
 
+from .cache import COMMAND_HELP_LAYOUT_CACHE
+
 # =========================== 从.model导入数据类型 =========================== #
 from .model import AliasListRequest, BirthdayEventTime, CharaBirthdayRequest, CommandHelpRenderRequest
 
@@ -64,6 +84,11 @@ _HELP_IMAGE_WIDTH = 1080
 _HELP_MARGIN = 62
 _HELP_CARD_MARGIN = 28
 _HELP_MAX_TEXT_WIDTH = _HELP_IMAGE_WIDTH - _HELP_MARGIN * 2
+_HELP_TITLE_H = 88
+_HELP_SECTION_GAP = 22
+_HELP_SECTION_PAD_X = 26
+_HELP_SECTION_PAD_Y = 20
+_REQUIRED_NATIVE_TEXT_METRICS_CAPABILITY = 1
 _HELP_LINK_RE = re.compile(r"\[([^\]]+)]\([^)]+\)")
 _ALIAS_TRIM_ALPHA_FLOOR = 36
 _ALIAS_TRIM_MIN_FRAME_W = 260
@@ -128,30 +153,112 @@ def _command_help_numbered(line: str) -> str | None:
     return f"{match.group(1)} {match.group(2)}"
 
 
-def _wrap_command_help_text(font_name: str, size: int, text: str, max_width: int) -> list[str]:
+class _CommandHelpMeasurer:
+    """Text fitting for the help layout.
+
+    On the Skia path the wheel's ``measure_text_batch`` measures with the typeface the IR text
+    nodes are drawn with; the Pillow path keeps Pillow metrics so its wrapping is unchanged.
+    Either way a line's break is predicted from ``measure_prefix_advances`` and only the
+    boundary is measured in full.
+    """
+
+    def __init__(self, kind: str, measure_batch: Callable[..., Any] | None = None) -> None:
+        self.kind = kind
+        self._measure_batch = measure_batch
+        self._y_shifts: dict[tuple[str, int], int] = {}
+
+    def _native_metrics(self, font_name: str, size: int, texts: list[str]) -> list[dict[str, Any]]:
+        results = list(self._measure_batch(FONT_DIR, font_name, [(text, float(size)) for text in texts]))
+        if len(results) != len(texts):
+            raise ValueError("native text metrics returned the wrong batch length")
+        return results
+
+    def width(self, font_name: str, size: int, text: str) -> float:
+        if self._measure_batch is None:
+            return get_text_size(get_font(font_name, size), text)[0]
+        bbox = self._native_metrics(font_name, size, [text])[0]["pillow_bbox"]
+        return float(bbox[2]) - float(bbox[0])
+
+    def fit(self, font_name: str, size: int, text: str, max_width: int) -> int:
+        """Length of the longest prefix of ``text`` no wider than ``max_width``."""
+        font = get_font(font_name, size)
+        if self._measure_batch is None:
+            return fit_text_prefix(font, text, max_width)
+        return fit_prefix_length(
+            text,
+            max_width,
+            measure_prefix_advances(font, text),
+            lambda k: self.width(font_name, size, text[:k]) if k else 0.0,
+        )
+
+    def painter_y_shift(self, font_name: str, size: int) -> int:
+        """``ascender_top_to_painter_y`` offset: the panel was laid out with ImageDraw's ``la`` anchor."""
+        key = (font_name, size)
+        shift = self._y_shifts.get(key)
+        if shift is None:
+            if self._measure_batch is None:
+                shift = ascender_top_to_painter_y(font_name, size, 0)
+            else:
+                metric = self._native_metrics(font_name, size, ["哇"])[0]
+                bbox = metric["pillow_bbox"]
+                shift = round(float(metric["ascent"]) - (float(bbox[3]) - float(bbox[1])))
+            self._y_shifts[key] = shift
+        return shift
+
+
+@cache
+def _native_measure_text_batch() -> Callable[..., Any] | None:
+    """The wheel's ``measure_text_batch``, or ``None`` when the module is missing or too old."""
+    try:
+        native = importlib.import_module("haruki_skia_renderer")
+    except ImportError:
+        return None
+    measure = getattr(native, "measure_text_batch", None)
+    capability = int(getattr(native, "TEXT_METRICS_CAPABILITY", 0) or 0)
+    if capability < _REQUIRED_NATIVE_TEXT_METRICS_CAPABILITY or not callable(measure):
+        return None
+    return measure
+
+
+def _command_help_measurer() -> _CommandHelpMeasurer:
+    measure = _native_measure_text_batch() if skia_plot_enabled() else None
+    if measure is None:
+        return _CommandHelpMeasurer("pillow")
+    return _CommandHelpMeasurer("native", measure)
+
+
+def _wrap_command_help_text(
+    measurer: _CommandHelpMeasurer,
+    font_name: str,
+    size: int,
+    text: str,
+    max_width: int,
+) -> list[str]:
     text = text.strip()
     if not text:
         return [""]
 
-    font = get_font(font_name, size)
+    # Greedy per-character wrap: a line breaks before the first character whose addition makes
+    # it wider than ``max_width`` (at least one character per line), and a single space at the
+    # break is dropped.
+    chars = text.replace("\t", " ")
     lines: list[str] = []
-    current = ""
-    for char in text:
-        if char == "\t":
-            char = " "
-        candidate = current + char
-        if current and get_text_size(font, candidate)[0] > max_width:
-            lines.append(current.rstrip())
-            current = "" if char == " " else char
-            continue
-        current = candidate
-    if current.strip():
-        lines.append(current.rstrip())
+    pos = 0
+    while pos < len(chars):
+        rest = chars[pos:]
+        k = max(1, measurer.fit(font_name, size, rest, max_width))
+        if k >= len(rest):
+            if rest.strip():
+                lines.append(rest.rstrip())
+            break
+        lines.append(rest[:k].rstrip())
+        pos += k + 1 if rest[k] == " " else k
     return lines or [text]
 
 
 def _append_command_help_wrapped_line(
     lines: list[_CommandHelpLine],
+    measurer: _CommandHelpMeasurer,
     text: str,
     *,
     font_name: str,
@@ -165,7 +272,7 @@ def _append_command_help_wrapped_line(
     if not text:
         lines.append(_CommandHelpLine("", font_name, size, indent, fill, bg, gap_before))
         return
-    for idx, part in enumerate(_wrap_command_help_text(font_name, size, text, _HELP_MAX_TEXT_WIDTH - indent)):
+    for idx, part in enumerate(_wrap_command_help_text(measurer, font_name, size, text, _HELP_MAX_TEXT_WIDTH - indent)):
         lines.append(
             _CommandHelpLine(
                 text=part,
@@ -181,6 +288,7 @@ def _append_command_help_wrapped_line(
 
 def _append_command_help_definition_line(
     lines: list[_CommandHelpLine],
+    measurer: _CommandHelpMeasurer,
     text: str,
     *,
     size: int = 21,
@@ -196,6 +304,7 @@ def _append_command_help_definition_line(
     if not label or not description:
         _append_command_help_wrapped_line(
             lines,
+            measurer,
             text,
             font_name=DEFAULT_FONT,
             size=size,
@@ -205,7 +314,9 @@ def _append_command_help_definition_line(
         )
         return
 
-    wrapped = _wrap_command_help_text(DEFAULT_FONT, size, description, _HELP_MAX_TEXT_WIDTH - indent - label_width)
+    wrapped = _wrap_command_help_text(
+        measurer, DEFAULT_FONT, size, description, _HELP_MAX_TEXT_WIDTH - indent - label_width
+    )
     for idx, part in enumerate(wrapped):
         lines.append(
             _CommandHelpLine(
@@ -250,7 +361,9 @@ def _strip_command_help_output_section(markdown: str) -> str:
     return "\n".join(kept)
 
 
-def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelpSection]]:
+def _layout_command_help_markdown(
+    markdown: str, measurer: _CommandHelpMeasurer
+) -> tuple[str, list[_CommandHelpSection]]:
     markdown = _strip_command_help_output_section(_strip_command_help_frontmatter(markdown or ""))
     title = "指令帮助"
     sections: list[_CommandHelpSection] = []
@@ -277,6 +390,7 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
         if in_code:
             _append_command_help_wrapped_line(
                 lines,
+                measurer,
                 trimmed_right,
                 font_name=DEFAULT_FONT,
                 size=20,
@@ -305,6 +419,7 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
                 continue
             _append_command_help_wrapped_line(
                 lines,
+                measurer,
                 text,
                 font_name=DEFAULT_BOLD_FONT,
                 size=23,
@@ -317,10 +432,11 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
         if bullet is not None:
             cleaned = _clean_command_help_inline(bullet)
             if "：" in cleaned or ":" in cleaned:
-                _append_command_help_definition_line(lines, cleaned)
+                _append_command_help_definition_line(lines, measurer, cleaned)
                 continue
             _append_command_help_wrapped_line(
                 lines,
+                measurer,
                 cleaned,
                 font_name=DEFAULT_FONT,
                 size=21,
@@ -334,6 +450,7 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
         if numbered is not None:
             _append_command_help_wrapped_line(
                 lines,
+                measurer,
                 _clean_command_help_inline(numbered),
                 font_name=DEFAULT_FONT,
                 size=21,
@@ -346,6 +463,7 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
         if trimmed.startswith(">"):
             _append_command_help_wrapped_line(
                 lines,
+                measurer,
                 _clean_command_help_inline(trimmed.lstrip(">").strip()),
                 font_name=DEFAULT_FONT,
                 size=20,
@@ -359,6 +477,7 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
         if trimmed.startswith("|") and "|" in trimmed[1:]:
             _append_command_help_wrapped_line(
                 lines,
+                measurer,
                 _clean_command_help_inline(trimmed),
                 font_name=DEFAULT_FONT,
                 size=18,
@@ -371,6 +490,7 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
 
         _append_command_help_wrapped_line(
             lines,
+            measurer,
             _clean_command_help_inline(trimmed),
             font_name=DEFAULT_FONT,
             size=21,
@@ -382,116 +502,147 @@ def _layout_command_help_markdown(markdown: str) -> tuple[str, list[_CommandHelp
     return title, sections
 
 
-def _compose_command_help_image_sync(rqd: CommandHelpRenderRequest) -> Image.Image:
-    title, sections = _layout_command_help_markdown(rqd.markdown)
-    title = (rqd.title or title or "指令帮助").strip()
+@dataclass(frozen=True)
+class _CommandHelpLayout:
+    """Everything about a help panel except its title text, in panel coordinates."""
+
+    title: str
+    sections: tuple[_CommandHelpSection, ...]
+    section_heights: tuple[int, ...]
+    height: int
+    # (font, size) -> y offset turning an ImageDraw ``la`` top into a ``Painter.text`` y.
+    text_shifts: dict[tuple[str, int], int]
+
+
+def _layout_command_help(markdown: str, measurer: _CommandHelpMeasurer) -> _CommandHelpLayout:
+    title, sections = _layout_command_help_markdown(markdown, measurer)
     if not sections:
         sections = [_CommandHelpSection("说明", [])]
 
-    content_w = _HELP_IMAGE_WIDTH - _HELP_CARD_MARGIN * 2
-    section_gap = 22
-    section_pad_x = 26
-    section_pad_y = 20
-    title_h = 88
-    height = _HELP_CARD_MARGIN + title_h + section_gap
-    section_sizes: list[tuple[int, int]] = []
+    height = _HELP_CARD_MARGIN + _HELP_TITLE_H + _HELP_SECTION_GAP
+    section_heights: list[int] = []
+    fonts = {(DEFAULT_HEAVY_FONT, 34), (DEFAULT_BOLD_FONT, 24)}
     for section in sections:
-        section_h = section_pad_y * 2 + 42
+        section_h = _HELP_SECTION_PAD_Y * 2 + 42
         for line in section.lines:
             section_h += line.gap_before + _command_help_line_height(line.size)
+            if line.text:
+                fonts.add((line.font_name, line.size))
+            if line.label:
+                fonts.add((DEFAULT_BOLD_FONT, line.size))
         section_h = max(92, section_h)
-        section_sizes.append((content_w, section_h))
-        height += section_h + section_gap
-    height = max(360, height + _HELP_CARD_MARGIN - section_gap)
-
-    img = Image.new("RGBA", (_HELP_IMAGE_WIDTH, height), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(img, "RGBA")
-
-    def draw_glass_box(box: tuple[int, int, int, int], radius: int, fill_alpha: int = 112) -> None:
-        shadow = Image.new("RGBA", img.size, (255, 255, 255, 0))
-        shadow_draw = ImageDraw.Draw(shadow, "RGBA")
-        shadow_draw.rounded_rectangle(
-            (box[0] + 4, box[1] + 6, box[2] + 4, box[3] + 6),
-            radius=radius,
-            fill=(72, 96, 128, 30),
-        )
-        img.alpha_composite(shadow.filter(ImageFilter.GaussianBlur(10)))
-        draw.rounded_rectangle(
-            box,
-            radius=radius,
+        section_heights.append(section_h)
+        height += section_h + _HELP_SECTION_GAP
+    height = max(360, height + _HELP_CARD_MARGIN - _HELP_SECTION_GAP)
+    return _CommandHelpLayout(
+        title=title,
+        sections=tuple(sections),
+        section_heights=tuple(section_heights),
+        height=height,
+        text_shifts={font: measurer.painter_y_shift(*font) for font in sorted(fonts)},
+    )
+
+
+def _command_help_layout_key(markdown: str, measurer_kind: str) -> tuple[str, str]:
+    return hashlib.sha256(markdown.encode("utf-8")).hexdigest(), measurer_kind
+
+
+def _compute_command_help_layout(markdown: str, measurer: _CommandHelpMeasurer) -> _CommandHelpLayout:
+    """Lay out and cache a help document after a cache miss (runs in the pool).
+
+    A native measuring failure falls back to Pillow metrics; the result is still stored under the
+    requested measurer's key so a bad font does not cost a failed FFI call on every request.
+    """
+    try:
+        layout = _layout_command_help(markdown, measurer)
+    except (RuntimeError, TypeError, ValueError):
+        if measurer.kind == "pillow":
+            raise
+        logger.warning("native text metrics failed for /help layout; measuring with Pillow", exc_info=True)
+        layout = _layout_command_help(markdown, _CommandHelpMeasurer("pillow"))
+    COMMAND_HELP_LAYOUT_CACHE.set(_command_help_layout_key(markdown, measurer.kind), layout)
+    return layout
+
+
+def _draw_command_help_panel(p: Painter, layout: _CommandHelpLayout, title: str) -> None:
+    """Emit the help panel as painter primitives: IR text/shape nodes on the Skia path."""
+
+    def text(value: str, pos: tuple[int, int], font_name: str, size: int, fill: tuple[int, int, int, int]) -> None:
+        y = pos[1] + layout.text_shifts[(font_name, size)]
+        p.text(value, (pos[0], y), font=get_font_desc(font_name, size), fill=fill)
+
+    def glass_box(box: tuple[int, int, int, int], radius: int, fill_alpha: int) -> None:
+        size = (box[2] - box[0], box[3] - box[1])
+        p.shadow_roundrect((box[0] + 4, box[1] + 6), size, radius, shadow_width=20, shadow_alpha=30 / 255)
+        p.roundrect(
+            (box[0], box[1]),
+            size,
             fill=(255, 255, 255, fill_alpha),
-            outline=(255, 255, 255, 150),
-            width=2,
+            radius=radius,
+            stroke=(255, 255, 255, 150),
+            stroke_width=2,
         )
 
-    title_box = (
-        _HELP_CARD_MARGIN,
-        _HELP_CARD_MARGIN,
-        _HELP_IMAGE_WIDTH - _HELP_CARD_MARGIN,
-        _HELP_CARD_MARGIN + title_h,
-    )
-    draw_glass_box(title_box, 22, 118)
-    draw.text(
-        (_HELP_CARD_MARGIN + 30, _HELP_CARD_MARGIN + 24),
-        title,
-        font=get_font(DEFAULT_HEAVY_FONT, 34),
-        fill=(24, 38, 58, 255),
-    )
+    width = _HELP_IMAGE_WIDTH
+    title_box = (_HELP_CARD_MARGIN, _HELP_CARD_MARGIN, width - _HELP_CARD_MARGIN, _HELP_CARD_MARGIN + _HELP_TITLE_H)
+    glass_box(title_box, 22, 118)
+    text(title, (_HELP_CARD_MARGIN + 30, _HELP_CARD_MARGIN + 24), DEFAULT_HEAVY_FONT, 34, (24, 38, 58, 255))
 
-    y = title_box[3] + section_gap
-    for section, (_, section_h) in zip(sections, section_sizes, strict=True):
-        section_box = (_HELP_CARD_MARGIN, y, _HELP_IMAGE_WIDTH - _HELP_CARD_MARGIN, y + section_h)
-        draw_glass_box(section_box, 18, 102)
+    y = title_box[3] + _HELP_SECTION_GAP
+    for section, section_h in zip(layout.sections, layout.section_heights, strict=True):
+        section_box = (_HELP_CARD_MARGIN, y, width - _HELP_CARD_MARGIN, y + section_h)
+        glass_box(section_box, 18, 102)
         header_box = (section_box[0] + 24, section_box[1] + 18, section_box[2] - 24, section_box[1] + 50)
-        draw.text(
-            (header_box[0], header_box[1]),
-            section.title,
-            font=get_font(DEFAULT_BOLD_FONT, 24),
-            fill=(24, 38, 58, 255),
-        )
-        draw.line(
-            (header_box[0], header_box[3] + 8, header_box[2], header_box[3] + 8),
+        text(section.title, (header_box[0], header_box[1]), DEFAULT_BOLD_FONT, 24, (24, 38, 58, 255))
+        p.rect(
+            (header_box[0], header_box[3] + 7),
+            (header_box[2] - header_box[0], 2),
             fill=(255, 255, 255, 86),
-            width=2,
         )
 
-        text_y = section_box[1] + section_pad_y + 48
-        text_x = section_box[0] + section_pad_x
-        text_right = section_box[2] - section_pad_x
+        text_y = section_box[1] + _HELP_SECTION_PAD_Y + 48
+        text_x = section_box[0] + _HELP_SECTION_PAD_X
+        text_right = section_box[2] - _HELP_SECTION_PAD_X
         for line in section.lines:
             text_y += line.gap_before
             line_height = _command_help_line_height(line.size)
             if line.bg is not None:
-                bg_box = (
-                    text_x + line.indent - 14,
-                    text_y - 4,
-                    text_right + 8,
-                    text_y + line_height - 1,
+                bg_x = text_x + line.indent - 14
+                p.roundrect(
+                    (bg_x, text_y - 4),
+                    (text_right + 8 - bg_x, line_height + 3),
+                    fill=line.bg,
+                    radius=10,
                 )
-                draw.rounded_rectangle(bg_box, radius=10, fill=line.bg)
             if line.text:
-                font = get_font(line.font_name, line.size)
                 if line.label:
-                    draw.text(
-                        (text_x + line.indent, text_y),
-                        line.label,
-                        font=get_font(DEFAULT_BOLD_FONT, line.size),
-                        fill=(30, 45, 66, 255),
-                    )
+                    text(line.label, (text_x + line.indent, text_y), DEFAULT_BOLD_FONT, line.size, (30, 45, 66, 255))
                 text_offset = line.label_width if line.label_width > 0 else 0
-                draw.text((text_x + line.indent + text_offset, text_y), line.text, font=font, fill=line.fill)
+                text(line.text, (text_x + line.indent + text_offset, text_y), line.font_name, line.size, line.fill)
             text_y += line_height
-        y += section_h + section_gap
-
-    return img
+        y += section_h + _HELP_SECTION_GAP
 
 
-async def _build_command_help_canvas(rqd: CommandHelpRenderRequest) -> Canvas:
-    panel = await run_in_pool(partial(_compose_command_help_image_sync, rqd))
+async def _build_command_help_content(rqd: CommandHelpRenderRequest, measurer: _CommandHelpMeasurer) -> Canvas:
+    layout = COMMAND_HELP_LAYOUT_CACHE.get(_command_help_layout_key(rqd.markdown, measurer.kind))
+    if layout is MISSING:
+        layout = await run_in_pool(_compute_command_help_layout, rqd.markdown, measurer)
+    title = (rqd.title or layout.title or "指令帮助").strip()
     with Canvas(bg=SEKAI_BLUE_BG).set_padding(BG_PADDING) as canvas:
-        Frame().set_size(panel.size).add_draw_func(
-            lambda _widget, painter: painter.paste_with_alpha_blend(panel, (0, 0), exclude_on_hash=True)
+        Frame().set_size((_HELP_IMAGE_WIDTH, layout.height)).add_draw_func(
+            lambda _widget, painter: _draw_command_help_panel(painter, layout, title)
         )
+    return canvas
+
+
+async def _build_command_help_canvas(rqd: CommandHelpRenderRequest) -> Canvas:
+    measurer = _command_help_measurer()
+    canvas = await build_layout_snapshot_canvas(
+        "command_help",
+        rqd,
+        lambda: _build_command_help_content(rqd, measurer),
+        extra={"measurer": measurer.kind},
+    )
     add_request_watermark(canvas, rqd)
     return canvas
 
@@ -502,7 +653,7 @@ async def compose_command_help_image(rqd: CommandHelpRenderRequest) -> Image.Ima
 
 
 async def try_render_command_help_payload(rqd: CommandHelpRenderRequest) -> EncodedImagePayload | None:
-    """Skia 路径：帮助面板位图经 mem 图传输,外壳走 IRPainter;不可用时返回 None 回退 Pillow。"""
+    """Skia 路径：帮助面板直接以 IRPainter 文本/形状节点绘制;不可用时返回 None 回退 Pillow。"""
     if not skia_plot_enabled():
         return None
     canvas = await _build_command_help_canvas(rqd)
@@ -905,8 +1056,8 @@ async def _build_chara_birthday_canvas(rqd: CharaBirthdayRequest) -> Canvas:
 
     # 绘制时间范围的辅助函数
     def draw_time_range(label: str, tr: BirthdayEventTime):
-        start_at = datetime_from_millis(tr.start_at, rqd.timezone)
-        end_at = datetime_from_millis(tr.end_at, rqd.timezone)
+        start_at = rqd.clock.localize(tr.start_at)
+        end_at = rqd.clock.localize(tr.end_at)
         timezone_label = rqd.timezone or ""
         if timezone_label == "" and (start_at and start_at.tzinfo):
             timezone_label = start_at.tzname() or ""
@@ -1026,7 +1177,7 @@ async def try_render_chara_birthday_payload(rqd: CharaBirthdayRequest) -> Encode
     return await render_canvas_payload(await _build_chara_birthday_canvas(rqd), endpoint="chara_birthday")
 
 
-async def _build_alias_list_canvas(rqd: AliasListRequest) -> Canvas:
+async def _build_alias_list_content(rqd: AliasListRequest) -> Canvas:
     aliases = [alias.strip() for alias in rqd.aliases if alias and alias.strip()]
     accent = _resolve_alias_accent(rqd.entity_label, rqd.entity_id)
     jacket_img = None
@@ -1177,6 +1328,12 @@ async def _build_alias_list_canvas(rqd: AliasListRequest) -> Canvas:
                                 )
                             ).set_padding((14, 9))
 
+    return canvas
+
+
+async def _build_alias_list_canvas(rqd: AliasListRequest) -> Canvas:
+    # 排版快照不含水印(水印在回放画布上按本次请求的 dt 重新添加),与下面删除结果缓存的原因不冲突。
+    canvas = await build_layout_snapshot_canvas("alias_list", rqd, lambda: _build_alias_list_content(rqd))
     add_request_watermark(canvas, rqd)
     return canvas
 
@@ -38,8 +38,7 @@ from src.sekai.base.plot import (
     TextStyle,
     VSplit,
 )
-from src.sekai.base.timezone import datetime_from_millis
-from src.sekai.base.utils import ImageSource, get_asset_image_ref, get_str_display_length
+from src.sekai.base.utils import AssetPrefetchPlan, ImageSource, get_asset_image_ref, get_str_display_length
 from src.sekai.profile.drawer import get_profile_card
 from src.sekai.skia_renderer.canvas import render_canvas_payload, skia_plot_enabled
 from src.settings import ASSETS_BASE_DIR, RESULT_ASSET_PATH
@@ -309,10 +308,9 @@ async def _build_music_detail_canvas(rqd: MusicDetailRequest) -> Canvas:
     lyricist = rqd.music_info.lyricist
     arranger = rqd.music_info.arranger
     mv_info = rqd.music_info.mv_info
-    publish_time = datetime_from_millis(rqd.music_info.release_at, rqd.timezone).strftime("%Y-%m-%d %H:%M:%S")
+    publish_time = rqd.clock.localize(rqd.music_info.release_at).strftime("%Y-%m-%d %H:%M:%S")
     bpm = rqd.bpm
     is_full_length = rqd.music_info.is_full_length
-    cover_img = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.music_jacket_path)
     length = rqd.length
     cn_name = rqd.cn_name
     region = rqd.region
@@ -320,24 +318,18 @@ async def _build_music_detail_canvas(rqd: MusicDetailRequest) -> Canvas:
     vocal_logos_raw = {} if custom_chart else rqd.vocal.vocal_assets
     # has_append = rqd.difficulty.has_append
 
-    # 并行加载封面、banner和所有vocal logos
-    _logo_names = list(vocal_logos_raw.keys())
-    _logo_paths = list(vocal_logos_raw.values())
-    _img_tasks = [get_asset_image_ref(ASSETS_BASE_DIR, p) for p in _logo_paths]
-    if rqd.event_banner_path and not custom_chart:
-        _img_tasks.append(get_asset_image_ref(ASSETS_BASE_DIR, rqd.event_banner_path))
-    _t0 = time.perf_counter()
-    _img_results = await asyncio.gather(*_img_tasks) if _img_tasks else []
-    logger.debug(
-        "[perf] compose_music_detail_image preload %d images: %.3fs",
-        len(_img_tasks),
-        time.perf_counter() - _t0,
-    )
-    vocal_logos = {}
-    for i, name_ in enumerate(_logo_names):
-        if _img_results[i]:
-            vocal_logos[name_] = _img_results[i]
-    event_banner = _img_results[len(_logo_names)] if rqd.event_banner_path and not custom_chart else None
+    # 封面、banner 和所有 vocal logos 一次性预取
+    plan = AssetPrefetchPlan(ASSETS_BASE_DIR)
+    plan.add(rqd.music_jacket_path)
+    for logo_path in vocal_logos_raw.values():
+        plan.add(logo_path)
+    show_event_banner = bool(rqd.event_banner_path) and not custom_chart
+    if show_event_banner:
+        plan.add(rqd.event_banner_path)
+    assets = await plan.resolve("music_detail")
+    cover_img = assets[rqd.music_jacket_path]
+    vocal_logos = {name_: assets[logo_path] for name_, logo_path in vocal_logos_raw.items()}
+    event_banner = assets[rqd.event_banner_path] if show_event_banner else None
 
     if is_full_length:
         name += " [FULL]"
@@ -346,7 +338,7 @@ async def _build_music_detail_canvas(rqd: MusicDetailRequest) -> Canvas:
     bpm_main = f"{bpm} BPM" if bpm else "?"
     if custom_chart:
         if custom_chart.published_at:
-            publish_time = datetime_from_millis(custom_chart.published_at, rqd.timezone).strftime("%Y-%m-%d %H:%M:%S")
+            publish_time = rqd.clock.localize(custom_chart.published_at).strftime("%Y-%m-%d %H:%M:%S")
         if custom_chart.bpm:
             bpm_main = f"{custom_chart.bpm} BPM"
 
@@ -459,8 +451,8 @@ async def _build_music_detail_canvas(rqd: MusicDetailRequest) -> Canvas:
                         TextBox("限定时间", TextStyle(font=DEFAULT_HEAVY_FONT, size=24, color=(50, 50, 50)))
                         with VSplit().set_content_align("l").set_item_align("l").set_sep(4):
                             for start, end in rqd.limited_times:
-                                start_at = datetime_from_millis(start, rqd.timezone)
-                                end_at = datetime_from_millis(end, rqd.timezone)
+                                start_at = rqd.clock.localize(start)
+                                end_at = rqd.clock.localize(end)
                                 TextBox(
                                     f"{start_at.strftime('%Y-%m-%d %H:%M')} ~ {end_at.strftime('%Y-%m-%d %H:%M')}",
                                     TextStyle(font=DEFAULT_FONT, size=24, color=(70, 70, 70)),
@@ -737,7 +729,7 @@ async def _build_music_brief_list_canvas(rqd: MusicBriefListRequest) -> Canvas:
                 for m in rqd.music_list:
                     release_at = ""
                     if m.music_info:
-                        release_at = datetime_from_millis(m.music_info.release_at, rqd.timezone).strftime("%Y-%m-%d")
+                        release_at = rqd.clock.localize(m.music_info.release_at).strftime("%Y-%m-%d")
                     diff_levels = []
                     if m.difficulty:
                         diff_order = m.difficulty.order or ["easy", "normal", "hard", "expert", "master"]
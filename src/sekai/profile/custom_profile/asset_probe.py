@@ -0,0 +1,103 @@
+"""Request-scoped memo of the filesystem probes one custom profile render repeats.
+
+Card members, honors and deck prefabs share frames, icons and sprites, so one card used to ask
+the filesystem the same questions hundreds of times: ``Path.exists``/``is_file`` while walking a
+candidate list, ``resolve`` + ``relative_to`` to confine a path to the asset root, ``os.stat``
+for a cache signature, and the native header probe for an asset's dimensions. ``AssetProbeMemo``
+answers each question once per path for the lifetime of one bound request.
+
+Scope is what keeps this correct without signatures in the keys: ``PNGRenderer.bind_request``
+installs a fresh memo for every request (like the renderer's other per-card memos), so an asset
+the updater replaces in place is seen by the next request. Values are plain verdicts, never file
+handles. Layer threads may race a miss and both probe; the duplicate is harmless and the counters
+are diagnostics, not invariants.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from pathlib import Path
+import stat
+from typing import Any
+
+from src.sekai.profile.custom_profile.cache import MISSING_FILE, FileSignature
+
+
+class AssetProbeMemo:
+    """Memoized ``stat``/``resolve``/native-header answers for one render request."""
+
+    __slots__ = ("_native_info", "_resolved", "_stats", "deduplicated", "probes")
+
+    def __init__(self) -> None:
+        self._stats: dict[str, os.stat_result | None] = {}
+        self._resolved: dict[tuple[str, bool], Path | None] = {}
+        self._native_info: dict[str, dict[str, Any] | None] = {}
+        # Filesystem/native probes actually issued, and repeats answered from the memo.
+        self.probes = 0
+        self.deduplicated = 0
+
+    def _stat(self, path: Path | str) -> os.stat_result | None:
+        key = os.fspath(path)
+        if key in self._stats:
+            self.deduplicated += 1
+            return self._stats[key]
+        self.probes += 1
+        try:
+            value = os.stat(key)
+        except (OSError, ValueError):
+            value = None
+        self._stats[key] = value
+        return value
+
+    def exists(self, path: Path | str) -> bool:
+        """``Path.exists`` (follows symlinks; an unreadable path counts as missing)."""
+        return self._stat(path) is not None
+
+    def is_file(self, path: Path | str) -> bool:
+        st = self._stat(path)
+        return st is not None and stat.S_ISREG(st.st_mode)
+
+    def signature(self, path: Path | str) -> FileSignature:
+        """``cache.optional_file_signature`` sharing the stat behind ``exists``/``is_file``."""
+        st = self._stat(path)
+        return MISSING_FILE if st is None else (st.st_mtime_ns, st.st_size)
+
+    def resolve(self, path: Path, *, strict: bool = False) -> Path | None:
+        """``path.resolve(strict=...)``, or ``None`` where that raises ``OSError``.
+
+        A non-``Path`` argument raises ``AttributeError`` exactly like the unmemoized call.
+        """
+        key = (str(path), strict)
+        if key in self._resolved:
+            self.deduplicated += 1
+            return self._resolved[key]
+        resolve = path.resolve
+        self.probes += 1
+        try:
+            value = resolve(strict=strict)
+        except OSError:
+            value = None
+        self._resolved[key] = value
+        return value
+
+    def relative_path(self, path: Path, root: Path) -> str | None:
+        """POSIX path of ``path`` under ``root`` after resolving both, or ``None`` outside it."""
+        resolved = self.resolve(path)
+        resolved_root = self.resolve(root)
+        if resolved is None or resolved_root is None:
+            return None
+        try:
+            return resolved.relative_to(resolved_root).as_posix()
+        except ValueError:
+            return None
+
+    def native_info(self, asset_path: str, probe: Callable[[str], dict[str, Any] | None]) -> dict[str, Any] | None:
+        """``probe(asset_path)`` once per asset; a raised error is not memoized."""
+        if asset_path in self._native_info:
+            self.deduplicated += 1
+            return self._native_info[asset_path]
+        self.probes += 1
+        value = probe(asset_path)
+        self._native_info[asset_path] = value
+        return value
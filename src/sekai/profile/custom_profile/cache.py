@@ -19,131 +19,39 @@ Design rules (docs/custom-profile-skia-feasibility.md Phase 0):
   a per-object critical section, measured at a 4-5x throughput loss on the free-threaded build
   when one object is shared across the pool (see ``skia_renderer.ir_builder.get_pil_font``).
 
-This module must stay light to import (no numpy/cv2/fontTools/renderer imports): it is lazily
-imported by ``src.sekai.base.utils.get_runtime_cache_stats`` for /cache/stats.
+The generic primitives (``BoundedCache``, ``GlyphDiskStore``, ``MISSING``, ``file_signature``) live
+in ``src.sekai.base.cache`` and are re-exported here; this module owns the renderer's pools. Keep it
+free of numpy/cv2/fontTools/renderer imports: ``get_runtime_cache_stats`` imports it for /cache/stats.
 """
 
 from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Callable
-import os
+import logging
 from pathlib import Path
 import threading
 from typing import Any
 
+from src.sekai.base.cache import (
+    MISSING,  # noqa: F401
+    MISSING_FILE,  # noqa: F401
+    BoundedCache,
+    FileSignature,
+    GlyphDiskStore,
+    ShardedBoundedCache,  # noqa: F401
+    file_signature,
+    optional_file_signature,
+)
 from src.settings import (
     CUSTOM_PROFILE_GLYPH_CACHE_MAX_BYTES,
     CUSTOM_PROFILE_GLYPH_CACHE_SIZE,
+    CUSTOM_PROFILE_GLYPH_DISK_CACHE_MAX_BYTES,
     CUSTOM_PROFILE_SPRITE_CACHE_MAX_BYTES,
     CUSTOM_PROFILE_SPRITE_CACHE_SIZE,
 )
 
-FileSignature = tuple[int, int]
-# Recorded for probed-but-absent paths: a table/font that *arrives* later must invalidate the
-# entry just like a replaced one (the "placeholder cached until TTL" failure mode in CLAUDE.md).
-MISSING_FILE = (-1, -1)
-
-#: Sentinel distinguishing "not cached" from a cached ``None``. BoundedCache supports caching
-#: ``None``, but the glyph pools deliberately store only SUCCESSFUL renders: their None verdicts
-#: come from broad except blocks, and a transient failure cached under an unchanged file
-#: signature would poison the glyph for the process lifetime (negatives stay in the renderer's
-#: per-request L1 instead).
-MISSING: Any = object()
-
-
-def file_signature(path: Path | str) -> FileSignature:
-    """``(st_mtime_ns, st_size)`` of ``path``; raises ``OSError`` when it does not exist."""
-    st = os.stat(path)
-    return (st.st_mtime_ns, st.st_size)
-
-
-def optional_file_signature(path: Path | str) -> FileSignature:
-    """Like :func:`file_signature` but maps a missing path to :data:`MISSING_FILE`."""
-    try:
-        return file_signature(path)
-    except OSError:
-        return MISSING_FILE
-
-
-class BoundedCache:
-    """LRU cache bounded by entry count and estimated bytes, with /cache/stats counters.
-
-    Not ``_TTLImageCache``: no TTL (invalidation is by file signature in the key), no
-    copy-on-get (values are shared immutables), no ``close()`` of evicted values.
-    """
-
-    def __init__(self, name: str, max_entries: int, max_bytes: int, estimate: Callable[[Any], int]) -> None:
-        self.name = name
-        self.max_entries = max_entries
-        self.max_bytes = max_bytes
-        self._estimate = estimate
-        self._lock = threading.RLock()
-        self._data: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
-        self._bytes = 0
-        self._hits = 0
-        self._misses = 0
-        self._sets = 0
-        self._evictions = 0
-
-    @property
-    def enabled(self) -> bool:
-        return self.max_entries > 0 and self.max_bytes > 0
-
-    def get(self, key: Any) -> Any:
-        """The cached value, or :data:`MISSING`. A cached ``None`` is a hit."""
-        if not self.enabled:
-            return MISSING
-        with self._lock:
-            if key in self._data:
-                value, _ = self._data[key]
-                self._data.move_to_end(key)
-                self._hits += 1
-                return value
-            self._misses += 1
-            return MISSING
-
-    def set(self, key: Any, value: Any) -> None:
-        if not self.enabled:
-            return
-        size = max(0, int(self._estimate(value)))
-        if size > self.max_bytes:
-            return  # would evict the whole pool to hold one entry
-        with self._lock:
-            old = self._data.pop(key, None)
-            if old is not None:
-                self._bytes -= old[1]
-            self._data[key] = (value, size)
-            self._bytes += size
-            self._sets += 1
-            while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
-                _, (_, evicted_size) = self._data.popitem(last=False)
-                self._bytes -= evicted_size
-                self._evictions += 1
-
-    def clear(self) -> None:
-        with self._lock:
-            self._data.clear()
-            self._bytes = 0
-
-    def stats(self) -> dict[str, Any]:
-        # Same key shape as src.sekai.base.utils._build_shared_cache_stats (not imported to keep
-        # this module lazily importable from there without a cycle).
-        with self._lock:
-            hits, misses = self._hits, self._misses
-            total = hits + misses
-            return {
-                "enabled": self.enabled,
-                "entries": len(self._data),
-                "max_entries": self.max_entries,
-                "bytes": self._bytes,
-                "max_bytes": self.max_bytes,
-                "hits": hits,
-                "misses": misses,
-                "sets": self._sets,
-                "evictions": self._evictions,
-                "hit_rate": (hits / total) if total > 0 else None,
-            }
+logger = logging.getLogger(__name__)
 
 
 def _glyph_sdf_bytes(value: Any) -> int:
@@ -180,6 +88,20 @@ SPRITE_ATLAS_CACHE = BoundedCache(
 )
 
 
+# ---- glyph disk store ---------------------------------------------------------------------------
+#
+# GLYPH_SDF_CACHE / GLYPH_CONTOUR_CACHE die with the process, and a restart or a heavy-worker
+# respawn pays FreeType + the distance transform again for every unusual character. The disk
+# store (``GlyphDiskStore``, see ``src.sekai.base.cache`` for the file format) keeps the same
+# successful values as files, content-addressed by the full L2 key plus the renderer's generator
+# digest, so a change to the SDF math never reads an old field.
+
+GLYPH_DISK_CACHE_DIR = Path("data/utils/custom_profile_glyphs")
+
+
+GLYPH_DISK_STORE = GlyphDiskStore("glyph_disk", GLYPH_DISK_CACHE_DIR, CUSTOM_PROFILE_GLYPH_DISK_CACHE_MAX_BYTES)
+
+
 # ---- TMP metadata table cache -----------------------------------------------------------------
 #
 # Caches the *parsed asset tables* from TMPFontLibrary.load, never the library object: the
@@ -190,7 +112,9 @@ SPRITE_ATLAS_CACHE = BoundedCache(
 # callback threaded through TMPFontLibrary._load_assets), including probed-but-missing
 # character/glyph tables and source-font candidates, plus the atlases directory (its glob result
 # is baked into the tables; a directory's mtime_ns moves when entries are added or removed).
-# A hit re-stats the list (~tens of µs); any mismatch reparses.
+# A hit re-stats the list (~tens of µs); any mismatch reparses. A miss is single-flight per key:
+# the first caller parses (through the compiled table pack, see tmp_tables.py) while concurrent
+# callers for the same key wait on its event and then take the fresh entry.
 
 _TMP_METADATA_CACHE_MAX = 8
 _tmp_metadata_lock = threading.RLock()
@@ -198,9 +122,31 @@ _tmp_metadata_cache: OrderedDict[
     tuple[str, str],
     tuple[Any, Any, list[tuple[str, FileSignature]]],
 ] = OrderedDict()
+_tmp_metadata_inflight: dict[tuple[str, str], threading.Event] = {}
 _tmp_metadata_hits = 0
 _tmp_metadata_misses = 0
 _tmp_metadata_sets = 0
+_tmp_metadata_waits = 0
+_tmp_table_pack_counts = {"loads": 0, "writes": 0, "write_errors": 0}
+
+
+def note_tmp_table_pack(outcome: str) -> None:
+    """Count one compiled-pack outcome (``loads``/``writes``/``write_errors``) for /cache/stats."""
+    with _tmp_metadata_lock:
+        _tmp_table_pack_counts[outcome] += 1
+
+
+def _fresh_tmp_tables(key: tuple[str, str]) -> tuple[Any, Any] | None:
+    with _tmp_metadata_lock:
+        entry = _tmp_metadata_cache.get(key)
+        if entry is not None:
+            _tmp_metadata_cache.move_to_end(key)
+    if entry is None:
+        return None
+    assets, source_assets, signatures = entry
+    if not all(optional_file_signature(path) == sig for path, sig in signatures):
+        return None
+    return assets, source_assets
 
 
 def get_tmp_font_tables(
@@ -212,20 +158,24 @@ def get_tmp_font_tables(
 
     ``loader(record)`` performs the actual parse, calling ``record(path)`` for every file it
     reads or probes; it returns ``(assets, source_assets_or_None)``. The parse runs outside the
-    lock — concurrent misses duplicate work, last write wins.
+    lock and once per key: concurrent misses wait for the running parse instead of repeating it
+    (a waiter whose leader raised retries as the new leader).
     """
-    global _tmp_metadata_hits, _tmp_metadata_misses, _tmp_metadata_sets
+    global _tmp_metadata_hits, _tmp_metadata_misses, _tmp_metadata_sets, _tmp_metadata_waits
     key = (str(metadata_path), str(source_metadata_path) if source_metadata_path is not None else "")
-    with _tmp_metadata_lock:
-        entry = _tmp_metadata_cache.get(key)
-        if entry is not None:
-            _tmp_metadata_cache.move_to_end(key)
-    if entry is not None:
-        assets, source_assets, signatures = entry
-        if all(optional_file_signature(path) == sig for path, sig in signatures):
+    while True:
+        fresh = _fresh_tmp_tables(key)
+        if fresh is not None:
             with _tmp_metadata_lock:
                 _tmp_metadata_hits += 1
-            return assets, source_assets
+            return fresh
+        with _tmp_metadata_lock:
+            event = _tmp_metadata_inflight.get(key)
+            if event is None:
+                event = _tmp_metadata_inflight[key] = threading.Event()
+                break
+            _tmp_metadata_waits += 1
+        event.wait()
 
     signatures: list[tuple[str, FileSignature]] = []
     seen: set[str] = set()
@@ -236,14 +186,19 @@ def get_tmp_font_tables(
             seen.add(text)
             signatures.append((text, optional_file_signature(path)))
 
-    assets, source_assets = loader(record)
-    with _tmp_metadata_lock:
-        _tmp_metadata_misses += 1
-        _tmp_metadata_sets += 1
-        _tmp_metadata_cache[key] = (assets, source_assets, signatures)
-        _tmp_metadata_cache.move_to_end(key)
-        while len(_tmp_metadata_cache) > _TMP_METADATA_CACHE_MAX:
-            _tmp_metadata_cache.popitem(last=False)
+    try:
+        assets, source_assets = loader(record)
+        with _tmp_metadata_lock:
+            _tmp_metadata_misses += 1
+            _tmp_metadata_sets += 1
+            _tmp_metadata_cache[key] = (assets, source_assets, signatures)
+            _tmp_metadata_cache.move_to_end(key)
+            while len(_tmp_metadata_cache) > _TMP_METADATA_CACHE_MAX:
+                _tmp_metadata_cache.popitem(last=False)
+    finally:
+        with _tmp_metadata_lock:
+            _tmp_metadata_inflight.pop(key, None)
+        event.set()
     return assets, source_assets
 
 
@@ -309,26 +264,33 @@ def get_custom_profile_cache_stats() -> dict[str, Any]:
             "sets": _tmp_metadata_sets,
             "evictions": 0,
             "hit_rate": (meta_hits / meta_total) if meta_total > 0 else None,
+            "single_flight_waits": _tmp_metadata_waits,
+            "pack": dict(_tmp_table_pack_counts),
         }
     return {
         "tmp_metadata": tmp_metadata,
         "glyph_sdf": GLYPH_SDF_CACHE.stats(),
         "glyph_contours": GLYPH_CONTOUR_CACHE.stats(),
+        "glyph_disk": GLYPH_DISK_STORE.stats(),
         "sprite_atlas": SPRITE_ATLAS_CACHE.stats(),
     }
 
 
 def clear_custom_profile_caches() -> None:
     """Drop every process-level pool (tests; per-thread font caches clear on thread death)."""
-    global _tmp_metadata_hits, _tmp_metadata_misses, _tmp_metadata_sets
+    global _tmp_metadata_hits, _tmp_metadata_misses, _tmp_metadata_sets, _tmp_metadata_waits
     GLYPH_SDF_CACHE.clear()
     GLYPH_CONTOUR_CACHE.clear()
+    GLYPH_DISK_STORE.reset_stats()
     SPRITE_ATLAS_CACHE.clear()
     with _tmp_metadata_lock:
         _tmp_metadata_cache.clear()
         _tmp_metadata_hits = 0
         _tmp_metadata_misses = 0
         _tmp_metadata_sets = 0
+        _tmp_metadata_waits = 0
+        for outcome in _tmp_table_pack_counts:
+            _tmp_table_pack_counts[outcome] = 0
     cache = getattr(_render_font_tls, "cache", None)
     if cache is not None:
         cache.clear()
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 import logging
 from pathlib import Path
+import threading
+import time
 from typing import Any
 
 from PIL import Image
 
 from src.sekai.base.utils import run_in_pool
 from src.sekai.profile.custom_profile.limits import validate_custom_profile_card
-from src.sekai.profile.custom_profile.renderer import PROFILE_RENDER_VIEW_H, PROFILE_RENDER_VIEW_W, PNGRenderer
+from src.sekai.profile.custom_profile.renderer import (
+    PROFILE_RENDER_VIEW_H,
+    PROFILE_RENDER_VIEW_W,
+    PNGRenderer,
+    TMPFontLibrary,
+)
 from src.sekai.profile.model import CustomProfileCardRenderRequest
 from src.settings import (
     CUSTOM_PROFILE_ASSETS_DIR,
@@ -23,6 +33,7 @@ from src.settings import (
     CUSTOM_PROFILE_SHAPE_SPRITE_DIR,
     CUSTOM_PROFILE_TMP_FONT_METADATA,
     CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR,
+    DEFAULT_THREAD_POOL_SIZE,
 )
 
 logger = logging.getLogger(__name__)
@@ -102,6 +113,186 @@ def _optional_region_file(name: str, path: Path | None, region: str) -> Path | N
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class CustomProfileSessionPaths:
+    assets: Path
+    fonts: Path
+    tmp_font_metadata: Path | None
+    shape_sprite_dir: Path
+    unity_ui_sprite_dir: Path
+
+    def still_valid(self, region: str) -> bool:
+        """One probe per resolved path; an optional metadata file that appeared since also fails it."""
+        dirs = (self.assets, self.fonts, self.shape_sprite_dir, self.unity_ui_sprite_dir)
+        if not all(path.is_dir() for path in dirs):
+            return False
+        if self.tmp_font_metadata is not None:
+            return self.tmp_font_metadata.is_file()
+        if CUSTOM_PROFILE_TMP_FONT_METADATA is None:
+            return True
+        return not any(path.exists() for path in _region_path_candidates(CUSTOM_PROFILE_TMP_FONT_METADATA, region))
+
+
+@dataclass(frozen=True, slots=True)
+class CustomProfileRenderSetup:
+    """What one request paid before its first element: checkout wall time and pool reuse."""
+
+    seconds: float
+    reused: bool
+
+
+def _resolve_session_paths(region: str) -> CustomProfileSessionPaths:
+    return CustomProfileSessionPaths(
+        assets=_require_region_path("custom_profile_assets_dir", CUSTOM_PROFILE_ASSETS_DIR, region),
+        fonts=_require_region_path("custom_profile_fonts_dir", CUSTOM_PROFILE_FONTS_DIR, region),
+        tmp_font_metadata=_optional_region_file(
+            "custom_profile_tmp_font_metadata",
+            CUSTOM_PROFILE_TMP_FONT_METADATA,
+            region,
+        ),
+        shape_sprite_dir=_require_region_path(
+            "custom_profile_shape_sprite_dir",
+            CUSTOM_PROFILE_SHAPE_SPRITE_DIR,
+            region,
+        ),
+        unity_ui_sprite_dir=_require_region_path(
+            "custom_profile_unity_ui_sprite_dir",
+            CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR,
+            region,
+        ),
+    )
+
+
+class CustomProfileRendererSession:
+    """Resolved region paths plus idle, warmed renderers for one (region, settings) pair.
+
+    Building a ``PNGRenderer`` per request re-resolved every region path and started from an empty
+    ``TMPFontLibrary`` (no source fonts opened, no source metrics memoized), all thrown away after
+    one card. A session keeps both: a request checks an idle renderer out (one thread at a time
+    owns it), ``bind_request`` swaps in the request's resources and fresh per-card memos, and the
+    renderer goes back on checkin. The library is kept while the shared TMP tables behind it are
+    current and replaced when they were reparsed.
+    """
+
+    def __init__(
+        self,
+        region: str,
+        paths: CustomProfileSessionPaths,
+        factory: Callable[..., PNGRenderer],
+        max_idle: int,
+    ) -> None:
+        self.region = region
+        self.paths = paths
+        self._factory = factory
+        # Test doubles standing in for PNGRenderer cannot be rebound: they are built per request.
+        self._poolable = hasattr(factory, "bind_request")
+        self._max_idle = max(0, max_idle)
+        self._idle: list[PNGRenderer] = []
+        self._lock = threading.Lock()
+
+    def checkout(self, resources: dict[str, Any], profile_context: dict[str, Any]) -> tuple[PNGRenderer, bool]:
+        renderer = None
+        if self._poolable:
+            with self._lock:
+                renderer = self._idle.pop() if self._idle else None
+        if renderer is None:
+            return self._new_renderer(resources, profile_context), False
+        renderer.bind_request(resources, profile_context)
+        library = TMPFontLibrary.load(self.paths.tmp_font_metadata, runtime_fonts_dir=self.paths.fonts)
+        current = renderer.tmp_font_library
+        if library.assets is not current.assets or library.source_assets is not current.source_assets:
+            renderer.tmp_font_library = library
+        return renderer, True
+
+    def checkin(self, renderer: PNGRenderer) -> None:
+        if not self._poolable:
+            return
+        renderer.bind_request(None, None)  # do not keep the last request's resources alive
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(renderer)
+
+    def _new_renderer(self, resources: dict[str, Any], profile_context: dict[str, Any]) -> PNGRenderer:
+        return self._factory(
+            masterdata=None,
+            assets=self.paths.assets,
+            fonts=self.paths.fonts,
+            resources=resources,
+            tmp_font_metadata=self.paths.tmp_font_metadata,
+            shape_sprite_dir=self.paths.shape_sprite_dir,
+            profile_context=profile_context,
+            parallel_workers=max(1, int(CUSTOM_PROFILE_PARALLEL_WORKERS or 1)),
+            parallel_stage="transform",
+            clip_canvas_transform=True,
+            canvas_w=int(PROFILE_RENDER_VIEW_W),
+            canvas_h=int(PROFILE_RENDER_VIEW_H),
+            origin_x=PROFILE_RENDER_VIEW_W / 2.0,
+            origin_y=PROFILE_RENDER_VIEW_H / 2.0,
+            unity_ui_sprite_dir=self.paths.unity_ui_sprite_dir,
+            region=self.region,
+            max_layer_pixels=CUSTOM_PROFILE_MAX_LAYER_PIXELS,
+            max_scene_bytes=CUSTOM_PROFILE_MAX_SCENE_BYTES,
+        )
+
+
+_sessions: dict[tuple[Any, ...], CustomProfileRendererSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _session_key(region: str) -> tuple[Any, ...]:
+    # Read at call time: the settings digest is whatever the module-level settings say now.
+    return (
+        region,
+        CUSTOM_PROFILE_ASSETS_DIR,
+        CUSTOM_PROFILE_FONTS_DIR,
+        CUSTOM_PROFILE_TMP_FONT_METADATA,
+        CUSTOM_PROFILE_SHAPE_SPRITE_DIR,
+        CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR,
+        CUSTOM_PROFILE_PARALLEL_WORKERS,
+        CUSTOM_PROFILE_MAX_LAYER_PIXELS,
+        CUSTOM_PROFILE_MAX_SCENE_BYTES,
+        PNGRenderer,
+    )
+
+
+def _session_for(region: str) -> CustomProfileRendererSession:
+    key = _session_key(region)
+    with _sessions_lock:
+        session = _sessions.get(key)
+    if session is not None and session.paths.still_valid(region):
+        return session
+    # Resolution raises the canonical configuration errors; a failed resolve caches nothing.
+    session = CustomProfileRendererSession(
+        region, _resolve_session_paths(region), PNGRenderer, DEFAULT_THREAD_POOL_SIZE
+    )
+    with _sessions_lock:
+        _sessions[key] = session
+    return session
+
+
+def clear_custom_profile_sessions() -> None:
+    """Drop every pooled renderer (tests; settings reloads rebuild sessions through the key)."""
+    with _sessions_lock:
+        _sessions.clear()
+
+
+@contextmanager
+def checkout_custom_profile_renderer(
+    region: str,
+    resources: dict[str, Any],
+    profile_context: dict[str, Any],
+) -> Iterator[tuple[PNGRenderer, CustomProfileRenderSetup]]:
+    """A renderer bound to this request, returned to its session's pool on exit."""
+    started = time.perf_counter()
+    session = _session_for(region)
+    renderer, reused = session.checkout(resources, profile_context)
+    setup = CustomProfileRenderSetup(seconds=time.perf_counter() - started, reused=reused)
+    try:
+        yield renderer, setup
+    finally:
+        session.checkin(renderer)
+
+
 def _render_custom_profile_card_sync(
     card: dict[str, Any],
     profile_context: dict[str, Any],
@@ -115,45 +306,9 @@ def _render_custom_profile_card_sync(
         max_text_size=CUSTOM_PROFILE_MAX_TEXT_SIZE,
         max_text_length=CUSTOM_PROFILE_MAX_TEXT_LENGTH,
     )
-    assets = _require_region_path("custom_profile_assets_dir", CUSTOM_PROFILE_ASSETS_DIR, region)
-    fonts = _require_region_path("custom_profile_fonts_dir", CUSTOM_PROFILE_FONTS_DIR, region)
-    tmp_font_metadata = _optional_region_file(
-        "custom_profile_tmp_font_metadata",
-        CUSTOM_PROFILE_TMP_FONT_METADATA,
-        region,
-    )
-    shape_sprite_dir = _require_region_path(
-        "custom_profile_shape_sprite_dir",
-        CUSTOM_PROFILE_SHAPE_SPRITE_DIR,
-        region,
-    )
-    unity_ui_sprite_dir = _require_region_path(
-        "custom_profile_unity_ui_sprite_dir",
-        CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR,
-        region,
-    )
-
-    renderer = PNGRenderer(
-        masterdata=None,
-        assets=assets,
-        fonts=fonts,
-        resources=resources,
-        tmp_font_metadata=tmp_font_metadata,
-        shape_sprite_dir=shape_sprite_dir,
-        profile_context=profile_context,
-        parallel_workers=max(1, int(CUSTOM_PROFILE_PARALLEL_WORKERS or 1)),
-        parallel_stage="transform",
-        clip_canvas_transform=True,
-        canvas_w=int(PROFILE_RENDER_VIEW_W),
-        canvas_h=int(PROFILE_RENDER_VIEW_H),
-        origin_x=PROFILE_RENDER_VIEW_W / 2.0,
-        origin_y=PROFILE_RENDER_VIEW_H / 2.0,
-        unity_ui_sprite_dir=unity_ui_sprite_dir,
-        region=region,
-        max_layer_pixels=CUSTOM_PROFILE_MAX_LAYER_PIXELS,
-        max_scene_bytes=CUSTOM_PROFILE_MAX_SCENE_BYTES,
-    )
-    return renderer.render_card(card)
+    with checkout_custom_profile_renderer(region, resources, profile_context) as (renderer, setup):
+        logger.debug("custom_profile_card setup=%.4fs reused=%s", setup.seconds, setup.reused)
+        return renderer.render_card(card)
 
 
 async def compose_custom_profile_card_image(request: CustomProfileCardRenderRequest) -> Image.Image:
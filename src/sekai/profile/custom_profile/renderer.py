@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 import ctypes
 import ctypes.util
@@ -20,15 +21,16 @@ Image.MAX_IMAGE_PIXELS = None
 
 from src.sekai.honor.drawer import compose_full_honor_image_from_loaded_assets, honor_group_uses_scroll_level
 from src.sekai.honor.model import HonorRequest
+from src.sekai.profile.custom_profile.asset_probe import AssetProbeMemo
 from src.sekai.profile.custom_profile.cache import (
     GLYPH_CONTOUR_CACHE,
+    GLYPH_DISK_STORE,
     GLYPH_SDF_CACHE,
     MISSING,
     SPRITE_ATLAS_CACHE,
     file_signature,
     get_render_font,
     get_tmp_font_tables,
-    optional_file_signature,
 )
 from src.sekai.profile.custom_profile.card_prefab import (
     CardAlphaMaskOp,
@@ -180,6 +182,18 @@ TMP_DYNAMIC_SDF_DISTANCE_MASK_SIZE = 5
 # atlases where _GradientScale is 6 for padding 5.
 TMP_DYNAMIC_SDF_VECTOR_SPREAD_BIAS = 0.1
 TMP_DYNAMIC_SDF_VECTOR_CURVE_STEPS = 24
+# Everything above that shapes a generated glyph field/contour, plus a manual version to bump when
+# the generation code itself changes: part of every GLYPH_DISK_STORE key, so retuning never reads
+# back a field produced by the old math.
+TMP_GLYPH_GENERATOR_VERSION = (
+    1,
+    TMP_DYNAMIC_SDF_SUPERSAMPLE,
+    TMP_DYNAMIC_SDF_ALPHA_THRESHOLD,
+    tuple(sorted(TMP_DYNAMIC_SDF_ALPHA_THRESHOLD_BY_FONT.items())),
+    TMP_DYNAMIC_SDF_DISTANCE_MASK_SIZE,
+    TMP_DYNAMIC_SDF_VECTOR_SPREAD_BIAS,
+    TMP_DYNAMIC_SDF_VECTOR_CURVE_STEPS,
+)
 TMP_PERCENT_INDENT_MAX_MARGIN_WIDTH = 50000.0
 SHAPE_SDF_RATIO_SCALE = 1.0
 # ShapeContentView.set_OutlineSize writes
@@ -879,7 +893,8 @@ class DirectSdfFontQuad:
 # frozen: instances are shared PROCESS-WIDE across requests/threads via the TMP metadata table
 # cache (see TMPFontLibrary.load). Attribute rebinding is forbidden by the dataclass; the
 # atlas_paths/fallback_names/glyphs containers are still technically mutable — never mutate them
-# after construction.
+# after construction. glyphs is a dict after a JSON parse and a CompiledGlyphTable (read-only
+# Mapping) after a pack load; use it only through the Mapping interface.
 @dataclass(frozen=True)
 class TMPFontAsset:
     name: str
@@ -914,7 +929,7 @@ class TMPFontAsset:
     underlay_offset_x: float
     underlay_offset_y: float
     fallback_names: list[str]
-    glyphs: dict[int, TMPGlyphMetrics]
+    glyphs: Mapping[int, TMPGlyphMetrics]
 
     @property
     def has_static_glyphs(self) -> bool:
@@ -1225,12 +1240,15 @@ class TMPFontLibrary:
         # frozen dataclasses (containers inside TMPFontAsset rely on the never-mutate-after-load
         # convention); only this per-request library instance with its private
         # _source_fonts/_source_metrics is fresh. The loader records every file it reads or
-        # probes so a replaced (or late-arriving) table invalidates the entry.
+        # probes so a replaced (or late-arriving) table invalidates the entry. A miss goes through
+        # the compiled table pack (tmp_tables.py) and only parses JSON when no valid pack exists.
         def _loader(record) -> tuple[dict[str, list[TMPFontAsset]], dict[str, list[TMPFontAsset]] | None]:
+            from src.sekai.profile.custom_profile.tmp_tables import load_tmp_font_assets
+
             source: dict[str, list[TMPFontAsset]] | None = None
             if source_metadata_path is not None and source_metadata_path != metadata_path:
-                source = cls._load_assets(source_metadata_path, record=record)
-            return cls._load_assets(metadata_path, record=record), source
+                source = load_tmp_font_assets(source_metadata_path, record)
+            return load_tmp_font_assets(metadata_path, record), source
 
         assets, source_assets = get_tmp_font_tables(metadata_path, source_metadata_path, _loader)
         return cls(assets, source_assets, runtime_fonts_dir=runtime_fonts_dir)
@@ -2083,12 +2101,10 @@ class PNGRenderer:
         max_scene_bytes: int = DEFAULT_MAX_SCENE_BYTES,
     ) -> None:
         self.masterdata = masterdata
-        self.resources = resources or {}
         self.assets = assets
         self.game_assets = assets.parent if assets.name == "custom_profile" else assets
         self.region = self.normalize_region(region)
         self.fonts = fonts
-        self.profile_context = profile_context or {}
         self.canvas_w = canvas_w
         self.canvas_h = canvas_h
         self.origin_x = float(canvas_w) / 2.0 if origin_x is None else origin_x
@@ -2143,6 +2159,19 @@ class PNGRenderer:
         self.tmp_font_library = TMPFontLibrary.load(tmp_font_metadata, runtime_fonts_dir=fonts)
         self.shape_sprite_dir = shape_sprite_dir
         self.tmp_native_line_gap = tmp_native_line_gap
+        self.static_images = self.resolve_static_images_root()
+        self.unity_ui_sprite_dir = unity_ui_sprite_dir or DEFAULT_UNITY_UI_SPRITE_DIR
+        self.bind_request(resources, profile_context)
+
+    def bind_request(self, resources: dict[str, Any] | None, profile_context: dict[str, Any] | None) -> None:
+        """(Re)bind the per-request state: the resource indices and the per-card memos.
+
+        Everything ``__init__`` sets before calling this depends only on paths and settings, which
+        is what lets ``drawer.CustomProfileRendererSession`` hand one instance (and its warmed
+        ``tmp_font_library``) to request after request.
+        """
+        self.resources = resources or {}
+        self.profile_context = profile_context or {}
         text_colors = self.load_resource_index(
             "customProfileTextColors", "custom_profile_text_colors", filename="customProfileTextColors.json"
         )
@@ -2225,8 +2254,6 @@ class PNGRenderer:
         self.chara_rank_icon_path_map = self.coerce_string_map(
             self.resources.get("charaRankIconPathMap", self.resources.get("chara_rank_icon_path_map", {}))
         )
-        self.static_images = self.resolve_static_images_root()
-        self.unity_ui_sprite_dir = unity_ui_sprite_dir or DEFAULT_UNITY_UI_SPRITE_DIR
         self._unity_ui_sprite_path_cache: dict[str, Path | None] = {}
         self._unity_ui_sprite_cache: dict[str, Image.Image | None] = {}
         self._shape_alpha_cache: dict[tuple[Path, str], Image.Image] = {}
@@ -2239,7 +2266,9 @@ class PNGRenderer:
         # snapshot). The L2 keys add the signature plus the metadata-derived shading inputs.
         self._tmp_dynamic_glyph_cache: dict[tuple[str, str, str, float], TMPDynamicGlyphSDF | None] = {}
         self._tmp_vector_glyph_cache: dict[tuple[str, str, float], tuple[list[Any], Any] | None] = {}
-        self._font_signature_memo: dict[str, tuple[int, int]] = {}
+        # exists/is_file/stat/resolve/native-header verdicts for this request (asset_probe.py),
+        # shared with the Skia scene so one card stats each frame and icon once.
+        self.asset_probes = AssetProbeMemo()
         self._tmp_render_char_cache: dict[tuple[str, str, bool], str] = {}
         self.native_audit: list[dict[str, Any]] = []
         self.tmp_layout_audit: list[dict[str, Any]] = []
@@ -2407,16 +2436,16 @@ class PNGRenderer:
 
     def first_region_asset(self, rels: list[Path] | tuple[Path, ...]) -> Path | None:
         for path in self.region_asset_candidate_paths(rels):
-            if path.exists():
+            if self.asset_probes.exists(path):
                 return path
         return None
 
     def static_image_path(self, *parts: str) -> Path | None:
         path = self.static_images.joinpath(*parts)
-        return path if path.exists() else None
+        return path if self.asset_probes.exists(path) else None
 
     def open_rgba(self, path: Path | None) -> Image.Image | None:
-        if path is None or not path.exists():
+        if path is None or not self.asset_probes.exists(path):
             return None
         return self.open_checked_image(path, "RGBA")
 
@@ -2559,7 +2588,7 @@ class PNGRenderer:
         for root in roots:
             for rel in rels:
                 path = root / rel / file_name
-                if path.exists():
+                if self.asset_probes.exists(path):
                     return path
         return None
 
@@ -2567,7 +2596,7 @@ class PNGRenderer:
         if self.masterdata is None:
             return None
         for path in self.stamp_resource_candidates(resource):
-            if path.exists():
+            if self.asset_probes.exists(path):
                 return path
         return None
 
@@ -2591,7 +2620,7 @@ class PNGRenderer:
             file_name += ".png"
         if self.shape_sprite_dir is not None:
             candidate = self.shape_sprite_dir / file_name
-            if candidate.exists():
+            if self.asset_probes.exists(candidate):
                 return candidate
         return self.resource_path(resource, "shape")
 
@@ -2999,11 +3028,8 @@ class PNGRenderer:
         """Resolve the first configured GeneralContentView font without opening it."""
 
         for path in self.general_font_candidates():
-            try:
-                if path.is_file():
-                    return path
-            except OSError:
-                continue
+            if self.asset_probes.is_file(path):
+                return path
         return None
 
     def general_font(self, size: int, bold: bool = True) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
@@ -3187,12 +3213,9 @@ class PNGRenderer:
         if name in self._unity_ui_sprite_path_cache:
             return self._unity_ui_sprite_path_cache[name]
         for path in self.unity_ui_sprite_candidates(name):
-            try:
-                if path.is_file():
-                    self._unity_ui_sprite_path_cache[name] = path
-                    return path
-            except OSError:
-                continue
+            if self.asset_probes.is_file(path):
+                self._unity_ui_sprite_path_cache[name] = path
+                return path
         self._unity_ui_sprite_path_cache[name] = None
         return None
 
@@ -3218,8 +3241,8 @@ class PNGRenderer:
         decoded VARIANTS (full-RGBA convert, atlas alpha channel) and the global 6-tuple key has
         no variant dimension, while its copy-on-get is pure waste for shared immutable images.
         """
-        sig = optional_file_signature(path)
-        if sig == (-1, -1):  # deleted between exists() and stat: keep the historical error path
+        sig = self.asset_probes.signature(path)
+        if sig == (-1, -1):  # deleted before the first probe: keep the historical error path
             return self._decode_image_variant(path, variant)
         cache_key = (str(path), *sig, variant)
         image = SPRITE_ATLAS_CACHE.get(cache_key)
@@ -4124,7 +4147,7 @@ class PNGRenderer:
         attr = str(card.get("attr", "") or "")
         frame_path = self.static_images / "card" / self.card_frame_file(card)
         attr_path = self.static_images / "card" / f"attr_icon_{attr}.png"
-        if not attr_path.exists():
+        if not self.asset_probes.exists(attr_path):
             attr_path = self.static_images / "card" / f"attr_{attr}.png"
         star_path = (
             self.static_images
@@ -4720,7 +4743,7 @@ class PNGRenderer:
             region_path = self.first_region_asset([rel])
             if region_path is not None and (honor_type == "birthday" or rarity_rank >= start_rare):
                 return region_path
-        return static_path if static_path.exists() else None
+        return static_path if self.asset_probes.exists(static_path) else None
 
     def honor_frame_degree_level_path(
         self,
@@ -5040,7 +5063,9 @@ class PNGRenderer:
             "background": self.omikuji_background_asset_path(omikuji),
             "fortune": self.omikuji_asset_path(omikuji, "fortune"),
         }
-        missing_assets = [name for name, path in asset_paths.items() if path is None or not path.exists()]
+        missing_assets = [
+            name for name, path in asset_paths.items() if path is None or not self.asset_probes.exists(path)
+        ]
         if missing_assets:
             return self.native_unresolved(
                 "collection",
@@ -5596,7 +5621,7 @@ class PNGRenderer:
 
     def card_member_image_path(self, item: dict[str, Any]) -> Path | None:
         for path in self.card_member_image_candidates(item):
-            if path.exists():
+            if self.asset_probes.exists(path):
                 return path
         return None
 
@@ -8904,13 +8929,8 @@ class PNGRenderer:
         return self.shade_tmp_sdf_field(field, asset, style, outline_color, outline_dilate), bbox, pad
 
     def _font_signature(self, path: Path) -> tuple[int, int]:
-        """Per-instance memo of one os.stat per font file per request (L2 key component)."""
-        text = str(path)
-        sig = self._font_signature_memo.get(text)
-        if sig is None:
-            sig = optional_file_signature(path)
-            self._font_signature_memo[text] = sig
-        return sig
+        """One os.stat per font file per request (L2 key component), via the request memo."""
+        return self.asset_probes.signature(path)
 
     def _store_vector_glyph(self, key, l2_key, value):
         # Negative results stay L1-only (per-request, the pre-cache behavior): the None sites
@@ -8921,6 +8941,12 @@ class PNGRenderer:
         self._tmp_vector_glyph_cache[key] = value
         if value is not None:
             GLYPH_CONTOUR_CACHE.set(l2_key, value)
+            packed, np = value
+            GLYPH_DISK_STORE.set(
+                ("contours", TMP_GLYPH_GENERATOR_VERSION, *l2_key),
+                {"lengths": [len(arr) for arr in packed]},
+                np.concatenate(packed).tobytes(),
+            )
         return value
 
     def _store_dynamic_glyph(self, key, l2_key, value):
@@ -8928,6 +8954,53 @@ class PNGRenderer:
         self._tmp_dynamic_glyph_cache[key] = value
         if value is not None:
             GLYPH_SDF_CACHE.set(l2_key, value)
+            GLYPH_DISK_STORE.set(
+                ("sdf", TMP_GLYPH_GENERATOR_VERSION, *l2_key),
+                {
+                    "mode": value.field.mode,
+                    "size": list(value.field.size),
+                    "bbox": list(value.bbox),
+                    "pad": value.pad,
+                    "sample_size": value.sample_size,
+                },
+                value.field.tobytes(),
+            )
+        return value
+
+    @staticmethod
+    def _disk_vector_glyph(l2_key) -> tuple[tuple[Any, ...], Any] | None:
+        """L3 for contours: the arrays are read-only float32 views on the mapped file."""
+        stored = GLYPH_DISK_STORE.get(("contours", TMP_GLYPH_GENERATOR_VERSION, *l2_key))
+        if stored is None:
+            return None
+        import numpy as np
+
+        meta, payload = stored
+        points = np.frombuffer(payload, dtype=np.float32).reshape(-1, 2)
+        packed = []
+        start = 0
+        for length in meta["lengths"]:
+            packed.append(points[start : start + length])
+            start += length
+        value = (tuple(packed), np)
+        GLYPH_CONTOUR_CACHE.set(l2_key, value)
+        return value
+
+    @staticmethod
+    def _disk_dynamic_glyph(l2_key) -> TMPDynamicGlyphSDF | None:
+        """L3 for dynamic glyph SDFs: the field image is built on the mapped file."""
+        stored = GLYPH_DISK_STORE.get(("sdf", TMP_GLYPH_GENERATOR_VERSION, *l2_key))
+        if stored is None:
+            return None
+        meta, payload = stored
+        mode = meta["mode"]
+        value = TMPDynamicGlyphSDF(
+            field=Image.frombuffer(mode, tuple(meta["size"]), payload, "raw", mode, 0, 1),
+            bbox=tuple(int(edge) for edge in meta["bbox"]),
+            pad=int(meta["pad"]),
+            sample_size=float(meta["sample_size"]),
+        )
+        GLYPH_SDF_CACHE.set(l2_key, value)
         return value
 
     def tmp_vector_glyph_contours(
@@ -8941,6 +9014,8 @@ class PNGRenderer:
             return self._tmp_vector_glyph_cache[key]
         l2_key = (key[0], *self._font_signature(source_path), key[1], key[2])
         l2_cached = GLYPH_CONTOUR_CACHE.get(l2_key)
+        if l2_cached is MISSING:
+            l2_cached = self._disk_vector_glyph(l2_key) or MISSING
         if l2_cached is not MISSING:
             self._tmp_vector_glyph_cache[key] = l2_cached
             return l2_cached
@@ -9244,6 +9319,8 @@ class PNGRenderer:
             round(asset.atlas_padding, 4),
         )
         l2_cached = GLYPH_SDF_CACHE.get(l2_key)
+        if l2_cached is MISSING:
+            l2_cached = self._disk_dynamic_glyph(l2_key) or MISSING
         if l2_cached is not MISSING:
             self._tmp_dynamic_glyph_cache[key] = l2_cached
             return (l2_cached, asset) if l2_cached is not None else None
@@ -52,6 +52,7 @@ from src.sekai.base.utils import AssetImageRef, ImageSource, run_in_pool
 from src.sekai.honor.assets import resolve_honor_assets
 from src.sekai.honor.model import HonorRequest
 from src.sekai.honor.widget import build_honor_badge_canvas
+from src.sekai.profile.custom_profile.asset_probe import AssetProbeMemo
 from src.sekai.profile.custom_profile.card_prefab import (
     CardAlphaMaskOp,
     CardCoverArtOp,
@@ -98,8 +99,13 @@ from src.sekai.profile.custom_profile.renderer import (
 from src.sekai.profile.custom_profile.svg import unity_rotation_degrees
 from src.sekai.profile.custom_profile.tmp_text_prefab import build_simple_tmp_text_display_list
 from src.sekai.profile.model import CustomProfileCardRenderRequest
-from src.sekai.skia_renderer.canvas import load_native_renderer, payload_from_native, skia_plot_enabled
-from src.sekai.skia_renderer.ir_builder import IRBuilder, image_tint
+from src.sekai.skia_renderer.canvas import (
+    load_native_renderer,
+    payload_from_native,
+    resolve_png_encode_profile,
+    skia_plot_enabled,
+)
+from src.sekai.skia_renderer.ir_builder import IRBuilder, clip_path, image_tint, rounded_rect_path
 from src.sekai.skia_renderer.render_stats import (
     OUTCOME_DISABLED,
     OUTCOME_ERROR,
@@ -148,6 +154,10 @@ _NATIVE_GENERAL_PREFABS = frozenset(
         "StoryFavorite",
     }
 )
+# Asset clip radii whose aliased path clip is pinned pixel-exact against Pillow's binary
+# ``rounded_rectangle`` mask (tests/test_custom_profile_story_favorite_prefab.py). The path's
+# half-pixel bump is not exact at every radius, so any other radius declines to Pillow.
+_PILLOW_PARITY_CLIP_RADII = frozenset({10})
 _GENERAL_FONT_IR_NAME = "custom_profile_general"
 _NATIVE_CARD_GENERAL_PREFABS = frozenset({"LeaderCard", "Deck"})
 
@@ -164,6 +174,13 @@ class CustomProfileSceneReport:
     unresolved_elements: int = 0
     mem_images: int = 0
     mem_bytes: int = 0
+    # Renderer checkout before the first element (drawer.checkout_custom_profile_renderer).
+    setup_us: int = 0
+    session_reused: int = 0
+    # Request-scoped filesystem/native-header probes issued vs answered from the memo
+    # (asset_probe.AssetProbeMemo shared by the renderer and the scene).
+    asset_probes: int = 0
+    asset_probes_deduplicated: int = 0
     issues: list[dict[str, int | str]] = field(default_factory=list)
 
     @property
@@ -224,6 +241,10 @@ class CustomProfileSceneReport:
             "unresolved_elements": self.unresolved_elements,
             "mem_images": self.mem_images,
             "mem_bytes": self.mem_bytes,
+            "setup_us": self.setup_us,
+            "session_reused": self.session_reused,
+            "asset_probes": self.asset_probes,
+            "asset_probes_deduplicated": self.asset_probes_deduplicated,
             "issues_by_kind": issues_by_kind,
         }
 
@@ -236,6 +257,10 @@ class CustomProfileSceneReport:
             "custom_profile_noop_elements": self.noop_elements,
             "custom_profile_mem_images": self.mem_images,
             "custom_profile_mem_bytes": self.mem_bytes,
+            "custom_profile_setup_us": self.setup_us,
+            "custom_profile_session_reused": self.session_reused,
+            "custom_profile_asset_probes": self.asset_probes,
+            "custom_profile_asset_probes_deduplicated": self.asset_probes_deduplicated,
         }
 
 
@@ -255,7 +280,9 @@ def _record(outcome: str, payload: EncodedImagePayload | None = None) -> None:
         record_native_metrics(payload.native_metrics)
 
 
-def _new_builder(width: int, height: int, *, general_font_path: Path | None = None) -> IRBuilder:
+def _new_builder(
+    width: int, height: int, *, general_font_path: Path | None = None, png_profile: str = "fastest"
+) -> IRBuilder:
     # export_format is HARDCODED png: the route pins PNG (the card is RGBA with real
     # transparency), regardless of the global EXPORT_IMAGE_FORMAT.
     return IRBuilder(
@@ -268,6 +295,7 @@ def _new_builder(width: int, height: int, *, general_font_path: Path | None = No
         extra_fonts={_GENERAL_FONT_IR_NAME: str(general_font_path)} if general_font_path is not None else None,
         export_format="png",
         jpg_quality=JPG_QUALITY,
+        png_profile=png_profile,
         max_node_pixels=CUSTOM_PROFILE_MAX_LAYER_PIXELS,
         max_scene_bytes=CUSTOM_PROFILE_MAX_SCENE_BYTES,
     )
@@ -276,9 +304,17 @@ def _new_builder(width: int, height: int, *, general_font_path: Path | None = No
 class _SceneAssembler:
     """Accumulates the z-ordered element scene: mem rasters + Transform placements."""
 
-    def __init__(self, builder: IRBuilder, canvas_size: tuple[int, int], max_mem_bytes: int) -> None:
+    def __init__(
+        self,
+        builder: IRBuilder,
+        canvas_size: tuple[int, int],
+        max_mem_bytes: int,
+        probes: AssetProbeMemo | None = None,
+    ) -> None:
         self.builder = builder
         self.canvas_size = canvas_size
+        # The renderer's request memo when there is one, so both sides share one probe report.
+        self.probes = probes if probes is not None else AssetProbeMemo()
         self.max_mem_bytes = max(1, int(max_mem_bytes))
         self.mem_bytes = 0
         # RGBA raw 3-tuples plus A8 raw-buffer 6-tuples (capability 9) share the registry.
@@ -332,10 +368,12 @@ class _SceneAssembler:
                     "shift": [u.shift_x, u.shift_y],
                 }
             if isinstance(quad, DirectSdfFontQuad):
-                asset_path = _relative_asset_path(quad.font_path)
+                asset_path = _relative_asset_path(quad.font_path, self.probes)
                 if asset_path is None:
                     raise ValueError("custom profile TMP source font is outside the configured asset root")
-                resolved_path = (ASSETS_BASE_DIR / asset_path).resolve(strict=True)
+                resolved_path = self.probes.resolve(ASSETS_BASE_DIR / asset_path, strict=True)
+                if resolved_path is None:
+                    raise FileNotFoundError(f"custom profile TMP source font disappeared: {asset_path}")
                 font_name = f"custom_profile_sdf_{hashlib.sha256(str(resolved_path).encode()).hexdigest()[:16]}"
                 self.builder.register_extra_font(font_name, resolved_path)
                 self.builder.sdf_font_quad(
@@ -358,7 +396,7 @@ class _SceneAssembler:
                 )
                 continue
             if isinstance(quad, DirectSdfAtlasQuad):
-                asset_path = _relative_asset_path(quad.atlas_path)
+                asset_path = _relative_asset_path(quad.atlas_path, self.probes)
                 if asset_path is None:
                     raise ValueError("custom profile TMP atlas is outside the configured asset root")
                 self.builder.sdf_atlas_quad(
@@ -502,11 +540,8 @@ def _emit_native_simple_tmp_text(renderer: PNGRenderer, content: Any, scene: _Sc
     display_list = build_simple_tmp_text_display_list(renderer, content.item, content.object_data)
     if display_list is None:
         return False
-    try:
-        font_path = display_list.font.path.resolve(strict=True)
-    except OSError:
-        return False
-    if not font_path.is_file():
+    font_path = scene.probes.resolve(display_list.font.path, strict=True)
+    if font_path is None or not scene.probes.is_file(font_path):
         return False
     font_name = f"custom_profile_tmp_{hashlib.sha256(str(font_path).encode()).hexdigest()[:16]}"
 
@@ -530,20 +565,24 @@ def _emit_native_simple_tmp_text(renderer: PNGRenderer, content: Any, scene: _Sc
     return True
 
 
-def _relative_asset_path(path) -> str | None:
+def _relative_asset_path(path, probes: AssetProbeMemo | None = None) -> str | None:
     try:
+        if probes is not None:
+            return probes.relative_path(path, ASSETS_BASE_DIR)
         return path.resolve().relative_to(ASSETS_BASE_DIR.resolve()).as_posix()
     except (AttributeError, ValueError):
         return None
 
 
-def _native_asset_info(asset_path: str) -> dict[str, Any] | None:
+def _native_asset_info(asset_path: str, probes: AssetProbeMemo | None = None) -> dict[str, Any] | None:
     """Rust-side asset metadata, or ``None`` for an older wheel.
 
     A wheel claiming the capability but returning a malformed result is broken and raises; only
     a genuinely absent API takes the explicit Pillow-header compatibility path.
     """
 
+    if probes is not None:
+        return probes.native_info(asset_path, _native_asset_info)
     native = load_native_renderer()
     info_fn = getattr(native, "asset_image_info", None)
     capability = int(getattr(native, "ASSET_INFO_CAPABILITY", 0) or 0)
@@ -562,17 +601,20 @@ def _native_asset_info(asset_path: str) -> dict[str, Any] | None:
     return info
 
 
-def _header_only_asset_ref(path, asset_path: str) -> AssetImageRef:
+def _header_only_asset_ref(path, asset_path: str, probes: AssetProbeMemo | None = None) -> AssetImageRef:
     """Build the image source the shared honor tree needs without decoding its pixels.
 
     Current wheels obtain dimensions from Rust. An older wheel explicitly falls back to a
     Pillow header probe and records that touch, so it cannot be mislabeled as native-pure.
     """
 
-    resolved = path.resolve(strict=True)
-    if not resolved.is_file():
+    probes = probes if probes is not None else AssetProbeMemo()
+    resolved = probes.resolve(path, strict=True)
+    if resolved is None:
+        raise FileNotFoundError(f"custom profile honor asset does not exist: {path}")
+    if not probes.is_file(resolved):
         raise ValueError(f"custom profile honor asset is not a regular file: {resolved}")
-    native_info = _native_asset_info(asset_path)
+    native_info = _native_asset_info(asset_path, probes)
     if native_info is not None:
         return AssetImageRef(
             path=resolved,
@@ -699,7 +741,7 @@ class _NativeGeneralTextMetrics:
         )
 
 
-def _existing_native_asset(path: Any) -> tuple[str, str | None]:
+def _existing_native_asset(path: Any, probes: AssetProbeMemo | None = None) -> tuple[str, str | None]:
     """Classify an optional filesystem resource before an IR scene is mutated.
 
     ``outside`` is distinct from ``missing``: an explicitly supplied path that escapes the
@@ -708,15 +750,13 @@ def _existing_native_asset(path: Any) -> tuple[str, str | None]:
 
     if path is None:
         return "missing", None
+    probes = probes if probes is not None else AssetProbeMemo()
     candidate = Path(path)
-    asset_path = _relative_asset_path(candidate)
+    asset_path = _relative_asset_path(candidate, probes)
     if asset_path is None:
         return "outside", None
-    try:
-        resolved = candidate.resolve(strict=True)
-    except OSError:
-        return "missing", None
-    if not resolved.is_file():
+    resolved = probes.resolve(candidate, strict=True)
+    if resolved is None or not probes.is_file(resolved):
         return "missing", None
     return "ready", asset_path
 
@@ -731,6 +771,7 @@ class _PreparedCardDisplayList:
 def _prepare_native_card_display_list(
     display_list: CardDisplayList,
     metrics: _NativeGeneralTextMetrics | None,
+    probes: AssetProbeMemo | None = None,
 ) -> _PreparedCardDisplayList | None:
     """Resolve every card dependency without opening or decoding an image in Pillow."""
 
@@ -744,7 +785,7 @@ def _prepare_native_card_display_list(
             # opt-in API can be truthfully classified native.
             return None
         if isinstance(op, CardCoverArtOp):
-            status, asset_path = _existing_native_asset(op.path)
+            status, asset_path = _existing_native_asset(op.path, probes)
             if status != "ready" or asset_path is None:
                 return None
             if op.cover_align != (0.5, 0.5):
@@ -753,11 +794,11 @@ def _prepare_native_card_display_list(
             asset_paths[op_key] = asset_path
             continue
         if isinstance(op, CardSpriteOp):
-            status, asset_path = _existing_native_asset(op.resource.path)
+            status, asset_path = _existing_native_asset(op.resource.path, probes)
             if status == "outside":
                 return None
             if status != "ready":
-                fallback_status, asset_path = _existing_native_asset(op.resource.fallback_path)
+                fallback_status, asset_path = _existing_native_asset(op.resource.fallback_path, probes)
                 if fallback_status == "outside":
                     return None
                 status = fallback_status
@@ -889,7 +930,7 @@ def _emit_native_card_general(renderer: PNGRenderer, content: Any, scene: _Scene
         display_list = renderer.build_profile_leader_card_display_list(card_id)
         if display_list is None:
             return None
-        prepared = _prepare_native_card_display_list(display_list, metrics)
+        prepared = _prepare_native_card_display_list(display_list, metrics, scene.probes)
         if prepared is None:
             return None
         prepared_cards.append((prepared, (0, 0)))
@@ -910,7 +951,7 @@ def _emit_native_card_general(renderer: PNGRenderer, content: Any, scene: _Scene
         start_x = max(0.0, (GENERAL_NATIVE_SIZES["Deck"][0] - total_w) / 2.0)
         y = GENERAL_NATIVE_SIZES["Deck"][1] - card_h
         for index, display_list in enumerate(card_lists):
-            prepared = _prepare_native_card_display_list(display_list, metrics)
+            prepared = _prepare_native_card_display_list(display_list, metrics, scene.probes)
             if prepared is None:
                 return None
             prepared_cards.append((prepared, (round(start_x + index * (card_w + gap)), round(y))))
@@ -969,7 +1010,7 @@ def _emit_native_card_member(renderer: PNGRenderer, content: Any, scene: _SceneA
     if display_list is None or display_list.render_size is not None:
         return False
     metrics = _NativeGeneralTextMetrics.create(font_path_for())
-    prepared = _prepare_native_card_display_list(display_list, metrics)
+    prepared = _prepare_native_card_display_list(display_list, metrics, scene.probes)
     if prepared is None:
         return False
 
@@ -1074,7 +1115,7 @@ def _emit_native_general(renderer: PNGRenderer, content: Any, scene: _SceneAssem
         if isinstance(op, GeneralSpriteOp):
             path = renderer.unity_ui_sprite_path(op.name)
             if path is not None:
-                asset_path = _relative_asset_path(path)
+                asset_path = _relative_asset_path(path, scene.probes)
                 if asset_path is None:
                     return None
                 resource_paths[op_key] = asset_path
@@ -1087,12 +1128,9 @@ def _emit_native_general(renderer: PNGRenderer, content: Any, scene: _SceneAssem
                 # IR Image cover is deliberately centered. A future non-centered display-list
                 # operation must decline instead of silently changing its crop.
                 return None
-            if op.clip_radius is not None:
-                # Pillow builds a discrete L mask with ImageDraw.rounded_rectangle and multiplies
-                # it into the resized alpha. Skia's anti-aliased rrect clip differs at the edge;
-                # keep banner-backed StoryFavorite hybrid until an exact mask primitive exists.
+            if op.clip_radius is not None and op.clip_radius not in _PILLOW_PARITY_CLIP_RADII:
                 return None
-            asset_status, asset_path = _existing_native_asset(op.path)
+            asset_status, asset_path = _existing_native_asset(op.path, scene.probes)
             if asset_status == "ready":
                 resource_paths[op_key] = asset_path
                 continue
@@ -1174,13 +1212,17 @@ def _emit_native_general(renderer: PNGRenderer, content: Any, scene: _SceneAssem
                 pos = (round(left), round(top))
                 size = (max(1, round(right - left)), max(1, round(bottom - top)))
                 sampling = "pillow_lanczos" if op.sampling == "lanczos" else sampling_map[op.sampling]
-                scene.builder.image(
-                    asset_path,
-                    pos,
-                    size,
-                    fit=op.fit,
-                    sampling=sampling,
-                )
+                if op.clip_radius is None:
+                    scene.builder.image(asset_path, pos, size, fit=op.fit, sampling=sampling)
+                    continue
+                # Pillow multiplies a binary ImageDraw.rounded_rectangle mask into the resized
+                # alpha; an aliased path clip keeps the same whole pixels instead of an AA rrect.
+                with scene.builder.group(
+                    offset=pos,
+                    size=size,
+                    clip=clip_path(rounded_rect_path(size, op.clip_radius), antialias=False),
+                ):
+                    scene.builder.image(asset_path, (0, 0), size, fit=op.fit, sampling=sampling)
                 continue
             if isinstance(op, GeneralViewportOp):
                 with scene.builder.group(
@@ -1221,6 +1263,7 @@ def _emit_native_general(renderer: PNGRenderer, content: Any, scene: _SceneAssem
 def _native_honor_sources(
     renderer: PNGRenderer,
     request: HonorRequest,
+    probes: AssetProbeMemo | None = None,
 ) -> tuple[str, dict[str, ImageSource | None] | None]:
     """Resolve one honor branch to lazy, root-confined image refs.
 
@@ -1230,10 +1273,10 @@ def _native_honor_sources(
     """
 
     def source_factory(path):
-        asset_path = _relative_asset_path(path)
+        asset_path = _relative_asset_path(path, probes)
         if asset_path is None:
             raise ValueError(f"honor asset is outside ASSETS_BASE_DIR: {path}")
-        return _header_only_asset_ref(path, asset_path)
+        return _header_only_asset_ref(path, asset_path, probes)
 
     resolution = resolve_honor_assets(
         request,
@@ -1318,7 +1361,7 @@ def _emit_native_honor(renderer: PNGRenderer, content: Any, scene: _SceneAssembl
         else:
             return False
 
-        source_status, images = _native_honor_sources(renderer, request)
+        source_status, images = _native_honor_sources(renderer, request, scene.probes)
         if source_status == "unrenderable":
             continue
         if source_status != "ready" or images is None:
@@ -1361,6 +1404,7 @@ def _native_profile_honor_badge(
     row: dict[str, Any],
     *,
     full_size: bool,
+    probes: AssetProbeMemo | None = None,
 ) -> tuple[str, NativeSubtree | None]:
     """Resolve one HonorDeck slot with the exact Pillow request-key precedence.
 
@@ -1392,7 +1436,7 @@ def _native_profile_honor_badge(
                 continue
             seen_payloads.add(id(payload))
             request = HonorRequest.model_validate(payload)
-            source_status, images = _native_honor_sources(renderer, request)
+            source_status, images = _native_honor_sources(renderer, request, probes)
             if source_status == "unrenderable":
                 continue
             if source_status != "ready" or images is None:
@@ -1434,6 +1478,7 @@ def _emit_native_honor_deck(renderer: PNGRenderer, content: Any, scene: _SceneAs
             renderer,
             dict(slot.profile_row),
             full_size=slot.full_size,
+            probes=scene.probes,
         )
         if status != "ready":
             return None
@@ -1456,7 +1501,7 @@ def _emit_native_honor_deck(renderer: PNGRenderer, content: Any, scene: _SceneAs
 
     assert plan.panel is not None
     background_path = renderer.unity_ui_sprite_path(plan.panel.sprite_name)
-    background_asset = _relative_asset_path(background_path) if background_path is not None else None
+    background_asset = _relative_asset_path(background_path, scene.probes) if background_path is not None else None
     if background_path is not None and background_asset is None:
         return None
     scale = content.object_data.get("scale") or {}
@@ -1521,7 +1566,7 @@ def _emit_native_asset_image(renderer: PNGRenderer, content: Any, scene: _SceneA
             path = renderer.stamp_resource_path(renderer.image_resource_for("stamp", content.item))
     else:
         return False
-    if path is None or (asset_path := _relative_asset_path(path)) is None:
+    if path is None or (asset_path := _relative_asset_path(path, scene.probes)) is None:
         return False
 
     scale = content.object_data.get("scale") or {}
@@ -1558,7 +1603,7 @@ def _emit_native_shape(renderer: PNGRenderer, content: Any, scene: _SceneAssembl
     resource_file = str(resource.get("fileName", "")).strip().lower()
     if resource_file == "triangle" and renderer.triangle_mode != "asset":
         return False
-    asset_path = _relative_asset_path(path)
+    asset_path = _relative_asset_path(path, scene.probes)
     if asset_path is None:
         return False
 
@@ -1607,15 +1652,19 @@ def _emit_native_shape(renderer: PNGRenderer, content: Any, scene: _SceneAssembl
 def _build_scene(
     renderer: PNGRenderer,
     card: dict[str, Any],
+    *,
+    png_profile: str = "fastest",
 ) -> tuple[bytes, dict[str, tuple], CustomProfileSceneReport]:
     canvas_size = (int(PROFILE_RENDER_VIEW_W), int(PROFILE_RENDER_VIEW_H))
     general_font_path_for = getattr(renderer, "general_font_path", None)
     general_font_path = general_font_path_for() if callable(general_font_path_for) else None
-    builder = _new_builder(*canvas_size, general_font_path=general_font_path)
+    builder = _new_builder(*canvas_size, general_font_path=general_font_path, png_profile=png_profile)
     # render_card starts from an OPAQUE WHITE base (Image.new(..., (255, 255, 255, 255))), not a
     # transparent canvas — the story background does not always cover the outermost pixels.
     builder.rect((0, 0), canvas_size, fill=(255, 255, 255, 255))
-    scene = _SceneAssembler(builder, canvas_size, CUSTOM_PROFILE_MAX_SCENE_BYTES)
+    probes = getattr(renderer, "asset_probes", None)
+    probes_before = (probes.probes, probes.deduplicated) if probes is not None else (0, 0)
+    scene = _SceneAssembler(builder, canvas_size, CUSTOM_PROFILE_MAX_SCENE_BYTES, probes)
     card_ref = renderer.native_card_ref(card)
     contents = renderer.build_native_contents(card)
     report = CustomProfileSceneReport(elements_total=len(contents))
@@ -1706,6 +1755,9 @@ def _build_scene(
     scene.flush_direct_layer()
     report.mem_images = len(scene.mem_images)
     report.mem_bytes = scene.mem_bytes
+    # Net of the font probe general_font_path made above, which the memo counted too.
+    report.asset_probes = scene.probes.probes - probes_before[0]
+    report.asset_probes_deduplicated = scene.probes.deduplicated - probes_before[1]
 
     ir_json = json.dumps(builder.build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
     return ir_json, scene.mem_images, report
@@ -1730,48 +1782,17 @@ async def try_render_custom_profile_card_payload(
     profile_context = dict(request.profile_context)
     resources = dict(request.resources)
     region = request.region
+    png_profile = resolve_png_encode_profile(CUSTOM_PROFILE_ENDPOINT)
 
     def _render():
-        # Same construction as drawer._render_custom_profile_card_sync (the Pillow service path);
-        # kept in one pool task so the event loop never sees the rasterization.
-        from src.sekai.profile.custom_profile import drawer as _drawer
-        from src.settings import (
-            CUSTOM_PROFILE_ASSETS_DIR,
-            CUSTOM_PROFILE_FONTS_DIR,
-            CUSTOM_PROFILE_MAX_LAYER_PIXELS,
-            CUSTOM_PROFILE_PARALLEL_WORKERS,
-            CUSTOM_PROFILE_SHAPE_SPRITE_DIR,
-            CUSTOM_PROFILE_TMP_FONT_METADATA,
-            CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR,
-        )
-
-        renderer = PNGRenderer(
-            masterdata=None,
-            assets=_drawer._require_region_path("custom_profile_assets_dir", CUSTOM_PROFILE_ASSETS_DIR, region),
-            fonts=_drawer._require_region_path("custom_profile_fonts_dir", CUSTOM_PROFILE_FONTS_DIR, region),
-            resources=resources,
-            tmp_font_metadata=_drawer._optional_region_file(
-                "custom_profile_tmp_font_metadata", CUSTOM_PROFILE_TMP_FONT_METADATA, region
-            ),
-            shape_sprite_dir=_drawer._require_region_path(
-                "custom_profile_shape_sprite_dir", CUSTOM_PROFILE_SHAPE_SPRITE_DIR, region
-            ),
-            profile_context=profile_context,
-            parallel_workers=max(1, int(CUSTOM_PROFILE_PARALLEL_WORKERS or 1)),
-            parallel_stage="transform",
-            clip_canvas_transform=True,
-            canvas_w=int(PROFILE_RENDER_VIEW_W),
-            canvas_h=int(PROFILE_RENDER_VIEW_H),
-            origin_x=PROFILE_RENDER_VIEW_W / 2.0,
-            origin_y=PROFILE_RENDER_VIEW_H / 2.0,
-            unity_ui_sprite_dir=_drawer._require_region_path(
-                "custom_profile_unity_ui_sprite_dir", CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR, region
-            ),
-            region=region,
-            max_layer_pixels=CUSTOM_PROFILE_MAX_LAYER_PIXELS,
-            max_scene_bytes=CUSTOM_PROFILE_MAX_SCENE_BYTES,
-        )
-        ir_json, mem_images, report = _build_scene(renderer, card)
+        # Same pooled renderer session as drawer._render_custom_profile_card_sync (the Pillow
+        # service path); kept in one pool task so the event loop never sees the rasterization.
+        from src.sekai.profile.custom_profile.drawer import checkout_custom_profile_renderer
+
+        with checkout_custom_profile_renderer(region, resources, profile_context) as (renderer, setup):
+            ir_json, mem_images, report = _build_scene(renderer, card, png_profile=png_profile)
+        report.setup_us = int(setup.seconds * 1_000_000)
+        report.session_reused = int(setup.reused)
         if not report.complete:
             return None, report
         return native.render_scene(ir_json, mem_images), report
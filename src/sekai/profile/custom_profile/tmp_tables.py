@@ -0,0 +1,282 @@
+"""Compiled TMP font tables: a parsed metadata.json and its tables as one mmap-able file.
+
+``TMPFontLibrary._load_assets`` reads TextMeshPro metadata plus one character table and one glyph
+table per font asset with ``json.loads`` and builds a ``TMPGlyphMetrics`` per glyph; for the CN
+asset set that is several seconds of parsing, paid by the first custom-profile requests after
+every deploy or asset update. A pack holds the same result in a form that loads in milliseconds:
+
+    magic (8 bytes) | manifest length (u32) | manifest JSON | pad to 8 | glyph records
+
+- the manifest carries every scalar ``TMPFontAsset`` field, the glyph slice of each asset and the
+  ``(path, signature)`` list of every file the parse read or probed (the same list the in-memory
+  table cache revalidates), so one manifest is the whole validity check;
+- the glyph records are a packed little-endian array (``GLYPH_DTYPE``) sorted by codepoint and
+  mapped read-only; ``CompiledGlyphTable`` is a lazy ``Mapping[int, TMPGlyphMetrics]`` over its
+  slice, materializing (and memoizing) a glyph the first time it is looked up.
+
+A pack is looked up next to the metadata (``metadata.tmptables``, written by the offline
+compiler, ``python -m src.sekai.profile.custom_profile.tmp_tables <metadata.json>``) and then in
+``TMP_TABLE_PACK_DIR``, where a JSON parse auto-compiles one (best effort, atomic replace). A pack
+whose manifest signatures no longer match the files on disk is ignored and recompiled.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator, Mapping
+import dataclasses
+import hashlib
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+import tempfile
+from typing import Any
+
+import numpy as np
+
+from src.sekai.profile.custom_profile.cache import FileSignature, note_tmp_table_pack, optional_file_signature
+from src.sekai.profile.custom_profile.renderer import TMPFontAsset, TMPFontLibrary, TMPGlyphMetrics
+
+logger = logging.getLogger(__name__)
+
+PACK_MAGIC = b"HTMPTBL1"
+PACK_SUFFIX = ".tmptables"
+TMP_TABLE_PACK_DIR = Path("data/utils/tmp_font_tables")
+
+GLYPH_DTYPE = np.dtype(
+    [
+        ("unicode", "<u4"),
+        ("rect_x", "<i4"),
+        ("rect_y", "<i4"),
+        ("rect_w", "<i4"),
+        ("rect_h", "<i4"),
+        ("atlas_index", "<i4"),
+        ("width", "<f8"),
+        ("height", "<f8"),
+        ("bearing_x", "<f8"),
+        ("bearing_y", "<f8"),
+        ("advance", "<f8"),
+        ("glyph_scale", "<f8"),
+    ]
+)
+_INT_FIELDS = ("rect_x", "rect_y", "rect_w", "rect_h", "atlas_index")
+_FLOAT_FIELDS = ("width", "height", "bearing_x", "bearing_y", "advance", "glyph_scale")
+_HEADER = struct.Struct("<8sI")
+
+
+class CompiledGlyphTable(Mapping[int, TMPGlyphMetrics]):
+    """Read-only ``codepoint -> TMPGlyphMetrics`` view over a slice of the mapped glyph records."""
+
+    __slots__ = ("_codes", "_memo", "_records")
+
+    def __init__(self, records: np.ndarray) -> None:
+        self._records = records
+        self._codes = records["unicode"]
+        self._memo: dict[int, TMPGlyphMetrics] = {}
+
+    def get(self, code: int, default: Any = None) -> Any:
+        metrics = self._memo.get(code)
+        if metrics is not None:
+            return metrics
+        if not 0 <= code <= 0xFFFFFFFF:
+            return default
+        index = int(np.searchsorted(self._codes, code))
+        if index >= len(self._codes) or int(self._codes[index]) != code:
+            return default
+        row = self._records[index]
+        metrics = TMPGlyphMetrics(
+            **{name: float(row[name]) for name in _FLOAT_FIELDS},
+            **{name: int(row[name]) for name in _INT_FIELDS},
+        )
+        self._memo[code] = metrics  # same value from every thread: a racing write is harmless
+        return metrics
+
+    def __getitem__(self, code: int) -> TMPGlyphMetrics:
+        metrics = self.get(code)
+        if metrics is None:
+            raise KeyError(code)
+        return metrics
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, int) and self.get(code) is not None
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._codes.tolist())
+
+
+def _pack_name(metadata_path: Path) -> str:
+    return hashlib.sha256(str(metadata_path).encode("utf-8")).hexdigest()[:24] + PACK_SUFFIX
+
+
+def tmp_table_pack_candidates(metadata_path: Path) -> list[Path]:
+    """Offline-compiled sibling first, then the auto-compiled cache entry."""
+    return [metadata_path.with_suffix(PACK_SUFFIX), TMP_TABLE_PACK_DIR / _pack_name(metadata_path)]
+
+
+def _glyph_records(glyphs: Mapping[int, TMPGlyphMetrics]) -> np.ndarray:
+    codes = sorted(glyphs)
+    records = np.zeros(len(codes), dtype=GLYPH_DTYPE)
+    records["unicode"] = codes
+    for name in (*_INT_FIELDS, *_FLOAT_FIELDS):
+        records[name] = [getattr(glyphs[code], name) for code in codes]
+    return records
+
+
+def _asset_manifest(asset: TMPFontAsset, glyph_start: int, glyph_count: int) -> dict[str, Any]:
+    row: dict[str, Any] = {}
+    for field in dataclasses.fields(TMPFontAsset):
+        value = getattr(asset, field.name)
+        if field.name == "glyphs":
+            continue
+        if field.name == "source_font_path":
+            value = None if value is None else str(value)
+        elif field.name == "atlas_paths":
+            value = [str(path) for path in value]
+        elif field.name == "fallback_names":
+            value = list(value)
+        row[field.name] = value
+    row["glyph_start"] = glyph_start
+    row["glyph_count"] = glyph_count
+    return row
+
+
+def write_tmp_table_pack(
+    target: Path,
+    metadata_path: Path,
+    assets: dict[str, list[TMPFontAsset]],
+    signatures: list[tuple[str, FileSignature]],
+) -> None:
+    """Write a pack for ``assets`` atomically (temp file + replace in the target directory)."""
+    manifest_assets: list[dict[str, Any]] = []
+    chunks: list[np.ndarray] = []
+    start = 0
+    for rows in assets.values():
+        for asset in rows:
+            records = _glyph_records(asset.glyphs)
+            manifest_assets.append(_asset_manifest(asset, start, len(records)))
+            chunks.append(records)
+            start += len(records)
+    manifest = {
+        "metadata_path": str(metadata_path),
+        "signatures": [[path, list(signature)] for path, signature in signatures],
+        "assets": manifest_assets,
+    }
+    manifest_bytes = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(PACK_MAGIC, len(manifest_bytes)) + manifest_bytes
+    header += b"\0" * (-len(header) % 8)
+    glyph_bytes = np.concatenate(chunks).tobytes() if chunks else b""
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", suffix=PACK_SUFFIX, dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(header)
+            fh.write(glyph_bytes)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_tmp_table_pack(
+    pack_path: Path, metadata_path: Path
+) -> tuple[dict[str, list[TMPFontAsset]], list[tuple[str, FileSignature]]] | None:
+    """The pack's tables and signature list, or ``None`` when it is absent, foreign, corrupt or stale."""
+    try:
+        with open(pack_path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, manifest_len = _HEADER.unpack_from(mapped, 0)
+        if magic != PACK_MAGIC:
+            return None
+        manifest = json.loads(mapped[_HEADER.size : _HEADER.size + manifest_len])
+        if manifest.get("metadata_path") != str(metadata_path):
+            return None
+        signatures = [(str(path), tuple(signature)) for path, signature in manifest["signatures"]]
+        if any(optional_file_signature(path) != signature for path, signature in signatures):
+            return None
+        offset = _HEADER.size + manifest_len
+        offset += -offset % 8
+        total = sum(int(row["glyph_count"]) for row in manifest["assets"])
+        records = np.frombuffer(mapped, dtype=GLYPH_DTYPE, count=total, offset=offset)
+        assets: dict[str, list[TMPFontAsset]] = {}
+        for row in manifest["assets"]:
+            start, count = int(row.pop("glyph_start")), int(row.pop("glyph_count"))
+            source_font_path = row.pop("source_font_path")
+            atlas_paths = [Path(path) for path in row.pop("atlas_paths")]
+            asset = TMPFontAsset(
+                **row,
+                source_font_path=None if source_font_path is None else Path(source_font_path),
+                atlas_paths=atlas_paths,
+                glyphs=CompiledGlyphTable(records[start : start + count]),
+            )
+            assets.setdefault(asset.name, []).append(asset)
+        return assets, signatures
+    except (KeyError, TypeError, ValueError, struct.error):
+        logger.warning("ignoring unreadable TMP table pack %s", pack_path, exc_info=True)
+        return None
+
+
+def load_tmp_font_assets(metadata_path: Path, record: Callable[[Path | str], None]) -> dict[str, list[TMPFontAsset]]:
+    """``TMPFontLibrary._load_assets`` through the pack: load a valid pack, else parse and compile.
+
+    ``record`` receives every path the tables depend on either way, so the in-memory table cache
+    revalidates the same list whichever route produced the value."""
+    for pack_path in tmp_table_pack_candidates(metadata_path):
+        packed = read_tmp_table_pack(pack_path, metadata_path)
+        if packed is not None:
+            assets, signatures = packed
+            for path, _signature in signatures:
+                record(path)
+            note_tmp_table_pack("loads")
+            return assets
+
+    signatures: list[tuple[str, FileSignature]] = []
+
+    def tracking(path: Path | str) -> None:
+        signatures.append((str(path), optional_file_signature(path)))
+        record(path)
+
+    assets = TMPFontLibrary._load_assets(metadata_path, record=tracking)
+    try:
+        write_tmp_table_pack(tmp_table_pack_candidates(metadata_path)[-1], metadata_path, assets, signatures)
+        note_tmp_table_pack("writes")
+    except OSError:
+        note_tmp_table_pack("write_errors")
+        logger.warning("could not write TMP table pack for %s", metadata_path, exc_info=True)
+    return assets
+
+
+def compile_tmp_font_tables(metadata_path: Path, target: Path | None = None) -> Path:
+    """Offline compiler: parse ``metadata_path`` and write its pack (default: next to it)."""
+    metadata_path = metadata_path.resolve()
+    signatures: list[tuple[str, FileSignature]] = []
+
+    def tracking(path: Path | str) -> None:
+        signatures.append((str(path), optional_file_signature(path)))
+
+    assets = TMPFontLibrary._load_assets(metadata_path, record=tracking)
+    target = target or tmp_table_pack_candidates(metadata_path)[0]
+    write_tmp_table_pack(target, metadata_path, assets, signatures)
+    return target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile TMP font metadata into a binary table pack.")
+    parser.add_argument("metadata", nargs="+", type=Path, help="TMP metadata.json file(s)")
+    args = parser.parse_args()
+    for metadata_path in args.metadata:
+        target = compile_tmp_font_tables(metadata_path)
+        print(f"{metadata_path} -> {target} ({target.stat().st_size} bytes)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
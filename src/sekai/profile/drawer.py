@@ -1,7 +1,7 @@
 import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
 import logging
-import time
 
 from PIL import Image
 
@@ -45,17 +45,12 @@ from src.sekai.base.plot import (
     Widget,
     colored_text_box,
 )
-from src.sekai.base.timezone import datetime_from_millis
 from src.sekai.base.utils import (
     AssetImageRef,
+    AssetPrefetchPlan,
     ImageSource,
-    build_rendered_image_cache_key,
     get_asset_image_ref,
-    get_composed_image_cached,
-    get_composed_image_disk_cached,
     get_str_display_length,
-    put_composed_image_cache,
-    put_composed_image_disk_cache,
     truncate,
 )
 from src.sekai.honor.drawer import (
@@ -170,6 +165,7 @@ from .model import (
 @dataclass(slots=True)
 class _ProfileLayoutContext:
     request: ProfileRequest
+    assets: Mapping[str | None, ImageSource | None]
     profile: BasicProfile
     avatar_img: ImageSource
     ui_bg: RoundRectBg
@@ -195,23 +191,29 @@ class CardFullThumbnailLayers:
     attr: AssetImageRef | Image.Image | None = None
 
 
-async def get_card_full_thumbnail_layers(rqd: CardFullThumbnailRequest) -> CardFullThumbnailLayers:
-    rare_img_path = rqd.birthday_icon_path if rqd.rare == "rarity_birthday" else rqd.rare_img_path
-    keys = ["base", "rare"]
-    tasks = [
-        get_asset_image_ref(ASSETS_BASE_DIR, rqd.card_thumbnail_path),
-        get_asset_image_ref(ASSETS_BASE_DIR, rare_img_path),
-    ]
+def _card_full_thumbnail_layer_paths(rqd: CardFullThumbnailRequest) -> dict[str, str | None]:
+    paths = {
+        "base": rqd.card_thumbnail_path,
+        "rare": rqd.birthday_icon_path if rqd.rare == "rarity_birthday" else rqd.rare_img_path,
+    }
     if rqd.frame_img_path:
-        keys.append("frame")
-        tasks.append(get_asset_image_ref(ASSETS_BASE_DIR, rqd.frame_img_path))
+        paths["frame"] = rqd.frame_img_path
     if rqd.is_pcard and rqd.train_rank and rqd.train_rank_img_path:
-        keys.append("rank")
-        tasks.append(get_asset_image_ref(ASSETS_BASE_DIR, rqd.train_rank_img_path))
+        paths["rank"] = rqd.train_rank_img_path
     if rqd.attr_img_path:
-        keys.append("attr")
-        tasks.append(get_asset_image_ref(ASSETS_BASE_DIR, rqd.attr_img_path))
-    loaded = dict(zip(keys, await asyncio.gather(*tasks)))
+        paths["attr"] = rqd.attr_img_path
+    return paths
+
+
+def plan_card_full_thumbnail_layers(plan: AssetPrefetchPlan, rqd: CardFullThumbnailRequest) -> None:
+    """Register one thumbnail's layers in a drawer's prefetch plan."""
+    for path in _card_full_thumbnail_layer_paths(rqd).values():
+        plan.add(path)
+
+
+def card_full_thumbnail_layers_from(assets: Mapping, rqd: CardFullThumbnailRequest) -> CardFullThumbnailLayers:
+    """Read one thumbnail's layers from a resolved plan (see :func:`plan_card_full_thumbnail_layers`)."""
+    loaded = {key: assets[path] for key, path in _card_full_thumbnail_layer_paths(rqd).items()}
     return CardFullThumbnailLayers(
         rqd=rqd,
         base=loaded["base"],
@@ -222,6 +224,12 @@ async def get_card_full_thumbnail_layers(rqd: CardFullThumbnailRequest) -> CardF
     )
 
 
+async def get_card_full_thumbnail_layers(rqd: CardFullThumbnailRequest) -> CardFullThumbnailLayers:
+    plan = AssetPrefetchPlan(ASSETS_BASE_DIR)
+    plan_card_full_thumbnail_layers(plan, rqd)
+    return card_full_thumbnail_layers_from(await plan.resolve("card_thumbnail"), rqd)
+
+
 class CardFullThumbnailBox(ImageBox):
     """Card thumbnail composed natively by whichever backend draws the tree.
 
@@ -303,6 +311,19 @@ class PlayerFrameLayers:
     righttop: AssetImageRef | Image.Image
 
 
+_PLAYER_FRAME_PARTS = ("base", "centertop", "leftbottom", "lefttop", "rightbottom", "righttop")
+
+
+def plan_player_frame_layers(plan: AssetPrefetchPlan, frame_paths) -> None:
+    """Register the six frame parts in a drawer's prefetch plan."""
+    for part in _PLAYER_FRAME_PARTS:
+        plan.add(getattr(frame_paths, part))
+
+
+def player_frame_layers_from(assets: Mapping, frame_paths) -> PlayerFrameLayers:
+    return PlayerFrameLayers(**{part: assets[getattr(frame_paths, part)] for part in _PLAYER_FRAME_PARTS})
+
+
 async def get_player_frame_layers(frame_paths) -> PlayerFrameLayers:
     r"""获取头像框六部件的图源引用（不解码像素）。
 
@@ -311,15 +332,9 @@ async def get_player_frame_layers(frame_paths) -> PlayerFrameLayers:
     frame_paths : PlayerFramePaths
         头像框各部件路径
     """
-    base, ct, lb, lt, rb, rt = await asyncio.gather(
-        get_asset_image_ref(ASSETS_BASE_DIR, frame_paths.base),
-        get_asset_image_ref(ASSETS_BASE_DIR, frame_paths.centertop),
-        get_asset_image_ref(ASSETS_BASE_DIR, frame_paths.leftbottom),
-        get_asset_image_ref(ASSETS_BASE_DIR, frame_paths.lefttop),
-        get_asset_image_ref(ASSETS_BASE_DIR, frame_paths.rightbottom),
-        get_asset_image_ref(ASSETS_BASE_DIR, frame_paths.righttop),
-    )
-    return PlayerFrameLayers(base=base, centertop=ct, leftbottom=lb, lefttop=lt, rightbottom=rb, righttop=rt)
+    plan = AssetPrefetchPlan(ASSETS_BASE_DIR)
+    plan_player_frame_layers(plan, frame_paths)
+    return player_frame_layers_from(await plan.resolve("player_frame"), frame_paths)
 
 
 class PlayerFrameBox(Widget):
@@ -398,7 +413,10 @@ async def get_avatar_widget_with_frame(
     frame_layers = None
     if is_frame and frame_paths:
         frame_layers = await get_player_frame_layers(frame_paths)
+    return _avatar_widget_with_frame(avatar_img, avatar_w, frame_layers)
+
 
+def _avatar_widget_with_frame(avatar_img: ImageSource, avatar_w: int, frame_layers: PlayerFrameLayers | None) -> Frame:
     with Frame().set_size((avatar_w, avatar_w)).set_content_align("c").set_allow_draw_outside(True) as ret:
         ImageBox(avatar_img, size=(avatar_w, avatar_w), use_alpha_blend=False)
         if frame_layers is not None:
@@ -429,54 +447,12 @@ def _build_profile_character_rank_lookup(character_ranks: list[CharacterRank]) -
     return rank_lookup
 
 
-async def _render_profile_widget_image(widget: Widget, *, scale: float = 1.0) -> Image.Image:
-    with Canvas().set_padding(0) as canvas:
-        canvas.add_item(widget)
-    return await canvas.get_img(scale)
-
-
-async def _build_cached_profile_module_image(
-    namespace: str,
-    request_payload,
-    build_widget,
-    *,
-    asset_signatures: dict | None = None,
-    extra: dict | None = None,
-    scale: float = 1.0,
-) -> Image.Image:
-    cache_key = build_rendered_image_cache_key(
-        namespace,
-        request_payload,
-        asset_signatures=asset_signatures,
-        extra=extra,
-    )
-    cached = get_composed_image_cached(cache_key)
-    if cached is not None:
-        return cached
-    disk_cached = get_composed_image_disk_cached(namespace, cache_key)
-    if disk_cached is not None:
-        put_composed_image_cache(cache_key, disk_cached)
-        return disk_cached
-
-    widget = await build_widget()
-    image = await _render_profile_widget_image(widget, scale=scale)
-    put_composed_image_cache(cache_key, image)
-    put_composed_image_disk_cache(namespace, cache_key, image)
-    return image
-
-
-def _build_cached_profile_module_widget(image: Image.Image) -> Widget:
-    return ImageBox(image, image_size_mode="original", use_alpha_blend=True)
-
-
-async def _build_profile_avatar_module(ctx: _ProfileLayoutContext) -> Widget:
-    return await get_avatar_widget_with_frame(
-        is_frame=bool(ctx.request.profile.has_frame),
-        frame_paths=ctx.request.frame_paths,
-        avatar_img=ctx.avatar_img,
-        avatar_w=128,
-        frame_data=[],
-    )
+def _build_profile_avatar_module(ctx: _ProfileLayoutContext) -> Widget:
+    frame_paths = ctx.request.frame_paths
+    frame_layers = None
+    if ctx.request.profile.has_frame and frame_paths:
+        frame_layers = player_frame_layers_from(ctx.assets, frame_paths)
+    return _avatar_widget_with_frame(ctx.avatar_img, 128, frame_layers)
 
 
 def _build_profile_identity_text_module(ctx: _ProfileLayoutContext) -> Widget:
@@ -498,8 +474,8 @@ def _build_profile_identity_text_module(ctx: _ProfileLayoutContext) -> Widget:
     return text_col
 
 
-async def _build_profile_rank_badge_module(ctx: _ProfileLayoutContext) -> Widget:
-    lv_rank_bg = await get_asset_image_ref(ASSETS_BASE_DIR, ctx.request.lv_rank_bg_path)
+def _build_profile_rank_badge_module(ctx: _ProfileLayoutContext) -> Widget:
+    lv_rank_bg = ctx.assets[ctx.request.lv_rank_bg_path]
     badge_w = 180
     badge_h = max(1, int(lv_rank_bg.size[1] * badge_w / lv_rank_bg.size[0]))
     number_box_x = 104
@@ -521,26 +497,19 @@ async def _build_profile_rank_badge_module(ctx: _ProfileLayoutContext) -> Widget
     return badge
 
 
-async def _build_profile_identity_module(ctx: _ProfileLayoutContext) -> Widget:
-    async def _build_identity_widget() -> Widget:
-        avatar_module, rank_badge_module = await asyncio.gather(
-            _build_profile_avatar_module(ctx),
-            _build_profile_rank_badge_module(ctx),
-        )
-        root = HSplit().set_content_align("c").set_item_align("c").set_sep(32).set_padding((32, 0))
-        root.add_item(avatar_module)
-        text_col = _build_profile_identity_text_module(ctx)
-        text_col.add_item(rank_badge_module)
-        root.add_item(text_col)
-        return root
-
-    # Adaptive text colors must be evaluated on the final painted background.
-    # Rendering this module through the disk/memory widget cache bakes it on a
-    # transparent canvas first, which turns the nickname/ID text white.
-    return await _build_identity_widget()
+def _build_profile_identity_module(ctx: _ProfileLayoutContext) -> Widget:
+    # Adaptive text colors must be evaluated on the final painted background, so this module
+    # is never wrapped in a cached CanvasImageBox: an isolated nested canvas is transparent,
+    # which turns the nickname/ID text white.
+    root = HSplit().set_content_align("c").set_item_align("c").set_sep(32).set_padding((32, 0))
+    root.add_item(_build_profile_avatar_module(ctx))
+    text_col = _build_profile_identity_text_module(ctx)
+    text_col.add_item(_build_profile_rank_badge_module(ctx))
+    root.add_item(text_col)
+    return root
 
 
-async def _build_profile_twitter_module(ctx: _ProfileLayoutContext) -> Widget:
+def _build_profile_twitter_module(ctx: _ProfileLayoutContext) -> Widget:
     root = Frame().set_content_align("l").set_w(450)
     root.add_item(
         TextBox(
@@ -555,7 +524,7 @@ async def _build_profile_twitter_module(ctx: _ProfileLayoutContext) -> Widget:
         .set_w(300)
         .set_content_align("l")
     )
-    x_icon = await get_asset_image_ref(ASSETS_BASE_DIR, ctx.request.x_icon_path)
+    x_icon = ctx.assets[ctx.request.x_icon_path]
     root.add_item(ImageBox(x_icon, image_size_mode="fill", size=(24, 24), sampling="linear").set_offset((16, 0)))
     return root
 
@@ -605,48 +574,33 @@ async def _build_profile_honor_module(ctx: _ProfileLayoutContext) -> Widget:
     return root
 
 
-async def _build_profile_cards_module(ctx: _ProfileLayoutContext) -> Widget:
+def _build_profile_cards_module(ctx: _ProfileLayoutContext) -> Widget:
     root = HSplit().set_content_align("c").set_item_align("c").set_sep(6).set_padding((16, 0))
-    _t0 = time.perf_counter()
-    card_layers = await asyncio.gather(*[get_card_full_thumbnail_layers(card) for card in ctx.pcards])
-    logger.debug("[perf] draw_main card_imgs %d: %.3fs", len(ctx.pcards), time.perf_counter() - _t0)
-    for layers in card_layers:
+    for card in ctx.pcards:
+        layers = card_full_thumbnail_layers_from(ctx.assets, card)
         root.add_item(CardFullThumbnailBox(layers, size=(90, 90), image_size_mode="fill", shadow=True))
     return root
 
 
 async def _build_profile_info_panel(ctx: _ProfileLayoutContext) -> Widget:
-    identity_module, twitter_module, honor_module, cards_module = await asyncio.gather(
-        _build_profile_identity_module(ctx),
-        _build_profile_twitter_module(ctx),
-        _build_profile_honor_module(ctx),
-        _build_profile_cards_module(ctx),
-    )
+    honor_module = await _build_profile_honor_module(ctx)
 
     root = VSplit().set_bg(ctx.ui_bg).set_content_align("c").set_item_align("c").set_sep(32).set_padding((32, 35))
-    root.add_item(identity_module)
-    root.add_item(twitter_module)
+    root.add_item(_build_profile_identity_module(ctx))
+    root.add_item(_build_profile_twitter_module(ctx))
     root.add_item(_build_profile_word_module(ctx))
     root.add_item(honor_module)
-    root.add_item(cards_module)
+    root.add_item(_build_profile_cards_module(ctx))
     return root
 
 
-async def _build_profile_play_icon_module(ctx: _ProfileLayoutContext) -> Widget:
+def _build_profile_play_icon_module(ctx: _ProfileLayoutContext) -> Widget:
     gh = 25
     vs = 12
     icon_column = VSplit().set_sep(vs)
     icon_column.add_item(Spacer(gh, gh))
-    _t0 = time.perf_counter()
-    icon_clear, icon_fc, icon_ap = await asyncio.gather(
-        get_asset_image_ref(ASSETS_BASE_DIR, ctx.request.icon_clear_path),
-        get_asset_image_ref(ASSETS_BASE_DIR, ctx.request.icon_fc_path),
-        get_asset_image_ref(ASSETS_BASE_DIR, ctx.request.icon_ap_path),
-    )
-    logger.debug("[perf] draw_play play icons 3: %.3fs", time.perf_counter() - _t0)
-    icon_column.add_item(ImageBox(icon_clear, size=(gh, gh)))
-    icon_column.add_item(ImageBox(icon_fc, size=(gh, gh)))
-    icon_column.add_item(ImageBox(icon_ap, size=(gh, gh)))
+    for path in (ctx.request.icon_clear_path, ctx.request.icon_fc_path, ctx.request.icon_ap_path):
+        icon_column.add_item(ImageBox(ctx.assets[path], size=(gh, gh)))
     return icon_column
 
 
@@ -684,42 +638,33 @@ def _build_profile_play_grid_module(ctx: _ProfileLayoutContext) -> Widget:
     return grid
 
 
-async def _build_profile_play_content_module(ctx: _ProfileLayoutContext) -> Widget:
-    icon_module = await _build_profile_play_icon_module(ctx)
+def _build_profile_play_content_module(ctx: _ProfileLayoutContext) -> Widget:
     root = HSplit().set_content_align("c").set_item_align("t").set_sep(12)
-    root.add_item(icon_module)
+    root.add_item(_build_profile_play_icon_module(ctx))
     root.add_item(_build_profile_play_grid_module(ctx))
     return root
 
 
-async def _build_profile_play_panel(ctx: _ProfileLayoutContext) -> Widget:
+def _build_profile_play_panel(ctx: _ProfileLayoutContext) -> Widget:
     root = HSplit().set_content_align("c").set_item_align("t").set_sep(12).set_bg(ctx.ui_bg).set_padding(32)
-    root.add_item(await _build_profile_play_content_module(ctx))
+    root.add_item(_build_profile_play_content_module(ctx))
     return root
 
 
-async def _preload_profile_chara_icons(ctx: _ProfileLayoutContext) -> dict[str, ImageSource]:
-    chara_map = ctx.request.chara_rank_icon_path_map
-    chara_paths: dict[str, str] = {}
+def _profile_chara_icon_paths(rqd: ProfileRequest) -> list[str]:
+    chara_map = rqd.chara_rank_icon_path_map
+    chara_paths: dict[str, None] = {}
     for chara, cid in CHARA_LIST:
         if chara is None:
             continue
         path = chara_map.get(cid) or chara_map.get(str(cid))
-        if path and path not in chara_paths:
-            chara_paths[path] = path
-    if ctx.solo_live is not None:
-        solo_path = chara_map.get(ctx.solo_live.character_id) or chara_map.get(str(ctx.solo_live.character_id))
-        if solo_path and solo_path not in chara_paths:
-            chara_paths[solo_path] = solo_path
-    ordered_paths = list(chara_paths.keys())
-    _t0 = time.perf_counter()
-    images = (
-        await asyncio.gather(*[get_asset_image_ref(ASSETS_BASE_DIR, path) for path in ordered_paths])
-        if ordered_paths
-        else []
-    )
-    logger.debug("[perf] draw_chara chara icons %d: %.3fs", len(ordered_paths), time.perf_counter() - _t0)
-    return dict(zip(ordered_paths, images))
+        if path:
+            chara_paths.setdefault(path)
+    if rqd.solo_live is not None:
+        solo_path = chara_map.get(rqd.solo_live.character_id) or chara_map.get(str(rqd.solo_live.character_id))
+        if solo_path:
+            chara_paths.setdefault(solo_path)
+    return list(chara_paths)
 
 
 def _build_profile_stats_badge(text: str, *, font_size: int = 18, width: int | None = None) -> Widget:
@@ -821,8 +766,8 @@ def _build_profile_solo_live_module(
     return module
 
 
-async def _build_profile_growth_content_module(ctx: _ProfileLayoutContext) -> Widget:
-    chara_icon_cache = await _preload_profile_chara_icons(ctx)
+def _build_profile_growth_content_module(ctx: _ProfileLayoutContext) -> Widget:
+    chara_icon_cache = {path: ctx.assets[path] for path in _profile_chara_icon_paths(ctx.request)}
     root = Frame().set_content_align("rb")
     root.add_item(_build_profile_character_grid_module(ctx, chara_icon_cache))
 
@@ -875,48 +820,55 @@ async def _build_profile_growth_content_module(ctx: _ProfileLayoutContext) -> Wi
     return root
 
 
-async def _build_profile_growth_panel(ctx: _ProfileLayoutContext) -> Widget:
+def _build_profile_growth_panel(ctx: _ProfileLayoutContext) -> Widget:
     root = Frame().set_content_align("rb").set_bg(ctx.ui_bg)
     # The growth panel contains nested translucent badges. They need the real
     # destination background to preserve the intended alpha/glass appearance.
-    root.add_item(await _build_profile_growth_content_module(ctx))
+    root.add_item(_build_profile_growth_content_module(ctx))
     return root
 
 
 async def _build_profile_layout_modules(ctx: _ProfileLayoutContext) -> dict[str, Widget]:
     # Visible rounded panels are treated as the top-level profile modules so
     # future feature work can target one panel at a time.
-    info_module, play_module, growth_module = await asyncio.gather(
-        _build_profile_info_panel(ctx),
-        _build_profile_play_panel(ctx),
-        _build_profile_growth_panel(ctx),
-    )
     return {
-        "info": info_module,
-        "play": play_module,
-        "growth": growth_module,
+        "info": await _build_profile_info_panel(ctx),
+        "play": _build_profile_play_panel(ctx),
+        "growth": _build_profile_growth_panel(ctx),
     }
 
 
+def _plan_profile_assets(rqd: ProfileRequest, bg_settings: ProfileBgSettings) -> AssetPrefetchPlan:
+    plan = AssetPrefetchPlan(ASSETS_BASE_DIR)
+    plan.add(rqd.profile.leader_image_path)
+    if bg_settings.img_path:
+        plan.add(bg_settings.img_path, on_missing="none")
+    if rqd.profile.has_frame and rqd.frame_paths:
+        plan_player_frame_layers(plan, rqd.frame_paths)
+    for path in (rqd.lv_rank_bg_path, rqd.x_icon_path, rqd.icon_clear_path, rqd.icon_fc_path, rqd.icon_ap_path):
+        plan.add(path)
+    for path in _profile_chara_icon_paths(rqd):
+        plan.add(path)
+    for card in rqd.pcards:
+        plan_card_full_thumbnail_layers(plan, card)
+    return plan
+
+
 async def _build_profile_canvas(rqd: ProfileRequest) -> Canvas:
     """Build the profile widget tree (shared by the Pillow and Skia render paths)."""
     # 玩家基本信息
     profile = rqd.profile
     # 个人信息卡组
     pcards = rqd.pcards
+    bg_settings = rqd.bg_settings if rqd.bg_settings is not None else ProfileBgSettings()
+    # 一次性预取整页素材（头像/背景/头像框/图标/角色/卡牌缩略图），布局阶段同步读取
+    assets = await _plan_profile_assets(rqd, bg_settings).resolve("profile")
     # 头像
-    avatar_img = await get_asset_image_ref(ASSETS_BASE_DIR, profile.leader_image_path)
+    avatar_img = assets[profile.leader_image_path]
     # 背景设置
-    # 使用传入的背景图片，如果没有则使用默认蓝色背景
-    bg_settings = rqd.bg_settings if rqd.bg_settings is not None else ProfileBgSettings()
-    if bg_settings.img_path:
-        try:
-            bg_img = await get_asset_image_ref(ASSETS_BASE_DIR, bg_settings.img_path, on_missing="raise")
-            bg = ImageBg(bg_img, blur=False, fade=0)
-        except (FileNotFoundError, OSError, ValueError):
-            bg = SEKAI_BLUE_BG
-    else:
-        bg = SEKAI_BLUE_BG
+    # 使用传入的背景图片，缺失或无效时使用默认蓝色背景
+    bg_img = assets[bg_settings.img_path] if bg_settings.img_path else None
+    bg = ImageBg(bg_img, blur=False, fade=0) if bg_img is not None else SEKAI_BLUE_BG
     ui_bg = roundrect_bg(
         fill=(255, 255, 255, bg_settings.alpha), blur_glass=True, blur_glass_kwargs={"blur": bg_settings.blur}
     )
@@ -934,6 +886,7 @@ async def _build_profile_canvas(rqd: ProfileRequest) -> Canvas:
     vertical = bg_settings.vertical
     layout_ctx = _ProfileLayoutContext(
         request=rqd,
+        assets=assets,
         profile=profile,
         avatar_img=avatar_img,
         ui_bg=ui_bg,
@@ -1047,14 +1000,14 @@ def _build_profile_card_identity_module(rqd: ProfileCardRequest, data_sources: l
 
         if len(data_sources) <= 1:
             if primary_source and primary_source.update_time:
-                update_time = datetime_from_millis(primary_source.update_time, rqd.timezone)
+                update_time = rqd.clock.localize(primary_source.update_time)
                 update_time_text = format_info_panel_update_time(update_time, rqd.timezone)
                 TextBox(f"更新时间: {update_time_text}", TextStyle(font=DEFAULT_FONT, size=16, color=BLACK))
         else:
             for data_source in data_sources[:2]:
                 if not data_source.update_time:
                     continue
-                update_time = datetime_from_millis(data_source.update_time, rqd.timezone)
+                update_time = rqd.clock.localize(data_source.update_time)
                 update_time_text = format_info_panel_update_time(update_time, rqd.timezone)
                 TextBox(
                     f"{_profile_card_data_source_label(data_source.name)}更新时间: {update_time_text}",
@@ -313,6 +313,27 @@ class CustomProfileCardRenderRequest(BaseModel):
     )
 
 
+class CustomProfileCardsRenderRequest(BaseModel):
+    """A whole GetAnotherProfileResponse plus a card selection (``split.select_custom_profile_cards``)."""
+
+    schema_version: int = 1
+    kind: Literal["pjsk_custom_profile_cards"] = "pjsk_custom_profile_cards"
+    # None: infer from the profile (``split.infer_profile_region``), then "cn".
+    region: str | None = None
+    profile: dict[str, Any]
+    resources: dict[str, Any] = Field(default_factory=dict)
+    seq: int | None = None
+    custom_profile_id: int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("custom_profile_id", "customProfileId"),
+    )
+    custom_profile_card_id: int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("custom_profile_card_id", "customProfileCardId"),
+    )
+    all_cards: bool = Field(default=False, validation_alias=AliasChoices("all_cards", "allCards"))
+
+
 class ProfileRequest(TimeZoneRequest):
     r"""ProfileRequest
 
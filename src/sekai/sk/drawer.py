@@ -33,7 +33,6 @@ from src.sekai.base.plot import (
     TextStyle,
     VSplit,
 )
-from src.sekai.base.timezone import datetime_from_millis, request_now
 from src.sekai.base.utils import (
     get_asset_image_ref,
     get_readable_datetime,
@@ -200,9 +199,9 @@ async def _build_skl_canvas(rqd: SklRequest) -> Canvas:
         rqd: 请求数据
     """
     eid = rqd.id
-    event_start = datetime_from_millis(rqd.start_at, rqd.timezone)
-    event_end = datetime_from_millis(rqd.aggregate_at + 1000, rqd.timezone)
-    now = request_now(rqd.timezone)
+    event_start = rqd.clock.localize(rqd.start_at)
+    event_end = rqd.clock.localize(rqd.aggregate_at + 1000)
+    now = rqd.clock.now
     title = rqd.name
     banner_img = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.banner_img_path)
     wl_cid = rqd.wl_cid
@@ -376,8 +375,8 @@ async def _build_sk_canvas(rqd: SKRequest) -> Canvas:
     """
     eid = rqd.id
     title = rqd.name
-    event_end = datetime_from_millis(rqd.aggregate_at + 1000, rqd.timezone)
-    now = request_now(rqd.timezone)
+    event_end = rqd.clock.localize(rqd.aggregate_at + 1000)
+    now = rqd.clock.now
     if rqd.wl_chara_icon_path:
         wl_chara_img = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.wl_chara_icon_path)
 
@@ -464,8 +463,8 @@ async def _build_cf_canvas(rqd: CFRequest) -> Canvas:
     """
     eid = rqd.eid
     title = rqd.event_name
-    event_end = datetime_from_millis(rqd.aggregate_at + 1000, rqd.timezone)
-    now = request_now(rqd.timezone)
+    event_end = rqd.clock.localize(rqd.aggregate_at + 1000)
+    now = rqd.clock.now
     wl_chara_img_path = rqd.wl_chara_icon_path
 
     style1 = TextStyle(font=DEFAULT_BOLD_FONT, size=24, color=BLACK)
@@ -600,8 +599,8 @@ async def _build_csb_canvas(rqd: CSBRequest) -> tuple[Canvas, float]:
     """
     eid = rqd.eid
     title = rqd.event_name
-    event_end = datetime_from_millis(rqd.aggregate_at + 1000, rqd.timezone)
-    now = request_now(rqd.timezone)
+    event_end = rqd.clock.localize(rqd.aggregate_at + 1000)
+    now = rqd.clock.now
     wl_chara_img_path = rqd.wl_chara_icon_path
 
     style1 = TextStyle(font=DEFAULT_BOLD_FONT, size=24, color=BLACK)
@@ -781,9 +780,9 @@ async def _build_sks_canvas(rqd: SpeedRequest) -> Canvas:
     unit_text = rqd.request_type
     eid = rqd.event_id
     title = rqd.event_name
-    event_start = datetime_from_millis(rqd.event_start_at, rqd.timezone)
-    event_end = datetime_from_millis(rqd.event_aggregate_at + 1000, rqd.timezone)
-    now = request_now(rqd.timezone)
+    event_start = rqd.clock.localize(rqd.event_start_at)
+    event_end = rqd.clock.localize(rqd.event_aggregate_at + 1000)
+    now = rqd.clock.now
     banner_img = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.banner_img_path)
     is_wl_event = rqd.is_wl_event
     period = rqd.period
@@ -1280,9 +1279,9 @@ async def _build_winrate_predict_canvas(rqd: WinRateRequest) -> Canvas:
     banner_img = await get_asset_image_ref(ASSETS_BASE_DIR, rqd.banner_img_path)
 
     event_name = rqd.event_name
-    event_start = datetime_from_millis(rqd.event_start_at, rqd.timezone)
-    event_end = datetime_from_millis(rqd.event_aggregate_at + 1000, rqd.timezone)
-    now = request_now(rqd.timezone)
+    event_start = rqd.clock.localize(rqd.event_start_at)
+    event_end = rqd.clock.localize(rqd.event_aggregate_at + 1000)
+    now = rqd.clock.now
 
     # Build display data without mutating rqd: the build may run twice on the same
     # request object (Skia shadow path + Pillow fallback), and appending the CN name
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 
 from pydantic import BaseModel, field_validator
 
-from src.sekai.base.timezone import TimeZoneRequest, localize_datetime, parse_datetime_utc
+from src.sekai.base.timezone import TimeZoneRequest, parse_datetime_utc
 
 
 class RankInfo(BaseModel):
@@ -166,17 +166,17 @@ class SklRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         for item in self.current_ranks or []:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         for column in self.forecast_columns or []:
-            column.forecast_time = localize_datetime(column.forecast_time, self.timezone)
-            column.update_time = localize_datetime(column.update_time, self.timezone)
+            column.forecast_time = self.clock.localize(column.forecast_time)
+            column.update_time = self.clock.localize(column.update_time)
             for item in column.ranks:
-                item.time = localize_datetime(item.time, self.timezone)
-                item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+                item.time = self.clock.localize(item.time)
+                item.record_start_at = self.clock.localize(item.record_start_at)
 
 
 class SKRequest(TimeZoneRequest):
@@ -219,14 +219,14 @@ class SKRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         if self.prev_ranks is not None:
-            self.prev_ranks.time = localize_datetime(self.prev_ranks.time, self.timezone)
-            self.prev_ranks.record_start_at = localize_datetime(self.prev_ranks.record_start_at, self.timezone)
+            self.prev_ranks.time = self.clock.localize(self.prev_ranks.time)
+            self.prev_ranks.record_start_at = self.clock.localize(self.prev_ranks.record_start_at)
         if self.next_ranks is not None:
-            self.next_ranks.time = localize_datetime(self.next_ranks.time, self.timezone)
-            self.next_ranks.record_start_at = localize_datetime(self.next_ranks.record_start_at, self.timezone)
+            self.next_ranks.time = self.clock.localize(self.next_ranks.time)
+            self.next_ranks.record_start_at = self.clock.localize(self.next_ranks.record_start_at)
 
 
 class CFRequest(TimeZoneRequest):
@@ -280,15 +280,15 @@ class CFRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         if self.prev_rank is not None:
-            self.prev_rank.time = localize_datetime(self.prev_rank.time, self.timezone)
-            self.prev_rank.record_start_at = localize_datetime(self.prev_rank.record_start_at, self.timezone)
+            self.prev_rank.time = self.clock.localize(self.prev_rank.time)
+            self.prev_rank.record_start_at = self.clock.localize(self.prev_rank.record_start_at)
         if self.next_rank is not None:
-            self.next_rank.time = localize_datetime(self.next_rank.time, self.timezone)
-            self.next_rank.record_start_at = localize_datetime(self.next_rank.record_start_at, self.timezone)
-        self.update_at = localize_datetime(self.update_at, self.timezone)
+            self.next_rank.time = self.clock.localize(self.next_rank.time)
+            self.next_rank.record_start_at = self.clock.localize(self.next_rank.record_start_at)
+        self.update_at = self.clock.localize(self.update_at)
 
 
 class CSBRequest(TimeZoneRequest):
@@ -330,9 +330,9 @@ class CSBRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
-        self.update_at = localize_datetime(self.update_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
+        self.update_at = self.clock.localize(self.update_at)
 
 
 class SpeedRequest(TimeZoneRequest):
@@ -381,7 +381,7 @@ class SpeedRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.record_time = localize_datetime(item.record_time, self.timezone)
+            item.record_time = self.clock.localize(item.record_time)
 
 
 class PlayerTraceRequest(TimeZoneRequest):
@@ -424,20 +424,17 @@ class PlayerTraceRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         for item in self.ranks2 or []:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         for item in self.compare_rank_trace or []:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         if self.compare_rank_latest is not None:
-            self.compare_rank_latest.time = localize_datetime(self.compare_rank_latest.time, self.timezone)
-            self.compare_rank_latest.record_start_at = localize_datetime(
-                self.compare_rank_latest.record_start_at,
-                self.timezone,
-            )
+            self.compare_rank_latest.time = self.clock.localize(self.compare_rank_latest.time)
+            self.compare_rank_latest.record_start_at = self.clock.localize(self.compare_rank_latest.record_start_at)
 
 
 class RankTraceRequest(TimeZoneRequest):
@@ -471,11 +468,11 @@ class RankTraceRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.ranks:
-            item.time = localize_datetime(item.time, self.timezone)
-            item.record_start_at = localize_datetime(item.record_start_at, self.timezone)
+            item.time = self.clock.localize(item.time)
+            item.record_start_at = self.clock.localize(item.record_start_at)
         if self.predict_ranks is not None:
-            self.predict_ranks.time = localize_datetime(self.predict_ranks.time, self.timezone)
-            self.predict_ranks.record_start_at = localize_datetime(self.predict_ranks.record_start_at, self.timezone)
+            self.predict_ranks.time = self.clock.localize(self.predict_ranks.time)
+            self.predict_ranks.record_start_at = self.clock.localize(self.predict_ranks.record_start_at)
 
 
 class TeamInfo(BaseModel):
@@ -551,4 +548,4 @@ class WinRateRequest(TimeZoneRequest):
 
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
-        self.updated_at = localize_datetime(self.updated_at, self.timezone)
+        self.updated_at = self.clock.localize(self.updated_at)
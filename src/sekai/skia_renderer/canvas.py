@@ -13,7 +13,7 @@ import json
 import logging
 from typing import Any
 
-from src.core.debug import set_render_backend
+from src.core.debug import current_png_encode_profile, set_render_backend
 from src.core.image_payload import EncodedImagePayload
 from src.sekai.base.triangle_bg import background_hour
 from src.sekai.base.utils import run_in_pool
@@ -54,6 +54,22 @@ def skia_plot_enabled() -> bool:
     return bool(settings.drawing.use_skia_plot)
 
 
+def resolve_png_encode_profile(endpoint: str | None) -> str:
+    """The native PNG encode profile for this render: the request's ``X-Haruki-Png-Profile``
+    header, else ``png_encode_profile_endpoints[endpoint]``, else ``png_encode_profile``.
+
+    ``endpoint`` is the /render-stats name. Read on the request's own context (the header lives
+    in a contextvar), before the render is handed to the pool.
+    """
+    requested = current_png_encode_profile()
+    if requested is not None:
+        return requested
+    per_endpoint = settings.drawing.png_encode_profile_endpoints
+    if endpoint and endpoint in per_endpoint:
+        return per_endpoint[endpoint]
+    return settings.drawing.png_encode_profile
+
+
 # Minimum IR capability this code emits. 5 added the SelfImage canvas snapshot, 6 the Porter-Duff
 # Src paste (Image.blend="src", i.e. Painter.paste_src), 7 the pre-generated TriangleBg.tris,
 # 8 = Transform subtree + catmull_rom sampling, 9 = SdfQuad (TMP text shading) + A8 raw mem
@@ -63,12 +79,13 @@ def skia_plot_enabled() -> bool:
 # resize for Image and UnitySubscene, 16 = straight-RGBA Pillow paste-mask blending for Image,
 # 17 = generic RasterSubscene isolate-then-place composition with whole-image shadow,
 # 18 = asset-backed SdfAtlasQuad with Pillow-compatible L-mode resize and affine warp,
-# 19 = source-font SdfFontQuad with native outline flattening, SDF generation, and caching.
+# 19 = source-font SdfFontQuad with native outline flattening, SDF generation, and caching,
+# 20 = SVG path-data Path node (fill/stroke/gradient) and the ``path`` Group clip.
 # An older wheel SILENTLY drops the fields it does not know (serde skips them) — a capability-6
 # wheel would render a triangle background with no triangles in it — so refuse it and fail open
 # to Pillow. The number is hardcoded in four places: here, rust lib.rs, and the two CI assertions
 # (quick-check.yml, skia-wheels.yml). Bump all four together.
-REQUIRED_NATIVE_IR_CAPABILITY = 19
+REQUIRED_NATIVE_IR_CAPABILITY = 20
 
 
 def load_native_renderer():
@@ -210,7 +227,13 @@ async def render_canvas_payload(
         _record(name, OUTCOME_DISABLED)
         return None
     try:
-        payload = await _render_canvas_uncounted(canvas, bg_hour=bg_hour, scale=scale, export_format=export_format)
+        payload = await _render_canvas_uncounted(
+            canvas,
+            bg_hour=bg_hour,
+            scale=scale,
+            export_format=export_format,
+            png_profile=resolve_png_encode_profile(name),
+        )
     except SkiaUnsupported as exc:
         logger.info("plot canvas not Skia-expressible (%s); falling back to Pillow", exc)
         _record(name, OUTCOME_FALLBACK)
@@ -227,7 +250,12 @@ async def render_canvas_payload(
 
 
 async def _render_canvas_uncounted(
-    canvas, *, bg_hour: float | None = None, scale: float | None = None, export_format: str | None = None
+    canvas,
+    *,
+    bg_hour: float | None = None,
+    scale: float | None = None,
+    export_format: str | None = None,
+    png_profile: str = "fastest",
 ) -> EncodedImagePayload | None:
     """The actual render. Returns None when the native extension is unavailable, raises
     ``SkiaUnsupported`` when the tree (or its size) is not Skia-expressible. Counting and the
@@ -253,6 +281,8 @@ async def _render_canvas_uncounted(
         scene = builder.build()
         if eff_scale is not None:
             scene["scale"] = eff_scale
+        if png_profile != "fastest":
+            scene["png_profile"] = png_profile
         ir_json = json.dumps(scene, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
         return native.render_scene(ir_json, mem_images)
 
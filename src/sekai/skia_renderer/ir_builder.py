@@ -166,6 +166,30 @@ def clip_rrect(radius: float, corners: Sequence[bool] = (True, True, True, True)
     return {"kind": "rrect", "radius": float(radius), "corners": [bool(c) for c in corners]}
 
 
+def clip_path(d: str, antialias: bool = True) -> Node:
+    """An SVG path-data clip for a Group, in the group's local space (IR_CAPABILITY >= 20).
+    ``antialias=False`` keeps whole pixels only, like a binary ``ImageDraw`` mask."""
+    return {"kind": "path", "d": d, "antialias": bool(antialias)}
+
+
+def rounded_rect_path(size: Vec2, radius: float) -> str:
+    """SVG path data for a ``(0, 0)``-anchored rounded rect, for :func:`clip_path` / ``path``.
+
+    Coordinates are pixel EDGES: ``size=(w, h)`` covers columns ``0..w-1``, the area Pillow's
+    ``rounded_rectangle((0, 0, w - 1, h - 1), radius)`` fills. Its corners are ellipses over an
+    inclusive ``2r`` box, i.e. ``2r + 1`` pixels across, hence the half-pixel radius bump.
+    """
+    w, h = float(size[0]), float(size[1])
+    r = min(max(0.0, float(radius) + 0.5), w / 2.0, h / 2.0) if radius > 0 else 0.0
+    if r <= 0.0:
+        return f"M0 0 H{w:g} V{h:g} H0 Z"
+    return (
+        f"M{r:g} 0 H{w - r:g} A{r:g} {r:g} 0 0 1 {w:g} {r:g} V{h - r:g} "
+        f"A{r:g} {r:g} 0 0 1 {w - r:g} {h:g} H{r:g} A{r:g} {r:g} 0 0 1 0 {h - r:g} "
+        f"V{r:g} A{r:g} {r:g} 0 0 1 {r:g} 0 Z"
+    )
+
+
 def adaptive_color(
     light: Color = (255, 255, 255, 255), dark: Color = (0, 0, 0, 255), threshold: float = 0.4, pixelwise: bool = False
 ) -> Node:
@@ -235,6 +259,7 @@ class IRBuilder:
         extra_fonts: dict[str, str] | None = None,
         export_format: str = "png",
         jpg_quality: int = 90,
+        png_profile: str = "fastest",
         max_node_pixels: int | None = None,
         max_scene_bytes: int | None = None,
     ) -> None:
@@ -243,6 +268,7 @@ class IRBuilder:
         self._assets_base_dir = str(assets_base_dir)
         self._export_format = export_format
         self._jpg_quality = int(jpg_quality)
+        self._png_profile = png_profile
         self._font_dir = str(font_dir)
         self._fonts: Node = {"dir": str(font_dir), "default": default_font, "bold": bold_font}
         if heavy_font:
@@ -404,6 +430,30 @@ class IRBuilder:
             node["stroke_width"] = stroke_width
         return self._add(node)
 
+    def path(
+        self,
+        d: str,
+        fill: Color | Node | None = None,
+        stroke: Color | Node | None = None,
+        stroke_width: float = 1,
+        stroke_join: str = "miter",
+        antialias: bool = True,
+    ) -> Node:
+        """Draw SVG path data (``M/L/H/V/C/Q/A/Z``) in the current group's space. Requires
+        IR_CAPABILITY >= 20; unparsable ``d`` fails the scene natively (-> Pillow fail-open)."""
+        if stroke_join not in {"miter", "round", "bevel"}:
+            raise ValueError(f"unsupported Path stroke_join: {stroke_join}")
+        node: Node = {"type": "Path", "d": d}
+        if fill is not None:
+            node["fill"] = _fill_value(fill)
+        if stroke is not None:
+            node["stroke"] = _fill_value(stroke)
+            node["stroke_width"] = stroke_width
+            node["stroke_join"] = stroke_join
+        if not antialias:
+            node["antialias"] = False
+        return self._add(node)
+
     def image(
         self,
         path: str,
@@ -633,6 +683,7 @@ class IRBuilder:
         sampling: str = "catmull_rom",
         alpha: float = 1.0,
         shadow: Node | None = None,
+        cache_key: str | None = None,
     ) -> Iterator[IRBuilder]:
         """Render children at ``natural_size`` on a transparent isolated raster.
 
@@ -644,6 +695,11 @@ class IRBuilder:
         The active builder stack points at this node's children inside the context, so
         ``NativeSubtree.splice_into(builder, mem_sink, ...)`` can be called directly here.
         Requires IR_CAPABILITY >= 17.
+
+        ``cache_key`` lets the renderer keep the completed raster in its process-wide subscene
+        cache and skip the children on a later render with the same key and ``natural_size``. It
+        must name everything the children draw; the children are still emitted, so a renderer
+        without that cache (or after an eviction) draws the same pixels.
         """
 
         self.push_raster_subscene(
@@ -653,6 +709,7 @@ class IRBuilder:
             sampling=sampling,
             alpha=alpha,
             shadow=shadow,
+            cache_key=cache_key,
         )
         try:
             yield self
@@ -668,6 +725,7 @@ class IRBuilder:
         sampling: str = "catmull_rom",
         alpha: float = 1.0,
         shadow: Node | None = None,
+        cache_key: str | None = None,
     ) -> Node:
         """Push form of :meth:`raster_subscene` for Painter-style spanning operations."""
 
@@ -697,6 +755,8 @@ class IRBuilder:
         }
         if shadow is not None:
             node["shadow"] = shadow
+        if cache_key:
+            node["cache_key"] = cache_key
         self._add(node)
         self._stack.append(node["children"])
         return node
@@ -1247,6 +1307,9 @@ class IRBuilder:
                 "children": self._root_children,
             },
         }
+        if self._png_profile != "fastest":
+            # Omitted at the default so the scene stays what pre-profile wheels were built for.
+            scene["png_profile"] = self._png_profile
         if self._background is not None:
             scene["background"] = self._background
         if self._limits is not None:
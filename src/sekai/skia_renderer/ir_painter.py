@@ -367,30 +367,40 @@ class IRPainter(Painter):
         require_asset_backed=False,
         skip_on_error=False,
     ):
-        del exclude_on_hash, cache_key, skip_on_error
+        del exclude_on_hash, skip_on_error
         # Local import avoids the canvas -> IRPainter -> subtree -> canvas module cycle.
+        from src.sekai.base.cache import MISSING
         from src.sekai.skia_renderer.subtree import NativeSubtreeError, lower_canvas_subtree
+        from src.sekai.skia_renderer.subtree_cache import NATIVE_SUBTREE_CACHE, native_subtree_cache_key
 
         parent_scene = self._b.build()
         parent_fonts = parent_scene["fonts"]
-        try:
-            subtree = lower_canvas_subtree(
-                canvas,
-                require_asset_backed=require_asset_backed,
-                renderer_options={
-                    "assets_base_dir": parent_scene["assets_base_dir"],
-                    "font_dir": parent_fonts["dir"],
-                    "default_font": parent_fonts["default"],
-                    "bold_font": parent_fonts["bold"],
-                    "heavy_font": parent_fonts.get("heavy"),
-                    "emoji_font": parent_fonts.get("emoji"),
-                    "bg_hour": self._bg_hour,
-                    "export_format": parent_scene["export_format"],
-                    "jpg_quality": parent_scene["jpg_quality"],
-                },
-            )
-        except NativeSubtreeError as exc:
-            raise SkiaUnsupported(str(exc)) from exc
+        renderer_options = {
+            "assets_base_dir": parent_scene["assets_base_dir"],
+            "font_dir": parent_fonts["dir"],
+            "default_font": parent_fonts["default"],
+            "bold_font": parent_fonts["bold"],
+            "heavy_font": parent_fonts.get("heavy"),
+            "emoji_font": parent_fonts.get("emoji"),
+            "bg_hour": self._bg_hour,
+            "export_format": parent_scene["export_format"],
+            "jpg_quality": parent_scene["jpg_quality"],
+        }
+        # Same contract as the Pillow path: one cache_key always names the same nested canvas,
+        # so the lowered subtree is reused instead of walking the child widget tree again.
+        subtree_key = native_subtree_cache_key(cache_key, renderer_options) if cache_key else None
+        subtree = NATIVE_SUBTREE_CACHE.get(subtree_key) if subtree_key else MISSING
+        if subtree is MISSING:
+            try:
+                subtree = lower_canvas_subtree(
+                    canvas,
+                    require_asset_backed=require_asset_backed,
+                    renderer_options=renderer_options,
+                )
+            except NativeSubtreeError as exc:
+                raise SkiaUnsupported(str(exc)) from exc
+            if subtree_key:
+                NATIVE_SUBTREE_CACHE.set(subtree_key, subtree)
 
         destination_size = subtree.size if size is None else size
         shadow = (
@@ -411,6 +421,9 @@ class IRPainter(Painter):
             dst_size=destination_size,
             sampling=sampling or "linear_mipmap",
             shadow=shadow,
+            # The subtree key already covers fonts, asset root and background, so the renderer can
+            # reuse the finished raster of this nested canvas as well.
+            cache_key=subtree_key,
         ):
             try:
                 subtree.splice_into(
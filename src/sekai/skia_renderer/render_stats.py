@@ -87,6 +87,10 @@ _SCENE_SUM_KEYS: tuple[str, ...] = (
     "unresolved_elements",
     "mem_images",
     "mem_bytes",
+    "setup_us",
+    "session_reused",
+    "asset_probes",
+    "asset_probes_deduplicated",
 )
 
 
@@ -0,0 +1,71 @@
+"""Process-level cache of lowered nested canvases (``CanvasImageBox`` with a ``cache_key``).
+
+The Pillow backend has always honoured ``Painter.paste_canvas(cache_key=...)`` by keeping the
+rasterized child in the composed-image pool. IRPainter ignored the key and lowered the nested
+canvas again on every request, so a profile page with three honor badges re-ran the full honor
+widget tree through IRPainter each time. The lowered :class:`NativeSubtree` is pure data (Render-IR
+nodes, a font map and, for memory-carrying trees, the raw mem payloads) and is spliced by deep
+copy, so one instance is shared read-only across requests: a hit appends the cached nodes inside
+the parent's ``RasterSubscene`` and nothing is re-rendered or re-encoded in Python.
+
+The key is the caller's ``cache_key`` (``build_rendered_image_cache_key`` material: request,
+asset signatures, renderer code fingerprint) plus every renderer option the lowering depends on —
+font map, asset root, ``bg_hour`` and export format — so two scenes with different fonts or
+backgrounds never share a subtree.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from src.sekai.base.cache import BoundedCache
+from src.settings import NATIVE_SUBTREE_CACHE_MAX_BYTES, NATIVE_SUBTREE_CACHE_SIZE
+
+_NODE_BYTES = 512
+
+
+def _count_nodes(nodes: Any) -> int:
+    count = 0
+    for node in nodes:
+        count += 1
+        if isinstance(node, dict):
+            count += _count_nodes(node.get("children", ()))
+    return count
+
+
+def _payload_bytes(payload: Any) -> int:
+    if isinstance(payload, bytes | bytearray | memoryview):
+        return len(payload)
+    if isinstance(payload, tuple | list):
+        return sum(_payload_bytes(item) for item in payload)
+    return 64
+
+
+def _subtree_bytes(subtree: Any) -> int:
+    """Rough resident size: a flat cost per IR node plus the raw mem payloads it carries."""
+    return _count_nodes(subtree.nodes) * _NODE_BYTES + sum(_payload_bytes(p) for p in subtree.mem_images.values())
+
+
+NATIVE_SUBTREE_CACHE = BoundedCache(
+    "native_subtree",
+    NATIVE_SUBTREE_CACHE_SIZE,
+    NATIVE_SUBTREE_CACHE_MAX_BYTES,
+    _subtree_bytes,
+)
+
+
+def native_subtree_cache_key(cache_key: str, renderer_options: dict[str, Any]) -> str:
+    material = {"cache_key": cache_key, "options": renderer_options}
+    payload = json.dumps(material, ensure_ascii=True, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_native_subtree_cache_stats() -> dict[str, Any]:
+    """Pool stats for /cache/stats (the ``native_subtree_cache`` key)."""
+    return NATIVE_SUBTREE_CACHE.stats()
+
+
+def clear_native_subtree_cache() -> None:
+    NATIVE_SUBTREE_CACHE.clear()
@@ -7,8 +7,7 @@ from PIL import Image
 from src.core.image_payload import EncodedImagePayload
 from src.sekai.base.draw import BG_PADDING, SEKAI_BLUE_BG, add_request_watermark, roundrect_bg
 from src.sekai.base.painter import DEFAULT_BOLD_FONT, DEFAULT_FONT
-from src.sekai.base.plot import Canvas, Flow, Frame, HSplit, ImageBox, TextBox, TextStyle, VSplit
-from src.sekai.base.timezone import request_now
+from src.sekai.base.plot import Canvas, CanvasImageBox, Flow, Frame, HSplit, ImageBox, TextBox, TextStyle, VSplit
 from src.sekai.base.utils import (
     build_rendered_image_cache_key,
     get_asset_image_ref,
@@ -98,11 +97,11 @@ async def _preload_vlive_entry_assets(vlive: VLiveBrief) -> dict[str, object]:
     return dict(zip(keys, values))
 
 
-async def _compose_vlive_entry_image(
+def _build_vlive_entry_canvas(
     vlive: VLiveBrief,
     loaded: dict[str, object],
     now: datetime,
-) -> Image.Image:
+) -> Canvas:
     title_style = TextStyle(font=DEFAULT_BOLD_FONT, size=20, color=(20, 20, 20))
     info_style = TextStyle(font=DEFAULT_FONT, size=18, color=(50, 50, 50))
     section_style = TextStyle(font=DEFAULT_BOLD_FONT, size=18, color=(50, 50, 50))
@@ -159,7 +158,21 @@ async def _compose_vlive_entry_image(
                                 for character_image in characters:
                                     ImageBox(character_image, size=(30, 30), use_alpha_blend=True)
 
-    return await canvas.get_img()
+    return canvas
+
+
+async def _compose_vlive_entry_image(
+    vlive: VLiveBrief,
+    loaded: dict[str, object],
+    now: datetime,
+) -> Image.Image:
+    return await _build_vlive_entry_canvas(vlive, loaded, now).get_img()
+
+
+async def _get_vlive_list_entry_canvas(vlive: VLiveBrief, now: datetime) -> tuple[Canvas, str]:
+    """Skia 路径的列表行: 返回行 Canvas 及其缓存 key,由 native 渲染器按 key 缓存整行光栅。"""
+    loaded = await _preload_vlive_entry_assets(vlive)
+    return _build_vlive_entry_canvas(vlive, loaded, now), _build_vlive_entry_cache_key(vlive, now)
 
 
 async def _get_vlive_list_entry_image(vlive: VLiveBrief, now: datetime) -> Image.Image:
@@ -184,18 +197,28 @@ async def _get_vlive_list_entry_image(vlive: VLiveBrief, now: datetime) -> Image
     return image
 
 
-async def _build_vlive_list_canvas(rqd: VLiveListRequest, now: datetime | None = None) -> Canvas:
+async def _build_vlive_list_canvas(
+    rqd: VLiveListRequest,
+    now: datetime | None = None,
+    *,
+    native_rows: bool = False,
+) -> Canvas:
     lives = rqd.lives
     if now is None:
-        now = request_now(rqd.timezone)
+        now = rqd.clock.now
 
-    entry_images = await asyncio.gather(*[_get_vlive_list_entry_image(vlive, now) for vlive in lives]) if lives else []
+    get_entry = _get_vlive_list_entry_canvas if native_rows else _get_vlive_list_entry_image
+    entries = await asyncio.gather(*[get_entry(vlive, now) for vlive in lives]) if lives else []
 
     with Canvas(bg=SEKAI_BLUE_BG).set_padding(BG_PADDING) as canvas:
         with VSplit().set_padding(0).set_sep(16).set_item_align("lt").set_content_align("lt"):
-            for entry_image in entry_images:
+            for entry in entries:
                 with Frame().set_w(760).set_padding(18).set_bg(roundrect_bg(alpha=80, blur_glass_kwargs={"blur": 8})):
-                    ImageBox(entry_image)
+                    if native_rows:
+                        entry_canvas, entry_key = entry
+                        CanvasImageBox(entry_canvas, cache_key=entry_key)
+                    else:
+                        ImageBox(entry)
 
     add_request_watermark(canvas, rqd)
     return canvas
@@ -212,6 +235,6 @@ async def try_render_vlive_list_payload(rqd: VLiveListRequest) -> EncodedImagePa
         return None
     # One `now` for the whole layout: recomputing it inside the builder could cross a minute
     # boundary mid-render and put two different living/upcoming states in one image.
-    now = request_now(rqd.timezone)
-    canvas = await _build_vlive_list_canvas(rqd, now=now)
+    now = rqd.clock.now
+    canvas = await _build_vlive_list_canvas(rqd, now=now, native_rows=True)
     return await render_canvas_payload(canvas, endpoint=_VLIVE_LIST_ENDPOINT)
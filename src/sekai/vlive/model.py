@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, field_validator
 
-from src.sekai.base.timezone import TimeZoneRequest, localize_datetime, parse_datetime_utc
+from src.sekai.base.timezone import TimeZoneRequest, parse_datetime_utc
 
 
 class VLiveRewardItem(BaseModel):
@@ -40,7 +40,7 @@ class VLiveListRequest(TimeZoneRequest):
     def model_post_init(self, __context, /) -> None:
         super().model_post_init(__context)
         for item in self.lives:
-            item.start_at = localize_datetime(item.start_at, self.timezone)
-            item.end_at = localize_datetime(item.end_at, self.timezone)
-            item.current_start_at = localize_datetime(item.current_start_at, self.timezone)
-            item.current_end_at = localize_datetime(item.current_end_at, self.timezone)
+            item.start_at = self.clock.localize(item.start_at)
+            item.end_at = self.clock.localize(item.end_at)
+            item.current_start_at = self.clock.localize(item.current_start_at)
+            item.current_end_at = self.clock.localize(item.current_end_at)
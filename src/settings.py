@@ -23,6 +23,10 @@ import yaml
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 STATIC_IMAGE_DIR = "static_images"
 
+# Native PNG encode profiles (fastest = the historical mtpng Fast/RGBA output).
+PngEncodeProfile = Literal["fastest", "balanced", "smallest"]
+PNG_ENCODE_PROFILES: tuple[str, ...] = ("fastest", "balanced", "smallest")
+
 
 class AssetsSettings(BaseModel):
     """资产文件配置"""
@@ -85,12 +89,21 @@ class DrawingSettings(BaseModel):
     """画图配置"""
 
     thread_pool_size: int = 8
+    # 线程池短任务通道的额外线程数:只执行资源头探测、ETag 计算等毫秒级任务,不会排在渲染后面
+    thread_pool_short_lane_workers: int = Field(default=2, ge=0)
     isolated_worker_pool_size: int = 8  # 重任务隔离子进程池大小，仅用于高风险接口
     isolated_worker_queue_limit: int = 16  # 重任务排队上限（不含正在执行的 worker）
     isolated_worker_queue_timeout_seconds: int = 30  # 重任务排队超时（秒）
     request_hard_timeout_seconds: int = 180  # 单个重任务的硬超时（秒）
     overload_max_inflight_requests: int = 0  # 过载保护：允许的最大并发请求数，0 表示关闭
     overload_retry_after_seconds: int = 5  # 过载拒绝后的 Retry-After 秒数
+    # 按预测渲染耗时做准入:在途请求的预测秒数之和不得超过该预算,0 表示关闭。
+    # 预测值按路径 + 请求体列表条目数在线拟合(见 src/core/admission.py),/admission-stats 查看误差。
+    admission_cost_budget_seconds: float = Field(default=0.0, ge=0)
+    admission_cheap_cost_seconds: float = Field(default=0.5, ge=0)  # 预测耗时不超过该值的算轻请求
+    # 重请求只能占用预算的该比例,剩余部分留给轻请求(过载时优先放行轻请求)
+    admission_heavy_budget_fraction: float = Field(default=0.75, gt=0, le=1)
+    admission_default_cost_seconds: float = Field(default=0.3, gt=0)  # 样本不足时的预测耗时
     readiness_unhealthy_inflight_requests: int = 0  # readiness: inflight 达到该值时返回不健康，0 表示关闭
     readiness_unhealthy_rss_mb: int = 0  # readiness: 父进程 RSS 达到该值时返回不健康，0 表示关闭
     readiness_unhealthy_asyncio_tasks: int = 0  # readiness: asyncio task 达到该值时返回不健康，0 表示关闭
@@ -107,6 +120,15 @@ class DrawingSettings(BaseModel):
     composed_image_cache_ttl_seconds: int = 7 * 24 * 3600  # 合成图片缓存 TTL（秒）
     export_image_format: Literal["png", "jpg"] = "png"  # 导出图片格式
     jpg_quality: int = Field(default=85, ge=1, le=100)  # JPEG 压缩质量 (1-100)
+    # Skia 原生 PNG 编码档位:fastest(默认,与历史输出逐字节一致)/ balanced(不透明页去 alpha)/
+    # smallest(再加 ≤256 色无损调色板、更大压缩块)。解码后像素在各档完全一致,只换 CPU 与体积。
+    # 按端点覆盖写 png_encode_profile_endpoints(键为 /render-stats 里的端点名),单请求用
+    # X-Haruki-Png-Profile 请求头覆盖。仅作用于 Skia 输出;JPG 导出时忽略。
+    png_encode_profile: PngEncodeProfile = "fastest"
+    png_encode_profile_endpoints: dict[str, PngEncodeProfile] = Field(default_factory=dict)
+    # Pillow 回退路径:不小于该像素数的 RGBA 图改用扩展的 mtpng 多核编码(档位同上),
+    # 扩展缺失或版本过旧时照旧走 Pillow 单核 zlib。0 表示关闭。
+    pillow_native_png_min_pixels: int = Field(default=512 * 512, ge=0)
     # Skia 门控:默认开启(2026-07-12 全端点真实数据对拍通过后切换)。扩展缺失时 fail-open
     # 回退 Pillow 并打 ERROR。开关一律不写入 configs.yaml,生产用 HARUKI_DRAWING__* 环境变量覆盖。
     use_skia_plot: bool = True  # plot.py widget 树端点的 IRPainter → Skia 渲染
@@ -129,13 +151,59 @@ class DrawingSettings(BaseModel):
     # 该渲染器冷路径的 1.5s+ 就是这些缓存随请求丢弃造成的,归零任一对即禁用对应池(回滚开关)。
     custom_profile_glyph_cache_size: int = 4096  # 字形 SDF/轮廓缓存条目数(两池各自适用),0 表示关闭
     custom_profile_glyph_cache_max_mb: int = 64  # 字形缓存单池内存上限(MB),0 表示关闭
+    # 字形 SDF/轮廓的磁盘缓存(data/utils/custom_profile_glyphs),跨重启与 heavy worker 重建保留,
+    # 按最近使用淘汰;0 表示关闭
+    custom_profile_glyph_disk_cache_max_mb: int = 256
     custom_profile_sprite_cache_size: int = 512  # sprite/atlas 解码缓存条目数,0 表示关闭
     custom_profile_sprite_cache_max_mb: int = 128  # sprite/atlas 缓存内存上限(MB),0 表示关闭
+    # 谱面进程级缓存:按文件 (mtime_ns, size) 缓存解析后的 SUS 谱面与样式表,资产原地替换即失效。
+    chart_score_cache_size: int = 128  # 谱面/样式表缓存条目数(两池各自适用),0 表示关闭
+    chart_score_cache_max_mb: int = 64  # 谱面/样式表缓存单池内存上限(MB),0 表示关闭
+    # 谱面 crate 栅格输出缓存(按谱面签名 + 样式 + 渲染参数)。单张几十 MB,默认关闭,按内存显式开启。
+    chart_raster_cache_size: int = 0  # 栅格缓存条目数,0 表示关闭
+    chart_raster_cache_max_mb: int = 0  # 栅格缓存内存上限(MB),0 表示关闭
+    # /help 排版缓存:按 markdown 摘要缓存折行/分节结果,重复的帮助页跳过测宽与折行。0 表示关闭
+    command_help_layout_cache_size: int = Field(default=64, ge=0)
+    # 排版快照缓存:/help、别名列表、加成详情、羁绊等静态页按 请求摘要 + 资产签名 缓存排版后的绘制列表
+    # (不含水印),命中时跳过组件构建与测宽直接回放。默认关闭,内存与磁盘各自归零即关闭对应层。
+    layout_snapshot_cache_size: int = Field(default=0, ge=0)  # 内存快照条目数,0 表示关闭
+    layout_snapshot_cache_max_mb: int = Field(default=64, ge=0)  # 内存快照上限(MB),0 表示关闭
+    # 磁盘快照(data/utils/layout_snapshots),跨重启保留,按最近使用淘汰;0 表示关闭
+    layout_snapshot_disk_cache_max_mb: int = Field(default=0, ge=0)
+    # 原生子场景缓存:带 cache_key 的 CanvasImageBox(profile 称号、活动/虚拟live列表行等)降级后的 IR 子树,
+    # 命中时跳过重新降级。原生渲染器侧另按同键缓存整块光栅(HARUKI_SKIA_SUBSCENE_RASTER_CACHE_MB)。
+    native_subtree_cache_size: int = 256  # 子树缓存条目数,0 表示关闭
+    native_subtree_cache_max_mb: int = 32  # 子树缓存内存上限(MB),0 表示关闭
+    # 缩放金字塔:同一资源被缩放到多种尺寸时(卡面缩略图、曲绘、角色图标、卡池横幅等),按 2 的幂盒式缩小并缓存各级,
+    # 缩放缓存未命中时从足够大的最近一级重采样,而不是每次从原图全量重采样。原生渲染器侧见 HARUKI_SKIA_MIP_CACHE_MB。
+    mip_pyramid_cache_size: int = Field(default=0, ge=0)  # 金字塔条目数(按资源),0 表示关闭
+    mip_pyramid_cache_max_mb: int = Field(default=64, ge=0)  # 金字塔内存上限(MB),0 表示关闭
+    # 磁盘金字塔(data/utils/mip_pyramids),跨重启免去原图解码;0 表示关闭
+    mip_pyramid_disk_cache_max_mb: int = Field(default=0, ge=0)
+    # Pillow 文本测宽缓存:按 (字体文件, 字号, 文本) 缓存 bbox/前缀步进,分片加锁的 LRU,满了逐条淘汰。
+    text_measure_cache_size: int = Field(default=200_000, ge=0)  # 测宽缓存条目数,0 表示关闭
+    text_measure_cache_max_mb: int = Field(default=64, ge=0)  # 测宽缓存内存上限(MB),0 表示关闭
+    text_measure_cache_shards: int = Field(default=16, ge=1)  # 分片数(锁条带数)
+    # 每线程 FreeTypeFont 缓存条目数(按 路径+字号),应覆盖一个页面用到的字号组合
+    font_cache_size: int = Field(default=128, ge=1)
+    # Pilmoji 文本的 emoji 图集:按 (emoji 序列, 像素宽) 缓存已解码并缩放好的 RGBA 位图,命中时跳过 PNG 解码与缩放。
+    emoji_atlas_cache_size: int = Field(default=2048, ge=0)  # 图集条目数,0 表示关闭
+    emoji_atlas_cache_max_mb: int = Field(default=32, ge=0)  # 图集内存上限(MB),0 表示关闭
+    # 三角形背景成品缓存:按 (宽, 高, 配色模式, 色相, 5 分钟档位的小时, 种子) 缓存 Pillow 画好的背景,
+    # 常见宽度的页面直接贴图。原生渲染器侧另有同键的缓存(HARUKI_SKIA_TRIANGLE_BG_CACHE_MB)。
+    triangle_bg_cache_size: int = Field(default=32, ge=0)  # 背景缓存条目数,0 表示关闭
+    triangle_bg_cache_max_mb: int = Field(default=96, ge=0)  # 背景缓存内存上限(MB),0 表示关闭
     # 请求体转储(采集对拍 payload/排障用):设为目录时把白名单路径前缀的原始请求 body 落盘。
     # 生产走 HARUKI_DRAWING__DEBUG_DUMP_REQUEST_DIR / _PATHS 短窗开启,采完即关。默认关闭。
     # (tmp 清扫器只删注册过的文件、不扫目录,dump 放哪都不会被清;独立目录只是整洁。)
     debug_dump_request_dir: Path | None = None
     debug_dump_request_paths: str = ""  # 逗号分隔的路径前缀白名单;空 = 不转储
+    # 条件请求:白名单路径前缀的图片响应带强 ETag(渲染 key + 水印策略 + 输出格式设置),
+    # If-None-Match 命中时只算 key 就回 304,不排版不渲染。只列输出除水印外是请求纯函数的路由
+    # (vlive 倒计时、sk 预测这类把"现在"画进正文的不要列)。逗号分隔;空 = 关闭(默认)。
+    conditional_get_paths: str = ""
+    # 水印必须实时的路径前缀:请求未带 dt(水印读当前时钟)时不签发 ETag。
+    conditional_get_fresh_watermark_paths: str = ""
 
     @field_validator(
         "custom_profile_assets_dir",
@@ -261,6 +329,7 @@ DEFAULT_EMOJI_FONT = settings.font.emoji
 
 # Drawing
 DEFAULT_THREAD_POOL_SIZE = settings.drawing.thread_pool_size
+THREAD_POOL_SHORT_LANE_WORKERS = settings.drawing.thread_pool_short_lane_workers
 ISOLATED_WORKER_POOL_SIZE = settings.drawing.isolated_worker_pool_size
 ISOLATED_WORKER_QUEUE_LIMIT = settings.drawing.isolated_worker_queue_limit
 ISOLATED_WORKER_QUEUE_TIMEOUT_SECONDS = settings.drawing.isolated_worker_queue_timeout_seconds
@@ -295,8 +364,30 @@ CUSTOM_PROFILE_MAX_LAYER_PIXELS = settings.drawing.custom_profile_max_layer_pixe
 CUSTOM_PROFILE_MAX_SCENE_BYTES = settings.drawing.custom_profile_max_scene_mb * 1024 * 1024
 CUSTOM_PROFILE_GLYPH_CACHE_SIZE = settings.drawing.custom_profile_glyph_cache_size
 CUSTOM_PROFILE_GLYPH_CACHE_MAX_BYTES = settings.drawing.custom_profile_glyph_cache_max_mb * 1024 * 1024
+CUSTOM_PROFILE_GLYPH_DISK_CACHE_MAX_BYTES = settings.drawing.custom_profile_glyph_disk_cache_max_mb * 1024 * 1024
 CUSTOM_PROFILE_SPRITE_CACHE_SIZE = settings.drawing.custom_profile_sprite_cache_size
 CUSTOM_PROFILE_SPRITE_CACHE_MAX_BYTES = settings.drawing.custom_profile_sprite_cache_max_mb * 1024 * 1024
+CHART_SCORE_CACHE_SIZE = settings.drawing.chart_score_cache_size
+CHART_SCORE_CACHE_MAX_BYTES = settings.drawing.chart_score_cache_max_mb * 1024 * 1024
+CHART_RASTER_CACHE_SIZE = settings.drawing.chart_raster_cache_size
+CHART_RASTER_CACHE_MAX_BYTES = settings.drawing.chart_raster_cache_max_mb * 1024 * 1024
+COMMAND_HELP_LAYOUT_CACHE_SIZE = settings.drawing.command_help_layout_cache_size
+LAYOUT_SNAPSHOT_CACHE_SIZE = settings.drawing.layout_snapshot_cache_size
+LAYOUT_SNAPSHOT_CACHE_MAX_BYTES = settings.drawing.layout_snapshot_cache_max_mb * 1024 * 1024
+LAYOUT_SNAPSHOT_DISK_CACHE_MAX_BYTES = settings.drawing.layout_snapshot_disk_cache_max_mb * 1024 * 1024
+NATIVE_SUBTREE_CACHE_SIZE = settings.drawing.native_subtree_cache_size
+NATIVE_SUBTREE_CACHE_MAX_BYTES = settings.drawing.native_subtree_cache_max_mb * 1024 * 1024
+MIP_PYRAMID_CACHE_SIZE = settings.drawing.mip_pyramid_cache_size
+MIP_PYRAMID_CACHE_MAX_BYTES = settings.drawing.mip_pyramid_cache_max_mb * 1024 * 1024
+MIP_PYRAMID_DISK_CACHE_MAX_BYTES = settings.drawing.mip_pyramid_disk_cache_max_mb * 1024 * 1024
+TEXT_MEASURE_CACHE_SIZE = settings.drawing.text_measure_cache_size
+TEXT_MEASURE_CACHE_MAX_BYTES = settings.drawing.text_measure_cache_max_mb * 1024 * 1024
+TEXT_MEASURE_CACHE_SHARDS = settings.drawing.text_measure_cache_shards
+FONT_CACHE_SIZE = settings.drawing.font_cache_size
+EMOJI_ATLAS_CACHE_SIZE = settings.drawing.emoji_atlas_cache_size
+EMOJI_ATLAS_CACHE_MAX_BYTES = settings.drawing.emoji_atlas_cache_max_mb * 1024 * 1024
+TRIANGLE_BG_CACHE_SIZE = settings.drawing.triangle_bg_cache_size
+TRIANGLE_BG_CACHE_MAX_BYTES = settings.drawing.triangle_bg_cache_max_mb * 1024 * 1024
 
 # Server
 SERVER_HOST = settings.server.host
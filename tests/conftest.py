@@ -39,3 +39,31 @@ def real_fonts():
     """Skip a test that is only meaningful with the real fonts present."""
     if not fonts_available():
         pytest.skip("configured fonts are not installed (CI lint-test has no data/ fonts)")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_custom_profile_state(tmp_path_factory, monkeypatch):
+    """Pooled custom-profile renderers pin resolved paths, and TMP table packs, generated glyphs,
+    layout snapshots and mip pyramids are written to disk: give every test fresh sessions and keep
+    those files out of data/utils."""
+    import sys
+
+    drawer = sys.modules.get("src.sekai.profile.custom_profile.drawer")
+    if drawer is not None:
+        drawer.clear_custom_profile_sessions()
+    monkeypatch.setattr(
+        "src.sekai.profile.custom_profile.tmp_tables.TMP_TABLE_PACK_DIR",
+        tmp_path_factory.getbasetemp() / "tmp_font_tables",
+    )
+    monkeypatch.setattr(
+        "src.sekai.profile.custom_profile.cache.GLYPH_DISK_STORE.root",
+        tmp_path_factory.getbasetemp() / "custom_profile_glyphs",
+    )
+    monkeypatch.setattr(
+        "src.sekai.base.layout_snapshot.LAYOUT_SNAPSHOT_DISK_STORE.root",
+        tmp_path_factory.getbasetemp() / "layout_snapshots",
+    )
+    monkeypatch.setattr(
+        "src.sekai.base.mip_pyramid.MIP_PYRAMID_DISK_STORE.root",
+        tmp_path_factory.getbasetemp() / "mip_pyramids",
+    )
@@ -0,0 +1,262 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+import httpx
+import pytest
+
+from src.core import debug
+from src.core.admission import (
+    ADMISSION,
+    AdmissionController,
+    get_admission_stats,
+    payload_item_count,
+    reset_admission_stats,
+    retry_after_seconds,
+)
+from src.core.debug import (
+    STREAMED_PARTS_HEADER,
+    current_request_context,
+    current_request_scheduling,
+    current_request_stage,
+    install_debug_middleware,
+)
+from src.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def _admission_settings(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "admission_cost_budget_seconds", 10.0)
+    monkeypatch.setattr(settings.drawing, "admission_cheap_cost_seconds", 0.5)
+    monkeypatch.setattr(settings.drawing, "admission_heavy_budget_fraction", 0.5)
+    monkeypatch.setattr(settings.drawing, "admission_default_cost_seconds", 0.3)
+    reset_admission_stats()
+    yield
+    reset_admission_stats()
+
+
+def _calibrate(controller: AdmissionController, path: str, seconds_per_item: float, base: float = 0.05) -> None:
+    for items in (0, 10, 50, 100, 200, 300, 20, 5):
+        ticket, _ = controller.try_admit(path, items)
+        controller.release(ticket, base + seconds_per_item * items)
+
+
+def test_payload_item_count_reads_the_top_two_levels():
+    assert payload_item_count(b'{"cards": [1, 2, 3], "profile": {"honors": [1, 2]}, "region": "jp"}') == 5
+    assert payload_item_count(b'[{"pcards": [1]}, {"pcards": [1, 2]}]') == 5
+    assert payload_item_count(b"not json") == 0
+    assert payload_item_count(b"") == 0
+
+
+def test_the_predictor_fits_cost_per_item_from_observed_renders():
+    controller = AdmissionController()
+    assert controller.predict("/box", 300) == 0.3  # uncalibrated: the configured default
+
+    _calibrate(controller, "/box", 0.02)
+
+    assert controller.predict("/box", 300) == pytest.approx(6.05, rel=1e-6)
+    assert controller.predict("/box", 0) == pytest.approx(0.05, rel=1e-6)
+    path_stats = controller.stats()["paths"]["/box"]
+    assert path_stats["calibrated"]
+    assert path_stats["seconds_per_item"] == pytest.approx(0.02)
+    assert path_stats["mean_abs_error_seconds"] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_cheap_requests_keep_headroom_that_heavy_ones_cannot_take():
+    controller = AdmissionController()
+    _calibrate(controller, "/box", 0.02)
+    _calibrate(controller, "/stamp", 0.0, base=0.1)
+
+    first, _ = controller.try_admit("/box", 200)  # 4.05s: admitted into an idle server
+    heavy, retry_after = controller.try_admit("/box", 100)  # 4.05 + 2.05 > 0.5 * 10
+    cheap, _ = controller.try_admit("/stamp", 0)
+
+    assert first is not None
+    assert heavy is None
+    assert retry_after == 1
+    assert cheap is not None
+    assert controller.stats()["rejected"] == {"cheap": 0, "heavy": 1}
+
+    controller.release(first, None)
+    controller.release(cheap, None)
+    assert controller.stats()["inflight_predicted_seconds"] == 0.0
+
+
+def test_an_idle_server_admits_one_request_of_any_cost():
+    controller = AdmissionController()
+    _calibrate(controller, "/box", 1.0)
+
+    ticket, _ = controller.try_admit("/box", 300)
+    again, retry_after = controller.try_admit("/box", 300)
+
+    assert ticket is not None
+    assert again is None
+    assert retry_after == 60
+
+
+def test_retry_after_scales_with_the_excess():
+    assert retry_after_seconds(0.01) == 1
+    assert retry_after_seconds(1000.0) == 60
+    assert retry_after_seconds(3.0 * settings.drawing.thread_pool_size) == 3
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    install_debug_middleware(app)
+
+    @app.post("/api/pjsk/card/box")
+    async def _render(body: dict):
+        return Response(content=b"png", media_type="image/png")
+
+    return app
+
+
+async def _post_pair(app: FastAPI, first_body, second_body) -> tuple[httpx.Response, httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        first = await client.post("/api/pjsk/card/box", json=first_body)
+        ADMISSION.try_admit("/api/pjsk/card/box", 10_000)  # a heavy render still in flight
+        second = await client.post("/api/pjsk/card/box", json=second_body)
+        return first, second
+
+
+def test_middleware_rejects_over_budget_with_retry_after_and_calibrates_on_success(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "admission_default_cost_seconds", 6.0)
+
+    first, second = asyncio.run(_post_pair(_app(), {"cards": [1, 2]}, {"cards": [1, 2, 3]}))
+
+    assert first.status_code == 200
+    assert second.status_code == 503
+    assert second.json()["status"] == "overloaded"
+    assert int(second.headers["Retry-After"]) >= 1
+    stats = get_admission_stats()
+    assert stats["paths"]["/api/pjsk/card/box"]["observations"] == 1
+    assert stats["rejected"]["heavy"] == 1
+
+
+def _streaming_app(held: list[float]) -> FastAPI:
+    app = FastAPI()
+    install_debug_middleware(app)
+
+    async def _body():
+        yield b"part-1"
+        # The handler has long returned; the batch is still rendering its second card.
+        held.append(get_admission_stats()["inflight_predicted_seconds"])
+        yield b"part-2"
+
+    @app.post("/api/pjsk/profile/custom-profile-cards")
+    async def _render(body: dict):
+        return StreamingResponse(_body(), media_type="multipart/mixed", headers={STREAMED_PARTS_HEADER: "2"})
+
+    return app
+
+
+def test_a_streamed_batch_holds_its_admission_ticket_until_the_last_part():
+    held: list[float] = []
+
+    async def _run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=_streaming_app(held))
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.post("/api/pjsk/profile/custom-profile-cards", json={"cards": [1]})
+
+    response = asyncio.run(_run())
+
+    assert response.content == b"part-1part-2"
+    assert held == [0.3]
+    stats = get_admission_stats()
+    assert stats["inflight_predicted_seconds"] == 0.0
+    assert stats["paths"]["/api/pjsk/profile/custom-profile-cards"]["observations"] == 1
+
+
+def test_calibration_subtracts_the_drawing_pool_queue_wait():
+    app = FastAPI()
+    install_debug_middleware(app)
+
+    @app.post("/api/pjsk/card/box")
+    async def _render(body: dict):
+        current_request_scheduling().pool_wait_seconds += 30.0  # queued behind a saturated pool
+        return Response(content=b"png", media_type="image/png")
+
+    async def _run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.post("/api/pjsk/card/box", json={"cards": [1]})
+
+    assert asyncio.run(_run()).status_code == 200
+    model = ADMISSION._models["/api/pjsk/card/box"]
+    assert model.observations == 1
+    assert model.sum_y == 0.0, "queue wait is not render cost (and it dwarfs this render's wall time)"
+
+
+@pytest.mark.parametrize(("budget", "parsed"), [(0.0, 0), (10.0, 1)])
+def test_the_body_is_only_parsed_for_items_when_a_budget_is_set(monkeypatch, budget, parsed):
+    monkeypatch.setattr(settings.drawing, "admission_cost_budget_seconds", budget)
+    counted: list[bytes] = []
+
+    def _counting(body: bytes) -> int:
+        counted.append(body)
+        return payload_item_count(body)
+
+    monkeypatch.setattr(debug, "payload_item_count", _counting)
+
+    async def _run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.post("/api/pjsk/card/box", json={"cards": [1, 2, 3]})
+
+    assert asyncio.run(_run()).status_code == 200
+    assert len(counted) == parsed
+    assert ADMISSION._models["/api/pjsk/card/box"].sum_x == 3 * parsed
+
+
+def test_a_matching_revalidation_skips_admission(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "conditional_get_paths", "/api/pjsk/card/box")
+    monkeypatch.setattr(settings.drawing, "conditional_get_fresh_watermark_paths", "")
+    monkeypatch.setattr(settings.drawing, "admission_default_cost_seconds", 6.0)
+    body = {"cards": [1, 2], "dt": 1700000000000}
+
+    async def _run() -> tuple[httpx.Response, httpx.Response]:
+        transport = httpx.ASGITransport(app=_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            first = await client.post("/api/pjsk/card/box", json=body)
+            ADMISSION.try_admit("/api/pjsk/card/box", 10_000)  # the budget is now full for heavy work
+            again = await client.post("/api/pjsk/card/box", json=body, headers={"If-None-Match": first.headers["etag"]})
+            return first, again
+
+    first, again = asyncio.run(_run())
+
+    assert first.status_code == 200
+    assert again.status_code == 412  # a matching If-None-Match on POST
+    stats = get_admission_stats()
+    assert stats["admitted"]["heavy"] == 2  # the first render and the reservation above, not the 412
+    assert stats["rejected"]["heavy"] == 0
+
+
+def test_a_streamed_batch_stays_in_flight_and_in_its_request_context_until_the_last_part():
+    seen: list[tuple[str, int, str]] = []
+    app = FastAPI()
+    install_debug_middleware(app)
+
+    async def _body():
+        yield b"part-1"
+        seen.append((current_request_context()["request_id"], debug._inflight_requests, current_request_stage()))
+        yield b"part-2"
+
+    @app.post("/api/pjsk/profile/custom-profile-cards")
+    async def _render(body: dict):
+        return StreamingResponse(_body(), media_type="multipart/mixed", headers={STREAMED_PARTS_HEADER: "2"})
+
+    async def _run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.post("/api/pjsk/profile/custom-profile-cards", json={"cards": [1]})
+
+    inflight_before = debug._inflight_requests
+    response = asyncio.run(_run())
+
+    assert response.content == b"part-1part-2"
+    [(request_id, inflight, stage)] = seen
+    assert request_id != "-"
+    assert inflight == inflight_before + 1
+    assert stage == "streaming"
+    assert debug._inflight_requests == inflight_before
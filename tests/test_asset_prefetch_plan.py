@@ -0,0 +1,107 @@
+"""Pins AssetPrefetchPlan: deduplicated registration, the raise/placeholder/none missing modes,
+fallback chains and how differing registrations of one path share a probe but not a result."""
+
+import asyncio
+
+from PIL import Image
+import pytest
+
+from src.sekai.base import utils
+from src.sekai.base.utils import AssetImageRef, AssetPrefetchPlan
+
+
+@pytest.fixture
+def assets(tmp_path):
+    Image.new("RGBA", (4, 3), (255, 0, 0, 255)).save(tmp_path / "a.png")
+    Image.new("RGBA", (6, 5), (0, 255, 0, 255)).save(tmp_path / "b.png")
+    return tmp_path
+
+
+def _resolve(plan: AssetPrefetchPlan):
+    return asyncio.run(plan.resolve("test"))
+
+
+def test_same_path_registered_twice_is_probed_once(assets):
+    plan = AssetPrefetchPlan(assets)
+
+    assert plan.add("a.png") == "a.png"
+    assert plan.add("a.png") == "a.png"
+    plan.add("b.png")
+    resolved = _resolve(plan)
+
+    assert len(plan) == 2
+    assert set(resolved) == {"a.png", "b.png"}
+    assert isinstance(resolved["a.png"], AssetImageRef)
+    assert (resolved["a.png"].width, resolved["a.png"].height) == (4, 3)
+
+
+def test_missing_asset_under_each_mode(assets):
+    plan = AssetPrefetchPlan(assets)
+    plan.add("gone_placeholder.png")
+    plan.add("gone_none.png", on_missing="none")
+    plan.add(None, on_missing="none")
+    plan.add("", on_missing="placeholder")
+    resolved = _resolve(plan)
+
+    assert isinstance(resolved["gone_placeholder.png"], Image.Image)
+    assert isinstance(resolved[""], Image.Image)
+    assert resolved["gone_none.png"] is None
+    assert resolved[None] is None
+
+    raising = AssetPrefetchPlan(assets)
+    raising.add("gone.png", on_missing="raise")
+    with pytest.raises(FileNotFoundError):
+        _resolve(raising)
+
+    empty = AssetPrefetchPlan(assets)
+    empty.add(None, on_missing="raise")
+    with pytest.raises(ValueError, match="不能为空"):
+        _resolve(empty)
+
+
+def test_fallback_chain_takes_the_first_candidate_that_loads(assets):
+    plan = AssetPrefetchPlan(assets)
+    plan.add("gone.png", "", "b.png", "a.png", on_missing="raise")
+    plan.add("a.png", "b.png")
+
+    resolved = _resolve(plan)
+
+    assert (resolved["gone.png"].width, resolved["gone.png"].height) == (6, 5)
+    assert (resolved["a.png"].width, resolved["a.png"].height) == (4, 3)
+
+
+def test_differing_registrations_share_the_probe_but_keep_their_own_mode_and_chain(assets, monkeypatch):
+    probed: list[str] = []
+    real_probe = utils._load_asset_image_ref_sync
+
+    def _counting_probe(base_path, path):
+        probed.append(path)
+        return real_probe(base_path, path)
+
+    monkeypatch.setattr(utils, "_load_asset_image_ref_sync", _counting_probe)
+    plan = AssetPrefetchPlan(assets)
+    background = plan.add("gone.png", on_missing="none")
+    with_fallback = plan.add("gone.png", "b.png", on_missing="placeholder")
+    placeholder = plan.add("gone.png")
+
+    resolved = _resolve(plan)
+
+    assert background == "gone.png"
+    assert plan.add("gone.png", on_missing="none") == background
+    assert len({background, with_fallback, placeholder}) == len(plan) == 3
+    assert resolved[background] is None  # the drawer's own fallback still applies
+    assert (resolved[with_fallback].width, resolved[with_fallback].height) == (6, 5)
+    assert isinstance(resolved[placeholder], Image.Image)
+    assert sorted(probed) == ["b.png", "gone.png"]
+
+
+def test_a_raising_registration_does_not_change_a_lenient_one(assets):
+    lenient = AssetPrefetchPlan(assets)
+    lenient.add("../outside.png", on_missing="none")
+    assert _resolve(lenient)["../outside.png"] is None
+
+    mixed = AssetPrefetchPlan(assets)
+    mixed.add("gone.png", on_missing="none")
+    mixed.add("gone.png", on_missing="raise")
+    with pytest.raises(FileNotFoundError):
+        _resolve(mixed)
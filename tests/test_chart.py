@@ -71,3 +71,75 @@ def test_render_chart_mem_image_falls_back_to_png(monkeypatch):
 
     assert mem_image is png
     assert (width, height, transport) == (7, 4, "png")
+
+
+def _chart_request(**overrides) -> GenerateMusicChartRequest:
+    values = {
+        "music_id": 1,
+        "title": "Tell Your World",
+        "artist": "kz",
+        "difficulty": "master",
+        "play_level": 26,
+        "jacket_path": "jacket.png",
+        "sus_path": "master.sus",
+        "style_path": "chart.css",
+        "note_host": "notes",
+    }
+    values.update(overrides)
+    return GenerateMusicChartRequest(**values)
+
+
+def test_scores_and_style_sheets_are_cached_by_file_signature(tmp_path, monkeypatch):
+    from src.sekai.base.cache import BoundedCache
+    from src.sekai.chart.cache import get_chart_cache_stats
+
+    (tmp_path / "master.sus").write_text("#00002: 4\n", encoding="utf-8")
+    (tmp_path / "chart.css").write_text("body {}", encoding="utf-8")
+    opened: list[str] = []
+
+    class FakeScore:
+        def __init__(self, path):
+            opened.append(path)
+            self.meta = None
+
+        def set_meta(self, **meta):
+            assert self.meta is None, "a cached score must never be mutated again"
+            self.meta = meta
+
+        def event_count(self):
+            return 1
+
+        def note_count(self):
+            return 0
+
+    monkeypatch.setattr(drawer, "ASSETS_BASE_DIR", tmp_path)
+    monkeypatch.setattr(drawer, "Score", type("Score", (), {"open": staticmethod(FakeScore)}))
+    for name in ("CHART_SCORE_CACHE", "CHART_STYLE_CACHE"):
+        pool = BoundedCache(name, 8, 1 << 20, lambda value: 1)
+        monkeypatch.setattr(drawer, name, pool)
+        monkeypatch.setattr(f"src.sekai.chart.cache.{name}", pool)
+
+    request = _chart_request()
+    first = drawer._load_score_with_meta(request, drawer._score_cache_key(request))
+    again = drawer._load_score_with_meta(request, drawer._score_cache_key(request))
+    assert again is first
+    assert first.meta["title"] == "Tell Your World"
+    assert drawer.load_style_sheet("chart.css") == drawer.load_style_sheet("chart.css") == "body {}"
+
+    # Different meta is a different entry; an in-place replacement changes the signature.
+    drawer._load_score_with_meta(_chart_request(title="Other"), drawer._score_cache_key(_chart_request(title="Other")))
+    (tmp_path / "master.sus").write_text("#00002: 4\n#00003: 4\n", encoding="utf-8")
+    (tmp_path / "chart.css").write_text("body { color: red }", encoding="utf-8")
+    drawer._load_score_with_meta(request, drawer._score_cache_key(request))
+    assert drawer.load_style_sheet("chart.css") == "body { color: red }"
+    assert len(opened) == 3
+
+    stats = get_chart_cache_stats()
+    assert stats["score"]["hits"] == 1
+    assert stats["style"]["hits"] == 1
+    assert stats["raster"]["enabled"] is False
+
+
+def test_inline_chart_json_is_never_cached():
+    request = _chart_request(sus_path=None, chart_json={"NoteList": []})
+    assert drawer._score_cache_key(request) is None
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from src.sekai.misc import drawer
+from src.sekai.misc.cache import COMMAND_HELP_LAYOUT_CACHE
+from src.sekai.misc.model import CommandHelpRenderRequest
+from src.settings import DEFAULT_FONT
+
+_MARKDOWN = "# 音乐与乐曲\n\n## 用法\n- `/查曲 Tell Your World` 查询歌曲\n- 难度：easy / expert\n\n" + "长" * 150
+
+
+class _FixedWidthBatch:
+    """Stand-in for the wheel's ``measure_text_batch``: every character is 10px wide."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, _font_dir, _font_name, requests):
+        self.calls += 1
+        return [
+            {"pillow_bbox": (0.0, 4.0, 10.0 * len(text), 24.0), "ascent": 22.0, "descent": 6.0}
+            for text, _size in requests
+        ]
+
+
+def _reference_wrap(text: str, max_width: int) -> list[str]:
+    """The old one-measurement-per-character loop, with the same 10px-per-character metric."""
+    text = text.strip()
+    lines: list[str] = []
+    current = ""
+    for char in text:
+        if char == "\t":
+            char = " "
+        candidate = current + char
+        if current and len(candidate) * 10 > max_width:
+            lines.append(current.rstrip())
+            current = "" if char == " " else char
+            continue
+        current = candidate
+    if current.strip():
+        lines.append(current.rstrip())
+    return lines or [text]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_layout_cache():
+    COMMAND_HELP_LAYOUT_CACHE.clear()
+    yield
+    COMMAND_HELP_LAYOUT_CACHE.clear()
+
+
+@pytest.mark.parametrize("max_width", [35, 200, 956])
+def test_wrap_matches_per_character_wrap(max_width):
+    text = "quick brown fox\tjumps  over 这是一段用于测试折行的说明 " * 12
+    measurer = drawer._CommandHelpMeasurer("native", _FixedWidthBatch())
+
+    assert drawer._wrap_command_help_text(measurer, DEFAULT_FONT, 21, text, max_width) == _reference_wrap(
+        text, max_width
+    )
+
+
+def test_layout_is_cached_per_markdown_digest(monkeypatch):
+    batch = _FixedWidthBatch()
+    monkeypatch.setattr(drawer, "_command_help_measurer", lambda: drawer._CommandHelpMeasurer("native", batch))
+    hits = COMMAND_HELP_LAYOUT_CACHE.stats()["hits"]
+
+    first = asyncio.run(drawer._build_command_help_canvas(CommandHelpRenderRequest(markdown=_MARKDOWN)))
+    calls = batch.calls
+    second = asyncio.run(
+        drawer._build_command_help_canvas(CommandHelpRenderRequest(markdown=_MARKDOWN, title="override"))
+    )
+
+    assert first is not second
+    assert calls > 0
+    assert batch.calls == calls
+    assert COMMAND_HELP_LAYOUT_CACHE.stats()["hits"] == hits + 1
+    layout = COMMAND_HELP_LAYOUT_CACHE.get(drawer._command_help_layout_key(_MARKDOWN, "native"))
+    assert layout.title == "音乐与乐曲"
+    assert [section.title for section in layout.sections] == ["用法"]
+    # 150 ten-pixel characters in a 956px column: wrapped at 95 characters per line.
+    assert [len(line.text) for line in layout.sections[0].lines[-2:]] == [95, 55]
+
+
+def test_native_measuring_failure_falls_back_to_pillow_metrics():
+    def broken(_font_dir, _font_name, _requests):
+        raise ValueError("font could not be resolved without fallback")
+
+    layout = drawer._compute_command_help_layout(_MARKDOWN, drawer._CommandHelpMeasurer("native", broken))
+
+    assert layout.sections
+    assert COMMAND_HELP_LAYOUT_CACHE.get(drawer._command_help_layout_key(_MARKDOWN, "native")) is layout
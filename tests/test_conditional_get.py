@@ -0,0 +1,131 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+import httpx
+import pytest
+
+from src.core.conditional import (
+    compute_render_etag,
+    get_conditional_get_stats,
+    if_none_match_matches,
+    reset_conditional_get_stats,
+)
+from src.core.debug import install_debug_middleware
+from src.settings import settings
+
+_PATH = "/api/pjsk/stamp/list"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "conditional_get_paths", "/api/pjsk/stamp")
+    monkeypatch.setattr(settings.drawing, "conditional_get_fresh_watermark_paths", "")
+    reset_conditional_get_stats()
+    yield
+    reset_conditional_get_stats()
+
+
+def _app(calls: list[bytes]) -> FastAPI:
+    app = FastAPI()
+    install_debug_middleware(app)
+
+    @app.post(_PATH)
+    async def _render(body: dict):
+        calls.append(repr(body).encode())
+        return Response(content=b"png", media_type="image/png")
+
+    @app.get(_PATH)
+    async def _render_get(region: str):
+        calls.append(region.encode())
+        return Response(content=b"png", media_type="image/png")
+
+    return app
+
+
+async def _post(app: FastAPI, json_body, headers=None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        return await client.post(_PATH, json=json_body, headers=headers or {})
+
+
+async def _get(app: FastAPI, query: str, headers=None) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        return await client.get(f"{_PATH}?{query}", headers=headers or {})
+
+
+def test_matching_if_none_match_on_post_fails_the_precondition_without_rendering():
+    calls: list[bytes] = []
+    app = _app(calls)
+
+    first = asyncio.run(_post(app, {"region": "jp", "dt": 1700000000000}))
+    etag = first.headers["etag"]
+    second = asyncio.run(_post(app, {"region": "jp", "dt": 1700000000000}, {"If-None-Match": etag}))
+    changed = asyncio.run(_post(app, {"region": "en", "dt": 1700000000000}, {"If-None-Match": etag}))
+
+    assert first.status_code == 200
+    assert etag.startswith('"')
+    assert second.status_code == 412
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(calls) == 2
+    assert get_conditional_get_stats()["totals"] == {
+        "not_modified": 0,
+        "precondition_failed": 1,
+        "etag_issued": 2,
+        "fresh_watermark": 0,
+    }
+
+
+def test_matching_if_none_match_on_get_is_not_modified():
+    calls: list[bytes] = []
+    app = _app(calls)
+
+    first = asyncio.run(_get(app, "region=jp"))
+    second = asyncio.run(_get(app, "region=jp", {"If-None-Match": first.headers["etag"]}))
+
+    assert (first.status_code, second.status_code) == (200, 304)
+    assert calls == [b"jp"]
+    assert get_conditional_get_stats()["totals"]["not_modified"] == 1
+
+
+def test_clock_watermark_renders_get_a_weak_validator():
+    clock_etag, _ = compute_render_etag(_PATH, "", b'{"region": "jp"}')
+    fixed_etag, _ = compute_render_etag(_PATH, "", b'{"region": "jp", "dt": 1700000000000}')
+
+    assert clock_etag.startswith('W/"')
+    assert fixed_etag.startswith('"')
+    assert if_none_match_matches(clock_etag, clock_etag)
+    assert if_none_match_matches(clock_etag.removeprefix("W/"), clock_etag)
+
+
+def test_fresh_watermark_paths_never_tag_a_clock_watermark(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "conditional_get_fresh_watermark_paths", "/api/pjsk/stamp")
+
+    assert compute_render_etag(_PATH, "", b'{"region": "jp"}') == (None, "fresh_watermark")
+    etag, skipped = compute_render_etag(_PATH, "", b'{"region": "jp", "dt": 1700000000000}')
+    assert etag is not None
+    assert skipped is None
+
+
+def test_unlisted_paths_and_unparsable_bodies_get_no_etag():
+    assert compute_render_etag("/api/pjsk/card/list", "", b"{}") == (None, None)
+    assert compute_render_etag(_PATH, "", b"not json") == (None, None)
+
+
+def test_etag_follows_output_format_settings(monkeypatch):
+    body = b'{"dt": 1700000000000}'
+    png_etag, _ = compute_render_etag(_PATH, "", body)
+    monkeypatch.setattr(settings.drawing, "export_image_format", "jpg")
+    jpg_etag, _ = compute_render_etag(_PATH, "", body)
+    assert png_etag != jpg_etag
+
+
+def test_if_none_match_uses_weak_comparison():
+    assert if_none_match_matches('W/"abc", "def"', '"abc"')
+    assert if_none_match_matches("*", '"abc"')
+    assert not if_none_match_matches('"abcd"', '"abc"')
+    assert not if_none_match_matches(None, '"abc"')
@@ -40,3 +40,40 @@ def test_encode_image_accepts_jpeg_subsampling_override():
     with Image.open(buffer) as decoded:
         assert decoded.size == (8, 6)
         assert decoded.mode == "RGB"
+
+
+def test_encode_image_uses_native_png_encoder_for_large_rgba(monkeypatch):
+    from src.core import png_encode
+
+    calls = []
+
+    def fake_encode(pixels, width, height, level):
+        calls.append((len(pixels), width, height, level))
+        return b"native-png"
+
+    monkeypatch.setattr(png_encode, "_native_png_encoder", lambda: fake_encode)
+    monkeypatch.setattr(png_encode.settings.drawing, "pillow_native_png_min_pixels", 48)
+
+    buffer, media_type, _ = _encode_image(Image.new("RGBA", (8, 6), (10, 20, 30, 40)), "png", 85)
+    assert media_type == "image/png"
+    assert buffer.getvalue() == b"native-png"
+    assert calls == [(8 * 6 * 4, 8, 6, "fastest")]
+
+    # Below the threshold, and for non-RGBA modes, Pillow keeps encoding.
+    for image in (Image.new("RGBA", (4, 4)), Image.new("RGB", (8, 6))):
+        buffer, _, _ = _encode_image(image, "png", 85)
+        with Image.open(buffer) as decoded:
+            assert decoded.format == "PNG"
+    assert len(calls) == 1
+
+
+def test_encode_image_falls_back_to_pillow_without_native_encoder(monkeypatch):
+    from src.core import png_encode
+
+    monkeypatch.setattr(png_encode, "_native_png_encoder", lambda: None)
+    monkeypatch.setattr(png_encode.settings.drawing, "pillow_native_png_min_pixels", 1)
+
+    buffer, _, _ = _encode_image(Image.new("RGBA", (8, 6), (10, 20, 30, 40)), "png", 85)
+    with Image.open(buffer) as decoded:
+        assert decoded.mode == "RGBA"
+        assert decoded.getpixel((0, 0)) == (10, 20, 30, 40)
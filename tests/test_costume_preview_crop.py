@@ -1,12 +1,18 @@
 import asyncio
 
+import numpy as np
 from PIL import Image, ImageDraw
+import pytest
 
 from src.sekai.base.plot import Canvas
+from src.sekai.base.utils import AssetImageRef
+from src.sekai.costume import drawer as costume_drawer
+from src.sekai.costume.cache import PreviewBBoxIndex
 from src.sekai.costume.drawer import (
     COSTUME_DETAIL_PREVIEW_SIZE,
     _costume_preview_cover_crop_box,
     _CostumePreviewBox,
+    _preview_foreground_bbox,
 )
 
 
@@ -47,3 +53,84 @@ def test_costume_preview_box_fills_exact_frame_size_with_the_cropped_foreground(
         60,
         55,
     )
+
+
+def _reference_foreground_bbox(image):
+    """The original per-pixel scan, kept here to pin the vectorized detector to it."""
+    source = image.convert("RGBA")
+    alpha_bbox = source.getchannel("A").getbbox()
+    if alpha_bbox and alpha_bbox != (0, 0, source.width, source.height):
+        return alpha_bbox
+    scale = min(1.0, 700 / source.width)
+    small_size = (max(1, round(source.width * scale)), max(1, round(source.height * scale)))
+    sample = source.resize(small_size, Image.Resampling.BILINEAR) if small_size != source.size else source
+    pixels = sample.load()
+    width, height = sample.size
+    edge_width = max(2, round(width * 0.02))
+    min_col_hits = max(2, round(height * 0.015))
+    min_row_hits = max(2, round(width * 0.015))
+    col_hits = [0] * width
+    row_hits = [0] * height
+    for y in range(height):
+        edge_pixels = []
+        for x in range(edge_width):
+            edge_pixels.append(pixels[x, y])
+            edge_pixels.append(pixels[width - 1 - x, y])
+        bg = [sum(item[c] for item in edge_pixels) // len(edge_pixels) for c in range(3)]
+        for x in range(width):
+            r, g, b, a = pixels[x, y]
+            if a > 16 and max(abs(r - bg[0]), abs(g - bg[1]), abs(b - bg[2])) > 36:
+                col_hits[x] += 1
+                row_hits[y] += 1
+    xs = [idx for idx, hits in enumerate(col_hits) if hits >= min_col_hits]
+    ys = [idx for idx, hits in enumerate(row_hits) if hits >= min_row_hits]
+    if not xs or not ys:
+        return None
+    inv_scale = 1.0 / scale
+    return (
+        max(0, round(min(xs) * inv_scale)),
+        max(0, round(min(ys) * inv_scale)),
+        min(source.width, round((max(xs) + 1) * inv_scale)),
+        min(source.height, round((max(ys) + 1) * inv_scale)),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_foreground_bbox_matches_the_per_pixel_scan(seed):
+    rng = np.random.default_rng(seed)
+    noise = rng.integers(0, 255, size=(300, 900, 4), dtype=np.uint8)
+    noise[..., 3] = rng.choice([0, 255], size=(300, 900), p=[0.05, 0.95])
+    image = Image.fromarray(noise, "RGBA")
+    # A gradient background with a solid subject, as the real previews look.
+    gradient = Image.linear_gradient("L").resize((1400, 1000)).convert("RGBA")
+    ImageDraw.Draw(gradient).rectangle((500, 120, 860, 940), fill=(80, 60, 55, 255))
+    gradient.paste(image.resize((200, 120)), (560, 300))
+
+    assert _preview_foreground_bbox(gradient) == _reference_foreground_bbox(gradient)
+    assert _preview_foreground_bbox(image) == _reference_foreground_bbox(image)
+
+
+def test_preview_crop_box_is_served_from_the_index_without_decoding(tmp_path, monkeypatch):
+    image = Image.new("RGBA", (2800, 2000), (250, 252, 254, 255))
+    ImageDraw.Draw(image).rectangle((1080, 260, 1780, 1920), fill=(80, 60, 55, 255))
+    asset = tmp_path / "preview.png"
+    image.save(asset)
+    stat = asset.stat()
+    ref = AssetImageRef(path=asset, size=image.size, mode="RGBA", mtime_ns=stat.st_mtime_ns, file_size=stat.st_size)
+    index_path = tmp_path / "index" / "bbox.json"
+    monkeypatch.setattr(costume_drawer, "COSTUME_PREVIEW_BBOX_INDEX", PreviewBBoxIndex(index_path))
+
+    cold = costume_drawer._detect_preview_crop_box(ref)
+
+    def no_decode(_source):
+        raise AssertionError("warm preview must not be decoded")
+
+    monkeypatch.setattr(costume_drawer, "resolve_image_source_sync", no_decode)
+    # A fresh index object reads the persisted file, as a restarted worker would.
+    monkeypatch.setattr(costume_drawer, "COSTUME_PREVIEW_BBOX_INDEX", PreviewBBoxIndex(index_path))
+    warm = costume_drawer._detect_preview_crop_box(ref)
+
+    assert warm == cold == _costume_preview_cover_crop_box(image)
+    replaced = AssetImageRef(path=asset, size=image.size, mode="RGBA", mtime_ns=stat.st_mtime_ns + 1, file_size=1)
+    with pytest.raises(AssertionError, match="must not be decoded"):
+        costume_drawer._detect_preview_crop_box(replaced)
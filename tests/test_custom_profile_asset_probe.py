@@ -0,0 +1,86 @@
+"""Pins the request-scoped asset probe memo shared by PNGRenderer and the custom-profile scene."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.sekai.profile.custom_profile import asset_probe
+from src.sekai.profile.custom_profile.asset_probe import AssetProbeMemo
+from src.sekai.profile.custom_profile.cache import MISSING_FILE
+from src.sekai.profile.custom_profile.card_prefab import CardDisplayList, CardSpriteOp, CardSpriteRef
+import src.sekai.profile.custom_profile.skia as skia_mod
+
+
+def _counting_stat(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    real_stat = os.stat
+
+    def _stat(path, *args, **kwargs):
+        calls.append(os.fspath(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(asset_probe.os, "stat", _stat)
+    return calls
+
+
+def test_exists_is_file_and_signature_share_one_stat_per_path(tmp_path: Path, monkeypatch):
+    sprite = tmp_path / "frame.png"
+    sprite.write_bytes(b"x" * 7)
+    expected_signature = (sprite.stat().st_mtime_ns, 7)
+    calls = _counting_stat(monkeypatch)
+    memo = AssetProbeMemo()
+
+    assert memo.exists(sprite)
+    assert memo.is_file(sprite)
+    assert memo.signature(sprite) == expected_signature
+    assert not memo.is_file(tmp_path)
+    assert not memo.exists(tmp_path / "missing.png")
+    assert memo.signature(tmp_path / "missing.png") == MISSING_FILE
+
+    assert calls == [str(sprite), str(tmp_path), str(tmp_path / "missing.png")]
+    assert (memo.probes, memo.deduplicated) == (3, 3)
+
+
+def test_native_info_and_resolve_verdicts_are_memoized_but_errors_are_not(tmp_path: Path):
+    memo = AssetProbeMemo()
+    seen: list[str] = []
+
+    def _probe(asset_path: str):
+        seen.append(asset_path)
+        if asset_path == "broken.png":
+            raise ValueError("malformed header")
+        return {"width": 4, "height": 2}
+
+    assert memo.native_info("a.png", _probe) == {"width": 4, "height": 2}
+    assert memo.native_info("a.png", _probe) is memo.native_info("a.png", _probe)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="malformed"):
+            memo.native_info("broken.png", _probe)
+    assert seen == ["a.png", "broken.png", "broken.png"]
+    assert memo.resolve(tmp_path / "gone.png", strict=True) is None
+    assert memo.relative_path(tmp_path / "a" / "b.png", tmp_path) == "a/b.png"
+    assert memo.relative_path(tmp_path.parent / "outside.png", tmp_path) is None
+
+
+def test_card_display_list_preflight_stats_a_shared_frame_once(tmp_path: Path, monkeypatch):
+    frame = tmp_path / "frame.png"
+    frame.write_bytes(b"png")
+    monkeypatch.setattr(skia_mod, "ASSETS_BASE_DIR", tmp_path)
+    calls = _counting_stat(monkeypatch)
+    ref = CardSpriteRef("frame", path=frame, resource_policy="required")
+    display_list = CardDisplayList(
+        "full",
+        (20, 10),
+        tuple(CardSpriteOp(ref, (0.0, 0.0, 20.0, 10.0)) for _ in range(5)),
+    )
+    memo = AssetProbeMemo()
+
+    prepared = skia_mod._prepare_native_card_display_list(display_list, None, memo)
+
+    assert prepared is not None
+    assert set(prepared.asset_paths.values()) == {"frame.png"}
+    assert calls == [str(frame)]
+    assert memo.deduplicated > memo.probes
@@ -0,0 +1,127 @@
+"""Pins /profile/custom-profile-cards: one validated batch, parts streamed in completion order."""
+
+import asyncio
+import email.parser
+
+from fastapi import FastAPI
+import httpx
+
+from src.core.debug import STREAMED_PARTS_HEADER
+from src.core.image_payload import EncodedImagePayload
+from src.core.pjsk import profile as profile_route
+
+
+def _card(seq: int, card_id: int, *, text: str = "hi") -> dict:
+    return {
+        "seq": seq,
+        "customProfileId": 7,
+        "customProfileCardId": card_id,
+        "customProfileCard": {"texts": [{"objectData": {"text": text}}]},
+    }
+
+
+def _profile(*cards: dict) -> dict:
+    return {"response": {"user": {"region": "JP"}, "userDeck": {"leader": 1}, "userCustomProfileCards": list(cards)}}
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(profile_route.router, prefix="/profile")
+    return app
+
+
+async def _post(body: dict) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        return await client.post("/profile/custom-profile-cards", json=body)
+
+
+def _parts(response: httpx.Response) -> list:
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {response.headers['content-type']}\r\n\r\n".encode() + response.content
+    )
+    return message.get_payload()
+
+
+def test_cards_share_one_context_and_stream_in_completion_order(monkeypatch):
+    seen = []
+
+    async def _render(request):
+        seen.append(request)
+        seq = request.card["seq"]
+        await asyncio.sleep({1: 0.2, 2: 0.0, 3: 0.05}[seq])
+        if seq == 3:
+            raise ValueError("bad card")
+        return EncodedImagePayload(
+            image_bytes=f"png{seq}".encode(),
+            media_type="image/png",
+            filename="image.png",
+            image_width=1,
+            image_height=1,
+            image_mode="RGBA",
+            encode_elapsed=0.0,
+            backend="skia",
+        )
+
+    monkeypatch.setattr(profile_route, "_render_custom_profile_card_payload", _render)
+    profile = _profile(_card(2, 20), _card(1, 10), _card(3, 30))
+
+    response = asyncio.run(_post({"profile": profile, "all_cards": True, "resources": {"k": 1}}))
+
+    assert response.status_code == 200
+    assert response.headers[STREAMED_PARTS_HEADER] == "3"
+    parts = _parts(response)
+    assert [part["X-Haruki-Card-Seq"] for part in parts] == ["2", "3", "1"]  # completion order
+    assert [part["X-Haruki-Card-Index"] for part in parts] == ["1", "2", "0"]  # selection order is by seq
+    assert parts[0].get_payload(decode=True) == b"png2"
+    assert parts[0]["Content-Disposition"] == "inline; filename=custom_profile_seq02_card20.png"
+    assert parts[0]["X-Haruki-Render-Backend"] == "skia"
+    assert parts[1].get_content_type() == "application/json"
+    assert b'"status": 400' in parts[1].get_payload(decode=True)
+    assert {request.region for request in seen} == {"jp"}
+    assert len({id(request.profile_context) for request in seen}) == 1
+    assert len({id(request.resources) for request in seen}) == 1
+    assert "userCustomProfileCards" not in seen[0].profile_context
+
+
+def test_selection_and_validation_errors_reject_the_whole_batch(monkeypatch):
+    async def _render(request):
+        raise AssertionError("nothing may render when the batch is rejected")
+
+    monkeypatch.setattr(profile_route, "_render_custom_profile_card_payload", _render)
+
+    empty = asyncio.run(_post({"profile": _profile(_card(1, 10)), "seq": 4}))
+    invalid = asyncio.run(
+        _post({"profile": _profile(_card(1, 10), {"seq": 2, "customProfileCard": []}), "all_cards": True})
+    )
+
+    assert empty.status_code == 400
+    assert empty.json()["detail"] == "no custom profile card matches the selection"
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"] == "card.customProfileCard must be an object"
+
+
+def test_a_malformed_profile_is_a_400_not_a_500(monkeypatch):
+    async def _render(request):
+        raise AssertionError("nothing may render when the batch is rejected")
+
+    monkeypatch.setattr(profile_route, "_render_custom_profile_card_payload", _render)
+
+    bad_seq = asyncio.run(_post({"profile": _profile(_card(1, 10), {**_card(2, 20), "seq": "x"}), "all_cards": True}))
+    bad_id = asyncio.run(_post({"profile": _profile({**_card(1, 10), "customProfileId": [7]}), "custom_profile_id": 7}))
+
+    assert bad_seq.status_code == 400
+    assert "invalid literal" in bad_seq.json()["detail"]
+    assert bad_id.status_code == 400
+
+
+def test_a_profile_context_rejection_is_a_400(monkeypatch):
+    def _reject(profile):
+        raise ValueError("profile.userProfile must be an object")
+
+    monkeypatch.setattr(profile_route, "build_profile_context", _reject)
+
+    response = asyncio.run(_post({"profile": _profile(_card(1, 10)), "all_cards": True}))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "profile.userProfile must be an object"
@@ -19,19 +19,28 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+import threading
+import time
 
+import numpy as np
 from PIL import Image
 import pytest
 
 from src.sekai.base.utils import get_runtime_cache_stats
+from src.sekai.profile.custom_profile import tmp_tables
 from src.sekai.profile.custom_profile.cache import (
+    GLYPH_CONTOUR_CACHE,
+    GLYPH_SDF_CACHE,
     MISSING,
     BoundedCache,
+    GlyphDiskStore,
+    ShardedBoundedCache,
     clear_custom_profile_caches,
     get_custom_profile_cache_stats,
     get_render_font,
+    get_tmp_font_tables,
 )
-from src.sekai.profile.custom_profile.renderer import PNGRenderer, TMPFontLibrary
+from src.sekai.profile.custom_profile.renderer import PNGRenderer, TMPDynamicGlyphSDF, TMPFontLibrary
 from src.settings import DEFAULT_FONT, FONT_DIR
 
 STAT_FIELDS = {
@@ -233,6 +242,35 @@ def test_bounded_cache_disabled_at_size_zero():
     assert stats["misses"] == 0  # a disabled pool records no traffic
 
 
+def test_bounded_cache_key_estimate_counts_toward_the_byte_bound():
+    cache = BoundedCache("t", 10, 10, lambda value: 0, key_estimate=len)
+    cache.set("abcd", 1)
+    cache.set("efgh", 2)
+    cache.set("ijkl", 3)  # 12 bytes of keys: the oldest goes
+
+    assert cache.get("abcd") is MISSING
+    assert cache.stats()["bytes"] == 8
+
+
+def test_sharded_cache_splits_the_budget_and_sums_shard_stats():
+    cache = ShardedBoundedCache("t", 8, 1024, lambda value: 1, shards=4)
+    for index in range(100):
+        cache.set(index, index)  # small ints hash to themselves: 25 keys per shard
+
+    assert cache.get(99) == 99
+    assert cache.get(0) is MISSING  # evicted per shard, oldest first
+    stats = cache.stats()
+    assert stats["shards"] == 4
+    assert stats["entries"] == 8
+    assert stats["max_entries"] == 8
+    assert stats["sets"] == 100
+    assert stats["evictions"] == 92
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
 # ---- TMP metadata table cache ------------------------------------------------------------------
 
 
@@ -264,6 +302,72 @@ def test_tmp_metadata_invalidation_covers_referenced_tables(tmp_path: Path):
     assert 66 in lib3.assets["TestFont"][0].glyphs  # reparsed from the rewritten table
 
 
+def test_tmp_table_pack_round_trips_the_json_parse(tmp_path: Path):
+    metadata_path = _write_tmp_font_metadata(tmp_path / "tmp_meta").resolve()
+    parsed = TMPFontLibrary._load_assets(metadata_path)
+
+    TMPFontLibrary.load(metadata_path, source_metadata_path=None)  # parses JSON, compiles the pack
+    clear_custom_profile_caches()
+    packed = TMPFontLibrary.load(metadata_path, source_metadata_path=None).assets
+
+    assert get_custom_profile_cache_stats()["tmp_metadata"]["pack"]["loads"] == 1
+    asset, expected = packed["TestFont"][0], parsed["TestFont"][0]
+    assert isinstance(asset.glyphs, tmp_tables.CompiledGlyphTable)
+    for name in ("name", "atlas_paths", "source_font_path", "point_size", "gradient_scale", "fallback_names"):
+        assert getattr(asset, name) == getattr(expected, name)
+    assert dict(asset.glyphs) == dict(expected.glyphs)
+    assert asset.glyphs.get(66) is None
+    assert 66 not in asset.glyphs
+
+
+def test_tmp_table_pack_is_ignored_once_a_referenced_table_changes(tmp_path: Path):
+    meta_dir = tmp_path / "tmp_meta"
+    metadata_path = _write_tmp_font_metadata(meta_dir)
+    TMPFontLibrary.load(metadata_path, source_metadata_path=None)
+    clear_custom_profile_caches()
+
+    char_path = meta_dir / "TestFont_characters.json"
+    _write_character_table(char_path, [65, 66])
+    _bump_mtime(char_path)
+    lib = TMPFontLibrary.load(metadata_path, source_metadata_path=None)
+
+    assert 66 in lib.assets["TestFont"][0].glyphs
+    pack_stats = get_custom_profile_cache_stats()["tmp_metadata"]["pack"]
+    assert pack_stats["loads"] == 0
+    assert pack_stats["writes"] == 1  # the stale pack was recompiled
+
+
+def test_tmp_table_misses_are_single_flight(tmp_path: Path):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader(record):
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"assets": True}, None
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_tmp_font_tables(tmp_path / "m.json", None, loader)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while get_custom_profile_cache_stats()["tmp_metadata"]["single_flight_waits"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result[0] is results[0][0] for result in results)
+
+
 # ---- per-thread render font cache --------------------------------------------------------------
 
 
@@ -303,6 +407,61 @@ def test_sprite_decode_shared_across_renderers_and_invalidated_on_replace(tmp_pa
     assert sprite_c.getpixel((0, 0)) == (0, 255, 0, 255)  # new pixels, not the stale decode
 
 
+# ---- glyph disk store --------------------------------------------------------------------------
+
+
+def test_glyph_disk_store_round_trips_and_evicts_least_recently_used(tmp_path: Path):
+    store = GlyphDiskStore("t", tmp_path / "glyphs", max_bytes=1000)
+
+    store.set(("a",), {"n": 1}, b"x" * 300)
+    store.set(("b",), {"n": 2}, b"y" * 300)
+    first = store.path_for(("a",))
+    os.utime(first, ns=(0, 0))  # "a" is the least recently used entry
+    store.set(("c",), {"n": 3}, b"z" * 300)
+
+    assert store.get(("a",)) is None
+    meta, payload = store.get(("c",))
+    assert meta["n"] == 3
+    assert bytes(payload) == b"z" * 300
+    stats = store.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= 1000
+
+
+def test_glyph_disk_store_drops_a_corrupt_entry(tmp_path: Path):
+    store = GlyphDiskStore("t", tmp_path / "glyphs", max_bytes=1 << 20)
+    store.set(("a",), {}, b"payload")
+    store.path_for(("a",)).write_bytes(b"garbage!")
+
+    assert store.get(("a",)) is None
+    assert not store.path_for(("a",)).exists()
+    assert store.stats()["errors"] == 1
+
+
+def test_generated_glyphs_survive_the_process_pools_through_the_disk_store(tmp_path: Path):
+    renderer = _make_renderer(tmp_path)
+    field = Image.linear_gradient("L").resize((12, 14))
+    sdf = TMPDynamicGlyphSDF(field=field, bbox=(-1, -10, 9, 2), pad=6, sample_size=48.0)
+    contours = (np.array([[0.0, 0.0], [1.0, 2.0]], dtype=np.float32), np.ones((3, 2), dtype=np.float32))
+    sdf_key = ("font.otf", 1, 2, "TestFont", "A", 48.0, 6.0, 5.0)
+    contour_key = ("font.otf", 1, 2, "A", 48.0)
+
+    renderer._store_dynamic_glyph(sdf_key[:1], sdf_key, sdf)
+    renderer._store_vector_glyph(contour_key[:1], contour_key, (contours, np))
+    GLYPH_SDF_CACHE.clear()
+    GLYPH_CONTOUR_CACHE.clear()
+
+    restored = PNGRenderer._disk_dynamic_glyph(sdf_key)
+    assert restored.field.tobytes() == field.tobytes()
+    assert (restored.bbox, restored.pad, restored.sample_size) == (sdf.bbox, sdf.pad, sdf.sample_size)
+    packed, _np = PNGRenderer._disk_vector_glyph(contour_key)
+    assert [arr.tolist() for arr in packed] == [arr.tolist() for arr in contours]
+    assert not packed[0].flags.writeable  # views on the read-only mapping
+    assert GLYPH_SDF_CACHE.get(sdf_key) is restored  # promoted back into the process pool
+    assert PNGRenderer._disk_dynamic_glyph((*sdf_key[:-1], 6.5)) is None  # other SDF parameters
+
+
 # ---- glyph contour L2 --------------------------------------------------------------------------
 
 
@@ -370,7 +529,7 @@ def test_transient_glyph_failure_is_not_negative_cached_process_wide(tmp_path: P
 def test_cache_stats_shape_and_runtime_plumbing():
     stats = get_custom_profile_cache_stats()
 
-    assert set(stats) == {"tmp_metadata", "glyph_sdf", "glyph_contours", "sprite_atlas"}
+    assert set(stats) == {"tmp_metadata", "glyph_sdf", "glyph_contours", "glyph_disk", "sprite_atlas"}
     for pool_stats in stats.values():
         assert STAT_FIELDS <= set(pool_stats)
 
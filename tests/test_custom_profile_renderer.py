@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -1696,3 +1697,75 @@ def test_custom_profile_api_uses_cropped_profile_viewport(tmp_path: Path, monkey
     assert captured["canvas_h"] == 909
     assert captured["origin_x"] == 1024.0
     assert captured["origin_y"] == 454.5
+
+
+def _patch_session_dirs(tmp_path: Path, monkeypatch, tmp_font_metadata: Path | None = None) -> dict[str, Path]:
+    dirs = {
+        "assets": tmp_path / "asset" / "cn-assets" / "startapp" / "custom_profile",
+        "fonts": tmp_path / "fonts" / "cn",
+        "shape_sprites": tmp_path / "shape-sprites",
+        "ui_sprites": tmp_path / "unity-ui-sprites",
+    }
+    for path in dirs.values():
+        path.mkdir(parents=True)
+    monkeypatch.setattr(custom_profile_drawer, "CUSTOM_PROFILE_ASSETS_DIR", dirs["assets"])
+    monkeypatch.setattr(custom_profile_drawer, "CUSTOM_PROFILE_FONTS_DIR", dirs["fonts"])
+    monkeypatch.setattr(custom_profile_drawer, "CUSTOM_PROFILE_SHAPE_SPRITE_DIR", dirs["shape_sprites"])
+    monkeypatch.setattr(custom_profile_drawer, "CUSTOM_PROFILE_UNITY_UI_SPRITE_DIR", dirs["ui_sprites"])
+    monkeypatch.setattr(custom_profile_drawer, "CUSTOM_PROFILE_TMP_FONT_METADATA", tmp_font_metadata)
+    return dirs
+
+
+def test_custom_profile_session_rebinds_one_pooled_renderer(tmp_path: Path, monkeypatch) -> None:
+    _patch_session_dirs(tmp_path, monkeypatch)
+    first_resources = {"stamps": [{"id": 1}]}
+    second_resources = {"stamps": [{"id": 2}]}
+
+    with custom_profile_drawer.checkout_custom_profile_renderer("cn", first_resources, {}) as (first, setup):
+        assert not setup.reused
+        first_probes = first.asset_probes
+        first_probes.exists(tmp_path)
+    with custom_profile_drawer.checkout_custom_profile_renderer("cn", second_resources, {"name": "x"}) as (
+        second,
+        setup,
+    ):
+        assert setup.reused
+        assert second is first
+        assert set(second.stamps) == {2}
+        assert second.profile_context == {"name": "x"}
+        # Per-card memos (and the asset probe memo) start empty for every request.
+        assert second.asset_probes is not first_probes
+        assert (second.asset_probes.probes, second.asset_probes.deduplicated) == (0, 0)
+    assert second.resources == {}  # the idle renderer does not keep the last request alive
+
+
+def test_custom_profile_session_keeps_the_tmp_library_while_its_tables_are_current(tmp_path: Path, monkeypatch) -> None:
+    metadata_path = tmp_path / "tmp" / "metadata.json"
+    metadata_path.parent.mkdir()
+    metadata_path.write_text('{"materials": [], "tmp_font_assets": []}', encoding="utf-8")
+    _patch_session_dirs(tmp_path, monkeypatch, tmp_font_metadata=metadata_path)
+
+    with custom_profile_drawer.checkout_custom_profile_renderer("cn", {}, {}) as (renderer, _setup):
+        library = renderer.tmp_font_library
+    with custom_profile_drawer.checkout_custom_profile_renderer("cn", {}, {}) as (renderer, _setup):
+        assert renderer.tmp_font_library is library
+
+    metadata_path.write_text('{"materials": [], "tmp_font_assets": [], "version": 2}', encoding="utf-8")
+    stat = metadata_path.stat()
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    with custom_profile_drawer.checkout_custom_profile_renderer("cn", {}, {}) as (renderer, _setup):
+        assert renderer.tmp_font_library is not library
+
+
+def test_custom_profile_session_is_rebuilt_when_a_resolved_path_disappears(tmp_path: Path, monkeypatch) -> None:
+    dirs = _patch_session_dirs(tmp_path, monkeypatch)
+    with custom_profile_drawer.checkout_custom_profile_renderer("cn", {}, {}):
+        pass
+
+    dirs["shape_sprites"].rmdir()
+
+    with (
+        pytest.raises(FileNotFoundError, match="custom_profile_shape_sprite_dir"),
+        custom_profile_drawer.checkout_custom_profile_renderer("cn", {}, {}),
+    ):
+        pass
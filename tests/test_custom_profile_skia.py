@@ -189,7 +189,7 @@ def test_incomplete_visible_scene_declines_before_native_render(monkeypatch, tmp
         issues=[{"kind": "stamp", "status": "missing", "data_id": 1, "layer": 2}],
     )
     monkeypatch.setattr(skia_mod, "load_native_renderer", lambda: _Native())
-    monkeypatch.setattr(skia_mod, "_build_scene", lambda renderer, card: (b"{}", {}, report))
+    monkeypatch.setattr(skia_mod, "_build_scene", lambda renderer, card, **_kwargs: (b"{}", {}, report))
 
     assert asyncio.run(try_render_custom_profile_card_payload(_request())) is None
     stats = _endpoint_stats()
@@ -220,7 +220,7 @@ def test_sdf_quad_mem_field_records_pillow_touch():
 
 
 def test_sdf_atlas_quad_emits_without_mem_or_pillow_touch(monkeypatch):
-    monkeypatch.setattr(skia_mod, "_relative_asset_path", lambda path: "tmp/atlas.png")
+    monkeypatch.setattr(skia_mod, "_relative_asset_path", lambda path, probes=None: "tmp/atlas.png")
     scalars = SimpleNamespace(
         face_color=(255, 240, 220),
         face_scale=1.25,
@@ -884,7 +884,7 @@ def test_native_honor_deck_declines_atomically_when_an_expected_slot_is_missing(
     monkeypatch.setattr(
         skia_mod,
         "_native_profile_honor_badge",
-        lambda renderer, row, *, full_size: statuses[int(row["seq"])],
+        lambda renderer, row, *, full_size, probes=None: statuses[int(row["seq"])],
     )
 
     class _Renderer:
@@ -906,7 +906,7 @@ def test_native_honor_deck_declines_atomically_when_an_expected_slot_is_missing(
 
 
 def test_native_honor_deck_emits_all_expected_slots_only_after_preflight(monkeypatch):
-    def fake_badge(renderer, row, *, full_size):
+    def fake_badge(renderer, row, *, full_size, probes=None):
         width = 380 if full_size else 180
         badge = skia_mod._new_builder(width, 80)
         badge.rect((0, 0), (width, 80), fill=(20 * int(row["seq"]), 40, 80, 255))
@@ -1,7 +1,17 @@
+import math
 from pathlib import Path
+import re
 
+import numpy as np
 from PIL import Image, ImageDraw
+import pytest
 
+from src.core.pillow_telemetry import (
+    PILLOW_TOUCH_CUSTOM_PROFILE_MEM_RASTER,
+    begin_pillow_touch_scope,
+    end_pillow_touch_scope,
+    take_pillow_touch_snapshot,
+)
 from src.sekai.profile.custom_profile.general_prefab import (
     GeneralAssetImageOp,
     GeneralRoundedRectOp,
@@ -17,7 +27,7 @@ from src.sekai.profile.custom_profile.renderer import (
     PNGRenderer,
 )
 import src.sekai.profile.custom_profile.skia as skia_mod
-from src.sekai.skia_renderer.ir_builder import IRBuilder
+from src.sekai.skia_renderer.ir_builder import IRBuilder, rounded_rect_path
 
 
 def _write_pattern(path: Path, size: tuple[int, int], seed: int) -> None:
@@ -213,10 +223,88 @@ def _walk_ir(node):
         yield from _walk_ir(child)
 
 
-def test_story_favorite_native_emitter_declines_inexact_rounded_banner_before_scene_mutation(
-    tmp_path: Path,
-    monkeypatch,
-) -> None:
+def _emit_native_without_mem_rasters(renderer: PNGRenderer, content: NativeContent, scene) -> str:
+    token = begin_pillow_touch_scope()
+    try:
+        result = skia_mod._emit_native_general(renderer, content, scene)
+        snapshot = take_pillow_touch_snapshot()
+    finally:
+        end_pillow_touch_scope(token)
+    assert snapshot.counts.get(PILLOW_TOUCH_CUSTOM_PROFILE_MEM_RASTER, 0) == 0
+    return result
+
+
+def _path_polygon(d: str) -> np.ndarray:
+    """The M/H/V/A/Z path data ``rounded_rect_path`` emits, with its circular arcs flattened."""
+    tokens = re.findall(r"[MHVAZ]|-?\d+(?:\.\d+)?", d)
+    points: list[tuple[float, float]] = []
+    cursor = (0.0, 0.0)
+    index = 0
+    command = ""
+
+    def number() -> float:
+        nonlocal index
+        index += 1
+        return float(tokens[index - 1])
+
+    while index < len(tokens):
+        if tokens[index].isalpha():
+            command = tokens[index]
+            index += 1
+            if command == "Z":
+                continue
+        if command == "M":
+            cursor = (number(), number())
+        elif command == "H":
+            cursor = (number(), cursor[1])
+        elif command == "V":
+            cursor = (cursor[0], number())
+        elif command == "A":
+            r, _ry, _rotation, large, sweep = (number() for _ in range(5))
+            end = (number(), number())
+            half_x, half_y = (end[0] - cursor[0]) / 2, (end[1] - cursor[1]) / 2
+            half = math.hypot(half_x, half_y)
+            offset = math.sqrt(max(r * r - half * half, 0.0)) * (1 if large != sweep else -1)
+            cx = cursor[0] + half_x - offset * half_y / half
+            cy = cursor[1] + half_y + offset * half_x / half
+            start = math.atan2(cursor[1] - cy, cursor[0] - cx)
+            span = math.atan2(end[1] - cy, end[0] - cx) - start
+            span += 2 * math.pi if sweep and span < 0 else 0.0
+            points.extend(
+                (cx + r * math.cos(start + span * step / 64), cy + r * math.sin(start + span * step / 64))
+                for step in range(1, 64)
+            )
+            cursor = end
+        points.append(cursor)
+    return np.array(points)
+
+
+def _aliased_path_coverage(d: str, size: tuple[int, int]) -> np.ndarray:
+    """Pixels an aliased (``antialias=False``) fill of ``d`` covers: those whose centre is inside."""
+    polygon = _path_polygon(d)
+    ys, xs = np.mgrid[0 : size[1], 0 : size[0]] + 0.5
+    inside = np.zeros(xs.shape, bool)
+    for (x0, y0), (x1, y1) in zip(polygon, np.roll(polygon, -1, axis=0), strict=True):
+        if y0 != y1:
+            crosses = (y0 > ys) != (y1 > ys)
+            inside ^= crosses & (xs < x0 + (ys - y0) * (x1 - x0) / (y1 - y0))
+    return inside
+
+
+@pytest.mark.parametrize("radius", sorted(skia_mod._PILLOW_PARITY_CLIP_RADII))
+@pytest.mark.parametrize("size", [(97, 53), (176, 99), (403, 172)])
+def test_rounded_rect_clip_covers_the_pillow_rounded_rectangle_mask(size: tuple[int, int], radius: int) -> None:
+    # Every radius the native emitter accepts. The half-pixel bump is not exact at every radius
+    # (at 8 four corner pixels differ), which is why the emitter declines the rest.
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, size[0] - 1, size[1] - 1), radius, fill=255)
+
+    coverage = _aliased_path_coverage(rounded_rect_path(size, radius), size)
+
+    assert np.array_equal(coverage, np.asarray(mask) > 0)
+
+
+def _banner_story_emit_setup(tmp_path: Path, monkeypatch):
     banner = tmp_path / "asset" / "cn-assets" / "startapp" / "event_story" / "banner.png"
     _write_pattern(banner, (97, 53), 29)
     story = {"shareNo": 1, "storyType": "event_story", "storyId": 10}
@@ -241,10 +329,44 @@ def test_story_favorite_native_emitter_declines_inexact_rounded_banner_before_sc
         "create",
         staticmethod(lambda font_path: _NativeMetricsStub()),
     )
+    return renderer, content, builder, scene
 
-    assert skia_mod._emit_native_general(renderer, content, scene) is None
+
+def test_story_favorite_native_emitter_clips_rounded_banner_with_aliased_path(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    renderer, content, builder, scene = _banner_story_emit_setup(tmp_path, monkeypatch)
+
+    assert _emit_native_without_mem_rasters(renderer, content, scene) == "native"
     assert scene.mem_images == {}
-    assert builder.build()["root"]["children"] == []
+    nodes = list(_walk_ir(builder.build()["root"]))
+    clipped = [node for node in nodes if node["type"] == "Group" and (node.get("clip") or {}).get("kind") == "path"]
+    assert len(clipped) == 1
+    assert clipped[0]["clip"]["antialias"] is False
+    assert clipped[0]["clip"]["d"].startswith("M10.5 0 ")
+    (image,) = clipped[0]["children"]
+    assert image["type"] == "Image"
+    clip_size = tuple(clipped[0]["size"])
+    banner_mask = Image.new("L", clip_size, 0)
+    ImageDraw.Draw(banner_mask).rounded_rectangle((0, 0, clip_size[0] - 1, clip_size[1] - 1), 10, fill=255)
+    assert np.array_equal(_aliased_path_coverage(clipped[0]["clip"]["d"], clip_size), np.asarray(banner_mask) > 0)
+    assert image["pos"] == [0, 0]
+    assert image["size"] == clipped[0]["size"]
+    assert image["fit"] == "cover"
+    assert image["sampling"] == "pillow_lanczos"
+
+
+def test_story_favorite_native_emitter_declines_an_unverified_clip_radius(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    renderer, content, builder, scene = _banner_story_emit_setup(tmp_path, monkeypatch)
+    before = builder.build()["root"]
+    monkeypatch.setattr(skia_mod, "_PILLOW_PARITY_CLIP_RADII", frozenset({8}))
+
+    assert skia_mod._emit_native_general(renderer, content, scene) is None
+    assert builder.build()["root"] == before
 
 
 def test_story_favorite_without_banner_can_use_existing_native_general_primitives(
@@ -272,7 +394,7 @@ def test_story_favorite_without_banner_can_use_existing_native_general_primitive
         staticmethod(lambda font_path: _NativeMetricsStub()),
     )
 
-    assert skia_mod._emit_native_general(renderer, content, scene) == "native"
+    assert _emit_native_without_mem_rasters(renderer, content, scene) == "native"
     assert scene.mem_images == {}
     nodes = list(_walk_ir(builder.build()["root"]))
     assert any(node["type"] == "UnitySubscene" for node in nodes)
@@ -0,0 +1,103 @@
+"""The emoji atlas behind ``Painter._text``.
+
+Emoji text used to go through ``Pilmoji.text``, which decoded and LANCZOS-resized the emoji PNG for
+every occurrence. ``painter._draw_emoji_text`` ports Pilmoji's layout and takes the rasters from
+``EMOJI_ATLAS`` instead; these tests pin it pixel-for-pixel to Pilmoji and check that a warm draw
+never touches the source.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+from pilmoji import Pilmoji
+from pilmoji.source import BaseSource
+import pytest
+
+from src.sekai.base import painter
+from src.sekai.base.text_cache import EMOJI_ATLAS
+
+
+def _emoji_png() -> bytes:
+    image = Image.new("RGBA", (72, 64), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((4, 4, 68, 60), fill=(255, 180, 0, 255))
+    draw.rectangle((20, 20, 30, 40), fill=(40, 40, 200, 200))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _FakeSource(BaseSource):
+    calls = 0
+    png = _emoji_png()
+
+    def get_emoji(self, emoji: str, /) -> BytesIO | None:
+        type(self).calls += 1
+        return None if emoji == "🎵" else BytesIO(self.png)
+
+    def get_discord_emoji(self, id: int, /) -> BytesIO | None:
+        type(self).calls += 1
+        return BytesIO(self.png)
+
+
+@pytest.fixture(autouse=True)
+def fake_source(monkeypatch):
+    monkeypatch.setattr(painter, "CachedGoogleEmojiSource", _FakeSource)
+    _FakeSource.calls = 0
+    EMOJI_ATLAS.clear()
+    yield _FakeSource
+    EMOJI_ATLAS.clear()
+
+
+def _canvas() -> Image.Image:
+    return Image.new("RGBA", (420, 160), (255, 255, 255, 255))
+
+
+@pytest.mark.parametrize(
+    ("text", "align", "xy"),
+    [
+        ("hi 😀 there", "left", (10, 60)),
+        ("😀😀 nick 😀", "left", (12.5, 48.25)),
+        ("first 😀\nsecond line 🎵 😀", "center", (20, 40)),
+        ("<:custom:123> and 😀", "right", (8, 70)),
+    ],
+)
+def test_atlas_text_matches_pilmoji_pixel_for_pixel(text, align, xy):
+    font = ImageFont.load_default(22)
+    expected = _canvas()
+    with Pilmoji(expected, source=_FakeSource) as pilmoji:
+        pilmoji.text(
+            xy, text, font=font, fill=(20, 30, 40, 255), align=align, emoji_position_offset=(0, 0), anchor="ls"
+        )
+
+    actual = _canvas()
+    painter._draw_emoji_text(actual, xy, text, font, (20, 30, 40, 255), align)
+
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_warm_draws_take_rasters_from_the_atlas():
+    font = ImageFont.load_default(22)
+    hits = EMOJI_ATLAS.stats()["hits"]
+    painter._draw_emoji_text(_canvas(), (10, 60), "😀 a 😀 b 😀", font, (0, 0, 0, 255))
+    cold_calls = _FakeSource.calls
+
+    painter._draw_emoji_text(_canvas(), (10, 60), "😀 again 😀", font, (0, 0, 0, 255))
+
+    assert cold_calls == 1  # one decode for three occurrences
+    assert _FakeSource.calls == cold_calls
+    stats = EMOJI_ATLAS.stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == hits + 4
+
+
+def test_atlas_is_keyed_by_width_and_does_not_cache_missing_emoji():
+    painter._draw_emoji_text(_canvas(), (10, 60), "🎵 😀", ImageFont.load_default(22), (0, 0, 0, 255))
+    painter._draw_emoji_text(_canvas(), (10, 60), "🎵 😀", ImageFont.load_default(30), (0, 0, 0, 255))
+
+    assert EMOJI_ATLAS.get(("emoji", "😀", 22)).size == (22, 20)
+    assert EMOJI_ATLAS.get(("emoji", "😀", 30)).width == 30
+    assert EMOJI_ATLAS.stats()["entries"] == 2
+    assert _FakeSource.calls == 4  # the missing 🎵 is asked for again on the second draw
@@ -1,10 +1,15 @@
+import asyncio
+
 from PIL import Image
 
 from src.sekai.base.painter import DEFAULT_FONT
-from src.sekai.base.plot import Grid, TextBox, TextStyle, VSplit
+from src.sekai.base.plot import CanvasImageBox, Grid, ImageBox, TextBox, TextStyle, VSplit
 from src.sekai.event import drawer as event_drawer
+from src.sekai.event.model import EventBrief, EventListRequest
 from src.sekai.profile.drawer import CardFullThumbnailBox, CardFullThumbnailLayers
 from src.sekai.profile.model import CardFullThumbnailRequest
+from src.sekai.skia_renderer.canvas import build_canvas_ir
+from src.sekai.skia_renderer.subtree_cache import NATIVE_SUBTREE_CACHE
 
 
 def _layers(card_id: int) -> CardFullThumbnailLayers:
@@ -36,3 +41,65 @@ def test_event_list_card_cell_places_card_id_below_thumbnail():
     assert isinstance(cell.items[1], TextBox)
     assert cell.items[1].text == "#1234"
     assert cell.items[1].w == event_drawer._EVENT_LIST_CARD_ID_WIDTH
+
+
+def _event_list_request() -> EventListRequest:
+    brief = EventBrief(
+        id=7,
+        event_name="测试活动",
+        event_type="marathon",
+        event_type_name="马拉松",
+        start_at=1_700_000_000_000,
+        end_at=1_700_600_000_000,
+    )
+    return EventListRequest(event_info=[brief], dt=1_700_300_000_000)
+
+
+def test_skia_path_rows_are_keyed_nested_canvases_not_composed_images(monkeypatch):
+    def _no_compose(*_args, **_kwargs):
+        raise AssertionError("the Skia path must not compose rows in Pillow")
+
+    monkeypatch.setattr(event_drawer, "_compose_event_list_entry_image", _no_compose)
+    rqd = _event_list_request()
+
+    canvas = asyncio.run(event_drawer._build_event_list_canvas(rqd, native_rows=True))
+
+    rows = [widget for widget in _walk(canvas) if isinstance(widget, CanvasImageBox)]
+    assert len(rows) == 1
+    phase = event_drawer._resolve_event_list_entry_phase(
+        rqd.event_info[0].start_at, rqd.event_info[0].end_at, rqd.clock.now
+    )
+    assert rows[0].cache_key == event_drawer._build_event_list_entry_cache_key(rqd.event_info[0], phase)
+    assert not any(isinstance(widget, ImageBox) for widget in _walk(canvas))
+
+
+def test_skia_path_rows_reach_the_ir_as_keyed_subscenes_without_pixels(monkeypatch):
+    monkeypatch.setattr(NATIVE_SUBTREE_CACHE, "max_entries", 8)
+    monkeypatch.setattr(NATIVE_SUBTREE_CACHE, "max_bytes", 1 << 20)
+    NATIVE_SUBTREE_CACHE.clear()
+    keys = []
+    for _ in range(2):
+        canvas = asyncio.run(event_drawer._build_event_list_canvas(_event_list_request(), native_rows=True))
+        builder, mem_images = build_canvas_ir(canvas)
+        subscenes = [
+            node for node in _walk_nodes(builder.build()["root"]["children"]) if node["type"] == "RasterSubscene"
+        ]
+        assert mem_images == {}
+        keys.append([node.get("cache_key") for node in subscenes])
+    NATIVE_SUBTREE_CACHE.clear()
+
+    assert len(keys[0]) == 1
+    assert keys[0][0]
+    assert keys[0] == keys[1]
+
+
+def _walk_nodes(nodes):
+    for node in nodes:
+        yield node
+        yield from _walk_nodes(node.get("children", ()))
+
+
+def _walk(widget):
+    yield widget
+    for item in getattr(widget, "items", ()):
+        yield from _walk(item)
@@ -11,13 +11,14 @@ def test_heavy_render_pool_reexports_encoded_image_payload():
     assert HeavyPoolEncodedImagePayload is EncodedImagePayload
 
 
-def test_heavy_render_pool_import_does_not_load_pillow():
+def test_heavy_render_pool_import_does_not_load_pillow_or_the_web_layer():
     project_root = Path(__file__).resolve().parents[1]
     result = subprocess.run(
         [
             sys.executable,
             "-c",
-            "import sys; import src.core.heavy_render_pool; assert 'PIL' not in sys.modules",
+            "import sys; import src.core.heavy_render_pool; "
+            "assert 'PIL' not in sys.modules; assert 'src.core.debug' not in sys.modules",
         ],
         cwd=project_root,
         capture_output=True,
@@ -5,7 +5,14 @@ from __future__ import annotations
 import pytest
 
 from src.sekai.base.painter import get_font, get_text_size
-from src.sekai.skia_renderer.ir_builder import IRBuilder, image_shadow, image_tint, linear_gradient
+from src.sekai.skia_renderer.ir_builder import (
+    IRBuilder,
+    clip_path,
+    image_shadow,
+    image_tint,
+    linear_gradient,
+    rounded_rect_path,
+)
 from src.settings import ASSETS_BASE_DIR, DEFAULT_BOLD_FONT, DEFAULT_FONT, FONT_DIR
 
 
@@ -40,6 +47,14 @@ def test_build_envelope_and_root():
     assert scene["root"]["size"] == [120, 100]
 
 
+def test_png_profile_is_omitted_at_the_default_and_serialized_otherwise():
+    assert "png_profile" not in _builder().build()
+    b = IRBuilder(
+        10, 10, assets_base_dir="/base", font_dir="/fonts", default_font="R", bold_font="B", png_profile="smallest"
+    )
+    assert b.build()["png_profile"] == "smallest"
+
+
 def test_group_nesting_and_node_shapes():
     b = _builder()
     b.rect((1, 2), (3, 4), fill=(255, 0, 0, 255), stroke=(0, 0, 0, 255), stroke_width=2)
@@ -322,6 +337,37 @@ def test_gradient_radial_and_stroke_and_corner_radii():
     assert node["corner_radii"] == [8.0, 0.0, 8.0, 0.0]
 
 
+def test_path_node_and_path_clip_serialize_svg_data():
+    b = _builder()
+    with b.group(offset=(4, 6), size=(20, 10), clip=clip_path(rounded_rect_path((20, 10), 3), antialias=False)):
+        b.path("M0 0 L10 0 L5 8 Z", fill=(255, 0, 0, 255), stroke=(0, 0, 0, 255), stroke_width=2, stroke_join="round")
+    b.path("M0 0 H4", stroke=linear_gradient((0, 0, 0, 255), (255, 255, 255, 255)), antialias=False)
+    root = b.build()["root"]
+    group, bare = root["children"]
+    assert group["clip"] == {
+        "kind": "path",
+        "d": "M3.5 0 H16.5 A3.5 3.5 0 0 1 20 3.5 V6.5 A3.5 3.5 0 0 1 16.5 10 H3.5 A3.5 3.5 0 0 1 0 6.5 "
+        "V3.5 A3.5 3.5 0 0 1 3.5 0 Z",
+        "antialias": False,
+    }
+    assert group["children"][0] == {
+        "type": "Path",
+        "d": "M0 0 L10 0 L5 8 Z",
+        "fill": [255, 0, 0, 255],
+        "stroke": [0, 0, 0, 255],
+        "stroke_width": 2,
+        "stroke_join": "round",
+    }
+    assert bare["stroke"]["kind"] == "linear"
+    assert bare["antialias"] is False
+    assert "fill" not in bare
+    # A zero radius is a plain rect; the radius never exceeds half the short side.
+    assert rounded_rect_path((8, 4), 0) == "M0 0 H8 V4 H0 Z"
+    assert rounded_rect_path((8, 4), 10).startswith("M2 0 H6 A2 2 ")
+    with pytest.raises(ValueError, match="stroke_join"):
+        b.path("M0 0 H1", stroke=(0, 0, 0, 255), stroke_join="square")
+
+
 def test_image_tint_shadow_and_text_extras():
     from src.sekai.skia_renderer.ir_builder import adaptive_color, image_shadow, image_tint, text_stroke
 
@@ -0,0 +1,223 @@
+"""Pins the layout snapshot cache: a recorded draw list replays the same painter ops, skips the
+builder on a hit, survives a restart through the disk store as JSON (never unpickling anything) and
+keys without the watermark's dt."""
+
+import asyncio
+import json
+from pathlib import Path
+import pickle
+
+from PIL import Image
+import pytest
+
+from src.sekai.base import layout_snapshot
+from src.sekai.base.layout_snapshot import (
+    LAYOUT_SNAPSHOT_CACHE,
+    LAYOUT_SNAPSHOT_DISK_STORE,
+    DrawOp,
+    LayoutSnapshot,
+    build_layout_snapshot_canvas,
+    layout_snapshot_key,
+    record_canvas_layout,
+)
+from src.sekai.base.painter import FontDesc, ImageTint, LinearGradient, Painter
+from src.sekai.base.plot import Canvas, CanvasImageBox, FillBg, Frame, HSplit, RandomTriangleBg, RoundRectBg, VSplit
+from src.sekai.base.utils import AssetImageRef
+from src.sekai.misc import drawer
+from src.sekai.misc.model import CommandHelpRenderRequest
+
+_DT = 1_700_000_000_000
+
+
+def _ops(canvas: Canvas) -> list[tuple]:
+    """Queued painter ops, with a nested canvas compared by its own ops rather than identity."""
+    painter = Painter(size=canvas._get_self_size())
+    canvas.draw(painter)
+    return [
+        (op.offset, op.size, op.func, [_ops(a) if isinstance(a, Canvas) else repr(a) for a in op.args])
+        for op in painter.operations
+    ]
+
+
+def _page() -> Canvas:
+    with Canvas(bg=FillBg((10, 20, 30, 255))).set_padding((12, 8)).set_content_align("c") as canvas:
+        with VSplit().set_sep(6).set_item_align("r"):
+            Frame().set_size((40, 30)).set_bg(RoundRectBg((255, 255, 255, 128), 6))
+            with HSplit().set_sep(4):
+                Frame().set_size((10, 10)).set_bg(FillBg((255, 0, 0, 255)))
+                with Canvas(bg=FillBg((0, 0, 255, 255))).set_padding(2) as badge:
+                    Frame().set_size((6, 6)).set_bg(FillBg((0, 255, 0, 255)))
+                CanvasImageBox(badge, size=(20, None), cache_key="badge")
+    return canvas
+
+
+@pytest.fixture
+def snapshot_cache(monkeypatch):
+    monkeypatch.setattr(LAYOUT_SNAPSHOT_CACHE, "max_entries", 8)
+    monkeypatch.setattr(LAYOUT_SNAPSHOT_CACHE, "max_bytes", 1 << 20)
+    LAYOUT_SNAPSHOT_CACHE.clear()
+    yield
+    LAYOUT_SNAPSHOT_CACHE.clear()
+
+
+def _help_measurer(monkeypatch) -> None:
+    def _batch(_font_dir, _font_name, requests):
+        return [
+            {"pillow_bbox": (0.0, 4.0, 10.0 * len(text), 24.0), "ascent": 22.0, "descent": 6.0}
+            for text, _size in requests
+        ]
+
+    monkeypatch.setattr(drawer, "_command_help_measurer", lambda: drawer._CommandHelpMeasurer("native", _batch))
+
+
+def test_replayed_snapshot_issues_the_same_painter_ops():
+    snapshot = record_canvas_layout(_page())
+
+    assert snapshot is not None
+    assert [op.method for op in snapshot.ops].count("paste_canvas") == 1
+    assert _ops(snapshot.to_canvas()) == _ops(_page())
+
+
+def test_canvas_drawing_on_itself_is_built_not_snapshotted(snapshot_cache):
+    canvas = _page().add_draw_func(lambda _widget, _painter: None)
+
+    assert record_canvas_layout(canvas) is None
+    assert asyncio.run(build_layout_snapshot_canvas("t", {"k": 1}, lambda: _async(canvas))) is canvas
+
+
+def test_disabled_cache_returns_the_built_canvas():
+    canvas = _page()
+
+    assert not LAYOUT_SNAPSHOT_CACHE.enabled
+    assert asyncio.run(build_layout_snapshot_canvas("t", {"k": 1}, lambda: _async(canvas))) is canvas
+
+
+async def _async(value):
+    return value
+
+
+def test_hit_skips_widget_construction_and_keeps_the_watermark_live(snapshot_cache, monkeypatch):
+    _help_measurer(monkeypatch)
+    built = []
+    real_build = drawer._build_command_help_content
+
+    async def _counting_build(rqd, measurer):
+        built.append(rqd.dt)
+        return await real_build(rqd, measurer)
+
+    monkeypatch.setattr(drawer, "_build_command_help_content", _counting_build)
+
+    first, second = (
+        asyncio.run(drawer._build_command_help_canvas(CommandHelpRenderRequest(markdown="# 帮助", dt=dt)))
+        for dt in (_DT, _DT + 60_000)
+    )
+
+    assert built == [_DT]
+    assert LAYOUT_SNAPSHOT_CACHE.stats()["hits"] == 1
+    first_ops, second_ops = _ops(first), _ops(second)
+    assert len(first_ops) == len(second_ops)
+    assert first_ops != second_ops  # only the DT watermark text differs
+    assert sum(a != b for a, b in zip(first_ops, second_ops, strict=True)) <= 2
+
+
+def test_disk_store_replays_across_a_process_restart(monkeypatch, tmp_path):
+    monkeypatch.setattr(LAYOUT_SNAPSHOT_DISK_STORE, "root", tmp_path)
+    monkeypatch.setattr(LAYOUT_SNAPSHOT_DISK_STORE, "max_bytes", 1 << 20)
+    LAYOUT_SNAPSHOT_DISK_STORE.reset_stats()
+    calls = []
+
+    async def _build():
+        calls.append(1)
+        return _page()
+
+    first = asyncio.run(build_layout_snapshot_canvas("page", {"k": 1}, _build))
+    second = asyncio.run(build_layout_snapshot_canvas("page", {"k": 1}, _build))
+
+    assert calls == [1]
+    assert LAYOUT_SNAPSHOT_DISK_STORE.stats()["hits"] == 1
+    assert _ops(second) == _ops(first) == _ops(_page())
+
+
+def test_key_ignores_the_watermark_dt_but_not_the_timezone_or_measurer(monkeypatch):
+    request = CommandHelpRenderRequest(markdown="# 帮助", dt=1)
+    key = layout_snapshot_key("command_help", request, {"measurer": "native"})
+
+    assert layout_snapshot_key("command_help", request.model_copy(update={"dt": 2}), {"measurer": "native"}) == key
+    assert layout_snapshot_key("command_help", request, {"measurer": "pillow"}) != key
+    assert layout_snapshot_key("alias_list", request, {"measurer": "native"}) != key
+    other_tz = request.model_copy(update={"timezone": "UTC"})
+    assert layout_snapshot_key("command_help", other_tz, {"measurer": "native"}) != key
+    monkeypatch.setattr(layout_snapshot, "_font_signature", lambda name: (name, 1, 1))
+    assert layout_snapshot_key("command_help", request, {"measurer": "native"}) != key
+
+
+@pytest.fixture
+def snapshot_disk(monkeypatch, tmp_path):
+    monkeypatch.setattr(LAYOUT_SNAPSHOT_DISK_STORE, "root", tmp_path)
+    monkeypatch.setattr(LAYOUT_SNAPSHOT_DISK_STORE, "max_bytes", 1 << 20)
+    LAYOUT_SNAPSHOT_DISK_STORE.reset_stats()
+
+
+def _referencing_snapshot() -> LayoutSnapshot:
+    jacket = AssetImageRef(Path("music/jacket.png"), (740, 740), "RGBA", mtime_ns=7, file_size=9)
+    ops = (
+        DrawOp((4, 4), (80, 20), "text", ("歌", (0, 0), FontDesc("SourceHanSansCN-Bold", 18)), {}),
+        DrawOp(
+            (4, 30),
+            (64, 64),
+            "paste",
+            (jacket, (0, 0), (64, 64)),
+            {"tint": ImageTint((255, 0, 0, 128)), "sampling": "linear"},
+        ),
+        DrawOp(
+            (0, 0), (90, 100), "rect", ((0, 0), (90, 100), LinearGradient((0, 0, 0), (9, 9, 9), (0, 0), (1, 1))), {}
+        ),
+    )
+    return LayoutSnapshot((90, 100), ops, (None, 120), RandomTriangleBg(True, 0.5), (8, 10), ("c", "t"))
+
+
+def test_disk_payload_is_json_naming_fonts_and_assets_by_reference(snapshot_disk):
+    snapshot = _referencing_snapshot()
+
+    stored = layout_snapshot._store_snapshot("k", "page", snapshot)
+    _meta, payload = LAYOUT_SNAPSHOT_DISK_STORE.get(("k",))
+    text_op, paste_op, _rect_op = json.loads(bytes(payload))["ops"]
+    loaded = layout_snapshot._load_snapshot("k")
+
+    assert text_op[3][2] == {"$": "font", "path": "SourceHanSansCN-Bold", "size": 18}
+    assert paste_op[3][0]["path"] == {"$": "path", "value": "music/jacket.png"}
+    assert stored.nbytes == len(payload) == loaded.nbytes
+    assert loaded.ops[:2] == snapshot.ops[:2]
+    assert vars(loaded.ops[2].args[2]) == vars(snapshot.ops[2].args[2])
+    assert (loaded.canvas_size, loaded.padding, loaded.content_align) == ((None, 120), (8, 10), ("c", "t"))
+    assert vars(loaded.bg) == vars(snapshot.bg)
+
+
+_UNPICKLED = []
+
+
+class _Payload:
+    def __reduce__(self):
+        return _UNPICKLED.append, ("executed",)
+
+
+def test_foreign_payloads_are_rebuilt_without_being_executed(snapshot_disk):
+    LAYOUT_SNAPSHOT_DISK_STORE.set(("pickled",), {"namespace": "t", "format": 1}, pickle.dumps(_Payload()))
+    unknown_method = {
+        **layout_snapshot._encode_snapshot(_referencing_snapshot()),
+        "ops": [[[0, 0], [1, 1], "__init__", [], {"$": "dict", "items": {}}]],
+    }
+    LAYOUT_SNAPSHOT_DISK_STORE.set(("method",), {"namespace": "t", "format": 1}, json.dumps(unknown_method).encode())
+    unknown_tag = {**unknown_method, "ops": [], "bg": {"$": "builtins.eval", "value": "1"}}
+    LAYOUT_SNAPSHOT_DISK_STORE.set(("tag",), {"namespace": "t", "format": 1}, json.dumps(unknown_tag).encode())
+
+    assert [layout_snapshot._load_snapshot(key) for key in ("pickled", "method", "tag")] == [None, None, None]
+    assert _UNPICKLED == []
+
+
+def test_snapshot_holding_decoded_pixels_stays_memory_only(snapshot_disk):
+    pixels = Image.new("RGBA", (4, 4))
+    snapshot = LayoutSnapshot((4, 4), (DrawOp((0, 0), (4, 4), "paste", (pixels, (0, 0), (4, 4)), {}),), nbytes=256)
+
+    assert layout_snapshot._store_snapshot("k", "page", snapshot) is snapshot
+    assert LAYOUT_SNAPSHOT_DISK_STORE.get(("k",)) is None
@@ -0,0 +1,147 @@
+"""Pins the Pillow mip pyramid: level choice, closeness to a direct resize, one source decode per
+hot asset across target sizes, the disk round trip and the direct fallbacks."""
+
+import numpy as np
+from PIL import Image
+import pytest
+
+from src.sekai.base import mip_pyramid
+from src.sekai.base.mip_pyramid import (
+    MIP_PYRAMID_CACHE,
+    MIP_PYRAMID_DISK_STORE,
+    build_mip_pyramid,
+    clear_mip_pyramid_cache,
+    get_mip_pyramid_cache_stats,
+    mip_level_for,
+    resize_with_mip_pyramid,
+)
+
+_KEY = ("jacket.png", 1, 2)
+
+
+def _jacket(mode: str = "RGBA") -> Image.Image:
+    rng = np.random.default_rng(0)
+    yy, xx = np.mgrid[0:740, 0:740]
+    pixels = np.zeros((740, 740, 4), np.int64)
+    pixels[..., 0] = xx * 255 // 739
+    pixels[..., 1] = yy * 255 // 739
+    pixels[..., 2] = (xx // 37 + yy // 37) % 2 * 255
+    pixels[..., :3] += rng.integers(-40, 40, (740, 740, 3))
+    pixels[..., 3] = np.where((xx - 370) ** 2 + (yy - 370) ** 2 < 330**2, 255, 0)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), "RGBA").convert(mode)
+
+
+@pytest.fixture
+def pyramid_cache(monkeypatch):
+    monkeypatch.setattr(MIP_PYRAMID_CACHE, "max_entries", 8)
+    monkeypatch.setattr(MIP_PYRAMID_CACHE, "max_bytes", 64 << 20)
+    clear_mip_pyramid_cache()
+    yield
+    clear_mip_pyramid_cache()
+
+
+def _counting_loader(source: Image.Image) -> tuple[list[int], object]:
+    loads: list[int] = []
+
+    def _load() -> Image.Image:
+        loads.append(1)
+        return source.copy()
+
+    return loads, _load
+
+
+def test_level_is_the_smallest_still_three_times_the_target():
+    assert mip_level_for((740, 740), (156, 156)) is None
+    assert mip_level_for((740, 740), (117, 117)) == 0
+    assert mip_level_for((740, 740), (61, 61)) == 1
+    assert mip_level_for((740, 740), (64, 64)) == 0
+    assert mip_level_for((740, 370), (40, 62)) is None
+    assert [level.size for level in build_mip_pyramid(_jacket()).levels] == [
+        (370, 370),
+        (185, 185),
+        (93, 93),
+        (47, 47),
+        (24, 24),
+        (12, 12),
+    ]
+
+
+@pytest.mark.parametrize("resample", [Image.Resampling.LANCZOS, Image.Resampling.BILINEAR, Image.Resampling.BICUBIC])
+def test_pyramid_resize_stays_within_a_few_steps_of_a_direct_resize(pyramid_cache, resample):
+    source = _jacket()
+    for size in (32, 64, 100, 117):
+        direct = np.asarray(source.resize((size, size), resample).convert("RGBa"), np.int64)
+        via_level = resize_with_mip_pyramid(_KEY, source.copy, (size, size), resample)
+        diff = np.abs(direct - np.asarray(via_level.convert("RGBa"), np.int64))
+
+        assert via_level.mode == "RGBA"
+        assert diff.mean() < 0.5
+        assert np.percentile(diff, 99) <= 4
+        assert diff.max() <= 8
+
+
+def test_every_target_size_of_a_hot_asset_shares_one_decode(pyramid_cache):
+    loads, load = _counting_loader(_jacket())
+
+    for size in (32, 48, 64, 80, 100, 117):
+        assert resize_with_mip_pyramid(_KEY, load, (size, size), Image.Resampling.LANCZOS).size == (size, size)
+
+    stats = get_mip_pyramid_cache_stats()
+    assert loads == [1]
+    assert (stats["pyramid_builds"], stats["pyramid_resizes"], stats["direct_resizes"]) == (1, 6, 0)
+    assert stats["resize_cpu_ms"] > 0
+
+
+def test_disk_store_rebuilds_nothing_after_a_restart(pyramid_cache, monkeypatch, tmp_path):
+    monkeypatch.setattr(MIP_PYRAMID_DISK_STORE, "root", tmp_path)
+    monkeypatch.setattr(MIP_PYRAMID_DISK_STORE, "max_bytes", 64 << 20)
+    MIP_PYRAMID_DISK_STORE.reset_stats()
+    source = _jacket()
+    first = resize_with_mip_pyramid(_KEY, source.copy, (64, 64), Image.Resampling.BICUBIC)
+    MIP_PYRAMID_CACHE.clear()
+    loads, load = _counting_loader(source)
+
+    second = resize_with_mip_pyramid(_KEY, load, (64, 64), Image.Resampling.BICUBIC)
+
+    assert loads == []
+    assert MIP_PYRAMID_DISK_STORE.stats()["hits"] == 1
+    assert second.tobytes() == first.tobytes()
+
+
+def test_a_disabled_disk_store_is_not_handed_the_level_bytes(pyramid_cache, monkeypatch):
+    def _fail(*_args):
+        raise AssertionError("the pyramid was serialized for a disabled disk store")
+
+    monkeypatch.setattr(MIP_PYRAMID_DISK_STORE, "max_bytes", 0)
+    monkeypatch.setattr(MIP_PYRAMID_DISK_STORE, "set", _fail)
+
+    resized = resize_with_mip_pyramid(_KEY, _jacket().copy, (64, 64), Image.Resampling.BICUBIC)
+
+    assert resized.size == (64, 64)
+    assert get_mip_pyramid_cache_stats()["pyramid_builds"] == 1
+
+
+@pytest.mark.parametrize(
+    ("mode", "size", "resample"),
+    [
+        ("RGBA", (300, 300), Image.Resampling.LANCZOS),
+        ("RGBA", (64, 64), Image.Resampling.NEAREST),
+        ("P", (64, 64), Image.Resampling.LANCZOS),
+    ],
+)
+def test_near_sizes_nearest_and_palette_sources_resize_directly(pyramid_cache, mode, size, resample):
+    source = _jacket(mode)
+
+    resized = resize_with_mip_pyramid(_KEY, source.copy, size, resample)
+
+    assert resized.tobytes() == source.resize(size, resample).tobytes()
+    assert get_mip_pyramid_cache_stats()["pyramid_resizes"] == 0
+
+
+def test_disabled_cache_never_builds(monkeypatch):
+    monkeypatch.setattr(mip_pyramid, "build_mip_pyramid", None)
+    source = _jacket()
+
+    assert not MIP_PYRAMID_CACHE.enabled
+    resized = resize_with_mip_pyramid(_KEY, source.copy, (64, 64), Image.Resampling.LANCZOS)
+    assert resized.tobytes() == source.resize((64, 64), Image.Resampling.LANCZOS).tobytes()
@@ -84,3 +84,18 @@ def test_native_text_metrics_enforce_batch_and_text_limits():
         _native.measure_text_batch("", str(TEST_FONT), [("x" * 4097, 16.0)])
     with pytest.raises(TypeError, match="list or tuple"):
         _native.measure_text_batch("", str(TEST_FONT), {"text": "x", "size": 16.0})
+
+
+@pytest.mark.skipif(
+    _native is None or getattr(_native, "TEXT_METRICS_CAPABILITY", 0) < 2 or not TEST_FONT.is_file(),
+    reason="native prefix advances + fixture font required",
+)
+def test_native_prefix_advances_are_cumulative_per_character():
+    text = "Haruki 未来"
+    advances = _native.measure_prefix_advances("", str(TEST_FONT), text, 24.0)
+
+    assert len(advances) == len(text)
+    assert advances == sorted(advances)
+    whole = _native.measure_text_batch("", str(TEST_FONT), [(text, 24.0)])[0]["advance"]
+    assert advances[-1] == pytest.approx(whole, abs=0.5)
+    assert _native.measure_prefix_advances("", str(TEST_FONT), "", 24.0) == []
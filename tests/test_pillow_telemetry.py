@@ -16,6 +16,7 @@ from src.core.pillow_telemetry import (
     PILLOW_TOUCH_TEXT_METRIC,
     record_pillow_touch,
 )
+from src.sekai.base import utils as base_utils
 from src.sekai.base.painter import get_text_size
 from src.sekai.base.utils import get_asset_image_ref, run_in_pool
 from src.sekai.skia_renderer.ir_painter import IRPainter
@@ -136,7 +137,9 @@ def test_ir_painter_reports_pil_source_and_one_mem_raster(tmp_path):
     assert reasons[PILLOW_TOUCH_IRPAINTER_MEM_RASTER] == {"renders": 1, "touches": 1}
 
 
-def test_header_probe_placeholder_and_text_metric_are_reported(tmp_path):
+def test_header_probe_placeholder_and_text_metric_are_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_utils, "_native_asset_image_info", lambda: None)  # a wheel without asset_image_info
+    base_utils._load_asset_image_ref_cached.cache_clear()
     Image.new("RGBA", (4, 5), "blue").save(tmp_path / "asset.png")
 
     async def exercise() -> None:
@@ -156,3 +159,38 @@ def test_header_probe_placeholder_and_text_metric_are_reported(tmp_path):
     assert reasons[PILLOW_TOUCH_IMAGE_HEADER_PROBE] == {"renders": 1, "touches": 1}
     assert reasons[PILLOW_TOUCH_PLACEHOLDER] == {"renders": 1, "touches": 1}
     assert reasons[PILLOW_TOUCH_TEXT_METRIC] == {"renders": 1, "touches": 1}
+
+
+def test_native_asset_header_probe_is_not_a_pillow_touch(tmp_path, monkeypatch):
+    Image.new("RGBA", (4, 5), "blue").save(tmp_path / "asset.png")
+    Image.new("RGBA", (3, 2), "red").save(tmp_path / "broken.png")
+    seen: list[tuple[str, str]] = []
+
+    def _asset_image_info(base_dir: str, asset_path: str) -> dict:
+        seen.append((base_dir, asset_path))
+        if asset_path == "broken.png":
+            raise ValueError("unsupported header")
+        return {"width": 4, "height": 5, "mode": "RGBA", "mtime_ns": 1, "file_size": 1}
+
+    monkeypatch.setattr(base_utils, "_native_asset_image_info", lambda: _asset_image_info)
+    base_utils._load_asset_image_ref_cached.cache_clear()
+
+    async def exercise() -> None:
+        tokens = push_request_context("rid", "/api/native-probe", "POST")
+        try:
+            ref = await get_asset_image_ref(tmp_path, "asset.png", on_missing="raise")
+            assert ref.size == (4, 5)
+            assert ref.file_size == (tmp_path / "asset.png").stat().st_size
+            record_render("native-probe", "skia")
+            fallback = await get_asset_image_ref(tmp_path, "broken.png", on_missing="raise")
+            assert fallback.size == (3, 2)
+            record_render("native-probe", "skia")
+        finally:
+            pop_request_context(tokens)
+
+    asyncio.run(exercise())
+    base_utils._load_asset_image_ref_cached.cache_clear()
+    stats = get_render_stats()["endpoints"]["native-probe"]
+    assert seen == [(str(tmp_path.resolve()), "asset.png"), (str(tmp_path.resolve()), "broken.png")]
+    assert (stats["native_pure"], stats["native_hybrid"]) == (1, 1)
+    assert stats["pillow_touch_reasons"][PILLOW_TOUCH_IMAGE_HEADER_PROBE] == {"renders": 1, "touches": 1}
@@ -0,0 +1,126 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+import httpx
+
+from src.core.admission import PRIORITY_BULK, PRIORITY_DEFAULT, PRIORITY_INTERACTIVE
+from src.core.debug import POOL_WAIT_HEADER, RequestSchedulingRef, install_debug_middleware
+from src.sekai.base.pool_scheduler import PoolScheduler
+from src.sekai.base.utils import run_in_pool
+
+
+def _submit(scheduler: PoolScheduler, func, *args, lane="render", priority=PRIORITY_DEFAULT, deadline=None):
+    scheduling = RequestSchedulingRef(priority=priority, deadline=deadline)
+    return scheduler.submit(func, args, context=contextvars.copy_context(), lane=lane, scheduling=scheduling)
+
+
+def test_a_busy_pool_picks_by_lane_then_class_then_submission():
+    async def scenario():
+        scheduler = PoolScheduler(1, 0)
+        gate = threading.Event()
+        order: list[str] = []
+        blocker = _submit(scheduler, gate.wait, 5)
+        await asyncio.sleep(0.05)  # the only worker is now busy
+        futures = [
+            _submit(scheduler, order.append, "bulk", priority=PRIORITY_BULK),
+            _submit(scheduler, order.append, "default", priority=PRIORITY_DEFAULT),
+            _submit(scheduler, order.append, "interactive-1", priority=PRIORITY_INTERACTIVE),
+            _submit(scheduler, order.append, "short", lane="short", priority=PRIORITY_BULK),
+            _submit(scheduler, order.append, "interactive-2", priority=PRIORITY_INTERACTIVE),
+        ]
+        gate.set()
+        await asyncio.gather(blocker, *futures)
+        scheduler.shutdown()
+        return order, scheduler.stats()
+
+    order, stats = asyncio.run(scenario())
+
+    assert order == ["short", "interactive-1", "interactive-2", "default", "bulk"]
+    assert stats["classes"]["interactive"]["started"] == 2
+    assert stats["classes"]["bulk"]["wait_ms_max"] >= stats["classes"]["short"]["wait_ms_max"]
+
+
+def test_short_lane_workers_run_while_every_render_worker_is_busy():
+    async def scenario():
+        scheduler = PoolScheduler(1, 1)
+        gate = threading.Event()
+        blocker = _submit(scheduler, gate.wait, 5)
+        started = time.perf_counter()
+        probe = await asyncio.wait_for(_submit(scheduler, lambda: "probed", lane="short"), timeout=2)
+        elapsed = time.perf_counter() - started
+        gate.set()
+        await blocker
+        scheduler.shutdown()
+        return probe, elapsed
+
+    probe, elapsed = asyncio.run(scenario())
+
+    assert probe == "probed"
+    assert elapsed < 1.0
+
+
+def test_cancelled_and_expired_tasks_are_dropped_without_running():
+    async def scenario():
+        scheduler = PoolScheduler(1, 0)
+        gate = threading.Event()
+        ran: list[str] = []
+        blocker = _submit(scheduler, gate.wait, 5)
+        await asyncio.sleep(0.05)
+        cancelled = _submit(scheduler, ran.append, "cancelled")
+        expired = _submit(scheduler, ran.append, "expired", deadline=time.monotonic() - 1)
+        cancelled.cancel()
+        gate.set()
+        await blocker
+        try:
+            await expired
+        except TimeoutError as exc:
+            error = exc
+        else:
+            error = None
+        scheduler.shutdown()
+        return ran, error, scheduler.stats()["classes"]["default"]
+
+    ran, error, stats = asyncio.run(scenario())
+
+    assert ran == []
+    assert isinstance(error, TimeoutError)
+    assert stats["dropped_cancelled"] == 1
+    assert stats["dropped_expired"] == 1
+
+
+def test_exceptions_reach_the_awaiting_coroutine():
+    def boom():
+        raise ValueError("broken asset")
+
+    async def scenario():
+        try:
+            await run_in_pool(boom)
+        except ValueError as exc:
+            return str(exc)
+        return None
+
+    assert asyncio.run(scenario()) == "broken asset"
+
+
+def test_responses_carry_the_requests_pool_wait():
+    app = FastAPI()
+    install_debug_middleware(app)
+
+    @app.post("/api/pjsk/stamp/list")
+    async def _render(body: dict):
+        await run_in_pool(time.sleep, 0.01)
+        return Response(content=b"png", media_type="image/png")
+
+    async def post():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.post("/api/pjsk/stamp/list", json={"stamps": [1, 2]})
+
+    response = asyncio.run(post())
+
+    assert response.status_code == 200
+    assert float(response.headers[POOL_WAIT_HEADER]) >= 0.0
@@ -147,3 +147,39 @@ def test_canvas_image_box_fill_with_both_dimensions_matches_image_box_contract()
     child = Canvas(4, 3)
 
     assert CanvasImageBox(child, image_size_mode="fill", size=(8, 8))._get_content_size() == (8, 8)
+
+
+def test_keyed_canvas_image_box_reuses_the_lowered_subtree(tmp_path, monkeypatch) -> None:
+    from src.sekai.skia_renderer import subtree as subtree_module
+    from src.sekai.skia_renderer.subtree_cache import NATIVE_SUBTREE_CACHE
+
+    Image.new("RGBA", (4, 3), (220, 40, 20, 255)).save(tmp_path / "badge.png")
+    asset_ref = asyncio.run(get_asset_image_ref(tmp_path, "badge.png", on_missing="raise"))
+    lowered = []
+    real_lower = subtree_module.lower_canvas_subtree
+
+    def counting_lower(canvas, **kwargs):
+        lowered.append(canvas)
+        return real_lower(canvas, **kwargs)
+
+    def scene(bg_hour: float) -> dict:
+        child = Canvas(380, 80)
+        child.add_item(ImageBox(asset_ref, image_size_mode="fill", size=(380, 80)))
+        parent = Canvas()
+        parent.add_item(CanvasImageBox(child, size=(None, 48), cache_key="honor-cached", require_asset_backed=True))
+        builder, mem_images = build_canvas_ir(parent, assets_base_dir=str(tmp_path), bg_hour=bg_hour)
+        assert mem_images == {}
+        return builder.build()
+
+    monkeypatch.setattr(subtree_module, "lower_canvas_subtree", counting_lower)
+    NATIVE_SUBTREE_CACHE.clear()
+    try:
+        first = scene(12.0)
+        second = scene(12.0)
+        assert len(lowered) == 1
+        assert second["root"] == first["root"]
+
+        scene(20.0)
+        assert len(lowered) == 2
+    finally:
+        NATIVE_SUBTREE_CACHE.clear()
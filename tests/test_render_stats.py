@@ -251,6 +251,44 @@ def test_an_unnamed_caller_is_still_counted(monkeypatch):
     assert get_render_stats()["endpoints"]["unknown"]["skia"] == 1
 
 
+# ---------------------------- PNG encode profile ----------------------------
+
+
+def test_png_profile_resolves_request_then_endpoint_then_global(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "png_encode_profile", "balanced")
+    monkeypatch.setattr(settings.drawing, "png_encode_profile_endpoints", {"card_box": "smallest"})
+    assert canvas_mod.resolve_png_encode_profile("card_list") == "balanced"
+    assert canvas_mod.resolve_png_encode_profile("card_box") == "smallest"
+
+    tokens = push_request_context("req", "/api/pjsk/card/box", "POST", png_encode_profile=" Fastest ")
+    try:
+        assert canvas_mod.resolve_png_encode_profile("card_box") == "fastest"
+    finally:
+        pop_request_context(tokens)
+
+    # An unknown header value is ignored, not an error: the configured profile still applies.
+    tokens = push_request_context("req", "/api/pjsk/card/box", "POST", png_encode_profile="tiny")
+    try:
+        assert canvas_mod.resolve_png_encode_profile("card_box") == "smallest"
+    finally:
+        pop_request_context(tokens)
+
+
+def test_render_passes_the_resolved_png_profile(monkeypatch):
+    monkeypatch.setattr(settings.drawing, "use_skia_plot", True)
+    monkeypatch.setattr(settings.drawing, "png_encode_profile_endpoints", {"card_list": "balanced"})
+    seen = {}
+
+    async def fake_render(canvas, **kwargs):
+        seen.update(kwargs)
+        return _payload()
+
+    monkeypatch.setattr(canvas_mod, "_render_canvas_uncounted", fake_render)
+
+    asyncio.run(canvas_mod.render_canvas_payload(_FakeCanvas(), endpoint="card_list"))
+    assert seen["png_profile"] == "balanced"
+
+
 # ---------------------------- canvas-size guard ----------------------------
 
 
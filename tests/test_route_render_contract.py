@@ -84,6 +84,20 @@ _HEAVY_WORKER_ROUTES = {
     "/api/pjsk/misc/chara-birthday",
 }
 
+# Routes that render each item through a module-level helper (a batch streams one task per item),
+# so the shadow layer and the Pillow fallback are in that helper, not the route body. The guards
+# below scan the helper instead; it must be defined in the route's own module.
+_PER_ITEM_RENDER_HELPERS = {
+    "/api/pjsk/profile/custom-profile-cards": "_render_custom_profile_card_payload",
+}
+
+
+def _render_source(path: str, endpoint) -> str:
+    helper = _PER_ITEM_RENDER_HELPERS.get(path)
+    if helper is not None:
+        return inspect.getsource(getattr(inspect.getmodule(endpoint), helper))
+    return inspect.getsource(endpoint)
+
 
 def test_every_drawing_route_has_a_skia_path():
     """A new drawing endpoint must go through the shadow layer, or say why not.
@@ -95,7 +109,7 @@ def test_every_drawing_route_has_a_skia_path():
     for path, endpoint in _drawing_routes():
         if path in _NO_SKIA_PATH or path in _HEAVY_WORKER_ROUTES:
             continue
-        source = inspect.getsource(endpoint)
+        source = _render_source(path, endpoint)
         if "try_render" not in source:
             missing.append(f"{path} -> {endpoint.__module__}.{endpoint.__name__}")
 
@@ -178,7 +192,7 @@ def test_drawing_routes_fall_back_to_pillow(path, endpoint):
     try_render must also have a Pillow compose path to fall back to."""
     if path in _NO_SKIA_PATH:
         pytest.skip(_NO_SKIA_PATH[path])
-    source = inspect.getsource(endpoint)
+    source = _render_source(path, endpoint)
     if "try_render" not in source:
         pytest.skip("no Skia path (covered by test_every_drawing_route_has_a_skia_path)")
 
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import replace
+from io import BytesIO
 import sys
+from types import SimpleNamespace
 
+from PIL import Image
 import pytest
 
 import scripts.skia_parity_sweep as sweep_mod
+from src.core.pillow_telemetry import PILLOW_TOUCH_TEXT_METRIC, record_pillow_touch, take_pillow_touch_snapshot
 
 
 def _run_main(
@@ -33,6 +38,7 @@ def _run_main(
     monkeypatch.setattr(sweep_mod, "PAYLOAD_DIR", payload_dir)
     monkeypatch.setattr(sweep_mod, "CASES", (case,))
     monkeypatch.setattr(sweep_mod, "PARITY_BUDGETS", budgets)
+    monkeypatch.setattr(sweep_mod, "NATIVE_PURE_CASES", frozenset({case.name} if case.native_pure else ()))
     monkeypatch.setattr(sweep_mod, "setup", lambda: None)
     monkeypatch.setattr(sweep_mod, "_load_mysekai_real", lambda: None)
     monkeypatch.setattr(sweep_mod, "sweep", fake_sweep)
@@ -49,6 +55,7 @@ def _run_main(
     [
         ([{"endpoint": "profile", "status": "ok"}], False, 0),
         ([{"endpoint": "profile", "status": "size-mismatch"}], False, 1),
+        ([{"endpoint": "profile", "status": "purity-regression"}], False, 1),
         ([{"endpoint": "profile", "status": "no-payload"}], False, 0),
         ([{"endpoint": "profile", "status": "no-payload"}], True, 1),
         ([{"endpoint": "profile", "status": "skipped"}], True, 1),
@@ -90,3 +97,58 @@ def test_strict_mode_rejects_unmapped_fixture(monkeypatch, tmp_path):
     rows = [{"endpoint": "profile", "status": "ok"}]
 
     assert _run_main(monkeypatch, tmp_path, rows, strict=True, extra_fixtures=("orphan",)) == 1
+
+
+def test_native_pure_cases_name_skia_rendered_cases():
+    pure = {case.name for case in sweep_mod.CASES if case.native_pure}
+
+    assert pure == sweep_mod.NATIVE_PURE_CASES
+    assert all(case.try_render is not None for case in sweep_mod.CASES if case.native_pure)
+
+
+def _png_payload(image: Image.Image) -> SimpleNamespace:
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return SimpleNamespace(image_bytes=buffer.getvalue())
+
+
+@pytest.mark.parametrize(("touch", "status"), [(False, "ok"), (True, "purity-regression")])
+def test_run_case_fails_a_native_pure_case_that_touches_pillow(tmp_path, touch, status):
+    case = next(item for item in sweep_mod.CASES if item.name == "custom_profile_card")
+    image = Image.new("RGBA", (8, 6), (10, 20, 30, 255))
+
+    async def compose(_req):
+        return image
+
+    async def try_render(_req):
+        if touch:
+            record_pillow_touch(PILLOW_TOUCH_TEXT_METRIC)
+            take_pillow_touch_snapshot()  # what the render's own record_render does
+            record_pillow_touch(PILLOW_TOUCH_TEXT_METRIC)
+        return _png_payload(image)
+
+    row = asyncio.run(sweep_mod.run_case(case, None, compose, try_render, tmp_path))
+
+    assert row["status"] == status
+    assert row["purity"] == ("hybrid" if touch else "pure")
+    assert row["pillow_touches"] == ({PILLOW_TOUCH_TEXT_METRIC: 2} if touch else {})
+
+
+def test_summary_lists_ratchet_candidates_by_what_keeps_them_out(tmp_path):
+    rows = [
+        {"endpoint": "custom_profile_card", "status": "ok", "purity": "pure", "pillow_touches": {}},
+        {"endpoint": "honor_bonds", "status": "ok", "purity": "pure", "pillow_touches": {}},
+        {"endpoint": "honor_fcap", "status": "ok", "purity": "hybrid", "pillow_touches": {PILLOW_TOUCH_TEXT_METRIC: 4}},
+        {
+            "endpoint": "card_list",
+            "status": "ok",
+            "purity": "hybrid",
+            "pillow_touches": {PILLOW_TOUCH_TEXT_METRIC: 9, "pillow_image_decode": 1},
+        },
+        {"endpoint": "vlive_list", "status": "over-budget", "purity": "pure", "pillow_touches": {}},
+    ]
+
+    assert sweep_mod.ratchet_candidates(rows) == {"ready": ["honor_bonds"], "text_metric_only": ["honor_fcap"]}
+    summary = sweep_mod.write_summary_md(rows, tmp_path).read_text(encoding="utf-8")
+    assert "- pure, not yet in `NATIVE_PURE_CASES`: honor_bonds" in summary
+    assert f"- only `{PILLOW_TOUCH_TEXT_METRIC}` left: honor_fcap" in summary
@@ -15,15 +15,61 @@ from __future__ import annotations
 import pytest
 
 from src.sekai.base import painter
+from src.sekai.base.cache import MISSING
+from src.sekai.base.text_cache import TEXT_MEASURE_CACHE
 
 
 @pytest.fixture(autouse=True)
 def clear_measure_caches():
-    painter._text_bbox_cache.clear()
-    painter._text_emoji_size_cache.clear()
+    TEXT_MEASURE_CACHE.clear()
     yield
-    painter._text_bbox_cache.clear()
-    painter._text_emoji_size_cache.clear()
+    TEXT_MEASURE_CACHE.clear()
+
+
+def test_measurements_are_shared_across_threads_and_counted(tmp_path):
+    """Fonts are per thread but measurements are not: a second thread with its own font object for
+    the same face file hits what the first one measured."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from PIL import ImageFont
+
+    font_path = tmp_path / "default.ttf"
+    font_path.write_bytes(ImageFont.load_default(20).font_bytes)
+    before = TEXT_MEASURE_CACHE.stats()
+    size = painter.get_text_size(painter.get_font(str(font_path), 20), "Haruki shared")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other = pool.submit(
+            lambda: painter.get_text_size(painter.get_font(str(font_path), 20), "Haruki shared")
+        ).result()
+
+    stats = TEXT_MEASURE_CACHE.stats()
+    assert other == size
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["hits"] == before["hits"] + 1
+    assert stats["bytes"] > 0
+
+
+def test_font_cache_is_a_per_thread_lru_reported_in_runtime_stats():
+    from src.sekai.base.text_cache import ThreadFontCache
+    from src.sekai.base.utils import get_runtime_cache_stats
+
+    cache = ThreadFontCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # "b" is the least recently used
+
+    assert cache.get("b") is None
+    assert list(cache.fonts) == ["a", "c"]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+    painter.get_font(painter.DEFAULT_FONT, 17)
+    painter.get_font(painter.DEFAULT_FONT, 17)
+    text_caches = get_runtime_cache_stats()["text_caches"]
+    assert text_caches["font"]["hits"] >= 1
+    assert text_caches["font"]["threads"] >= 1
+    assert text_caches["text_measure"]["shards"] >= 1
 
 
 def test_the_cache_key_separates_font_sizes(real_fonts):
@@ -52,7 +98,9 @@ def test_cached_measurements_match_an_uncached_probe(real_fonts):
 
     cold_size = painter.get_text_size(font, text)
     cold_offset = painter.get_text_offset(font, text)
-    assert painter._text_bbox_cache, "nothing was cached — the cache is not on the measuring path"
+    assert TEXT_MEASURE_CACHE.get(("bbox", painter._font_key(font), text)) is not MISSING, (
+        "nothing was cached — the cache is not on the measuring path"
+    )
 
     warm_size = painter.get_text_size(font, text)
     warm_offset = painter.get_text_offset(font, text)
@@ -70,8 +118,125 @@ def test_emoji_text_is_measured_by_the_emoji_path_and_cached_separately(real_fon
     text = "hello 🎵"
 
     first = painter.get_text_size(font, text)
-    assert painter._text_emoji_size_cache, "emoji string did not take the emoji measuring path"
+    assert TEXT_MEASURE_CACHE.get(("emoji", painter._font_key(font), text)) is not MISSING, (
+        "emoji string did not take the emoji measuring path"
+    )
     assert painter.get_text_size(font, text) == first
 
     plain = painter.get_text_size(font, "hello ")
     assert first[0] > plain[0], "the emoji contributed no width"
+
+
+def _bisect_clip(font, text: str, width: int, suffix: str = "") -> int:
+    """The per-probe binary search ``TextBox`` and the inventory helpers used before prefix advances."""
+    left_idx, right_idx = 0, len(text)
+    while left_idx <= right_idx:
+        mid_idx = (left_idx + right_idx) // 2
+        measured = painter.get_text_size(font, text[:mid_idx] + suffix)[0]
+        if measured < width:
+            left_idx = mid_idx + 1
+        elif measured > width:
+            right_idx = mid_idx - 1
+        else:
+            return mid_idx
+    return right_idx
+
+
+def _assert_fit_matches_bisection(font, text: str) -> None:
+    full = painter.get_text_size(font, text)[0]
+    for width in range(0, full + 8, 3):
+        for suffix in ("", "..."):
+            # The bisection ran off to -1 when not even the bare suffix fit; the fit clamps to 0.
+            expected = max(0, _bisect_clip(font, text, width, suffix))
+            got = painter.fit_text_prefix(font, text, width, suffix)
+            if got != expected:
+                # The bisection returns whichever index it probes first on an exact-width plateau;
+                # the fit returns the last one. Both must fit exactly at ``width``.
+                assert painter.get_text_size(font, text[:got] + suffix)[0] == width
+                assert painter.get_text_size(font, text[:expected] + suffix)[0] == width
+
+
+def test_prefix_fit_matches_the_bisected_break_positions():
+    from PIL import ImageFont
+
+    font = ImageFont.load_default(20)
+    advances = painter.measure_prefix_advances(font, "Haruki Drawing 123")
+
+    assert len(advances) == len("Haruki Drawing 123")
+    assert advances == sorted(advances)
+    _assert_fit_matches_bisection(font, "The quick brown fox jumps over the lazy dog, WAVE AVA 1234567")
+
+
+def test_prefix_fit_matches_the_bisected_break_positions_with_real_fonts(real_fonts):
+    font = painter.get_font(painter.DEFAULT_FONT, 24)
+    _assert_fit_matches_bisection(font, "プロセカ Haruki 测试换行 The quick brown fox「引用」123")
+
+
+class _FixedWidthBatch:
+    """Stand-in for the wheel's ``measure_text_batch``: every character is 10px wide."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, float]] = []
+
+    def __call__(self, _font_dir, _font_name, requests):
+        self.requests.extend(requests)
+        return [{"pillow_bbox": (1.0, 4.0, 1.0 + 10.0 * len(text), 24.0)} for text, _size in requests]
+
+
+def _native_watermark_setup(monkeypatch, tmp_path) -> _FixedWidthBatch:
+    from PIL import ImageFont
+
+    from src.sekai.base import draw
+
+    font_path = tmp_path / "default.ttf"
+    font_path.write_bytes(ImageFont.load_default(20).font_bytes)
+    batch = _FixedWidthBatch()
+    monkeypatch.setattr(painter, "_native_text_batch", lambda: batch)
+    monkeypatch.setattr(
+        painter,
+        "_native_prefix_advances",
+        lambda: lambda _font_dir, _path, text, _size: [10.0 * (i + 1) for i in range(len(text))],
+    )
+    monkeypatch.setattr(draw, "get_font", lambda _name, size: painter.get_font(str(font_path), size))
+    return batch
+
+
+def test_the_native_watermark_layout_never_measures_with_pillow(monkeypatch, tmp_path):
+    """chart and honor are in ``NATIVE_PURE_CASES`` because their watermark layout measures with
+    ``measure_text_batch``: wrapping, the fitted breaks and the block width all take the native
+    metric, and a Pillow text metric on that path is a purity regression."""
+    from src.core.pillow_telemetry import begin_pillow_touch_scope, end_pillow_touch_scope, take_pillow_touch_snapshot
+    from src.sekai.base.draw import get_watermark_render_spec
+
+    batch = _native_watermark_setup(monkeypatch, tmp_path)
+    text_width = painter.native_text_width()
+    assert text_width is not None
+
+    token = begin_pillow_touch_scope()
+    try:
+        font_size, lines, text_w, _ = get_watermark_render_spec("abcdefghijk", 75, 12, text_width)
+        touches = take_pillow_touch_snapshot()
+    finally:
+        end_pillow_touch_scope(token)
+
+    assert touches.counts == {}
+    assert font_size == 12
+    assert lines == ["abcdefg", "hijk"]
+    assert text_w == 70
+    assert batch.requests
+
+
+def test_native_text_width_falls_back_to_pillow_for_emoji_and_failures(monkeypatch, tmp_path):
+    _native_watermark_setup(monkeypatch, tmp_path)
+    font = painter.get_font(str(tmp_path / "default.ttf"), 20)
+    text_width = painter.native_text_width()
+
+    assert text_width(font, "") == 0.0
+    assert text_width(font, "Haruki") == 60.0
+    assert text_width(font, "hello 🎵") == painter.get_text_width(font, "hello 🎵")
+
+    def failing(*_args):
+        raise RuntimeError("font not found")
+
+    monkeypatch.setattr(painter, "_native_text_batch", lambda: failing)
+    assert painter.native_text_width()(font, "Drawing") == painter.get_text_width(font, "Drawing")
@@ -33,3 +33,57 @@ def test_timezone_request_normalizes_bad_timezone_and_seconds_dt():
     assert normalize_timezone("Not/AZone") == DEFAULT_TIMEZONE
     assert request.timezone == DEFAULT_TIMEZONE
     assert request.dt == 1_700_000_000_000
+
+
+def test_timezone_registry_resolves_each_string_once():
+    from src.sekai.base.timezone import _resolve_timezone, get_timezone
+
+    _resolve_timezone.cache_clear()
+    for _ in range(5):
+        assert normalize_timezone(" Not/AZone ") == DEFAULT_TIMEZONE
+        assert get_timezone("Asia/Tokyo").key == "Asia/Tokyo"
+
+    info = _resolve_timezone.cache_info()
+    assert info.misses == 2
+    assert info.hits == 8
+    assert info.maxsize is not None
+
+
+def test_request_clock_shares_one_now_and_parses_each_value_once(monkeypatch):
+    from src.sekai.base import timezone as timezone_mod
+
+    parsed = []
+    original = timezone_mod.localize_datetime
+
+    def counting_localize(value, timezone_name):
+        parsed.append(value)
+        return original(value, timezone_name)
+
+    monkeypatch.setattr(timezone_mod, "localize_datetime", counting_localize)
+    request = TimeZoneRequest(timezone="Asia/Tokyo")
+    clock = request.clock
+
+    assert request.clock is clock
+    assert clock.localize(1_700_000_000_000) is clock.localize(1_700_000_000_000)
+    assert clock.localize(1_700_000_000_000).tzinfo.key == "Asia/Tokyo"
+    assert clock.localize(None) is None
+    assert parsed == [1_700_000_000_000]
+    assert clock.watermark_time() == clock.now
+
+    # A timezone rewritten by apply_timezone rebuilds the clock but keeps the request's instant.
+    request.timezone = "UTC"
+    assert request.clock is not clock
+    assert request.clock.now == clock.now
+    assert request.clock.now.tzinfo.key == "UTC"
+
+
+def test_request_watermark_prints_the_request_clock():
+    from src.sekai.base.draw import build_request_watermark_text
+    from src.sekai.base.timezone import RequestClock
+
+    request = TimeZoneRequest(timezone="Asia/Tokyo")
+    request._clock = RequestClock("Asia/Tokyo", now=datetime(2024, 1, 1, 3, 4, 5, tzinfo=UTC))
+
+    assert build_request_watermark_text(request).startswith("DT: 2024-01-01 12:04:05 (Asia/Tokyo)")
+    fixed = TimeZoneRequest(timezone="Asia/Tokyo", dt=1_700_000_000_000)
+    assert build_request_watermark_text(fixed).startswith("DT: 2023-11-15 07:13:20 (Asia/Tokyo)")
@@ -10,7 +10,14 @@ from __future__ import annotations
 
 import random
 
-from src.sekai.base.triangle_bg import build_triangle_bg, triangle_bg_seed
+from src.sekai.base.triangle_bg import (
+    TRIANGLE_BG_CACHE,
+    background_hour,
+    build_triangle_bg,
+    palette_hour_bucket,
+    triangle_bg_cache_key,
+    triangle_bg_seed,
+)
 
 ARGS = (900, 600, 15.5, True, None, 0.0)
 
@@ -91,3 +98,57 @@ def test_the_custom_hue_palette_differs_from_the_time_palette():
     hue_spec = build_triangle_bg(900, 600, 15.5, False, 0.05, 0.0)
     assert time_spec.grad1 != hue_spec.grad1
     assert time_spec.white_alpha != hue_spec.white_alpha or time_spec.grad2 != hue_spec.grad2
+
+
+def test_the_clock_hour_moves_in_palette_steps(monkeypatch):
+    assert palette_hour_bucket(15.5) == 15.5
+    assert palette_hour_bucket(15.53) == 15.5
+    assert palette_hour_bucket(15.999) == 15 + 11 / 12
+    monkeypatch.setenv("HARUKI_BG_TEST_HOUR", "15.53")
+    assert background_hour() == 15.53, "the pinned hour is the parity harnesses' and stays exact"
+    monkeypatch.delenv("HARUKI_BG_TEST_HOUR")
+    hour = background_hour()
+    assert hour == palette_hour_bucket(hour)
+
+
+def test_the_cache_key_separates_every_input():
+    base = triangle_bg_cache_key(900, 600, 15.5, True, None, 0.0)
+    assert triangle_bg_cache_key(900, 600, 15.5, True, 0.0, 0.0) == base
+    others = [
+        triangle_bg_cache_key(901, 600, 15.5, True, None, 0.0),
+        triangle_bg_cache_key(900, 601, 15.5, True, None, 0.0),
+        triangle_bg_cache_key(900, 600, 15.5 + 1 / 12, True, None, 0.0),  # palette step, same seed
+        triangle_bg_cache_key(900, 600, 15.5, False, None, 0.0),
+        triangle_bg_cache_key(900, 600, 15.5, True, 0.05, 0.0),
+        triangle_bg_cache_key(900, 600, 15.5, True, None, 0.5),
+    ]
+    assert len({base, *others}) == len(others) + 1
+
+
+def test_the_cache_key_only_carries_the_palette_step_for_the_time_palette():
+    assert triangle_bg_cache_key(900, 600, 15.5, True, None, 0.0) == triangle_bg_cache_key(
+        900, 600, 15.55, True, None, 0.0
+    )
+    custom_hue = triangle_bg_cache_key(900, 600, 15.0, False, 0.3, 0.0)
+    assert triangle_bg_cache_key(900, 600, 15.75, False, 0.3, 0.0) == custom_hue
+    assert triangle_bg_cache_key(900, 600, 16.0, False, 0.3, 0.0) != custom_hue, "the scatter seed moves hourly"
+
+
+def test_the_painter_pastes_a_cached_background(monkeypatch):
+    from PIL import Image
+
+    from src.sekai.base.painter import Painter, _render_triangle_bg
+
+    monkeypatch.setenv("HARUKI_BG_TEST_HOUR", "15.5")
+    TRIANGLE_BG_CACHE.clear()
+    hits = TRIANGLE_BG_CACHE.stats()["hits"]
+    expected = _render_triangle_bg(240, 160, 15.5, True, None, 0.0)
+
+    first = Painter(Image.new("RGBA", (240, 160)))._impl_draw_random_triangle_bg(True, None, 0.0)
+    second = Painter(Image.new("RGBA", (240, 160)))._impl_draw_random_triangle_bg(True, None, 0.0)
+
+    assert first.img.tobytes() == expected.tobytes()
+    assert second.img.tobytes() == expected.tobytes()
+    assert TRIANGLE_BG_CACHE.stats()["hits"] == hits + 1
+    assert TRIANGLE_BG_CACHE.stats()["entries"] == 1
+    TRIANGLE_BG_CACHE.clear()
@@ -5,8 +5,10 @@ from datetime import UTC, datetime, timedelta
 
 from PIL import Image
 
-from src.sekai.vlive.drawer import _compose_vlive_entry_image
-from src.sekai.vlive.model import VLiveBrief, VLiveCharacterItem
+from src.sekai.skia_renderer.canvas import build_canvas_ir
+from src.sekai.skia_renderer.subtree_cache import NATIVE_SUBTREE_CACHE
+from src.sekai.vlive.drawer import _build_vlive_list_canvas, _compose_vlive_entry_image
+from src.sekai.vlive.model import VLiveBrief, VLiveCharacterItem, VLiveListRequest
 
 
 def test_compose_vlive_entry_image_wraps_connected_live_characters() -> None:
@@ -31,3 +33,44 @@ def test_compose_vlive_entry_image_wraps_connected_live_characters() -> None:
 
     assert image.width <= 724
     assert image.height > 212
+
+
+def _walk_nodes(nodes):
+    for node in nodes:
+        yield node
+        yield from _walk_nodes(node.get("children", ()))
+
+
+def test_skia_path_rows_reach_the_ir_as_keyed_subscenes_without_pixels(monkeypatch) -> None:
+    monkeypatch.setattr(NATIVE_SUBTREE_CACHE, "max_entries", 8)
+    monkeypatch.setattr(NATIVE_SUBTREE_CACHE, "max_bytes", 1 << 20)
+    NATIVE_SUBTREE_CACHE.clear()
+    start = datetime(2026, 10, 19, 12, 30, 5, tzinfo=UTC)
+    rqd = VLiveListRequest(
+        region="jp",
+        lives=[
+            VLiveBrief(
+                id=idx,
+                name=f"Live {idx}",
+                start_at=start - timedelta(hours=1),
+                end_at=start + timedelta(hours=2),
+                living=idx == 1,
+            )
+            for idx in (1, 2)
+        ],
+    )
+    keys = []
+    for now in (start, start + timedelta(seconds=40), start + timedelta(minutes=1)):
+        canvas = asyncio.run(_build_vlive_list_canvas(rqd, now, native_rows=True))
+        builder, mem_images = build_canvas_ir(canvas)
+        subscenes = [
+            node for node in _walk_nodes(builder.build()["root"]["children"]) if node["type"] == "RasterSubscene"
+        ]
+        assert mem_images == {}
+        keys.append([node.get("cache_key") for node in subscenes])
+    NATIVE_SUBTREE_CACHE.clear()
+
+    assert len(keys[0]) == 2
+    assert all(keys[0])
+    assert keys[1] == keys[0]  # same minute bucket
+    assert not set(keys[2]) & set(keys[0])  # the relative times moved on